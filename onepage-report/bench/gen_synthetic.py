@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+gen_synthetic.py - 產生合成報告輸入（benchmark 用）
+
+依指定規模產生 Phase 5/6 的輸入檔：
+    one_page.md       - 報告本文（區塊、條列、表格）
+    diagrams.md       - 圖表規格（主圖 + 附錄圖）
+    layout.json       - 多頁 layout（pt 座標，格式同 mcp-yogalayout 輸出）
+    slide_data.json   - 對應 layout 的 slide_data（格式同 templates/slide-data-schema.json）
+    material.pdf      - 純文字 PDF（抽取 benchmark 用）
+
+用法:
+    python gen_synthetic.py ./bench_input --pages 5 --sections 6 --bullets 5 \
+        --tables 1 --table-rows 8 --figures before_after,flow,line_chart
+
+相同參數與 --seed 會產生完全相同的檔案。
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Dict, List
+
+FIGURE_TYPES = [
+    "before_after", "flow", "timeline", "platform_compare",
+    "architecture", "line_chart", "bar_chart", "pie_chart",
+]
+
+# 內建規模
+PRESETS = {
+    "small": {"pages": 1, "sections": 4, "bullets": 3, "tables": 1, "table_rows": 4,
+              "figures": ["before_after"]},
+    "medium": {"pages": 5, "sections": 6, "bullets": 5, "tables": 1, "table_rows": 8,
+               "figures": ["before_after", "flow", "line_chart"]},
+    "large": {"pages": 30, "sections": 8, "bullets": 6, "tables": 2, "table_rows": 12,
+              "figures": FIGURE_TYPES},
+}
+
+SLIDE_W = 960
+SLIDE_H = 540
+MARGIN = 24
+GAP = 10
+
+_WORDS = ["延遲", "排程", "快取", "遷移", "功耗", "頻率", "觸控", "渲染", "佇列",
+          "Frame", "GPU", "CPU", "cluster", "thread", "latency", "SDK", "POC"]
+
+
+def _phrase(rng: random.Random, words: int = 6) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _figure_data(rng: random.Random, fig_type: str) -> Dict:
+    """產生 slide_data 格式的圖表資料"""
+    if fig_type == "before_after":
+        return {
+            "before": {"title": "改善前", "steps": [_phrase(rng, 3) for _ in range(5)]},
+            "after": {"title": "改善後", "steps": [_phrase(rng, 3) for _ in range(5)]},
+        }
+    if fig_type == "flow":
+        return {"stages": [{"title": _phrase(rng, 2), "nodes": [_phrase(rng, 2)]} for _ in range(4)]}
+    if fig_type == "timeline":
+        return {"points": [{"time": f"T+{i * 5}ms", "label": _phrase(rng, 2), "duration": "5ms"}
+                           for i in range(5)]}
+    if fig_type == "platform_compare":
+        return {"platforms": [
+            {"name": name, "items": [{"text": _phrase(rng, 2), "status": "ok"} for _ in range(4)]}
+            for name in ("PC", "Mobile")
+        ]}
+    if fig_type == "architecture":
+        return {"layers": [{"name": _phrase(rng, 2), "components": [_phrase(rng, 1) for _ in range(3)]}
+                           for _ in range(4)]}
+    categories = [f"W{i + 1}" for i in range(8)]
+    series = [{"name": f"S{j + 1}", "values": [round(rng.uniform(10, 100), 1) for _ in categories]}
+              for j in range(1 if fig_type == "pie_chart" else 2)]
+    return {"title": _phrase(rng, 2), "categories": categories, "series": series}
+
+
+def _grid_boxes(count: int, top: float, bottom: float, cols: int) -> List[Dict]:
+    """在 [top, bottom] 區間以 cols 欄平均切出 count 個方塊"""
+    if count == 0:
+        return []
+    rows = (count + cols - 1) // cols
+    cell_w = (SLIDE_W - 2 * MARGIN - GAP * (cols - 1)) / cols
+    cell_h = (bottom - top - GAP * (rows - 1)) / rows
+    return [
+        {"x": round(MARGIN + (i % cols) * (cell_w + GAP), 1),
+         "y": round(top + (i // cols) * (cell_h + GAP), 1),
+         "w": round(cell_w, 1), "h": round(cell_h, 1)}
+        for i in range(count)
+    ]
+
+
+def generate(pages: int = 1, sections: int = 4, bullets: int = 3, tables: int = 1,
+             table_rows: int = 4, figures: List[str] = None, seed: int = 0) -> Dict:
+    """
+    產生合成輸入
+
+    Args:
+        pages: 頁數
+        sections: 每頁區塊數
+        bullets: 每區塊條列數
+        tables: 每頁表格數
+        table_rows: 每個表格資料列數
+        figures: 每頁圖表類型列表（依序放置）
+        seed: 亂數種子
+
+    Returns:
+        dict: {"one_page_md", "diagrams_md", "layout", "slide_data", "pdf_pages"}
+    """
+    rng = random.Random(seed)
+    figures = list(figures if figures is not None else ["before_after"])
+
+    md = ["# 合成報告：效能基準", "> 自動產生的 benchmark 輸入", ""]
+    diagrams_md = ["# 圖表集", ""]
+    layout_pages = []
+    slide_pages = []
+    pdf_pages = []
+    fig_index = 0
+
+    for page in range(1, pages + 1):
+        layout_elems = [
+            {"id": "title", "kind": "text", "role": "title",
+             "box": {"x": MARGIN, "y": 12, "w": SLIDE_W - 2 * MARGIN, "h": 30}},
+            {"id": "subtitle", "kind": "text", "role": "subtitle",
+             "box": {"x": MARGIN, "y": 44, "w": SLIDE_W - 2 * MARGIN, "h": 20}},
+        ]
+        data_elems = [
+            {"id": "title", "kind": "text", "role": "title", "content": f"合成報告 第 {page} 頁"},
+            {"id": "subtitle", "kind": "text", "role": "subtitle", "content": _phrase(rng, 8)},
+        ]
+
+        blocks = sections + tables + len(figures)
+        boxes = _grid_boxes(blocks, 72, SLIDE_H - MARGIN, cols=3 if blocks > 4 else 2)
+        box_iter = iter(boxes)
+        page_text = [f"Page {page}"]
+
+        for s in range(sections):
+            sec_id = f"section:p{page}_s{s + 1}"
+            title = f"區塊 {s + 1}：{_phrase(rng, 2)}"
+            items = [_phrase(rng, rng.randint(4, 10)) for _ in range(bullets)]
+            layout_elems.append({"id": sec_id, "kind": "bullets", "role": "body", "box": next(box_iter)})
+            data_elems.append({"id": sec_id, "kind": "section", "title": title, "bullets": items})
+            md.append(f"## {title}")
+            md.extend(f"- {item}" for item in items)
+            md.append("")
+            page_text.append(f"Section {s + 1}: " + " ".join(f"item{b}" for b in range(bullets)))
+
+        for t in range(tables):
+            tbl_id = f"table:p{page}_t{t + 1}"
+            headers = ["項目", "PC", "手機", "差異"]
+            rows = [[_phrase(rng, 1), f"{rng.randint(1, 99)}ms", f"{rng.randint(1, 99)}ms", _phrase(rng, 1)]
+                    for _ in range(table_rows)]
+            layout_elems.append({"id": tbl_id, "kind": "table", "role": "body", "box": next(box_iter)})
+            data_elems.append({"id": tbl_id, "kind": "table", "headers": headers, "rows": rows})
+            md.append("| " + " | ".join(headers) + " |")
+            md.append("|" + "---|" * len(headers))
+            md.extend("| " + " | ".join(row) + " |" for row in rows)
+            md.append("")
+
+        for fig_type in figures:
+            prefix = "main" if fig_index == 0 else "appendix"
+            fig_id = f"fig:{prefix}:f{fig_index}"
+            layout_elems.append({"id": fig_id, "kind": "figure", "role": "body",
+                                 "alt": fig_type, "box": next(box_iter)})
+            data_elems.append({"id": fig_id, "kind": "figure", "type": fig_type,
+                               "data": _figure_data(rng, fig_type)})
+            heading = "主圖" if fig_index == 0 else f"附錄圖 {fig_index}"
+            diagrams_md += [
+                f"## {heading}：Figure {fig_index} {fig_type}", "",
+                f"- **類型**：{fig_type}",
+                f"- **說明**：{_phrase(rng, 6)}", "",
+                "### 節點列表",
+            ]
+            diagrams_md += [f"{n + 1}. {_phrase(rng, 2)}：{_phrase(rng, 3)}" for n in range(4)]
+            diagrams_md += ["", "---", ""]
+            fig_index += 1
+
+        layout_pages.append({"page_number": page, "slide": {"w_pt": SLIDE_W, "h_pt": SLIDE_H},
+                             "elements": layout_elems})
+        slide_pages.append({"page": page, "elements": data_elems})
+        pdf_pages.append(page_text)
+
+    slide_data = {
+        "metadata": {"title": "合成報告：效能基準", "subtitle": "benchmark", "total_pages": pages},
+        "pages": slide_pages,
+    }
+    return {
+        "one_page_md": "\n".join(md),
+        "diagrams_md": "\n".join(diagrams_md),
+        "layout": {"pages": layout_pages},
+        "slide_data": slide_data,
+        "pdf_pages": pdf_pages,
+    }
+
+
+def write_text_pdf(path: str, pages: List[List[str]]):
+    """
+    寫出最小的純文字 PDF（Helvetica，僅 ASCII），供 extract_pdf 基準測試使用
+
+    Args:
+        path: 輸出路徑
+        pages: 每頁的文字行
+    """
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for lines in pages:
+        ops = ["BT", "/F1 11 Tf", "14 TL", "50 780 Td"]
+        for line in lines:
+            safe = line.encode("ascii", "replace").decode().replace("\\", "\\\\")
+            safe = safe.replace("(", "\\(").replace(")", "\\)")
+            ops.append(f"({safe}) Tj T*")
+        ops.append("ET")
+        stream = "\n".join(ops).encode("ascii")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_num = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_num
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        " ".join(f"{k} 0 R" for k in kids).encode(), len(kids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    with open(path, "wb") as f:
+        f.write(out)
+
+
+def write_inputs(output_dir: str, **params) -> Dict[str, str]:
+    """產生並寫出所有合成輸入，回傳各檔案路徑"""
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    data = generate(**params)
+    paths = {
+        "one_page": str(out / "one_page.md"),
+        "diagrams": str(out / "diagrams.md"),
+        "layout": str(out / "layout.json"),
+        "slide_data": str(out / "slide_data.json"),
+        "pdf": str(out / "material.pdf"),
+    }
+    Path(paths["one_page"]).write_text(data["one_page_md"], encoding="utf-8")
+    Path(paths["diagrams"]).write_text(data["diagrams_md"], encoding="utf-8")
+    Path(paths["layout"]).write_text(json.dumps(data["layout"], ensure_ascii=False, indent=2), encoding="utf-8")
+    Path(paths["slide_data"]).write_text(json.dumps(data["slide_data"], ensure_ascii=False, indent=2),
+                                         encoding="utf-8")
+    write_text_pdf(paths["pdf"], data["pdf_pages"])
+    return paths
+
+
+def add_scale_arguments(parser):
+    """加入規模參數（run_bench.py 共用）"""
+    parser.add_argument("--preset", choices=sorted(PRESETS), help="內建規模（個別參數可覆寫）")
+    parser.add_argument("--pages", type=int, help="頁數")
+    parser.add_argument("--sections", type=int, help="每頁區塊數")
+    parser.add_argument("--bullets", type=int, help="每區塊條列數")
+    parser.add_argument("--tables", type=int, help="每頁表格數")
+    parser.add_argument("--table-rows", type=int, help="每個表格資料列數")
+    parser.add_argument("--figures", help=f"每頁圖表類型（逗號分隔）：{','.join(FIGURE_TYPES)}")
+    parser.add_argument("--seed", type=int, default=0, help="亂數種子")
+
+
+def scale_params(args) -> Dict:
+    """由 argparse 結果組出 generate() 參數"""
+    params = dict(PRESETS[args.preset or "small"])
+    for key in ("pages", "sections", "bullets", "tables", "table_rows"):
+        value = getattr(args, key)
+        if value is not None:
+            params[key] = value
+    if args.figures is not None:
+        figures = [f.strip() for f in args.figures.split(",") if f.strip()]
+        unknown = [f for f in figures if f not in FIGURE_TYPES]
+        if unknown:
+            raise SystemExit(f"[gen_synthetic] 未知的圖表類型: {', '.join(unknown)}")
+        params["figures"] = figures
+    params["seed"] = args.seed
+    return params
+
+
+def main():
+    parser = argparse.ArgumentParser(description="產生合成報告輸入（benchmark 用）")
+    parser.add_argument("output_dir", help="輸出目錄")
+    add_scale_arguments(parser)
+    args = parser.parse_args()
+
+    params = scale_params(args)
+    paths = write_inputs(args.output_dir, **params)
+    print(f"[gen_synthetic] 參數: {params}")
+    for name, path in paths.items():
+        print(f"  - {name}: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+import_bench.py - CLI 冷啟動（import 時間）基準測試
+
+orchestrator 每天會啟動這些腳本上千次，冷啟動的 import 成本直接累加。
+每個目標都以全新的 python 程序執行（量到的是含直譯器啟動的 wall time）：
+
+    cli:<script>     - python scripts/<script>.py --help
+    import:<module>  - python -c "import <module>"（reference/ 在 sys.path）
+
+另外以 -X importtime 各跑一次，列出累計最久的頂層 import（找出誰拖慢啟動）。
+
+用法:
+    python import_bench.py --iterations 10 -o before.json
+    python import_bench.py --iterations 10 -o after.json --compare before.json
+    python import_bench.py --targets cli:render_from_json,import:modules --top 10
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BENCH_DIR = Path(__file__).parent
+ROOT_DIR = BENCH_DIR.parent
+SCRIPTS_DIR = ROOT_DIR / "scripts"
+REFERENCE_DIR = ROOT_DIR / "reference"
+sys.path.insert(0, str(BENCH_DIR))
+
+from run_bench import _git_commit, _percentile
+
+# 預設量測的模組（CLI 以外的常用進入點）
+DEFAULT_IMPORTS = ["modules", "modules.draw_flow", "scene", "render_pptx", "figure_export"]
+
+
+def default_targets() -> List[str]:
+    """scripts/ 下所有 CLI（有 argparse 的腳本）的 --help，加上常用模組的 import"""
+    clis = [f"cli:{p.stem}" for p in sorted(SCRIPTS_DIR.glob("*.py"))
+            if "argparse" in p.read_text(encoding="utf-8")]
+    return clis + [f"import:{m}" for m in DEFAULT_IMPORTS]
+
+
+def target_command(target: str) -> List[str]:
+    """目標 → 子程序指令"""
+    kind, _, name = target.partition(":")
+    if kind == "cli":
+        return [sys.executable, str(SCRIPTS_DIR / f"{name}.py"), "--help"]
+    if kind == "import":
+        return [sys.executable, "-c", f"import sys; sys.path.insert(0, {str(REFERENCE_DIR)!r}); import {name}"]
+    raise ValueError(f"未知的目標: {target}（需為 cli:<腳本> 或 import:<模組>）")
+
+
+def _run(cmd: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run(cmd, cwd=ROOT_DIR, capture_output=True, text=True)
+
+
+def import_profile(cmd: List[str], top: int) -> Dict:
+    """
+    以 -X importtime 執行一次
+
+    Returns:
+        dict: {"import_ms": 頂層 import 累計總和, "modules": [{"module", "cumulative_ms", "self_ms"}]}
+    """
+    proc = _run([cmd[0], "-X", "importtime"] + cmd[1:])
+    top_level = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, self_us, cumulative_us, name = line.replace("import time:", "|", 1).split("|")
+        if name.startswith("  "):
+            continue   # 巢狀 import，已計入上層的累計時間
+        top_level.append({
+            "module": name.strip(),
+            "cumulative_ms": round(int(cumulative_us) / 1000, 2),
+            "self_ms": round(int(self_us) / 1000, 2),
+        })
+    top_level.sort(key=lambda m: m["cumulative_ms"], reverse=True)
+    return {
+        "import_ms": round(sum(m["cumulative_ms"] for m in top_level), 2),
+        "modules": top_level[:top],
+    }
+
+
+def measure_target(target: str, iterations: int, top: int, warmup: int = 1) -> Dict:
+    """
+    量測單一目標的冷啟動時間
+
+    Args:
+        target: cli:<腳本> 或 import:<模組>
+        iterations: 計時次數（每次都是新程序）
+        top: 列出幾個最久的頂層 import
+        warmup: 暖身次數（讓 .pyc 與 OS 檔案快取就緒，不計時）
+
+    Returns:
+        dict: 統計結果
+    """
+    cmd = target_command(target)
+    for _ in range(warmup):
+        _run(cmd)
+
+    durations = []
+    returncode = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        proc = _run(cmd)
+        durations.append(time.perf_counter() - start)
+        returncode = returncode or proc.returncode
+
+    return {
+        "target": target,
+        "iterations": iterations,
+        "returncode": returncode,
+        "p50_ms": round(_percentile(durations, 50) * 1000, 2),
+        "p99_ms": round(_percentile(durations, 99) * 1000, 2),
+        "mean_ms": round(statistics.mean(durations) * 1000, 2),
+        "min_ms": round(min(durations) * 1000, 2),
+        **import_profile(cmd, top),
+    }
+
+
+def run_import_benchmarks(targets: List[str], iterations: int, top: int) -> Dict:
+    """量測所有目標，回傳 {"meta": {...}, "targets": [...]}"""
+    results = [measure_target(target, iterations, top) for target in targets]
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "targets": results,
+    }
+
+
+def print_report(report: Dict, baseline: Optional[Dict] = None, top: int = 0):
+    """輸出結果表格（有 baseline 時附上 p50 差異）"""
+    base = {t["target"]: t for t in (baseline or {}).get("targets", [])}
+    print(f"\n[import_bench] commit={report['meta']['commit']} python={report['meta']['python']}")
+    header = f"{'target':<30}{'p50 ms':>10}{'p99 ms':>10}{'import ms':>11}"
+    if base:
+        header += f"{'Δp50':>9}"
+    print(header)
+    print("-" * len(header))
+    for t in report["targets"]:
+        line = f"{t['target']:<30}{t['p50_ms']:>10.1f}{t['p99_ms']:>10.1f}{t['import_ms']:>11.1f}"
+        prev = base.get(t["target"])
+        if prev and prev["p50_ms"] > 0:
+            line += f"{(t['p50_ms'] / prev['p50_ms'] - 1) * 100:>+8.1f}%"
+        if t["returncode"]:
+            line += f"  (exit {t['returncode']})"
+        print(line)
+        for m in t["modules"][:top]:
+            print(f"    {m['module']:<40}{m['cumulative_ms']:>9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CLI 冷啟動（import 時間）基準測試")
+    parser.add_argument("--targets", help="逗號分隔的目標（cli:<腳本> / import:<模組>，預設全部 CLI 與常用模組）")
+    parser.add_argument("--iterations", type=int, default=10, help="每個目標的計時次數（預設 10）")
+    parser.add_argument("--top", type=int, default=5, help="每個目標列出幾個最久的頂層 import（預設 5）")
+    parser.add_argument("--output", "-o", help="結果 JSON 輸出路徑")
+    parser.add_argument("--compare", help="與先前的結果 JSON 比較")
+    args = parser.parse_args()
+
+    targets = [t.strip() for t in args.targets.split(",") if t.strip()] if args.targets else default_targets()
+    try:
+        for target in targets:
+            target_command(target)
+    except ValueError as e:
+        parser.error(str(e))
+
+    report = run_import_benchmarks(targets, args.iterations, args.top)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline, args.top)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n[import_bench] 結果已儲存: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
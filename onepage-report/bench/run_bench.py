@@ -0,0 +1,338 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+run_bench.py - Pipeline 效能基準測試
+
+以 gen_synthetic.py 產生的合成輸入，逐階段計時：
+    convert         - yoga_converter.convert_files（Phase 5 → yoga markdown + content.json）
+    layout          - mcp-yogalayout 佈局 RPC（需 --mcp-exe，否則略過）
+    content_mapping - render_from_json.convert_slide_data_to_content_data
+    render          - python-pptx 渲染（render_pptx.PptxLayoutRenderer，含儲存）
+    overlap_review  - _tracking.check_overlaps（全部投影片）
+    extract_pptx    - extract_pptx.extract_pptx（抽取 render 產出的 PPTX）
+    extract_pdf     - extract_pdf.extract_pdf（合成的純文字 PDF）
+
+每個階段輸出 p50 / p99 / 平均耗時、吞吐量（每秒處理的頁數或元素數）
+與峰值記憶體（程序 RSS 高水位 + 單次執行的 Python 配置峰值）。
+
+用法:
+    python run_bench.py --preset medium --iterations 5 --output results.json
+    python run_bench.py --pages 20 --figures flow,line_chart --compare baseline.json
+
+結果 JSON 內含 git commit，可跨 commit 比較（--compare 會列出差異百分比）。
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+BENCH_DIR = Path(__file__).parent
+sys.path.insert(0, str(BENCH_DIR.parent / "scripts"))
+sys.path.insert(0, str(BENCH_DIR.parent / "reference"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from gen_synthetic import add_scale_arguments, scale_params, write_inputs
+
+STAGES = ["convert", "layout", "content_mapping", "render",
+          "overlap_review", "extract_pptx", "extract_pdf"]
+
+
+def _peak_rss_kb() -> int:
+    """程序 RSS 高水位（KB；macOS 的 ru_maxrss 單位為 bytes）"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """最近序位法百分位數"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct * len(ordered) / 100) - 1))
+    return ordered[index]
+
+
+def _quiet(func: Callable, *args, **kwargs):
+    """執行函數並吞掉 stdout（被測函數會大量 print）"""
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        saved, sys.stdout = sys.stdout, devnull
+        try:
+            return func(*args, **kwargs)
+        finally:
+            sys.stdout = saved
+
+
+def measure(name: str, func: Callable[[], None], iterations: int, units: int,
+            unit_name: str, warmup: int = 1) -> Dict:
+    """
+    量測單一階段
+
+    Args:
+        name: 階段名稱
+        func: 無參數的被測函數
+        iterations: 計時次數
+        units: 每次執行處理的單位數（計算吞吐量用）
+        unit_name: 單位名稱（pages / elements / slides）
+        warmup: 暖身次數（不計時）
+
+    Returns:
+        dict: 統計結果
+    """
+    for _ in range(warmup):
+        _quiet(func)
+
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        _quiet(func)
+        durations.append(time.perf_counter() - start)
+
+    # 記憶體另外量一次，避免 tracemalloc 影響計時
+    tracemalloc.start()
+    _quiet(func)
+    _, py_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    mean = statistics.mean(durations)
+    return {
+        "stage": name,
+        "iterations": iterations,
+        "units": units,
+        "unit": unit_name,
+        "p50_ms": round(_percentile(durations, 50) * 1000, 3),
+        "p99_ms": round(_percentile(durations, 99) * 1000, 3),
+        "mean_ms": round(mean * 1000, 3),
+        "min_ms": round(min(durations) * 1000, 3),
+        "throughput": round(units / mean, 2) if mean > 0 else None,
+        "py_peak_kb": py_peak // 1024,
+        "rss_peak_kb": _peak_rss_kb(),
+    }
+
+
+def _skipped(name: str, reason: str) -> Dict:
+    return {"stage": name, "skipped": reason}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(params: Dict, iterations: int, work_dir: str, stages: List[str],
+                   mcp_exe: Optional[str] = None, mcp_cwd: Optional[str] = None,
+                   profile_path: Optional[str] = None,
+                   fragment_cache: bool = False) -> Dict:
+    """
+    執行所有階段的基準測試
+
+    Args:
+        params: gen_synthetic.generate() 參數
+        iterations: 每階段計時次數
+        work_dir: 工作目錄（輸入與中間產物）
+        stages: 要執行的階段
+        mcp_exe: mcp-yogalayout 執行檔（layout 階段用）
+        mcp_cwd: mcp-yogalayout workspace 根目錄
+        profile_path: 繪圖成本報告輸出路徑（可選，不計入計時）
+        fragment_cache: render 階段共用記憶體圖表片段快取（第 2 次起的迭代命中快取）
+
+    Returns:
+        dict: {"meta": {...}, "params": {...}, "stages": [...]}
+    """
+    paths = write_inputs(work_dir, **params)
+    layout = json.loads(Path(paths["layout"]).read_text(encoding="utf-8"))
+    slide_data = json.loads(Path(paths["slide_data"]).read_text(encoding="utf-8"))
+    pages = layout["pages"]
+    element_count = sum(len(p["elements"]) for p in pages)
+    pptx_path = os.path.join(work_dir, "bench.pptx")
+    results = []
+
+    if "convert" in stages:
+        from yoga_converter import convert_files
+        yoga_md = os.path.join(work_dir, "one_page.yoga.md")
+        content_json = os.path.join(work_dir, "content.json")
+        results.append(measure(
+            "convert",
+            lambda: convert_files(paths["one_page"], paths["diagrams"], yoga_md,
+                                  content_json, mode="multi_page"),
+            iterations, len(pages), "pages"))
+
+    if "layout" in stages:
+        if not mcp_exe:
+            results.append(_skipped("layout", "未指定 --mcp-exe"))
+        else:
+            try:
+                from modules_pywin32._mcp_client import YogaLayoutClient
+            except ImportError as e:
+                results.append(_skipped("layout", f"無法載入 MCP client: {e}"))
+            else:
+                client = YogaLayoutClient(exe_path=mcp_exe, cwd=mcp_cwd)
+                client.start()
+                try:
+                    yoga_md = os.path.join(work_dir, "one_page.yoga.md")
+                    if not os.path.exists(yoga_md):
+                        from yoga_converter import convert_files
+                        _quiet(convert_files, paths["one_page"], paths["diagrams"], yoga_md,
+                               mode="multi_page")
+                    results.append(measure(
+                        "layout",
+                        lambda: client.compute_layout(yoga_md, "theme.json",
+                                                      os.path.join(work_dir, "layout_out")),
+                        iterations, len(pages), "pages"))
+                finally:
+                    client.stop()
+
+    from render_from_json import convert_slide_data_to_content_data
+    content_data = convert_slide_data_to_content_data(slide_data)
+
+    if "content_mapping" in stages:
+        results.append(measure(
+            "content_mapping",
+            lambda: convert_slide_data_to_content_data(slide_data),
+            iterations, element_count, "elements"))
+
+    if {"render", "overlap_review", "extract_pptx"} & set(stages) or profile_path:
+        from render_pptx import PptxLayoutRenderer
+        from fragment_cache import FragmentCache
+        from modules._tracking import reset_element_tracker, check_overlaps
+
+        cache = FragmentCache() if fragment_cache else None
+
+        def render_deck():
+            reset_element_tracker()
+            renderer = PptxLayoutRenderer(fragment_cache=cache)
+            renderer.create_presentation()
+            for page in pages:
+                renderer.render_from_layout(page, content_data)
+            renderer.save(pptx_path)
+
+        if "render" in stages:
+            results.append(measure("render", render_deck, iterations, element_count, "elements"))
+        else:
+            _quiet(render_deck)
+
+        if profile_path:
+            from profiling import enable_profiling, finish_profiling
+            enable_profiling()
+            try:
+                _quiet(render_deck)
+            finally:
+                finish_profiling(profile_path)
+
+        if "overlap_review" in stages:
+            results.append(measure(
+                "overlap_review",
+                lambda: [check_overlaps(i) for i in range(len(pages))],
+                iterations, len(pages), "slides"))
+
+    if "extract_pptx" in stages:
+        from extract_pptx import extract_pptx
+        out_dir = os.path.join(work_dir, "extract_pptx")
+        results.append(measure(
+            "extract_pptx", lambda: extract_pptx(pptx_path, out_dir),
+            iterations, len(pages), "slides"))
+
+    if "extract_pdf" in stages:
+        from extract_pdf import extract_pdf
+        out_dir = os.path.join(work_dir, "extract_pdf")
+        results.append(measure(
+            "extract_pdf", lambda: extract_pdf(paths["pdf"], out_dir),
+            iterations, len(pages), "pages"))
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "elements": element_count,
+        },
+        "params": params,
+        "stages": results,
+    }
+
+
+def print_report(report: Dict, baseline: Optional[Dict] = None):
+    """輸出結果表格（有 baseline 時附上 p50 差異）"""
+    base = {s["stage"]: s for s in (baseline or {}).get("stages", []) if "skipped" not in s}
+    meta = report["meta"]
+    print(f"\n[bench] commit={meta['commit']} elements={meta['elements']} params={report['params']}")
+    header = f"{'stage':<16}{'p50 ms':>10}{'p99 ms':>10}{'throughput':>22}{'py peak KB':>12}{'RSS KB':>10}"
+    if base:
+        header += f"{'Δp50':>9}"
+    print(header)
+    print("-" * len(header))
+    for s in report["stages"]:
+        if "skipped" in s:
+            print(f"{s['stage']:<16}  (略過：{s['skipped']})")
+            continue
+        tput = f"{s['throughput']} {s['unit']}/s"
+        line = (f"{s['stage']:<16}{s['p50_ms']:>10.2f}{s['p99_ms']:>10.2f}{tput:>22}"
+                f"{s['py_peak_kb']:>12}{s['rss_peak_kb']:>10}")
+        prev = base.get(s["stage"])
+        if prev and prev["p50_ms"] > 0:
+            line += f"{(s['p50_ms'] / prev['p50_ms'] - 1) * 100:>+8.1f}%"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline 效能基準測試")
+    add_scale_arguments(parser)
+    parser.add_argument("--iterations", type=int, default=5, help="每階段計時次數（預設 5）")
+    parser.add_argument("--stages", default=",".join(STAGES),
+                        help=f"要執行的階段（逗號分隔，預設全部）：{','.join(STAGES)}")
+    parser.add_argument("--work-dir", help="工作目錄（預設使用暫存目錄並於結束後刪除）")
+    parser.add_argument("--mcp-exe", help="mcp-yogalayout 執行檔（layout 階段用）")
+    parser.add_argument("--mcp-cwd", help="mcp-yogalayout workspace 根目錄")
+    parser.add_argument("--output", "-o", help="結果 JSON 輸出路徑")
+    parser.add_argument("--compare", help="與先前的結果 JSON 比較")
+    parser.add_argument("--profile", metavar="OUT_JSON",
+                        help="額外渲染一次並輸出每個 draw_* 的成本報告（見 reference/profiling.py）")
+    parser.add_argument("--fragment-cache", action="store_true",
+                        help="render 階段啟用圖表片段快取（見 reference/fragment_cache.py）")
+    args = parser.parse_args()
+
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        print(f"[ERROR] 未知的階段: {', '.join(unknown)}")
+        sys.exit(1)
+
+    params = scale_params(args)
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="onepage_bench_")
+    try:
+        report = run_benchmarks(params, args.iterations, work_dir, stages,
+                                mcp_exe=args.mcp_exe, mcp_cwd=args.mcp_cwd,
+                                profile_path=args.profile, fragment_cache=args.fragment_cache)
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n[bench] 結果已儲存: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
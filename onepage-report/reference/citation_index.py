@@ -0,0 +1,652 @@
+"""
+素材全文索引（BM25 + CJK 雙字切詞）
+
+Phase 2 抽取出的 text.md 只有 `[來源：slide=N, shape=K]` / `[來源：page=N]` 標記，
+建立 Citation Map、Phase 4 查證宣稱時都要整份重讀。這裡把抽取結果切成段落
+（PPTX：每個 shape；PDF：每頁依行數分段；.md/.txt 素材：依空行分段），
+以 BM25 建立倒排索引，查詢只需掃過查詢詞的 posting list。
+
+切詞：
+    - 先做 NFKC（全形英數 → 半形）並轉小寫
+    - 英數字串整段為一個詞；中日韓文字取相鄰兩字（bigram），單字詞保留單字
+
+增量更新：
+    每個檔案記錄 (size, mtime_ns, sha256)；update() 只重新切詞內容有變的檔案，
+    目錄下已刪除的檔案會一併移出索引。索引存成 JSON（含各段落的詞頻），
+    載入時不需重新切詞。
+
+使用範例：
+    from citation_index import CitationIndex
+
+    index = CitationIndex.load("./output/phase2/index.json")
+    index.update(["./output/phase2/extracted", "./input/notes.md"])
+    index.save("./output/phase2/index.json")
+    for hit in index.search("SF queue 功耗", k=3):
+        print(format_location(hit.passage), hit.score, hit.snippet)
+"""
+import hashlib
+import heapq
+import itertools
+import json
+import math
+import os
+import re
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+INDEX_VERSION = 1
+
+# BM25 參數
+K1 = 1.2
+B = 0.75
+
+# PDF 頁面 / 純文字段落超過這個行數就再切開，讓查到的位置夠精確
+MAX_PASSAGE_LINES = 12
+
+# 摘錄長度（字元）
+SNIPPET_CHARS = 80
+
+# 目錄中會被索引的檔名（extract_pptx.py / extract_pdf.py 的輸出）
+EXTRACTED_NAME = "text.md"
+
+# 直接指定檔案時可索引的副檔名
+TEXT_SUFFIXES = (".md", ".txt")
+
+_HEADER_RE = re.compile(r"^# (?:PPTX|PDF) 內容抽取：(.+)$")
+_MARKER_RE = re.compile(r"^\[來源：(.+)\]$")
+_TOKEN_RE = re.compile(r"[0-9a-z_]+|[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]+")
+_CJK_RE = re.compile(r"[^0-9a-z_]")
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
+# text.md 中不是素材內容的行
+_SKIP_LINES = ("（此頁無可抽取的文字）", "錯誤：")
+
+
+class Passage(NamedTuple):
+    """索引中的一段素材"""
+    path: str              # 被索引的檔案
+    source: str            # 原始素材檔名（text.md 標頭），純文字素材為檔名
+    page: Optional[int]    # PPTX 投影片編號 / PDF 頁碼；純文字素材為 None
+    shape: Optional[int]   # PPTX shape 編號；其他為 None
+    line: int              # 段落在檔案中的起訖行（1 起算）
+    end_line: int
+    text: str
+
+
+class SearchHit(NamedTuple):
+    """查詢結果"""
+    passage: Passage
+    score: float
+    snippet: str
+
+
+class IndexUpdate(NamedTuple):
+    """update() 的統計（檔案數）"""
+    added: int
+    updated: int
+    removed: int
+    unchanged: int
+
+
+# ----------------------------------------------------------------------
+# 切詞
+# ----------------------------------------------------------------------
+
+def tokenize(text: str) -> List[str]:
+    """
+    切詞：英數字串整段、中日韓文字取 bigram
+
+    Args:
+        text: 任意文字
+
+    Returns:
+        list: 詞（依出現順序，可重複）
+    """
+    tokens = []
+    for run in _TOKEN_RE.findall(unicodedata.normalize("NFKC", text).lower()):
+        if len(run) == 1 or not _CJK_RE.match(run):
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def _fold(text: str) -> str:
+    """逐字 NFKC + 小寫且長度不變，摘錄時比對位置才能對回原文"""
+    folded = []
+    for char in text:
+        normalized = unicodedata.normalize("NFKC", char).lower()
+        folded.append(normalized if len(normalized) == 1 else char)
+    return "".join(folded)
+
+
+def _term_counts(text: str) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for token in tokenize(text):
+        counts[token] = counts.get(token, 0) + 1
+    return counts
+
+
+# ----------------------------------------------------------------------
+# 段落切分
+# ----------------------------------------------------------------------
+
+def _chunks(lines: Iterable[tuple]) -> Iterator[List[tuple]]:
+    """(行號, 文字) 依空行分段，過長的段落再依 MAX_PASSAGE_LINES 切開"""
+    block = []
+    for number, text in itertools.chain(lines, [(0, "")]):
+        if text.strip():
+            block.append((number, text))
+            if len(block) < MAX_PASSAGE_LINES:
+                continue
+        yield from ([block] if block else [])
+        block = []
+
+
+def _passages_from_lines(path: str, source: str, page, shape, lines: Iterable[tuple]) -> Iterator[Passage]:
+    for chunk in _chunks(lines):
+        yield Passage(path, source, page, shape, chunk[0][0], chunk[-1][0],
+                      "\n".join(text.strip() for _, text in chunk))
+
+
+def iter_extracted(path: str, lines: Iterable[str]) -> Iterator[Passage]:
+    """
+    逐行解析 extract_pptx.py / extract_pdf.py 的 text.md（不需整份載入）
+
+    每個 `[來源：...]` 標記之後到下一個標記、`## ` 標題或 `---` 之前的內容為一個位置；
+    圖片區塊（只有 `![...]`）與 `###` 小標不列入。
+
+    Args:
+        path: 檔案路徑（記錄在 Passage.path）
+        lines: text.md 的各行（可為開啟中的檔案）
+
+    Yields:
+        Passage
+    """
+    source = Path(path).parent.name or path
+    location = None
+    block: List[tuple] = []
+
+    def flush():
+        if location is None:
+            return iter(())
+        return _passages_from_lines(path, source, location.get("slide", location.get("page")),
+                                    location.get("shape"), block)
+
+    for number, line in enumerate(lines, 1):
+        line = line.rstrip("\r\n")
+        header = _HEADER_RE.match(line)
+        marker = _MARKER_RE.match(line.strip())
+        if header:
+            source = header.group(1).strip()
+        elif marker:
+            yield from flush()
+            location, block = {}, []
+            for pair in marker.group(1).split(","):
+                key, _, value = pair.strip().partition("=")
+                if value.strip().isdigit():
+                    location[key] = int(value)
+            if "image" in location:
+                location = None
+        elif line.startswith("## ") or line.strip() == "---":
+            yield from flush()
+            location, block = None, []
+        elif location is not None and not line.startswith(("#", "![")) and not line.startswith(_SKIP_LINES):
+            block.append((number, line))
+    yield from flush()
+
+
+def parse_extracted(path: str, markdown: str) -> List[Passage]:
+    """
+    解析 extract_pptx.py / extract_pdf.py 的 text.md（規則同 iter_extracted）
+
+    Args:
+        path: 檔案路徑（記錄在 Passage.path）
+        markdown: text.md 內容
+
+    Returns:
+        list: Passage
+    """
+    return list(iter_extracted(path, markdown.splitlines()))
+
+
+def parse_text(path: str, text: str) -> List[Passage]:
+    """
+    解析一般 .md / .txt 素材：依空行分段，位置為行號
+
+    Args:
+        path: 檔案路徑
+        text: 檔案內容
+
+    Returns:
+        list: Passage（page / shape 為 None）
+    """
+    return list(_passages_from_lines(path, Path(path).name, None, None, enumerate(text.splitlines(), 1)))
+
+
+def _is_extracted(path: str, first_line: str) -> bool:
+    return Path(path).name == EXTRACTED_NAME or bool(_HEADER_RE.match(first_line.strip()))
+
+
+def parse_file(path: str) -> List[Passage]:
+    """依檔案格式選擇解析方式（有 `# PPTX/PDF 內容抽取` 標頭的視為抽取結果）"""
+    text = Path(path).read_text(encoding="utf-8", errors="replace")
+    if _is_extracted(path, text.lstrip().split("\n", 1)[0]):
+        return parse_extracted(path, text)
+    return parse_text(path, text)
+
+
+def iter_file(path: str) -> Iterator[Passage]:
+    """
+    逐段讀取一個素材檔（串流版 parse_file，記憶體用量與檔案大小無關）
+
+    Args:
+        path: text.md 或 .md / .txt 素材
+
+    Yields:
+        Passage
+    """
+    with open(path, encoding="utf-8", errors="replace") as f:
+        first = f.readline()
+        lines = itertools.chain([first], f)
+        if _is_extracted(path, first):
+            yield from iter_extracted(path, lines)
+        else:
+            numbered = ((number, line.rstrip("\r\n")) for number, line in enumerate(lines, 1))
+            yield from _passages_from_lines(path, Path(path).name, None, None, numbered)
+
+
+def material_files(paths: Iterable[str]) -> List[str]:
+    """
+    展開素材路徑：目錄遞迴尋找 text.md（抽取結果），檔案需為 .md / .txt
+
+    Raises:
+        ValueError: 無法處理的路徑
+    """
+    found = []
+    for path in paths:
+        p = Path(path)
+        if p.is_dir():
+            found.extend(str(f) for f in sorted(p.rglob(EXTRACTED_NAME)))
+        elif p.suffix.lower() in TEXT_SUFFIXES and p.exists():
+            found.append(str(p))
+        else:
+            raise ValueError(f"無法處理: {path}（需為抽取結果目錄或 {'/'.join(TEXT_SUFFIXES)} 檔）")
+    return found
+
+
+def format_location(passage: Passage) -> str:
+    """
+    位置字串，格式同抽取結果的來源標記（純文字素材為 Citation Map 的「第 a-b 行」）
+
+    Returns:
+        str: 例如 "deck.pptx slide=3, shape=2"、"paper.pdf page=5"、"notes.md 第 1-5 行"
+    """
+    if passage.shape is not None:
+        return f"{passage.source} slide={passage.page}, shape={passage.shape}"
+    if passage.page is not None:
+        return f"{passage.source} page={passage.page}"
+    if passage.line == passage.end_line:
+        return f"{passage.source} 第 {passage.line} 行"
+    return f"{passage.source} 第 {passage.line}-{passage.end_line} 行"
+
+
+# ----------------------------------------------------------------------
+# 索引
+# ----------------------------------------------------------------------
+
+class CitationIndex:
+    """
+    BM25 倒排索引（可增量更新）
+
+    postings[詞] = {段落 id: 詞頻}；段落 id 只在同一個 CitationIndex 物件內有效。
+    """
+
+    def __init__(self):
+        self.passages: Dict[int, Passage] = {}
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.lengths: Dict[int, int] = {}
+        self.files: Dict[str, Dict] = {}
+        self._counts: Dict[int, Dict[str, int]] = {}
+        self._next_id = 0
+        self._total_length = 0
+        self._norms: Optional[Dict[int, float]] = None
+        self._impacts: Dict[str, Dict[int, float]] = {}
+
+    def __len__(self):
+        return len(self.passages)
+
+    # --- 建立 / 更新 -------------------------------------------------------
+
+    def _add(self, passage: Passage, counts: Dict[str, int]) -> int:
+        doc = self._next_id
+        self._next_id += 1
+        self.passages[doc] = passage
+        self._counts[doc] = counts
+        length = sum(counts.values())
+        self.lengths[doc] = length
+        self._total_length += length
+        for term, tf in counts.items():
+            self.postings.setdefault(term, {})[doc] = tf
+        self._invalidate()
+        return doc
+
+    def _remove_file(self, path: str):
+        for doc in self.files.pop(path, {}).get("docs", []):
+            for term in self._counts.pop(doc):
+                posting = self.postings[term]
+                del posting[doc]
+                if not posting:
+                    del self.postings[term]
+            self._total_length -= self.lengths.pop(doc)
+            del self.passages[doc]
+        self._invalidate()
+
+    def add_file(self, path: str, passages: Optional[List[Passage]] = None):
+        """
+        索引一個檔案（已索引時先移除舊內容）
+
+        Args:
+            path: 檔案路徑
+            passages: 已解析的段落（None = 以 iter_file 逐段讀取）
+        """
+        key = _key(path)
+        stat = os.stat(path)
+        digest = _sha256(path)
+        self._remove_file(key)
+        if passages is None:
+            passages = iter_file(path)
+        docs = [self._add(p._replace(path=key), _term_counts(p.text)) for p in passages]
+        self.files[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest, "docs": docs}
+
+    def update(self, paths: Iterable[str]) -> IndexUpdate:
+        """
+        增量更新：只重新索引內容有變的檔案
+
+        目錄會遞迴尋找 text.md（抽取結果）；檔案則直接索引（.md / .txt）。
+        曾在這些目錄下索引、但檔案已不存在的會被移除。
+
+        Args:
+            paths: 抽取結果目錄或素材檔案
+
+        Returns:
+            IndexUpdate
+        """
+        paths = list(paths)
+        found = material_files(paths)
+        roots = [_key(p) + "/" for p in paths if Path(p).is_dir()]
+
+        added = updated = unchanged = 0
+        seen = set()
+        for path in found:
+            key = _key(path)
+            seen.add(key)
+            record = self.files.get(key)
+            if record is not None:
+                stat = os.stat(path)
+                if (stat.st_size, stat.st_mtime_ns) == (record["size"], record["mtime_ns"]):
+                    unchanged += 1
+                    continue
+                if _sha256(path) == record["sha256"]:
+                    record["size"], record["mtime_ns"] = stat.st_size, stat.st_mtime_ns
+                    unchanged += 1
+                    continue
+                updated += 1
+            else:
+                added += 1
+            self.add_file(path)
+
+        stale = [key for key in self.files if key not in seen and key.startswith(tuple(roots))]
+        for key in stale:
+            self._remove_file(key)
+        return IndexUpdate(added, updated, len(stale), unchanged)
+
+    # --- 查詢 -------------------------------------------------------------
+
+    def _invalidate(self):
+        self._norms = None
+        self._impacts = {}
+
+    def _impact(self, term: str) -> Dict[int, float]:
+        """詞在各段落的 BM25 分數（查過的詞快取起來，索引變動後重算）"""
+        impact = self._impacts.get(term)
+        if impact is None:
+            if self._norms is None:
+                average = self._total_length / len(self.lengths) if self.lengths else 1.0
+                self._norms = {doc: K1 * (1 - B + B * length / average) for doc, length in self.lengths.items()}
+            weight = self.idf(term) * (K1 + 1)
+            norms = self._norms
+            impact = {doc: weight * tf / (tf + norms[doc]) for doc, tf in self.postings.get(term, {}).items()}
+            self._impacts[term] = impact
+        return impact
+
+    def has_source(self, source: str) -> bool:
+        """索引中是否有這個素材（比對方式同 search 的 source）"""
+        return any(_matches_source(p, source) for p in self.passages.values())
+
+    def idf(self, term: str) -> float:
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self.passages) - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, k: int = 5, source: Optional[str] = None) -> List[SearchHit]:
+        """
+        BM25 查詢
+
+        Args:
+            query: 查詢文字（切詞方式同索引）
+            k: 回傳筆數
+            source: 只查這個素材（比對 Passage.source 或檔案路徑結尾）
+
+        Returns:
+            list: SearchHit（依分數由高到低）
+        """
+        terms = set(tokenize(query))
+        scores: Dict[int, float] = {}
+        for term in terms:
+            impact = self._impact(term)
+            if not scores:
+                scores = dict(impact)
+                continue
+            get = scores.get
+            for doc, value in impact.items():
+                scores[doc] = get(doc, 0.0) + value
+
+        if source is not None:
+            scores = {doc: s for doc, s in scores.items() if _matches_source(self.passages[doc], source)}
+        best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [SearchHit(self.passages[doc], score, self.snippet(self.passages[doc].text, terms))
+                for doc, score in best]
+
+    def snippet(self, text: str, terms: Iterable[str], width: int = SNIPPET_CHARS) -> str:
+        """
+        取出涵蓋最多查詢詞（以 idf 加權）的一段文字
+
+        Args:
+            text: 段落文字
+            terms: 查詢詞（tokenize 的結果）
+            width: 摘錄長度
+
+        Returns:
+            str: 單行摘錄，前後被截斷時加「…」
+        """
+        folded = _fold(text)
+        hits = []
+        for term in terms:
+            start = folded.find(term)
+            while start >= 0:
+                hits.append((start, term))
+                start = folded.find(term, start + 1)
+        hits.sort()
+
+        begin, best = 0, -1.0
+        for i, (start, _) in enumerate(hits):
+            covered = {term for pos, term in hits[i:] if pos + len(term) <= start + width}
+            score = sum(self.idf(term) for term in covered)
+            if score > best:
+                begin, best = start, score
+        begin = max(0, min(begin - width // 4, len(text) - width))
+        piece = " ".join(text[begin:begin + width].split())
+        return ("…" if begin > 0 else "") + piece + ("…" if begin + width < len(text) else "")
+
+    # --- 存取 -------------------------------------------------------------
+
+    def save(self, path: str):
+        """以 JSON 存檔（段落與詞頻；原子寫入）"""
+        files = {}
+        for key, record in self.files.items():
+            files[key] = {
+                "size": record["size"], "mtime_ns": record["mtime_ns"], "sha256": record["sha256"],
+                "passages": [[self.passages[d].source, self.passages[d].page, self.passages[d].shape,
+                              self.passages[d].line, self.passages[d].end_line, self.passages[d].text,
+                              self._counts[d]] for d in record["docs"]],
+            }
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp = Path(str(path) + ".tmp")
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "files": files}, ensure_ascii=False),
+                       encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "CitationIndex":
+        """
+        載入索引；檔案不存在或版本不符時回傳空索引
+
+        Args:
+            path: save() 寫出的 JSON
+
+        Returns:
+            CitationIndex
+        """
+        index = cls()
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return index
+        if data.get("version") != INDEX_VERSION:
+            return index
+        for key, record in data["files"].items():
+            docs = [index._add(Passage(key, *fields[:6]), fields[6]) for fields in record["passages"]]
+            index.files[key] = {"size": record["size"], "mtime_ns": record["mtime_ns"],
+                                "sha256": record["sha256"], "docs": docs}
+        return index
+
+
+def _key(path) -> str:
+    return Path(path).resolve().as_posix()
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _matches_source(passage: Passage, source: str) -> bool:
+    source = source.strip()
+    return passage.source == source or passage.path.endswith("/" + source.lstrip("./"))
+
+
+# ----------------------------------------------------------------------
+# Citation Map 與宣稱查證
+# ----------------------------------------------------------------------
+
+class Citation(NamedTuple):
+    """citation_map.md 的一筆（格式見 phases/phase2-input.md 2.1.7）"""
+    cid: str
+    source: str
+    location: str
+    quote: str
+
+
+class ClaimCheck(NamedTuple):
+    """一行引用了 [Cn] 的宣稱與查到的來源段落"""
+    line: int
+    claim: str
+    cids: List[str]
+    hits: List[SearchHit]
+    missing_numbers: List[str]   # 宣稱中的數字在查到的段落裡都找不到
+
+
+_CITATION_RE = re.compile(r"^###\s+(C\d+)\s*$")
+_FIELD_RE = re.compile(r"^-\s+\*\*(來源|位置|原文)\*\*[：:]\s*(.*)$")
+_CID_RE = re.compile(r"\[(C\d+)\]")
+
+
+def parse_citation_map(markdown: str) -> List[Citation]:
+    """
+    解析 citation_map.md
+
+    Args:
+        markdown: citation_map.md 內容
+
+    Returns:
+        list: Citation（缺少的欄位為空字串）
+    """
+    citations = []
+    fields = None
+    for line in markdown.splitlines():
+        heading = _CITATION_RE.match(line.strip())
+        if heading:
+            fields = {"cid": heading.group(1)}
+            citations.append(fields)
+            continue
+        field = _FIELD_RE.match(line.strip())
+        if fields is not None and field:
+            fields.setdefault({"來源": "source", "位置": "location", "原文": "quote"}[field.group(1)],
+                              field.group(2).strip())
+    return [Citation(c["cid"], c.get("source", ""), c.get("location", ""), c.get("quote", ""))
+            for c in citations]
+
+
+def resolve_citation(index: CitationIndex, citation: Citation, k: int = 1) -> List[SearchHit]:
+    """
+    以原文查出 citation 在素材中的實際位置
+
+    來源檔名有被索引時只查該素材，否則查全部。
+
+    Returns:
+        list: SearchHit（空 = 找不到）
+    """
+    quote = citation.quote.rstrip(".…。 ")
+    source = citation.source if citation.source and index.has_source(citation.source) else None
+    return index.search(quote, k, source)
+
+
+def check_claims(index: CitationIndex, markdown: str, citations: Optional[List[Citation]] = None,
+                 k: int = 3) -> List[ClaimCheck]:
+    """
+    查證報告中引用 [Cn] 的每一行（Phase 4 審稿用）
+
+    以該行文字查詢索引（有 citation_map 時限定在引用的素材），
+    並列出宣稱中出現、但查到的段落裡沒有的數字（常見的生成錯誤）。
+
+    Args:
+        index: CitationIndex
+        markdown: one_page.md 等報告內容
+        citations: parse_citation_map 的結果（None = 不限定素材）
+        k: 每行取幾個來源段落
+
+    Returns:
+        list: ClaimCheck
+    """
+    indexed = {c.source for c in citations or [] if c.source and index.has_source(c.source)}
+    sources = {c.cid: c.source for c in citations or [] if c.source in indexed}
+    checks = []
+    for number, line in enumerate(markdown.splitlines(), 1):
+        cids = _CID_RE.findall(line)
+        if not cids:
+            continue
+        claim = " ".join(_CID_RE.sub("", line).strip("#->*| ").split())
+        cited = {sources[c] for c in cids if sources.get(c)}
+        hits = []
+        for source in cited or [None]:
+            hits.extend(index.search(claim, k, source))
+        hits = sorted(hits, key=lambda h: -h.score)[:k]
+        found = " ".join(unicodedata.normalize("NFKC", h.passage.text) for h in hits)
+        missing = [n for n in _NUMBER_RE.findall(unicodedata.normalize("NFKC", claim))
+                   if not re.search(rf"(?<![\d.]){re.escape(n)}(?![\d])", found)]
+        checks.append(ClaimCheck(number, claim, cids, hits, missing))
+    return checks
@@ -0,0 +1,613 @@
+# -*- coding: utf-8 -*-
+"""
+多份 PPTX 合併成一份（part 層級複製，不經過 python-pptx 物件樹）
+
+python-pptx 沒有跨簡報複製投影片的 API。這裡直接操作 OPC 套件：
+
+    1. 依 presentation.xml 的 sldIdLst 順序走訪每張投影片的關聯圖
+       （版面配置 → 母片 → 佈景主題、圖片、圖表 → 內嵌活頁簿、備忘稿...）
+    2. 每個 part 配置新名稱，重寫 .rels 的 Target；投影片 XML 只引用 rId，原樣串流複製
+    3. 去重：
+       - 圖片與影音依內容雜湊，相同內容只寫一次
+       - 母片 / 版面配置 / 佈景主題整組（互相參照的封閉集合）依整組雜湊，
+         以同一範本產生的簡報共用一份
+    4. 每個 part 讀出後立即寫入輸出 zip，記憶體上限約為單一最大 part；
+       close() 時才寫入 presentation.xml、關聯、content types 與文件屬性（投影片數、標題）
+    5. 輸出到路徑時先寫入 <path>.tmp，close() 完成才取代目標檔；中途發生例外時捨棄（abort）
+
+限制：投影片大小必須一致（容許 _SIZE_TOLERANCE EMU 的換算誤差）；備忘稿母片只保留第一份（其他簡報的備忘稿改指向它）；
+註解（comments）與自訂放映、章節不複製；簡報層級的設定（presProps、tableStyles...）取自第一份。
+
+使用方式：
+    from deck_merge import merge_decks
+
+    stats = merge_decks(["a/final.pptx", "b/final.pptx"], "review.pptx")
+"""
+
+import hashlib
+import os
+import posixpath
+import re
+import shutil
+import zipfile
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from lxml import etree
+
+from tracing import span
+
+_NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+_NS_CT = "http://schemas.openxmlformats.org/package/2006/content-types"
+_NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_NS_EP = "http://schemas.openxmlformats.org/officeDocument/2006/extended-properties"
+_NS_VT = "http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes"
+
+_REL_OFFICE_DOCUMENT = _NS_R + "/officeDocument"
+_REL_SLIDE = _NS_R + "/slide"
+_REL_SLIDE_MASTER = _NS_R + "/slideMaster"
+_REL_NOTES_MASTER = _NS_R + "/notesMaster"
+_REL_HANDOUT_MASTER = _NS_R + "/handoutMaster"
+_REL_COMMENTS = _NS_R + "/comments"
+_REL_EXTENDED_PROPS = _NS_R + "/extended-properties"
+_REL_NOTES_SLIDE = _NS_R + "/notesSlide"
+
+# 整組共用的 part（依關聯封閉集合的雜湊去重）
+_SHARED_RELS = {
+    _NS_R + "/slideLayout", _REL_SLIDE_MASTER, _NS_R + "/theme", _REL_NOTES_MASTER, _REL_HANDOUT_MASTER,
+}
+# 依內容雜湊去重的媒體（圖表內嵌活頁簿不共用：PowerPoint 編輯資料時會改寫它）
+_MEDIA_RELS = {
+    _NS_R + "/image", _NS_R + "/audio", _NS_R + "/video",
+    "http://schemas.microsoft.com/office/2007/relationships/media",
+}
+# 不複製的關聯
+_SKIPPED_RELS = {_REL_COMMENTS}
+# presentation.xml 中由合併結果重建的關聯
+_REBUILT_RELS = {_REL_SLIDE, _REL_SLIDE_MASTER, _REL_NOTES_MASTER, _REL_HANDOUT_MASTER}
+
+_CONTENT_TYPES = "[Content_Types].xml"
+_PACKAGE = "/"      # 套件本身（_rels/.rels 的來源）
+
+# sldMasterId / sldLayoutId 共用的 id 空間起點
+_FIRST_MASTER_ID = 2147483648
+_FIRST_SLIDE_ID = 256
+_SECTION_EXT_URI = "{521415D9-36F7-43E2-AB2F-B90AF26B5E84}"
+
+# 投影片大小比對的容許誤差（EMU）：13.333 吋換算成 12191695 或 12192000 都視為相同
+_SIZE_TOLERANCE = 1270
+# app.xml HeadingPairs 中投影片標題的群組名稱
+_SLIDE_TITLES = "Slide Titles"
+
+_COPY_CHUNK = 1 << 20
+_NUMBERED_NAME = re.compile(r"^(.*?)(\d*)(\.[^./]*)$")
+
+
+class MergeStats(NamedTuple):
+    """合併結果統計"""
+    decks: int
+    slides: int
+    parts: int          # 寫出的 part 數
+    deduplicated: int   # 因內容相同而共用的 part 數
+
+
+def _rels_name(partname: str) -> str:
+    directory, base = posixpath.split(partname)
+    return posixpath.join(directory, "_rels", base + ".rels")
+
+
+def _dump(element) -> bytes:
+    return etree.tostring(element, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _same_size(a, b) -> bool:
+    """sldSz (cx, cy) 是否相同（容許 _SIZE_TOLERANCE 的誤差）"""
+    if a is None or b is None:
+        return a == b
+    return all(abs(int(x) - int(y)) <= _SIZE_TOLERANCE for x, y in zip(a, b))
+
+
+def _slide_title(stream) -> str:
+    """投影片標題（title / ctrTitle 佔位符的文字，沒有時為空字串）；iterparse 逐元素讀取"""
+    ph_path = f"{{{_NS_P}}}nvSpPr/{{{_NS_P}}}nvPr/{{{_NS_P}}}ph"
+    for _, shape in etree.iterparse(stream, tag=f"{{{_NS_P}}}sp"):
+        ph = shape.find(ph_path)
+        if ph is not None and ph.get("type") in ("title", "ctrTitle"):
+            return "".join(t.text or "" for t in shape.iter(f"{{{_NS_A}}}t"))
+        shape.clear()
+    return ""
+
+
+def _app_properties(data: bytes, slides: int, notes: int, titles: List[str]) -> bytes:
+    """
+    更新 docProps/app.xml：Slides / Pages / Notes 與 HeadingPairs / TitlesOfParts 的投影片標題群組
+
+    其他群組（字型、佈景主題）沿用第一份簡報。
+    """
+    props = etree.fromstring(data)
+    for tag, value in (("Slides", slides), ("Pages", slides), ("Notes", notes)):
+        element = props.find(f"{{{_NS_EP}}}{tag}")
+        if element is not None:
+            element.text = str(value)
+    pairs = props.find(f"{{{_NS_EP}}}HeadingPairs/{{{_NS_VT}}}vector")
+    parts = props.find(f"{{{_NS_EP}}}TitlesOfParts/{{{_NS_VT}}}vector")
+    if pairs is None or parts is None:
+        return _dump(props)
+
+    names = [t.text or "" for t in parts]
+    groups, offset = [], 0
+    variants = list(pairs)
+    for name, count in zip(variants[0::2], variants[1::2]):
+        size = int("".join(count.itertext()) or 0)
+        groups.append(("".join(name.itertext()), names[offset:offset + size]))
+        offset += size
+    groups = [(name, titles if name == _SLIDE_TITLES else items) for name, items in groups]
+    if all(name != _SLIDE_TITLES for name, _ in groups):
+        groups.append((_SLIDE_TITLES, titles))
+
+    pairs.clear()
+    pairs.attrib.update({"size": str(2 * len(groups)), "baseType": "variant"})
+    for name, items in groups:
+        etree.SubElement(etree.SubElement(pairs, f"{{{_NS_VT}}}variant"), f"{{{_NS_VT}}}lpstr").text = name
+        etree.SubElement(etree.SubElement(pairs, f"{{{_NS_VT}}}variant"), f"{{{_NS_VT}}}i4").text = str(len(items))
+    parts.clear()
+    parts.attrib.update({"size": str(sum(len(items) for _, items in groups)), "baseType": "lpstr"})
+    for _, items in groups:
+        for item in items:
+            etree.SubElement(parts, f"{{{_NS_VT}}}lpstr").text = item
+    return _dump(props)
+
+
+class _Relationship(NamedTuple):
+    rel_id: str
+    rel_type: str
+    target: str         # 內部關聯為絕對 partname；外部關聯為原字串
+    external: bool
+
+
+class _SourceDeck:
+    """來源套件（唯讀 zip，part 按需讀取）"""
+
+    def __init__(self, source):
+        self.zip = zipfile.ZipFile(source)
+        self.names = set(self.zip.namelist())
+        types = etree.fromstring(self.zip.read(_CONTENT_TYPES))
+        self.defaults = {}
+        self.overrides = {}
+        for entry in types:
+            if entry.tag == f"{{{_NS_CT}}}Default":
+                self.defaults[entry.get("Extension").lower()] = entry.get("ContentType")
+            elif entry.tag == f"{{{_NS_CT}}}Override":
+                self.overrides[entry.get("PartName")] = entry.get("ContentType")
+        self._closure_keys: Dict[str, Tuple[str, Set[str]]] = {}
+
+    def close(self):
+        self.zip.close()
+
+    def has(self, partname: str) -> bool:
+        return partname.lstrip("/") in self.names
+
+    def read(self, partname: str) -> bytes:
+        return self.zip.read(partname.lstrip("/"))
+
+    def open(self, partname: str):
+        return self.zip.open(partname.lstrip("/"))
+
+    def content_type(self, partname: str) -> str:
+        if partname in self.overrides:
+            return self.overrides[partname]
+        ext = posixpath.splitext(partname)[1][1:].lower()
+        return self.defaults.get(ext, "application/octet-stream")
+
+    def rels_blob(self, partname: str) -> Optional[bytes]:
+        name = _rels_name(partname)
+        return self.read(name) if self.has(name) else None
+
+    def relationships(self, partname: str) -> List[_Relationship]:
+        blob = self.rels_blob(partname)
+        if blob is None:
+            return []
+        base = posixpath.dirname(partname)
+        result = []
+        for rel in etree.fromstring(blob):
+            target = rel.get("Target")
+            external = rel.get("TargetMode") == "External"
+            if not external:
+                target = target if target.startswith("/") else posixpath.normpath(posixpath.join(base, target))
+            result.append(_Relationship(rel.get("Id"), rel.get("Type"), target, external))
+        return result
+
+    def digest(self, partname: str) -> str:
+        """part 內容的 SHA-256（分段讀取）"""
+        hasher = hashlib.sha256()
+        with self.open(partname) as stream:
+            for chunk in iter(lambda: stream.read(_COPY_CHUNK), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def closure_key(self, partname: str) -> Tuple[str, Set[str]]:
+        """
+        由 partname 出發、沿內部關聯可達的封閉集合及其雜湊
+
+        母片與其版面配置互相參照，從任一成員出發得到同一個集合與雜湊，結果對每個成員快取。
+        """
+        if partname in self._closure_keys:
+            return self._closure_keys[partname]
+        members, stack = set(), [partname]
+        while stack:
+            current = stack.pop()
+            if current in members or not self.has(current):
+                continue
+            members.add(current)
+            stack.extend(rel.target for rel in self.relationships(current)
+                         if not rel.external and rel.rel_type not in _SKIPPED_RELS)
+        hasher = hashlib.sha256()
+        for member in sorted(members):
+            rels = self.rels_blob(member) or b""
+            hasher.update(f"{member}\0{self.digest(member)}\0{hashlib.sha256(rels).hexdigest()}\n".encode())
+        key = (hasher.hexdigest(), members)
+        for member in members:
+            self._closure_keys[member] = key
+        return key
+
+
+class DeckMerger:
+    """
+    逐份加入簡報，串流寫出合併後的 .pptx
+
+    第一份簡報提供簡報層級的設定（投影片大小、presProps、文件屬性...）。
+    輸出到路徑時先寫入 <path>.tmp，close() 完成後才取代目標檔；
+    with 區塊內發生例外時改呼叫 abort()，不留下合併到一半的簡報。
+
+    Args:
+        path: 輸出 .pptx 路徑（或可寫入的 file-like 物件）
+    """
+
+    def __init__(self, path):
+        if isinstance(path, (str, os.PathLike)):
+            self._path = os.fspath(path)
+            self._tmp = self._path + ".tmp"
+            self._zip = zipfile.ZipFile(self._tmp, "w", zipfile.ZIP_DEFLATED)
+        else:
+            self._path = self._tmp = None
+            self._zip = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+        self._content_types: Dict[str, str] = {}
+        self._used_names: Set[str] = set()
+        self._counters: Dict[Tuple[str, str], int] = {}
+        self._blobs: Dict[Tuple[str, str], str] = {}                 # (content type, 雜湊) → 新 partname
+        self._bundles: Dict[str, Dict[str, str]] = {}                # 整組雜湊 → {原 partname: 新 partname}
+        self._masters: List[str] = []
+        self._master_ids: Dict[str, int] = {}
+        self._notes_master: Optional[str] = None
+        self._handout_master: Optional[str] = None
+        self._next_layout_id = _FIRST_MASTER_ID
+        self._slides: List[str] = []
+        self._titles: List[str] = []
+        self._notes = 0
+        self._first = None      # 第一份簡報的簡報層級資料
+        self._deck_map: Dict[str, str] = {}
+        self.decks = 0
+        self.deduplicated = 0
+        self.stats = MergeStats(0, 0, 0, 0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    # ------------------------------------------------------------------
+    # part 名稱與寫入
+    # ------------------------------------------------------------------
+
+    def _allocate(self, partname: str) -> str:
+        """同目錄、同前綴的新名稱（slide3.xml → slideN.xml；無編號的名稱第一次沿用）"""
+        prefix, digits, ext = _NUMBERED_NAME.match(partname).groups()
+        key = (prefix, ext)
+        while True:
+            number = self._counters.get(key, 0) + 1
+            self._counters[key] = number
+            name = f"{prefix}{ext}" if number == 1 and not digits else f"{prefix}{number}{ext}"
+            if name not in self._used_names:
+                self._used_names.add(name)
+                return name
+
+    def _write(self, partname: str, data: bytes, content_type: str):
+        self._zip.writestr(partname.lstrip("/"), data)
+        self._content_types[partname] = content_type
+
+    def _stream(self, deck: _SourceDeck, source: str, partname: str, content_type: str):
+        """分段複製 part（不整份讀入記憶體）"""
+        with deck.open(source) as reader, self._zip.open(partname.lstrip("/"), "w", force_zip64=True) as writer:
+            shutil.copyfileobj(reader, writer, _COPY_CHUNK)
+        self._content_types[partname] = content_type
+
+    def _write_rels(self, deck: _SourceDeck, source: str, partname: str):
+        """重寫 .rels 的 Target 為新 partname 的相對路徑"""
+        blob = deck.rels_blob(source)
+        if blob is None:
+            return
+        rels = etree.fromstring(blob)
+        base = posixpath.dirname(source)
+        new_base = posixpath.dirname(partname)
+        for rel in list(rels):
+            rel_type = rel.get("Type")
+            if rel_type in _SKIPPED_RELS:
+                rels.remove(rel)
+                continue
+            if rel.get("TargetMode") == "External":
+                continue
+            target = rel.get("Target")
+            target = target if target.startswith("/") else posixpath.normpath(posixpath.join(base, target))
+            new_target = self._copy(deck, target, rel_type)
+            if new_target is not None:
+                rel.set("Target", posixpath.relpath(new_target, new_base))
+        self._zip.writestr(_rels_name(partname).lstrip("/"), _dump(rels))
+
+    # ------------------------------------------------------------------
+    # 複製
+    # ------------------------------------------------------------------
+
+    def _copy(self, deck: _SourceDeck, source: str, rel_type: str) -> Optional[str]:
+        """複製 part（含其關聯），回傳新 partname；來源不存在時回傳 None"""
+        if source in self._deck_map:
+            return self._deck_map[source]
+        if not deck.has(source):
+            return None
+        if rel_type == _REL_NOTES_MASTER and self._notes_master is not None:
+            self._deck_map[source] = self._notes_master
+            return self._notes_master
+
+        content_type = deck.content_type(source)
+        if rel_type in _SHARED_RELS:
+            bundle_key, members = deck.closure_key(source)
+            bundle = self._bundles.get(bundle_key)
+            if bundle is not None:
+                self._deck_map.update(bundle)
+                self.deduplicated += len(members)
+                return bundle[source]
+            partname = self._copy_part(deck, source, rel_type, content_type)
+            if all(member in self._deck_map for member in members):
+                self._bundles[bundle_key] = {member: self._deck_map[member] for member in members}
+            return partname
+
+        if rel_type in _MEDIA_RELS:
+            blob_key = (content_type, deck.digest(source))
+            if blob_key in self._blobs:
+                self.deduplicated += 1
+                self._deck_map[source] = self._blobs[blob_key]
+                return self._blobs[blob_key]
+            partname = self._copy_part(deck, source, rel_type, content_type)
+            self._blobs[blob_key] = partname
+            return partname
+        return self._copy_part(deck, source, rel_type, content_type)
+
+    def _copy_part(self, deck: _SourceDeck, source: str, rel_type: str, content_type: str) -> str:
+        partname = self._allocate(source)
+        self._deck_map[source] = partname     # 先登記，關聯成環時（母片 ↔ 版面配置）直接回傳
+        self._write_rels(deck, source, partname)
+        if rel_type == _REL_SLIDE_MASTER:
+            self._write(partname, self._renumber_layouts(partname, deck.read(source)), content_type)
+            self._masters.append(partname)
+        else:
+            self._stream(deck, source, partname, content_type)
+            if rel_type == _REL_NOTES_MASTER:
+                self._notes_master = partname
+            elif rel_type == _REL_HANDOUT_MASTER:
+                self._handout_master = partname
+        return partname
+
+    def _renumber_layouts(self, partname: str, master_xml: bytes) -> bytes:
+        """sldMasterId 與 sldLayoutId 在整份簡報中必須唯一：母片取一個 id，其版面配置依序接續"""
+        master = etree.fromstring(master_xml)
+        self._master_ids[partname] = self._next_layout_id
+        self._next_layout_id += 1
+        for layout_id in master.iter(f"{{{_NS_P}}}sldLayoutId"):
+            layout_id.set("id", str(self._next_layout_id))
+            self._next_layout_id += 1
+        return _dump(master)
+
+    # ------------------------------------------------------------------
+    # 公開介面
+    # ------------------------------------------------------------------
+
+    def add_deck(self, source) -> int:
+        """
+        加入一份簡報的全部投影片（依原順序）
+
+        Args:
+            source: .pptx 路徑或 file-like 物件
+
+        Returns:
+            int: 加入的投影片數
+        """
+        if self._zip is None:
+            raise RuntimeError("DeckMerger 已關閉")
+        deck = _SourceDeck(source)
+        self._deck_map = {}
+        try:
+            with span("merge:deck", cat="io", deck=str(source)):
+                package_rels = deck.relationships(_PACKAGE)
+                main = next(rel.target for rel in package_rels if rel.rel_type == _REL_OFFICE_DOCUMENT)
+                presentation = etree.fromstring(deck.read(main))
+                pres_rels = {rel.rel_id: rel for rel in deck.relationships(main)}
+                size = presentation.find(f"{{{_NS_P}}}sldSz")
+                size = (size.get("cx"), size.get("cy")) if size is not None else None
+
+                if self._first is None:
+                    self._start(deck, main, presentation, pres_rels, package_rels, size)
+                elif not _same_size(size, self._first["size"]):
+                    raise ValueError(f"投影片大小不一致: {source}（{size} ≠ {self._first['size']}）")
+
+                slide_ids = presentation.find(f"{{{_NS_P}}}sldIdLst")
+                sources = [pres_rels[entry.get(f"{{{_NS_R}}}id")].target
+                           for entry in (slide_ids if slide_ids is not None else [])]
+                # 先配置全部投影片名稱，投影片之間的超連結與備忘稿的反向關聯才能指到新名稱
+                for slide in sources:
+                    self._deck_map[slide] = self._allocate(slide)
+                for slide in sources:
+                    partname = self._deck_map[slide]
+                    self._write_rels(deck, slide, partname)
+                    self._stream(deck, slide, partname, deck.content_type(slide))
+                    self._slides.append(partname)
+                    with deck.open(slide) as stream:
+                        self._titles.append(_slide_title(stream))
+                    if any(rel.rel_type == _REL_NOTES_SLIDE for rel in deck.relationships(slide)):
+                        self._notes += 1
+        finally:
+            deck.close()
+        self.decks += 1
+        return len(sources)
+
+    def _start(self, deck, main, presentation, pres_rels, package_rels, size):
+        """第一份簡報：複製母片與簡報層級的 part，保留 presentation.xml 作為合併結果的基礎"""
+        for rel in pres_rels.values():
+            if rel.rel_type in (_REL_SLIDE_MASTER, _REL_NOTES_MASTER, _REL_HANDOUT_MASTER):
+                self._copy(deck, rel.target, rel.rel_type)
+        kept = {}
+        for rel_id, rel in pres_rels.items():
+            if rel.rel_type in _REBUILT_RELS or rel.rel_type in _SKIPPED_RELS:
+                continue
+            kept[rel_id] = rel if rel.external else rel._replace(target=self._copy(deck, rel.target, rel.rel_type))
+
+        self._used_names.add(main)
+        package = {}
+        for rel in package_rels:
+            if rel.external or rel.rel_type == _REL_OFFICE_DOCUMENT or not deck.has(rel.target):
+                continue
+            self._used_names.add(rel.target)
+            package[rel.target] = (deck.read(rel.target), deck.content_type(rel.target), rel.rel_type)
+        self._first = {
+            "main": main, "presentation": presentation, "rels": kept, "size": size,
+            "main_type": deck.content_type(main), "package_rels": deck.rels_blob(_PACKAGE), "package": package,
+        }
+
+    def _presentation_xml(self) -> Tuple[bytes, bytes]:
+        """重建 sldMasterIdLst / notesMasterIdLst / handoutMasterIdLst / sldIdLst 與簡報關聯"""
+        first = self._first
+        main_dir = posixpath.dirname(first["main"])
+        presentation = first["presentation"]
+        for tag in ("sldMasterIdLst", "notesMasterIdLst", "handoutMasterIdLst", "sldIdLst", "custShowLst"):
+            found = presentation.find(f"{{{_NS_P}}}{tag}")
+            if found is not None:
+                presentation.remove(found)
+        ext_list = presentation.find(f"{{{_NS_P}}}extLst")
+        if ext_list is not None:
+            for ext in list(ext_list):
+                if ext.get("uri") == _SECTION_EXT_URI:
+                    ext_list.remove(ext)
+
+        rels = etree.Element(f"{{{_NS_PKG_REL}}}Relationships", nsmap={None: _NS_PKG_REL})
+        for rel_id, rel in first["rels"].items():
+            attrs = {"Id": rel_id, "Type": rel.rel_type}
+            if rel.external:
+                attrs.update(Target=rel.target, TargetMode="External")
+            else:
+                attrs["Target"] = posixpath.relpath(rel.target, main_dir)
+            etree.SubElement(rels, f"{{{_NS_PKG_REL}}}Relationship", attrs)
+        used = [int(m.group(1)) for rel_id in first["rels"] for m in [re.match(r"rId(\d+)$", rel_id)] if m]
+        next_rid = [max(used, default=0)]
+
+        def relate(rel_type, partname):
+            next_rid[0] += 1
+            rel_id = f"rId{next_rid[0]}"
+            etree.SubElement(rels, f"{{{_NS_PKG_REL}}}Relationship", Id=rel_id, Type=rel_type,
+                             Target=posixpath.relpath(partname, main_dir))
+            return rel_id
+
+        lists = []
+        masters = etree.Element(f"{{{_NS_P}}}sldMasterIdLst")
+        for partname in self._masters:
+            etree.SubElement(masters, f"{{{_NS_P}}}sldMasterId",
+                             {"id": str(self._master_ids[partname]),
+                              f"{{{_NS_R}}}id": relate(_REL_SLIDE_MASTER, partname)})
+        lists.append(masters)
+        for tag, partname, rel_type in (("notesMasterIdLst", self._notes_master, _REL_NOTES_MASTER),
+                                        ("handoutMasterIdLst", self._handout_master, _REL_HANDOUT_MASTER)):
+            if partname is not None:
+                id_list = etree.Element(f"{{{_NS_P}}}{tag}")
+                child = tag[:-3]   # notesMasterId / handoutMasterId
+                etree.SubElement(id_list, f"{{{_NS_P}}}{child}", {f"{{{_NS_R}}}id": relate(rel_type, partname)})
+                lists.append(id_list)
+        if self._slides:
+            slides = etree.Element(f"{{{_NS_P}}}sldIdLst")
+            for offset, partname in enumerate(self._slides):
+                etree.SubElement(slides, f"{{{_NS_P}}}sldId",
+                                 {"id": str(_FIRST_SLIDE_ID + offset), f"{{{_NS_R}}}id": relate(_REL_SLIDE, partname)})
+            lists.append(slides)
+        # 這幾個清單是 presentation 的前幾個子元素（依 schema 順序）
+        for index, element in enumerate(lists):
+            presentation.insert(index, element)
+        return _dump(presentation), _dump(rels)
+
+    def close(self) -> MergeStats:
+        """寫入 presentation.xml、關聯與 content types 並關閉 zip（可重複呼叫）"""
+        if self._zip is None:
+            return self.stats
+        if self._first is not None:
+            first = self._first
+            presentation, rels = self._presentation_xml()
+            self._write(first["main"], presentation, first["main_type"])
+            self._zip.writestr(_rels_name(first["main"]).lstrip("/"), rels)
+            for partname, (data, content_type, rel_type) in first["package"].items():
+                if rel_type == _REL_EXTENDED_PROPS:
+                    data = _app_properties(data, len(self._slides), self._notes, self._titles)
+                self._write(partname, data, content_type)
+            self._zip.writestr(_rels_name(_PACKAGE).lstrip("/"), first["package_rels"])
+            self._zip.writestr(_CONTENT_TYPES, self._content_types_xml())
+        self.stats = MergeStats(self.decks, len(self._slides), len(self._content_types), self.deduplicated)
+        self._zip.close()
+        self._zip = None
+        if self._tmp is not None:
+            os.replace(self._tmp, self._path)
+        return self.stats
+
+    def abort(self):
+        """捨棄合併到一半的輸出：刪除暫存檔，不寫出目標檔（file-like 輸出的內容不完整，由呼叫端丟棄）"""
+        if self._zip is None:
+            return
+        self._zip.close()
+        self._zip = None
+        if self._tmp is not None and os.path.exists(self._tmp):
+            os.remove(self._tmp)
+
+    def _content_types_xml(self) -> bytes:
+        """副檔名一致的 part 用 Default，其餘用 Override"""
+        by_ext: Dict[str, Set[str]] = {}
+        for partname, content_type in self._content_types.items():
+            by_ext.setdefault(posixpath.splitext(partname)[1][1:].lower(), set()).add(content_type)
+        types = etree.Element(f"{{{_NS_CT}}}Types", nsmap={None: _NS_CT})
+        defaults = {"rels": "application/vnd.openxmlformats-package.relationships+xml"}
+        for ext, content_types in sorted(by_ext.items()):
+            if ext and ext != "xml" and len(content_types) == 1:
+                defaults[ext] = next(iter(content_types))
+        defaults.setdefault("xml", "application/xml")
+        for ext, content_type in defaults.items():
+            etree.SubElement(types, f"{{{_NS_CT}}}Default", Extension=ext, ContentType=content_type)
+        for partname, content_type in sorted(self._content_types.items()):
+            ext = posixpath.splitext(partname)[1][1:].lower()
+            if defaults.get(ext) != content_type:
+                etree.SubElement(types, f"{{{_NS_CT}}}Override", PartName=partname, ContentType=content_type)
+        return _dump(types)
+
+
+def merge_decks(sources: Iterable, output) -> MergeStats:
+    """
+    依序合併多份簡報
+
+    Args:
+        sources: .pptx 路徑（或 file-like 物件）列表
+        output: 輸出路徑
+
+    Returns:
+        MergeStats
+    """
+    with DeckMerger(output) as merger:
+        for source in sources:
+            merger.add_deck(source)
+    return merger.stats
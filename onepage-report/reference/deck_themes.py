@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+已產生的簡報 → 多個主題版本（只替換樣式，不重新排版、不重新渲染）
+
+同一份報告要出多種配色 / 品牌時，原本要改 _colors.py 後整份重跑 layout 與渲染。
+版面與形狀座標跟配色無關，所以這裡只渲染一次 final.pptx，再逐個 part 串流複製：
+
+    - 投影片與圖表 part（ppt/slides/slideN.xml、ppt/charts/chartN.xml）
+      以 scene.themes.theme_slide_xml 替換 srgbClr 與 typeface
+    - 其他 part（圖片、母片、版面配置...）以原本的壓縮方式串流複製
+
+來源簡報只讀一次；每多一個主題只多一次 zip 寫出，十個品牌版本的成本接近一次渲染。
+render_from_json（pywin32）、render_pptx（python-pptx）與 OoxmlDeckWriter 輸出的簡報都適用，
+只要配色來自 modules/_colors.py / _colors_pywin32.py 的常數。
+
+使用方式：
+    from deck_themes import theme_deck
+    from scene.themes import load_theme
+
+    themes = [load_theme(p) for p in ("templates/themes/dark.json", "templates/themes/brand.json")]
+    theme_deck("output/final.pptx", {f"output/themes/final_{t.name}.pptx": t for t in themes})
+"""
+
+import re
+import zipfile
+from pathlib import Path
+from typing import Dict, NamedTuple
+
+from scene.themes import DEFAULT_THEME, Theme, style_map, theme_slide_xml
+from tracing import span
+
+# 需要換樣式的 part
+THEMED_PARTS = re.compile(r"^ppt/(?:slides/slide\d+|charts/chart\d+)\.xml$")
+
+
+class ThemedDeck(NamedTuple):
+    """一個主題版本的輸出"""
+    path: str
+    theme: str
+    parts: int      # 換過樣式的 part 數
+
+
+def theme_deck(source: str, outputs: Dict[str, Theme], base: Theme = DEFAULT_THEME) -> list:
+    """
+    將一份簡報輸出成多個主題版本
+
+    Args:
+        source: 以 base 配色渲染的 .pptx
+        outputs: {輸出路徑: Theme}
+        base: 渲染 source 時使用的主題（預設為 _colors.py 的配色）
+
+    Returns:
+        list: ThemedDeck（與 outputs 同順序）
+    """
+    mappings = {path: style_map(theme, base) for path, theme in outputs.items()}
+    results = []
+    with zipfile.ZipFile(source) as src:
+        infos = src.infolist()
+        themed_names = [info.filename for info in infos if THEMED_PARTS.match(info.filename)]
+        with span("themes:read", cat="io", parts=len(themed_names)):
+            xml = {name: src.read(name).decode("utf-8") for name in themed_names}
+
+        for path, theme in outputs.items():
+            mapping = mappings[path]
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            with span("themes:write", cat="io", theme=theme.name):
+                with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as dst:
+                    for info in infos:
+                        if info.filename in xml:
+                            dst.writestr(info, theme_slide_xml(xml[info.filename], mapping).encode("utf-8"),
+                                         zipfile.ZIP_DEFLATED)
+                        else:
+                            _copy_raw(src, dst, info)
+            results.append(ThemedDeck(path, theme.name, len(themed_names)))
+    return results
+
+
+def _copy_raw(src: zipfile.ZipFile, dst: zipfile.ZipFile, info: zipfile.ZipInfo):
+    """原樣複製一個 zip 成員（沿用原本的壓縮方式）"""
+    with src.open(info) as reader, dst.open(_clone_info(info), "w") as writer:
+        while True:
+            block = reader.read(1 << 20)
+            if not block:
+                break
+            writer.write(block)
+
+
+def _clone_info(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    clone = zipfile.ZipInfo(info.filename, info.date_time)
+    clone.compress_type = info.compress_type
+    clone.external_attr = info.external_attr
+    return clone
@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+"""
+圖表 → SVG / PNG（程式化產生）
+
+LAYOUT_ENGINE = svg_png 時，圖表原本由 subagent 逐張手寫 SVG 再用 cairosvg 轉 PNG：
+慢、輸出不穩定，也無法快取。這裡改為由 diagrams_content（與 render_pptx 的
+FIGURE_DISPATCH 相同資料）直接建立 Scene：
+
+    before_after / comparison / flow / platform_compare / timeline / architecture
+        → modules 的 build_* 函數（與 PPTX 版面完全相同）
+    line_chart / bar_chart / pie_chart
+        → scene.charts 的向量圖表
+
+同一份資料永遠產生同一份 SVG。PNG 以內容雜湊為檔名快取（cache_dir/<key>.png），
+只有新的圖表才需要點陣化，並在 process pool 中平行處理。
+
+多個主題（scene.themes）：每張圖表的 Scene 只建立一次，再以 apply_theme 換樣式輸出各主題版本，
+輸出到 output_dir/<主題名稱>/。
+
+點陣化：
+    "auto"     - 有 cairosvg 就用，否則用 Pillow（預設）
+    "pillow"   - scene.raster_backend 直接繪製（不需 cairosvg / GTK runtime）
+    "cairosvg" - 將 SVG 交給 cairosvg（文字排版較精細）
+
+使用方式：
+    from figure_export import FigureJob, export_figures
+
+    jobs = [FigureJob("main_diagram", dc, 864, 300)]
+    for result in export_figures(jobs, "./output", cache_dir=".figure_cache"):
+        print(result.png, result.cached)
+"""
+
+import hashlib
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from fragment_cache import fragment_key, theme_fingerprint
+from modules._colors import COLOR_BLUE, COLOR_GREEN
+from modules.draw_architecture import build_architecture
+from modules.draw_before_after import build_before_after
+from modules.draw_flow import build_flow
+from modules.draw_mini_timeline import build_mini_timeline
+from modules.draw_platform_compare import build_platform_compare
+from scene import Scene, bar_chart, line_chart, pie_chart, save_png, scene_to_svg
+from scene.themes import StyleMap, Theme, apply_theme, style_map
+from tracing import span
+
+# 預設點陣化倍率（每 pt 的像素數）
+DEFAULT_SCALE = 2.0
+
+
+# ---------------------------------------------------------------------------
+# diagrams_content → 繪圖函數參數（render_pptx 共用）
+# ---------------------------------------------------------------------------
+
+def comparison_args(dc: Dict) -> Tuple[str, list, str, list]:
+    """before_after / comparison → (before_title, before_items, after_title, after_items)"""
+    before = dc.get("before", {})
+    after = dc.get("after", {})
+    return (before.get("title", "改善前"), before.get("flow", [])[:6],
+            after.get("title", "改善後"), after.get("flow", [])[:6])
+
+
+def flow_nodes(dc: Dict) -> List[Dict]:
+    """flow 的 stages（字串或 {"title", "nodes"}）攤平成節點列表"""
+    nodes = []
+    for stage in dc.get("stages", []):
+        if isinstance(stage, str):
+            nodes.append({"title": stage})
+            continue
+        if stage.get("title"):
+            nodes.append({"title": stage["title"]})
+        for node in stage.get("nodes", []):
+            if node and node not in ("v", "|"):
+                nodes.append({"title": node})
+    return nodes
+
+
+def platform_args(dc: Dict) -> Tuple[Dict, Dict]:
+    """platform_compare → (platform_a, platform_b)"""
+    platforms = []
+    for key, color in (("platform1", COLOR_BLUE), ("platform2", COLOR_GREEN)):
+        p = dc.get(key, {})
+        platforms.append({
+            "name": p.get("title", ""),
+            "color": color,
+            "flow_nodes": [{"title": n} for n in p.get("nodes", [])],
+        })
+    return platforms[0], platforms[1]
+
+
+def timeline_stages(dc: Dict) -> List[str]:
+    """timeline 的 events → 階段文字"""
+    return [f"{e.get('time', '')} {e.get('name', '')}".strip() for e in dc.get("events", [])]
+
+
+def architecture_layers(dc: Dict) -> List[Dict]:
+    """architecture 的 layers（字串或 dict）→ dict 列表"""
+    return [
+        layer if isinstance(layer, dict) else {"name": str(layer)}
+        for layer in dc.get("layers", [])
+    ]
+
+
+def pie_data(dc: Dict) -> List[Dict]:
+    """pie_chart 的 categories + 第一個 series → [{"name", "value"}]"""
+    values = (dc.get("series") or [{}])[0].get("values", [])
+    return [{"name": c, "value": v} for c, v in zip(dc.get("categories", []), values)]
+
+
+# ---------------------------------------------------------------------------
+# diagrams_content → Scene
+# ---------------------------------------------------------------------------
+
+def _build_comparison(w, h, dc):
+    return build_before_after(Scene(unit="in"), 0, 0, w / 72, h / 72, *comparison_args(dc))
+
+
+def _build_flow(w, h, dc):
+    nodes = flow_nodes(dc)
+    return build_flow(Scene(unit="in"), 0, 0, w / 72, h / 72, nodes) if nodes else None
+
+
+def _build_platform_compare(w, h, dc):
+    return build_platform_compare(Scene(unit="in"), 0, 0, w / 72, h / 72, *platform_args(dc))
+
+
+def _build_timeline(w, h, dc):
+    stages = timeline_stages(dc)
+    return build_mini_timeline(Scene(unit="in"), 0, 0, w / 72, h / 72, stages) if stages else None
+
+
+def _build_architecture(w, h, dc):
+    layers = architecture_layers(dc)
+    return build_architecture(Scene(unit="in"), 0, 0, w / 72, h / 72, layers) if layers else None
+
+
+def _build_line_chart(w, h, dc):
+    return line_chart(0, 0, w, h, dc.get("title", ""), dc.get("categories", []), dc.get("series", []))
+
+
+def _build_bar_chart(w, h, dc):
+    return bar_chart(0, 0, w, h, dc.get("title", ""), dc.get("categories", []), dc.get("series", []))
+
+
+def _build_pie_chart(w, h, dc):
+    return pie_chart(0, 0, w, h, dc.get("title", ""), pie_data(dc))
+
+
+# 圖表類型 → Scene 建構函數（類型同 render_pptx.FIGURE_DISPATCH）
+FIGURE_BUILDERS = {
+    "before_after": _build_comparison,
+    "comparison": _build_comparison,
+    "flow": _build_flow,
+    "platform_compare": _build_platform_compare,
+    "timeline": _build_timeline,
+    "architecture": _build_architecture,
+    "line_chart": _build_line_chart,
+    "bar_chart": _build_bar_chart,
+    "pie_chart": _build_pie_chart,
+}
+
+
+def figure_scene(dc: Dict, width: float, height: float) -> Optional[Scene]:
+    """
+    由 diagrams_content 建立圖表 Scene（原點為左上角）
+
+    Args:
+        dc: diagrams_content 中的一個圖表（含 "type"）
+        width, height: 圖表大小（pt）
+
+    Returns:
+        Scene；類型不支援或資料為空時回傳 None
+    """
+    builder = FIGURE_BUILDERS.get(dc.get("type"))
+    return builder(width, height, dc) if builder else None
+
+
+def figure_svg(dc: Dict, width: float, height: float) -> Optional[str]:
+    """由 diagrams_content 產生 SVG（同一份資料輸出完全相同）"""
+    scene = figure_scene(dc, width, height)
+    return scene_to_svg(scene, width, height) if scene is not None else None
+
+
+# ---------------------------------------------------------------------------
+# 點陣化與快取
+# ---------------------------------------------------------------------------
+
+def _has_cairosvg() -> bool:
+    try:
+        import cairosvg  # noqa: F401
+    except (ImportError, OSError):
+        return False
+    return True
+
+
+def resolve_rasterizer(name: str = "auto") -> str:
+    """解析點陣化方式（"auto" → "cairosvg" 或 "pillow"）"""
+    if name == "auto":
+        return "cairosvg" if _has_cairosvg() else "pillow"
+    if name not in ("pillow", "cairosvg"):
+        raise ValueError(f"不支援的點陣化方式: {name}")
+    return name
+
+
+@lru_cache(maxsize=None)
+def _scene_fingerprint() -> str:
+    """scene/*.py 的版本指紋（圖表與點陣化程式改版後 PNG 快取自動失效）"""
+    h = hashlib.sha1()
+    for path in sorted((Path(__file__).parent / "scene").glob("*.py")):
+        stat = path.stat()
+        h.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return h.hexdigest()[:12]
+
+
+def figure_key(dc: Dict, width: float, height: float, scale: float = DEFAULT_SCALE,
+               rasterizer: str = "pillow", mapping: Optional[StyleMap] = None) -> str:
+    """PNG 快取 key（資料、大小、倍率、點陣化方式、繪圖模組版本與主題配色）"""
+    theme = f"{theme_fingerprint()}:{mapping.fingerprint()}" if mapping else None
+    return fragment_key(f"png:{rasterizer}:{_scene_fingerprint()}:{dc.get('type')}", dc,
+                        (width, height, scale), theme)
+
+
+def rasterize(dc: Dict, width: float, height: float, png_path: str, scale: float = DEFAULT_SCALE,
+              rasterizer: str = "pillow") -> bool:
+    """
+    將一個圖表點陣化為透明背景 PNG（process pool 的工作函數）
+
+    Returns:
+        bool: 是否產生檔案（類型不支援或資料為空時為 False）
+    """
+    return rasterize_variants(dc, width, height, [(png_path, None)], scale, rasterizer)
+
+
+def rasterize_variants(dc: Dict, width: float, height: float, targets: List[Tuple[str, Optional[StyleMap]]],
+                       scale: float = DEFAULT_SCALE, rasterizer: str = "pillow") -> bool:
+    """
+    建立一次圖表 Scene，依各主題換樣式後點陣化（process pool 的工作函數）
+
+    Args:
+        targets: [(png 路徑, StyleMap 或 None = 預設配色), ...]
+
+    Returns:
+        bool: 是否產生檔案（類型不支援或資料為空時為 False）
+    """
+    scene = figure_scene(dc, width, height)
+    if scene is None:
+        return False
+    for png_path, mapping in targets:
+        themed = apply_theme(scene, mapping) if mapping else scene
+        tmp = f"{png_path}.{os.getpid()}.tmp"
+        if rasterizer == "cairosvg":
+            import cairosvg
+            cairosvg.svg2png(bytestring=scene_to_svg(themed, width, height).encode("utf-8"), write_to=tmp,
+                             output_width=round(width * scale), output_height=round(height * scale))
+        else:
+            save_png(themed, tmp, width, height, scale=scale, background=None)
+        os.replace(tmp, png_path)
+    return True
+
+
+class FigureJob(NamedTuple):
+    """一張要輸出的圖表"""
+    name: str          # 輸出檔名（不含副檔名）
+    dc: Dict           # diagrams_content 中的圖表資料
+    width: float       # pt
+    height: float      # pt
+
+
+class FigureResult(NamedTuple):
+    """輸出結果（不支援的圖表 svg / png 為 None）"""
+    name: str
+    svg: Optional[str]
+    png: Optional[str]
+    key: str
+    cached: bool
+    theme: Optional[str] = None    # 主題名稱（None = 預設配色）
+
+
+def export_figures(jobs: Iterable[FigureJob], output_dir: str, scale: float = DEFAULT_SCALE,
+                   cache_dir: Optional[str] = None, workers: Optional[int] = None,
+                   rasterizer: str = "auto", write_svg: bool = True,
+                   themes: Optional[List[Theme]] = None) -> List[FigureResult]:
+    """
+    批次輸出圖表 SVG 與 PNG
+
+    相同內容（資料、大小、倍率、配色相同）的圖表只點陣化一次；快取中已有的直接複製。
+    需要點陣化的圖表超過一張時使用 ProcessPoolExecutor 平行處理；
+    同一張圖表的各主題版本在同一個工作中完成，Scene 只建立一次。
+
+    Args:
+        jobs: FigureJob 列表
+        output_dir: 輸出目錄（<name>.svg / <name>.png）
+        scale: 每 pt 的像素數
+        cache_dir: PNG 快取目錄（None = output_dir/.figure_cache）
+        workers: 平行程序數（None = CPU 數；1 = 不開 process pool）
+        rasterizer: "auto" / "pillow" / "cairosvg"
+        write_svg: 是否同時輸出 SVG
+        themes: 主題列表（None = 預設配色輸出到 output_dir；
+                指定時各主題輸出到 output_dir/<主題名稱>/）
+
+    Returns:
+        list: FigureResult（依 themes 順序，每個主題內與 jobs 同順序）
+    """
+    jobs = list(jobs)
+    rasterizer = resolve_rasterizer(rasterizer)
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    cache = Path(cache_dir) if cache_dir else output / ".figure_cache"
+    cache.mkdir(parents=True, exist_ok=True)
+
+    # (主題名稱, 輸出目錄, StyleMap)
+    variants = [(None, output, None)] if not themes else \
+        [(theme.name, output / theme.name, style_map(theme)) for theme in themes]
+    keys = [[figure_key(job.dc, job.width, job.height, scale, rasterizer, mapping) for job in jobs]
+            for _, _, mapping in variants]
+
+    # 圖表內容 key → (job, [(png 路徑, StyleMap)])：同一張圖的各主題版本一起點陣化
+    pending: Dict[str, Tuple[FigureJob, list]] = {}
+    queued = set()
+    for (_, _, mapping), variant_keys in zip(variants, keys):
+        for job, key in zip(jobs, variant_keys):
+            if key in queued or (cache / f"{key}.png").exists():
+                continue
+            queued.add(key)
+            base_key = figure_key(job.dc, job.width, job.height, scale, rasterizer)
+            pending.setdefault(base_key, (job, []))[1].append((str(cache / f"{key}.png"), mapping))
+
+    produced = {}
+    with span("figures:rasterize", cat="render", count=len(queued), rasterizer=rasterizer):
+        if len(pending) > 1 and workers != 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    base_key: pool.submit(rasterize_variants, job.dc, job.width, job.height, targets,
+                                          scale, rasterizer)
+                    for base_key, (job, targets) in pending.items()
+                }
+                done = {base_key: future.result() for base_key, future in futures.items()}
+        else:
+            done = {
+                base_key: rasterize_variants(job.dc, job.width, job.height, targets, scale, rasterizer)
+                for base_key, (job, targets) in pending.items()
+            }
+        for base_key, (_, targets) in pending.items():
+            for png_path, _ in targets:
+                produced[Path(png_path).stem] = done[base_key]
+
+    results = []
+    scenes = {}
+    for (theme_name, target_dir, mapping), variant_keys in zip(variants, keys):
+        target_dir.mkdir(parents=True, exist_ok=True)
+        for index, (job, key) in enumerate(zip(jobs, variant_keys)):
+            cached_png = cache / f"{key}.png"
+            if not cached_png.exists():
+                results.append(FigureResult(job.name, None, None, key, False, theme_name))
+                continue
+            png_path = target_dir / f"{job.name}.png"
+            shutil.copyfile(cached_png, png_path)
+            svg_path = None
+            if write_svg:
+                if index not in scenes:
+                    scenes[index] = figure_scene(job.dc, job.width, job.height)
+                scene = apply_theme(scenes[index], mapping) if mapping else scenes[index]
+                svg_path = target_dir / f"{job.name}.svg"
+                svg_path.write_text(scene_to_svg(scene, job.width, job.height), encoding="utf-8")
+            results.append(FigureResult(job.name, str(svg_path) if svg_path else None, str(png_path),
+                                        key, not produced.get(key, False), theme_name))
+    return results
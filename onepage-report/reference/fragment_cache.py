@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""
+圖表片段快取（figure fragment cache）
+
+同一份報告的多個版本（地區版、語系版）常有完全相同的圖表：同一個術語迷你圖示、
+同一組架構分層、同一張前後對比圖。每次都逐一建立形狀很浪費。
+
+這裡把繪圖函數在 slide 上新增的形狀 XML 存成片段，key 為
+(圖表類型, 資料, 方框大小, 主題) 的雜湊；命中時直接把片段複製到新投影片
+（重新編號 shape id、平移到新位置），不再執行繪圖函數。
+
+兩層 LRU：
+    記憶體  - OrderedDict，上限 max_entries 筆
+    磁碟    - disk_dir/<key>.xml，上限 max_disk_bytes（依最近使用時間淘汰），可跨程序共用
+
+含外部關聯（r:id / r:embed，例如原生圖表、圖片）的片段無法只靠 XML 複製，
+不會被快取，之後同一個 key 直接執行繪圖函數。
+
+使用方式：
+    from fragment_cache import FragmentCache
+
+    cache = FragmentCache(disk_dir=".fragment_cache")
+    renderer = PptxLayoutRenderer(fragment_cache=cache)
+    ...
+    print(cache.stats())
+"""
+
+import copy
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from lxml import etree
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+
+from tracing import span
+
+# 片段格式版本（格式變更時遞增，讓舊的磁碟快取失效）
+FORMAT_VERSION = 1
+
+EMU_PER_PT = 12700
+
+_MODULES_DIR = Path(__file__).parent / "modules"
+_WRAPPER_OPEN = f"<p:spTree {nsdecls('p', 'a', 'r')}>".encode("utf-8")
+_WRAPPER_CLOSE = b"</p:spTree>"
+_R_ATTRS = ("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id",
+            "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed",
+            "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}link")
+_SHAPE_TAGS = frozenset(qn(tag) for tag in ("p:sp", "p:cxnSp", "p:grpSp", "p:graphicFrame", "p:pic"))
+
+# 不可快取的 key（片段含外部關聯）
+_UNCACHEABLE = b""
+
+_code_fingerprint_value = None
+
+
+def code_fingerprint() -> str:
+    """
+    繪圖模組的版本指紋（modules/*.py 的名稱、大小、修改時間）
+
+    繪圖函數改版後磁碟快取自動失效。
+    """
+    global _code_fingerprint_value
+    if _code_fingerprint_value is None:
+        h = hashlib.sha1(str(FORMAT_VERSION).encode())
+        for path in sorted(_MODULES_DIR.glob("*.py")):
+            stat = path.stat()
+            h.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        _code_fingerprint_value = h.hexdigest()[:12]
+    return _code_fingerprint_value
+
+
+def theme_fingerprint() -> str:
+    """目前色彩 / 字體常數（modules._colors）的指紋"""
+    from modules import _colors
+    values = {name: str(getattr(_colors, name)) for name in dir(_colors) if name.isupper()}
+    return hashlib.sha1(json.dumps(values, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def fragment_key(fig_type: str, data, size: Tuple[float, float], theme: Optional[str] = None) -> str:
+    """
+    計算片段 key
+
+    Args:
+        fig_type: 圖表類型（例如 "architecture"、"mini_icon"）
+        data: 圖表資料（可 JSON 序列化；其他物件以 str() 表示）
+        size: 方框大小 (w, h)，單位不限，只要一致
+        theme: 主題識別（None = theme_fingerprint()）
+
+    Returns:
+        str: 40 字元 hex
+    """
+    payload = json.dumps(
+        [code_fingerprint(), fig_type, data, [round(v, 2) for v in size],
+         theme if theme is not None else theme_fingerprint()],
+        sort_keys=True, ensure_ascii=False, default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _offset_of(element):
+    """頂層形狀的 a:off（群組為 grpSpPr 內的 xfrm，在子形狀之前）"""
+    return element.find(".//" + qn("a:off"))
+
+
+def _has_relationships(element) -> bool:
+    for node in element.iter():
+        for attr in _R_ATTRS:
+            if attr in node.attrib:
+                return True
+    return False
+
+
+class FragmentCache:
+    """
+    記憶體 + 磁碟兩層 LRU 的圖表片段快取
+
+    Args:
+        max_entries: 記憶體層最多保留的片段數
+        disk_dir: 磁碟層目錄（None = 只用記憶體）
+        max_disk_bytes: 磁碟層容量上限
+    """
+
+    def __init__(self, max_entries: int = 256, disk_dir: Optional[str] = None,
+                 max_disk_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._disk_dir = Path(disk_dir) if disk_dir else None
+        self._disk_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        if self._disk_dir is not None:
+            self._disk_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(p.stat().st_size for p in self._disk_dir.glob("*.xml"))
+
+    # ------------------------------------------------------------------
+    # 儲存層
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[bytes]:
+        """取出片段（記憶體 → 磁碟），不存在回傳 None"""
+        blob = self._memory.get(key)
+        if blob is not None:
+            self._memory.move_to_end(key)
+            return blob
+        if self._disk_dir is None:
+            return None
+        path = self._disk_dir / f"{key}.xml"
+        try:
+            blob = path.read_bytes()
+            os.utime(path)  # 更新最近使用時間
+        except OSError:
+            return None
+        self.disk_hits += 1
+        self._remember(key, blob)
+        return blob
+
+    def put(self, key: str, blob: bytes):
+        """存入片段（記憶體與磁碟）"""
+        self._remember(key, blob)
+        if self._disk_dir is None or not blob:
+            return
+        path = self._disk_dir / f"{key}.xml"
+        try:
+            replaced = path.stat().st_size  # 覆寫既有片段時扣掉舊檔大小
+        except OSError:
+            replaced = 0
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(blob)
+        os.replace(tmp, path)
+        self._disk_bytes += len(blob) - replaced
+        if self._disk_bytes > self.max_disk_bytes:
+            self._evict_disk()
+
+    def _remember(self, key: str, blob: bytes):
+        self._memory[key] = blob
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        """依最近使用時間淘汰磁碟片段，直到低於容量上限的 90%"""
+        entries = []
+        for path in self._disk_dir.glob("*.xml"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        target = self.max_disk_bytes * 0.9
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._disk_bytes = total
+
+    def clear(self):
+        """清空兩層快取"""
+        self._memory.clear()
+        if self._disk_dir is not None:
+            for path in self._disk_dir.glob("*.xml"):
+                path.unlink()
+            self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """命中統計"""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "uncacheable": self.uncacheable,
+            "memory_entries": len(self._memory),
+            "disk_bytes": self._disk_bytes,
+        }
+
+    # ------------------------------------------------------------------
+    # 擷取 / 複製
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def capture(slide, existing, origin_emu: Tuple[int, int]) -> bytes:
+        """
+        將 spTree 中不在 existing 內的（新增的）形狀序列化為片段（座標改為相對 origin）
+
+        Returns:
+            bytes: 片段 XML；含外部關聯時回傳空 bytes（不可快取）
+        """
+        tree = slide.shapes._spTree
+        ox, oy = origin_emu
+        parts = [_WRAPPER_OPEN]
+        for element in tree:
+            if element.tag not in _SHAPE_TAGS or element in existing:
+                continue
+            if _has_relationships(element):
+                return _UNCACHEABLE
+            element = copy.deepcopy(element)
+            off = _offset_of(element)
+            if off is not None:
+                off.set("x", str(int(off.get("x")) - ox))
+                off.set("y", str(int(off.get("y")) - oy))
+            parts.append(etree.tostring(element))
+        parts.append(_WRAPPER_CLOSE)
+        return b"".join(parts)
+
+    @staticmethod
+    def paste(slide, blob: bytes, origin_emu: Tuple[int, int]) -> int:
+        """
+        將片段複製到 slide（重新編號 shape id、平移到 origin）
+
+        Returns:
+            int: 新增的頂層形狀數
+        """
+        shapes = slide.shapes
+        tree = shapes._spTree
+        next_id = shapes._next_shape_id
+        ox, oy = origin_emu
+        fragment = parse_xml(blob)
+        id_map = {}
+        for c_nv_pr in fragment.iter(qn("p:cNvPr")):
+            id_map[c_nv_pr.get("id")] = str(next_id)
+            c_nv_pr.set("id", str(next_id))
+            next_id += 1
+        for tag in ("a:stCxn", "a:endCxn"):
+            for cxn in fragment.iter(qn(tag)):
+                cxn.set("id", id_map.get(cxn.get("id"), cxn.get("id")))
+        count = 0
+        for element in list(fragment):
+            off = _offset_of(element)
+            if off is not None:
+                off.set("x", str(int(off.get("x")) + ox))
+                off.set("y", str(int(off.get("y")) + oy))
+            tree.insert_element_before(element, "p:extLst")
+            count += 1
+        return count
+
+    def render(self, slide, key: str, box_pt: Tuple[float, float], draw: Callable[[], object]) -> bool:
+        """
+        以快取繪製一個圖表
+
+        Args:
+            slide: python-pptx Slide
+            key: fragment_key() 的結果
+            box_pt: 方框左上角 (x, y)（pt），片段以此為原點
+            draw: 未命中時呼叫的繪圖函數（無參數）
+
+        Returns:
+            bool: 是否命中快取
+        """
+        origin = (int(box_pt[0] * EMU_PER_PT), int(box_pt[1] * EMU_PER_PT))
+        blob = self.get(key)
+        if blob:
+            with span("fragment_cache:hit", cat="render"):
+                self.paste(slide, blob, origin)
+            self.hits += 1
+            return True
+
+        draw_only = blob is not None  # 已知不可快取
+        existing = set(slide.shapes._spTree)
+        draw()
+        if draw_only:
+            self.uncacheable += 1
+            return False
+        self.misses += 1
+        fragment = self.capture(slide, existing, origin)
+        if not fragment:
+            self.uncacheable += 1
+        self.put(key, fragment)
+        return False
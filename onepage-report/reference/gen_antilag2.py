@@ -8,6 +8,9 @@ from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 
+from modules._textstyles import text_style, set_paragraph_text
+from modules._textstyles import set_cell_text as _set_styled_cell_text
+
 # 顏色定義
 BG_COLOR = RGBColor(255, 249, 230)
 WHITE = RGBColor(255, 255, 255)
@@ -17,12 +20,7 @@ ACCENT_ORANGE = RGBColor(230, 126, 34)
 ACCENT_GREEN = RGBColor(39, 174, 96)
 
 def set_cell_text(cell, text, font_size=10, bold=True, color=DARK_GRAY):
-    cell.text = text
-    for paragraph in cell.text_frame.paragraphs:
-        paragraph.font.size = Pt(font_size)
-        paragraph.font.bold = bold
-        paragraph.font.color.rgb = color
-        paragraph.font.name = "Microsoft JhengHei"
+    _set_styled_cell_text(cell, text, text_style("table_cell", size=font_size, bold=bold, color=color))
 
 def add_content_box(slide, left, top, width, height, title, content_lines, title_color=ACCENT_BLUE):
     shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height)
@@ -35,11 +33,7 @@ def add_content_box(slide, left, top, width, height, title, content_lines, title
     tf = title_box.text_frame
     tf.word_wrap = True
     p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(12)
-    p.font.bold = True
-    p.font.color.rgb = title_color
-    p.font.name = "Microsoft JhengHei"
+    set_paragraph_text(p, title, text_style("section_title", color=title_color))
 
     content_box = slide.shapes.add_textbox(left + Inches(0.08), top + Inches(0.28), width - Inches(0.16), height - Inches(0.32))
     tf = content_box.text_frame
@@ -49,11 +43,7 @@ def add_content_box(slide, left, top, width, height, title, content_lines, title
             p = tf.paragraphs[0]
         else:
             p = tf.add_paragraph()
-        p.text = line
-        p.font.size = Pt(10)
-        p.font.bold = True
-        p.font.color.rgb = DARK_GRAY
-        p.font.name = "Microsoft JhengHei"
+        set_paragraph_text(p, line, "body_bold")
         p.space_after = Pt(1)
 
 def create_pptx():
@@ -73,20 +63,12 @@ def create_pptx():
     title_box = slide.shapes.add_textbox(Inches(0.25), Inches(0.1), Inches(10), Inches(0.5))
     tf = title_box.text_frame
     p = tf.paragraphs[0]
-    p.text = "MTK Anti-Lag SDK - 輸入-顯示延遲優化方案"
-    p.font.size = Pt(26)
-    p.font.bold = True
-    p.font.color.rgb = DARK_GRAY
-    p.font.name = "Microsoft JhengHei"
+    set_paragraph_text(p, "MTK Anti-Lag SDK - 輸入-顯示延遲優化方案", "title")
 
     subtitle_box = slide.shapes.add_textbox(Inches(0.25), Inches(0.5), Inches(12), Inches(0.3))
     tf = subtitle_box.text_frame
     p = tf.paragraphs[0]
-    p.text = "靈感來源：AMD Radeon Anti-Lag 2 SDK | 目標：透過 SDK 實現引擎與 SoC 的深度節奏同步"
-    p.font.size = Pt(11)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(100, 100, 100)
-    p.font.name = "Microsoft JhengHei"
+    set_paragraph_text(p, "靈感來源：AMD Radeon Anti-Lag 2 SDK | 目標：透過 SDK 實現引擎與 SoC 的深度節奏同步", "subtitle")
 
     # ===== 左上：PC Anti-Lag 2 成功要素 =====
     add_content_box(
@@ -148,11 +130,7 @@ def create_pptx():
     table_title = slide.shapes.add_textbox(Inches(0.25), Inches(3.0), Inches(6), Inches(0.3))
     tf = table_title.text_frame
     p = tf.paragraphs[0]
-    p.text = "PC vs Mobile 延遲治理對照"
-    p.font.size = Pt(12)
-    p.font.bold = True
-    p.font.color.rgb = ACCENT_BLUE
-    p.font.name = "Microsoft JhengHei"
+    set_paragraph_text(p, "PC vs Mobile 延遲治理對照", text_style("section_title", color=ACCENT_BLUE))
 
     table = slide.shapes.add_table(4, 3, Inches(0.25), Inches(3.28), Inches(6.5), Inches(1.25)).table
     table.columns[0].width = Inches(1.5)
@@ -8,6 +8,9 @@ from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 
+from modules._textstyles import text_style, set_paragraph_text
+from modules._textstyles import set_cell_text as _set_styled_cell_text
+
 # 顏色定義
 BG_COLOR = RGBColor(255, 249, 230)
 WHITE = RGBColor(255, 255, 255)
@@ -18,12 +21,7 @@ ACCENT_GREEN = RGBColor(39, 174, 96)
 ACCENT_PURPLE = RGBColor(142, 68, 173)
 
 def set_cell_text(cell, text, font_size=10, bold=True, color=DARK_GRAY):
-    cell.text = text
-    for paragraph in cell.text_frame.paragraphs:
-        paragraph.font.size = Pt(font_size)
-        paragraph.font.bold = bold
-        paragraph.font.color.rgb = color
-        paragraph.font.name = "Microsoft JhengHei"
+    _set_styled_cell_text(cell, text, text_style("table_cell", size=font_size, bold=bold, color=color))
 
 def add_content_box(slide, left, top, width, height, title, content_lines, title_color=ACCENT_BLUE):
     shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height)
@@ -36,11 +34,7 @@ def add_content_box(slide, left, top, width, height, title, content_lines, title
     tf = title_box.text_frame
     tf.word_wrap = True
     p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(12)
-    p.font.bold = True
-    p.font.color.rgb = title_color
-    p.font.name = "Microsoft JhengHei"
+    set_paragraph_text(p, title, text_style("section_title", color=title_color))
 
     content_box = slide.shapes.add_textbox(left + Inches(0.08), top + Inches(0.28), width - Inches(0.16), height - Inches(0.32))
     tf = content_box.text_frame
@@ -50,11 +44,7 @@ def add_content_box(slide, left, top, width, height, title, content_lines, title
             p = tf.paragraphs[0]
         else:
             p = tf.add_paragraph()
-        p.text = line
-        p.font.size = Pt(10)
-        p.font.bold = True
-        p.font.color.rgb = DARK_GRAY
-        p.font.name = "Microsoft JhengHei"
+        set_paragraph_text(p, line, "body_bold")
         p.space_after = Pt(1)
 
 def create_pptx():
@@ -74,20 +64,12 @@ def create_pptx():
     title_box = slide.shapes.add_textbox(Inches(0.25), Inches(0.1), Inches(10), Inches(0.5))
     tf = title_box.text_frame
     p = tf.paragraphs[0]
-    p.text = "Cache Aware Scheduling - 解決掉幀問題"
-    p.font.size = Pt(26)
-    p.font.bold = True
-    p.font.color.rgb = DARK_GRAY
-    p.font.name = "Microsoft JhengHei"
+    set_paragraph_text(p, "Cache Aware Scheduling - 解決掉幀問題", "title")
 
     subtitle_box = slide.shapes.add_textbox(Inches(0.25), Inches(0.5), Inches(12), Inches(0.3))
     tf = subtitle_box.text_frame
     p = tf.paragraphs[0]
-    p.text = "靈感來源：Linux sched_cache (Intel/AMD) | 目標：降低跨 cluster 遷移，改善效能穩定度與功耗"
-    p.font.size = Pt(11)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(100, 100, 100)
-    p.font.name = "Microsoft JhengHei"
+    set_paragraph_text(p, "靈感來源：Linux sched_cache (Intel/AMD) | 目標：降低跨 cluster 遷移，改善效能穩定度與功耗", "subtitle")
 
     # ===== 左上：PC sched_cache 成功要素 =====
     add_content_box(
@@ -146,11 +128,7 @@ def create_pptx():
     table_title = slide.shapes.add_textbox(Inches(0.25), Inches(2.95), Inches(6), Inches(0.3))
     tf = table_title.text_frame
     p = tf.paragraphs[0]
-    p.text = "PC vs Mobile 結構相似性對照"
-    p.font.size = Pt(12)
-    p.font.bold = True
-    p.font.color.rgb = ACCENT_BLUE
-    p.font.name = "Microsoft JhengHei"
+    set_paragraph_text(p, "PC vs Mobile 結構相似性對照", text_style("section_title", color=ACCENT_BLUE))
 
     table = slide.shapes.add_table(3, 3, Inches(0.25), Inches(3.2), Inches(6.5), Inches(1.0)).table
     table.columns[0].width = Inches(1.3)
@@ -178,11 +156,7 @@ def create_pptx():
     note_box = slide.shapes.add_textbox(Inches(0.25), Inches(4.25), Inches(6.5), Inches(0.4))
     tf = note_box.text_frame
     p = tf.paragraphs[0]
-    p.text = "Dimensity 非與 Genoa 等價，但在「跨 domain 遷移有實質成本」上具可比性，且手機 L2 邊界更早、容量更小、對 IPC 更敏感"
-    p.font.size = Pt(9)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(100, 100, 100)
-    p.font.name = "Microsoft JhengHei"
+    set_paragraph_text(p, "Dimensity 非與 Genoa 等價，但在「跨 domain 遷移有實質成本」上具可比性，且手機 L2 邊界更早、容量更小、對 IPC 更敏感", "caption")
 
     # ===== 右中：MAGT 整合 =====
     add_content_box(
@@ -8,6 +8,9 @@ from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 
+from modules._textstyles import text_style, set_paragraph_text
+from modules._textstyles import set_cell_text as _set_styled_cell_text
+
 # 顏色定義
 BG_COLOR = RGBColor(255, 249, 230)
 WHITE = RGBColor(255, 255, 255)
@@ -28,11 +31,7 @@ def add_content_box(slide, left, top, width, height, title, content_lines, title
     tf = title_box.text_frame
     tf.word_wrap = True
     p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(12)
-    p.font.bold = True
-    p.font.color.rgb = title_color
-    p.font.name = "Microsoft JhengHei"
+    set_paragraph_text(p, title, text_style("section_title", color=title_color))
 
     content_box = slide.shapes.add_textbox(left + Inches(0.08), top + Inches(0.28), width - Inches(0.16), height - Inches(0.32))
     tf = content_box.text_frame
@@ -42,11 +41,7 @@ def add_content_box(slide, left, top, width, height, title, content_lines, title
             p = tf.paragraphs[0]
         else:
             p = tf.add_paragraph()
-        p.text = line
-        p.font.size = Pt(10)
-        p.font.bold = True
-        p.font.color.rgb = DARK_GRAY
-        p.font.name = "Microsoft JhengHei"
+        set_paragraph_text(p, line, "body_bold")
         p.space_after = Pt(1)
 
 def create_pptx():
@@ -66,20 +61,12 @@ def create_pptx():
     title_box = slide.shapes.add_textbox(Inches(0.25), Inches(0.1), Inches(10), Inches(0.5))
     tf = title_box.text_frame
     p = tf.paragraphs[0]
-    p.text = "Workload Prediction - 降低功耗與提升 1% Low"
-    p.font.size = Pt(26)
-    p.font.bold = True
-    p.font.color.rgb = DARK_GRAY
-    p.font.name = "Microsoft JhengHei"
+    set_paragraph_text(p, "Workload Prediction - 降低功耗與提升 1% Low", "title")
 
     subtitle_box = slide.shapes.add_textbox(Inches(0.25), Inches(0.5), Inches(12), Inches(0.3))
     tf = subtitle_box.text_frame
     p = tf.paragraphs[0]
-    p.text = "目標：從引擎底層取得每幀算力提示，實現精準控頻且不掉幀"
-    p.font.size = Pt(11)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(100, 100, 100)
-    p.font.name = "Microsoft JhengHei"
+    set_paragraph_text(p, "目標：從引擎底層取得每幀算力提示，實現精準控頻且不掉幀", "subtitle")
 
     # ===== 左上：歷史問題 =====
     add_content_box(
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+全份簡報的術語自動超連結
+
+pptx_reference.parse_text_with_terms 只處理作者手動標記的 [[術語]]。這裡改成產生簡報後
+再跑一次連結：
+
+    1. 由 glossary.md（或術語列表）建立 Aho–Corasick 比對器（TermMatcher），
+       一次掃描即可找出所有術語，不隨術語數量變慢
+    2. 逐一走訪每張投影片的文字 run（含群組與表格），術語所在的 run 切成
+       前段 / 術語 / 後段，術語 run 加上投影片跳轉超連結（藍色底線）
+    3. 每組（來源投影片, 目標投影片）只建立一個關聯，同頁的多個連結共用 rId
+
+英數術語比對不分大小寫，且要求前後不是英數字（FPS 不會連到 FPSGO 裡）；
+重疊時取最左、最長的術語。跨 run 的術語不連結；已有超連結的 run 不動。
+
+使用方式：
+    from glossary_links import parse_glossary, find_term_slides, link_glossary_terms
+
+    terms = [t["term"] for t in parse_glossary(Path("glossary.md").read_text(encoding="utf-8"))]
+    stats = link_glossary_terms(prs, find_term_slides(prs, terms))
+"""
+
+import copy
+import re
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from lxml import etree
+from pptx.dml.color import RGBColor
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+from pptx.text.text import Font
+
+# 術語超連結樣式（與 pptx_reference.TERM_LINK_COLOR 相同）
+TERM_LINK_COLOR = RGBColor(0, 102, 204)
+
+_SLIDE_JUMP = "ppaction://hlinksldjump"
+_TAG_R = qn("a:r")
+_TAG_T = qn("a:t")
+_TAG_P = qn("a:p")
+_TAG_RPR = qn("a:rPr")
+_TAG_HLINK = qn("a:hlinkClick")
+
+_CORE_HEADING = re.compile(r"^####\s*G\d+\s*[:：]\s*(.+?)\s*$")
+_FIELD = re.compile(r"^-\s*\*\*(.+?)\*\*\s*[:：]\s*(.*)$")
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isascii() and (char.isalnum() or char == "_")
+
+
+def _fold(text: str) -> str:
+    """轉小寫且長度不變（少數字元小寫後長度改變，保留原字元），比對位置才能對回原文"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+# ----------------------------------------------------------------------
+# glossary.md 解析
+# ----------------------------------------------------------------------
+
+def parse_glossary(markdown: str) -> List[Dict]:
+    """
+    解析 glossary.md（templates/glossary-format.md 格式）
+
+    核心術語取 `#### G1: 名稱` 與其「白話解釋」；次要術語取表格的「術語 | 類別 | 簡短解釋」。
+
+    Args:
+        markdown: glossary.md 內容
+
+    Returns:
+        list: [{"term", "category", "desc"}]（依出現順序，重複名稱只取第一個）
+    """
+    terms, seen = [], set()
+    current = None
+    for raw in markdown.splitlines():
+        line = raw.strip()
+        heading = _CORE_HEADING.match(line)
+        if heading:
+            current = {"term": heading.group(1), "category": "", "desc": ""}
+            if current["term"].lower() not in seen:
+                seen.add(current["term"].lower())
+                terms.append(current)
+            continue
+        if line.startswith("#"):
+            current = None
+            continue
+        field = _FIELD.match(line)
+        if field and current is not None:
+            name, value = field.group(1), field.group(2).strip()
+            if "類別" in name:
+                current["category"] = value
+            elif ("白話" in name or "解釋" in name) and not current["desc"]:
+                current["desc"] = value
+            continue
+        if line.startswith("|") and current is None:
+            cells = [cell.strip() for cell in line.strip("|").split("|")]
+            if not cells[0] or set(cells[0]) <= set("-: ") or cells[0] in ("術語", "Term"):
+                continue
+            term = cells[0].strip("*` ")
+            if term and term.lower() not in seen:
+                seen.add(term.lower())
+                terms.append({"term": term, "category": cells[1] if len(cells) > 1 else "",
+                              "desc": cells[2] if len(cells) > 2 else ""})
+    return terms
+
+
+# ----------------------------------------------------------------------
+# 比對器
+# ----------------------------------------------------------------------
+
+class TermMatcher:
+    """
+    多術語比對器（Aho–Corasick）
+
+    建構時把所有術語（轉小寫）放進 trie 並建立失敗連結；find() 對文字只掃描一次，
+    時間與文字長度加上命中數成正比，與術語數量無關。
+
+    Args:
+        terms: 術語列表（空字串忽略；大小寫不同視為同一術語，保留第一個）
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]      # 在此節點結束的術語索引
+        seen = set()
+        for term in terms:
+            key = _fold(term.strip())
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            self._insert(key, len(self.terms))
+            self.terms.append(term.strip())
+        self._build()
+        self._lengths = [len(term) for term in self.terms]
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def _insert(self, key: str, index: int):
+        node = 0
+        for char in key:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][char] = child
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = child
+        self._out[node].append(index)
+
+    def _build(self):
+        """廣度優先建立失敗連結，並把失敗節點的輸出併入（後綴也是術語時一併回報）"""
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find_all(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """所有命中（可重疊）：(起點, 終點, 術語索引)，已套用英數字邊界規則"""
+        folded = _fold(text)
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        node = 0
+        for end, char in enumerate(folded, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for index in out[node]:
+                start = end - lengths[index]
+                if _is_word_char(text[start]) and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if _is_word_char(text[end - 1]) and end < len(text) and _is_word_char(text[end]):
+                    continue
+                yield start, end, index
+
+    def find(self, text: str) -> List[Tuple[int, int, int]]:
+        """不重疊的命中（最左優先，同起點取最長）：[(起點, 終點, 術語索引)]"""
+        matches = sorted(self.find_all(text), key=lambda m: (m[0], -m[1]))
+        result, cursor = [], 0
+        for start, end, index in matches:
+            if start >= cursor:
+                result.append((start, end, index))
+                cursor = end
+        return result
+
+
+# ----------------------------------------------------------------------
+# 目標投影片
+# ----------------------------------------------------------------------
+
+def glossary_targets(terms: Sequence[str], first_slide: int, per_page: int = 16) -> Dict[str, int]:
+    """
+    術語 → 術語頁索引（依 draw_glossary_page_* 的分頁方式：每頁 per_page 個，依序排列）
+
+    Args:
+        terms: 術語（與術語頁的順序相同）
+        first_slide: 第一張術語頁的索引（0-based）
+        per_page: 每頁術語數（純文字版 16、有圖版 6）
+
+    Returns:
+        dict: {術語: 投影片索引}
+    """
+    return {term: first_slide + i // per_page for i, term in enumerate(terms)}
+
+
+def _paragraph_text(p) -> str:
+    return "".join(t.text or "" for t in p.iter(_TAG_T))
+
+
+def find_term_slides(prs, terms: Sequence[str]) -> Dict[str, int]:
+    """
+    由簡報內容找出每個術語的說明頁：術語單獨成一個段落（術語卡片標題）的最後一張投影片
+
+    附錄在簡報最後，取最後一次出現可避開正文表格中剛好只有術語的儲存格。
+
+    Returns:
+        dict: {術語: 投影片索引}（找不到的術語不列入）
+    """
+    wanted = {_fold(term.strip()): term for term in terms if term.strip()}
+    targets = {}
+    for index, slide in enumerate(prs.slides):
+        for p in slide.shapes._spTree.iter(_TAG_P):
+            term = wanted.get(_fold(_paragraph_text(p).strip()))
+            if term is not None:
+                targets[term] = index
+    return targets
+
+
+# ----------------------------------------------------------------------
+# 連結
+# ----------------------------------------------------------------------
+
+class LinkStats(NamedTuple):
+    """連結結果統計"""
+    links: int           # 新增的超連結數
+    runs: int            # 掃描的 run 數
+    relationships: int   # 使用的（來源投影片, 目標投影片）關聯數
+
+
+def _style_link(r, rel_id: str, color: Optional[RGBColor]):
+    """術語 run：超連結 + 藍色底線"""
+    rpr = r.get_or_add_rPr()
+    font = Font(rpr)
+    if color is not None:
+        font.color.rgb = color
+    font.underline = True
+    rpr.add_hlinkClick(rel_id).set("action", _SLIDE_JUMP)
+
+
+def _split_run(r, text: str, pieces: List[Tuple[int, int, Optional[str]]], color, styled: Dict) -> int:
+    """
+    依命中切開 run：pieces 為 [(起點, 終點, rId 或 None)]，回傳新增的連結數
+
+    連結 run 的 rPr 依（原 rPr, rId）只建一次（styled 快取），之後直接複製。
+    """
+    links = 0
+    anchor = r
+    rpr = r.find(_TAG_RPR)
+    rpr_key = etree.tostring(rpr) if rpr is not None else b""
+    for start, end, rel_id in pieces:
+        piece = copy.deepcopy(r)
+        piece.find(_TAG_T).text = text[start:end]
+        if rel_id is not None:
+            key = (rpr_key, rel_id)
+            if key not in styled:
+                _style_link(piece, rel_id, color)
+                styled[key] = piece.find(_TAG_RPR)
+            else:
+                linked = copy.deepcopy(styled[key])
+                old = piece.find(_TAG_RPR)
+                if old is not None:
+                    piece.replace(old, linked)
+                else:
+                    piece.insert(0, linked)
+            links += 1
+        anchor.addnext(piece)
+        anchor = piece
+    r.getparent().remove(r)
+    return links
+
+
+def link_glossary_terms(prs, targets: Dict[str, int], skip_slides: Optional[Iterable[int]] = None,
+                        color: Optional[RGBColor] = TERM_LINK_COLOR) -> LinkStats:
+    """
+    為整份簡報的術語加上跳到說明頁的超連結
+
+    Args:
+        prs: python-pptx Presentation
+        targets: {術語: 目標投影片索引（0-based）}，例如 find_term_slides 的結果
+        skip_slides: 不處理的投影片索引（預設為所有目標頁，術語頁本身不連結）
+        color: 術語文字顏色（None = 保留原色，只加底線）
+
+    Returns:
+        LinkStats
+    """
+    matcher = TermMatcher(targets)
+    target_index = {_fold(term.strip()): index for term, index in targets.items()}
+    term_targets = [target_index[_fold(term)] for term in matcher.terms]
+    slide_parts = [slide.part for slide in prs.slides]
+    skip = set(targets.values()) if skip_slides is None else set(skip_slides)
+    links = runs = relationships = 0
+
+    for index, slide in enumerate(prs.slides):
+        if index in skip or not len(matcher):
+            continue
+        rel_ids: Dict[int, str] = {}
+        styled: Dict = {}
+        for r in list(slide.shapes._spTree.iter(_TAG_R)):
+            runs += 1
+            t = r.find(_TAG_T)
+            text = t.text if t is not None else None
+            if not text:
+                continue
+            rpr = r.find(_TAG_RPR)
+            if rpr is not None and rpr.find(_TAG_HLINK) is not None:
+                continue
+            matches = matcher.find(text)
+            if not matches:
+                continue
+            pieces, cursor = [], 0
+            for start, end, term in matches:
+                target = term_targets[term]
+                if target == index or not 0 <= target < len(slide_parts):
+                    continue
+                if target not in rel_ids:
+                    rel_ids[target] = slide.part.relate_to(slide_parts[target], RT.SLIDE)
+                    relationships += 1
+                if start > cursor:
+                    pieces.append((cursor, start, None))
+                pieces.append((start, end, rel_ids[target]))
+                cursor = end
+            if not pieces:
+                continue
+            if cursor < len(text):
+                pieces.append((cursor, len(text), None))
+            links += _split_run(r, text, pieces, color, styled)
+    return LinkStats(links, runs, relationships)
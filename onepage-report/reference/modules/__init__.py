@@ -5,6 +5,10 @@ PPTX 圖表繪製模組集合
 
 ├── _colors.py                          # 顏色常數與字體定義
 ├── _tracking.py                        # 元素追蹤與排版審查
+├── _textfit.py                         # 離線文字自動縮放（auto-fit）
+├── _textstyles.py                      # 具名文字樣式登錄表（title / body / table_header...）
+├── _chartxml.py                        # 原生圖表 XML / 內嵌活頁簿（NativeChartData）
+├── _registry.py                        # 圖表類型 → 繪圖函數登錄表（延遲載入、第三方登錄）
 ├── helpers.py                          # 輔助函數
 │
 ├── draw_before_after.py                # 前後對比圖
@@ -22,7 +26,7 @@ PPTX 圖表繪製模組集合
 ├── draw_bar_chart.py                   # 長條圖
 ├── draw_pie_chart.py                   # 圓餅圖
 │
-├── draw_gantt_chart.py                 # 甘特圖
+├── draw_gantt_chart.py                 # 甘特圖（泳道、收合彙總、續頁）
 ├── draw_architecture_enhanced.py       # 增強版架構圖
 ├── draw_matrix_chart.py                # 矩陣圖
 │
@@ -35,62 +39,96 @@ PPTX 圖表繪製模組集合
 ├── draw_glossary_card_with_diagram.py  # 帶圖術語卡片
 ├── draw_glossary_card_text_only.py     # 純文字術語卡片
 ├── draw_glossary_page_with_diagrams.py # 術語頁面(有圖)
-└── draw_glossary_page_text_only.py     # 術語頁面(純文字)
+├── draw_glossary_page_text_only.py     # 術語頁面(純文字)
+└── draw_glossary_pages.py              # 術語附錄自動分頁(量測卡片高度後裝箱)
 
 使用範例：
     from modules.draw_before_after import draw_before_after
     from modules.draw_line_chart import draw_line_chart
+
+    from modules import get_drawer
+    get_drawer("flow")(slide, x, y, w, h, nodes)
+
+套件本身不預先載入任何繪圖模組：`from modules import draw_flow` 或 `modules.COLOR_BLUE`
+第一次存取時才 import 對應的子模組（PEP 562 __getattr__），CLI 冷啟動不必載入全部 30 個模組。
+
+draw_flow、draw_flow_detailed、draw_before_after、draw_before_after_with_flow、draw_architecture、
+draw_platform_compare、draw_mini_*、draw_glossary_card_*、draw_glossary_page_*、draw_comparison_table、
+draw_gantt_chart 另有 build_* 版本，只產生 scene graph 節點（見 reference/scene/），可改輸出到 COM 或 SVG。
 """
 
-# 顏色常數
-from ._colors import (
-    COLOR_RED, COLOR_GREEN, COLOR_BLUE, COLOR_ORANGE, COLOR_PURPLE,
-    COLOR_GRAY_BG, COLOR_GRAY_DARK, COLOR_TEXT, COLOR_WHITE, COLOR_ACCENT,
-    BG_COLOR, ACCENT_BLUE, ACCENT_ORANGE, ACCENT_GREEN, ACCENT_PURPLE, ACCENT_RED,
-    FONT_NAME, FLOW_LAYOUT_CONFIG
-)
+import importlib
+import sys
+import types
 
-# 追蹤系統
-from ._tracking import (
-    reset_element_tracker, set_current_slide, track_element,
-    boxes_overlap, calculate_overlap_area, check_overlaps, layout_review
+from ._registry import (
+    ENTRY_POINT_GROUP, BUILTIN_DRAWERS, register_drawer, unregister_drawer, get_drawer, drawer_types
 )
 
-# 輔助函數
-from .helpers import add_section_title, add_bullet_list, add_content_box
-
-# 基礎圖表
-from .draw_before_after import draw_before_after
-from .draw_architecture import draw_architecture
-from .draw_metric_cards import draw_metric_cards
-from .draw_comparison_table import draw_comparison_table
-from .draw_icon_list import draw_icon_list
-
-# 流程圖
-from .draw_flow import draw_flow
-from .draw_flow_detailed import draw_flow_detailed
-from .draw_before_after_with_flow import draw_before_after_with_flow
-from .draw_platform_compare import draw_platform_compare
-
-# 原生圖表
-from .draw_line_chart import draw_line_chart
-from .draw_bar_chart import draw_bar_chart
-from .draw_pie_chart import draw_pie_chart
-
-# 進階圖表
-from .draw_gantt_chart import draw_gantt_chart
-from .draw_architecture_enhanced import draw_architecture_enhanced
-from .draw_matrix_chart import draw_matrix_chart
-
-# 迷你圖表
-from .draw_mini_flow import draw_mini_flow
-from .draw_mini_before_after import draw_mini_before_after
-from .draw_mini_layers import draw_mini_layers
-from .draw_mini_timeline import draw_mini_timeline
-from .draw_mini_icon import draw_mini_icon
-
-# 術語卡片
-from .draw_glossary_card_with_diagram import draw_glossary_card_with_diagram
-from .draw_glossary_card_text_only import draw_glossary_card_text_only
-from .draw_glossary_page_with_diagrams import draw_glossary_page_with_diagrams
-from .draw_glossary_page_text_only import draw_glossary_page_text_only
+# 子模組 → 套件層級匯出的名稱（第一次存取時才 import）
+_EXPORTS = {
+    # 顏色常數
+    "._colors": (
+        "COLOR_RED", "COLOR_GREEN", "COLOR_BLUE", "COLOR_ORANGE", "COLOR_PURPLE",
+        "COLOR_GRAY_BG", "COLOR_GRAY_DARK", "COLOR_TEXT", "COLOR_WHITE", "COLOR_ACCENT",
+        "BG_COLOR", "ACCENT_BLUE", "ACCENT_ORANGE", "ACCENT_GREEN", "ACCENT_PURPLE", "ACCENT_RED",
+        "FONT_NAME", "FLOW_LAYOUT_CONFIG",
+    ),
+    # 追蹤系統
+    "._tracking": (
+        "reset_element_tracker", "set_current_slide", "track_element",
+        "boxes_overlap", "calculate_overlap_area", "check_overlaps", "layout_review",
+    ),
+    # 文字自動縮放
+    "._textfit": ("fit_font_size", "measure_text", "text_fits", "MIN_FONT_SIZES"),
+    # 文字樣式
+    "._textstyles": ("TEXT_STYLES", "text_style", "set_paragraph_text", "set_text_frame_lines"),
+    # 原生圖表資料
+    "._chartxml": ("NativeChartData",),
+    # 輔助函數
+    ".helpers": ("add_section_title", "add_bullet_list", "add_content_box"),
+    # 術語附錄分頁
+    ".draw_glossary_pages": ("draw_glossary_pages", "paginate_glossary", "GlossaryPage"),
+    # 甘特圖（泳道、彙總列、續頁）
+    ".draw_gantt_chart": ("draw_gantt_chart", "build_gantt_chart", "paginate_gantt", "GanttRow", "GanttPage"),
+}
+# 繪圖函數（draw_x 位於 .draw_x）
+for _spec in dict.fromkeys(BUILTIN_DRAWERS.values()):
+    _module, _, _attr = _spec.partition(":")
+    _EXPORTS.setdefault(_module, (_attr,))
+del _spec, _module, _attr
+
+_LAZY = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_LAZY) + [
+    "ENTRY_POINT_GROUP", "BUILTIN_DRAWERS", "register_drawer", "unregister_drawer", "get_drawer", "drawer_types",
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+class _LazyPackage(types.ModuleType):
+    """
+    draw_x 子模組載入時，import 系統會把套件屬性 draw_x 設為子模組；
+    這裡改存同名函數，維持原本 `from .draw_x import draw_x` 預先載入時的行為
+    （`from modules import draw_flow` 一律取得函數）。
+    """
+
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and _LAZY.get(name) == "." + name:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyPackage
@@ -0,0 +1,270 @@
+"""
+原生圖表資料：直接產生 chart XML 與內嵌活頁簿
+
+python-pptx 的 CategoryChartData 在寫入類別時每個類別都會重新掃描整份類別列表
+（Categories.index），數千個點的延遲曲線要數秒；XlsxWriter 也逐格寫入。
+NativeChartData 提供同樣的 xml_bytes(chart_type) / xlsx_blob 介面，
+可直接傳給 slide.shapes.add_chart，以字串範本一次組出 XML 與 .xlsx（不需要 Excel 或 PowerPoint）。
+
+輸出結構與 python-pptx 相同（工作表 Sheet1：A 欄類別、第 1 列數列名稱），
+之後仍可用 python-pptx 的 Chart API 設定標題、圖例、顏色。
+
+使用範例：
+    from modules._chartxml import NativeChartData
+
+    data = NativeChartData(["0.0", "0.1", ...], [{"name": "延遲", "values": [...]}])
+    frame = slide.shapes.add_chart(XL_CHART_TYPE.LINE, x, y, cx, cy, data)
+"""
+import io
+import zipfile
+from numbers import Number
+from xml.sax.saxutils import escape
+
+from pptx.enum.chart import XL_CHART_TYPE
+
+# chart_type → (grouping, 是否顯示標記)
+_LINE = {
+    XL_CHART_TYPE.LINE: ("standard", False),
+    XL_CHART_TYPE.LINE_MARKERS: ("standard", True),
+    XL_CHART_TYPE.LINE_STACKED: ("stacked", False),
+    XL_CHART_TYPE.LINE_MARKERS_STACKED: ("stacked", True),
+}
+# chart_type → (barDir, grouping)
+_BAR = {
+    XL_CHART_TYPE.COLUMN_CLUSTERED: ("col", "clustered"),
+    XL_CHART_TYPE.COLUMN_STACKED: ("col", "stacked"),
+    XL_CHART_TYPE.BAR_CLUSTERED: ("bar", "clustered"),
+    XL_CHART_TYPE.BAR_STACKED: ("bar", "stacked"),
+}
+_AREA = {
+    XL_CHART_TYPE.AREA: "standard",
+    XL_CHART_TYPE.AREA_STACKED: "stacked",
+}
+SUPPORTED_CHART_TYPES = frozenset(_LINE) | frozenset(_BAR) | frozenset(_AREA) | {XL_CHART_TYPE.PIE}
+
+_CHART_HEAD = (
+    "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+    '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawingml/2006/chart" '
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+)
+# 圖表文字（座標軸、圖例）明確使用 COLOR_TEXT，換主題時才會一起換色（不依賴 PowerPoint 的配色方案）
+_CHART_TAIL = (
+    '<c:txPr><a:bodyPr/><a:lstStyle/><a:p><a:pPr><a:defRPr sz="1800"><a:solidFill><a:srgbClr val="333333"/>'
+    '</a:solidFill></a:defRPr></a:pPr>'
+    '<a:endParaRPr lang="en-US"/></a:p></c:txPr></c:chartSpace>'
+)
+_LEGEND = ('<c:legend><c:legendPos val="r"/><c:layout/><c:overlay val="0"/></c:legend>'
+           '<c:plotVisOnly val="1"/>')
+_CAT_AX = (
+    '<c:catAx><c:axId val="{cat}"/><c:scaling><c:orientation val="minMax"/></c:scaling>'
+    '<c:delete val="0"/><c:axPos val="{pos}"/>{fmt}<c:majorTickMark val="out"/>'
+    '<c:minorTickMark val="none"/><c:tickLblPos val="nextTo"/><c:crossAx val="{val}"/>'
+    '<c:crosses val="autoZero"/><c:auto val="1"/><c:lblAlgn val="ctr"/><c:lblOffset val="100"/>'
+    '<c:noMultiLvlLbl val="0"/></c:catAx>'
+)
+_VAL_AX = (
+    '<c:valAx><c:axId val="{val}"/>{scaling}<c:delete val="0"/><c:axPos val="{pos}"/>'
+    '<c:majorGridlines/>{fmt}<c:majorTickMark val="out"/><c:minorTickMark val="none"/>'
+    '<c:tickLblPos val="nextTo"/><c:crossAx val="{cat}"/><c:crosses val="autoZero"/>{extra}</c:valAx>'
+)
+_AREA_FMT = '<c:numFmt formatCode="General" sourceLinked="1"/>'
+_NO_DLBLS = ('<c:dLbls><c:showLegendKey val="0"/><c:showVal val="0"/><c:showCatName val="0"/>'
+             '<c:showSerName val="0"/><c:showPercent val="0"/><c:showBubbleSize val="0"/></c:dLbls>')
+
+_XLSX_STATIC = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/></Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/></Relationships>'
+    ),
+}
+
+
+def column_letter(n: int) -> str:
+    """1 → A、27 → AA"""
+    result = ""
+    while n > 0:
+        n, remainder = divmod(n - 1, 26)
+        result = chr(65 + remainder) + result
+    return result
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, Number) and not isinstance(value, bool)
+
+
+class NativeChartData:
+    """
+    類別圖表資料（與 CategoryChartData 相容的最小介面）
+
+    Args:
+        categories: 類別列表（全為數字時寫成數值類別；比最長的數列短時補空類別，同 CategoryChartData 不丟棄多出的數值）
+        series: [{"name": "延遲", "values": [...]}, ...]；values 中的 None 為空點
+        number_format: 數值格式（Excel 格式碼）
+    """
+
+    def __init__(self, categories, series, number_format="General"):
+        self.categories = list(categories)
+        self.series = [(s.get("name", f"Series {i + 1}"), list(s.get("values", [])))
+                       for i, s in enumerate(series)]
+        self.number_format = number_format
+        self._numeric_categories = bool(self.categories) and all(map(_is_number, self.categories))
+        longest = max((len(values) for _, values in self.series), default=0)
+        self.categories += [None] * (longest - len(self.categories))
+
+    # ------------------------------------------------------------------
+    # chart XML
+    # ------------------------------------------------------------------
+
+    def _cat_xml(self) -> str:
+        n = len(self.categories)
+        ref = f"Sheet1!$A$2:$A${n + 1}"
+        if self._numeric_categories:
+            pts = "".join(f'<c:pt idx="{i}"><c:v>{v}</c:v></c:pt>' for i, v in enumerate(self.categories)
+                          if v is not None)
+            return (f"<c:cat><c:numRef><c:f>{ref}</c:f><c:numCache><c:formatCode>General</c:formatCode>"
+                    f'<c:ptCount val="{n}"/>{pts}</c:numCache></c:numRef></c:cat>')
+        pts = "".join(f'<c:pt idx="{i}"><c:v>{escape(str(v))}</c:v></c:pt>'
+                      for i, v in enumerate(self.categories) if v is not None)
+        return (f'<c:cat><c:strRef><c:f>{ref}</c:f><c:strCache><c:ptCount val="{n}"/>{pts}'
+                "</c:strCache></c:strRef></c:cat>")
+
+    def _ser_xml(self, index, name, values, cat_xml, marker, smooth) -> str:
+        col = column_letter(index + 2)
+        n = len(self.categories)
+        pts = "".join(f'<c:pt idx="{i}"><c:v>{v}</c:v></c:pt>'
+                      for i, v in enumerate(values[:n]) if v is not None)
+        return (
+            f'<c:ser><c:idx val="{index}"/><c:order val="{index}"/>'
+            f"<c:tx><c:strRef><c:f>Sheet1!${col}$1</c:f><c:strCache><c:ptCount val=\"1\"/>"
+            f'<c:pt idx="0"><c:v>{escape(str(name))}</c:v></c:pt></c:strCache></c:strRef></c:tx>'
+            f"{marker}{cat_xml}"
+            f"<c:val><c:numRef><c:f>Sheet1!${col}$2:${col}${n + 1}</c:f><c:numCache>"
+            f"<c:formatCode>{escape(self.number_format)}</c:formatCode>"
+            f'<c:ptCount val="{n}"/>{pts}</c:numCache></c:numRef></c:val>{smooth}</c:ser>'
+        )
+
+    def _sers_xml(self, marker="", smooth="", limit=None) -> str:
+        cat_xml = self._cat_xml()
+        return "".join(self._ser_xml(i, name, values, cat_xml, marker, smooth)
+                       for i, (name, values) in enumerate(self.series[:limit]))
+
+    def xml_bytes(self, chart_type) -> bytes:
+        """
+        產生 chart part 的 XML
+
+        Args:
+            chart_type: XL_CHART_TYPE（見 SUPPORTED_CHART_TYPES）
+
+        Returns:
+            bytes: UTF-8 XML
+        """
+        head = '<c:date1904 val="0"/>'
+        if chart_type in _LINE:
+            grouping, markers = _LINE[chart_type]
+            cat, val = 2118791784, 2140495176
+            plot = (f'<c:lineChart><c:grouping val="{grouping}"/><c:varyColors val="0"/>'
+                    + self._sers_xml("" if markers else '<c:marker><c:symbol val="none"/></c:marker>',
+                                     '<c:smooth val="0"/>')
+                    + f'<c:marker val="1"/><c:smooth val="0"/><c:axId val="{cat}"/><c:axId val="{val}"/>'
+                    "</c:lineChart>"
+                    + _CAT_AX.format(cat=cat, val=val, pos="b", fmt="")
+                    + _VAL_AX.format(cat=cat, val=val, pos="l", fmt="", scaling="<c:scaling/>", extra=""))
+            tail = _LEGEND + '<c:dispBlanksAs val="gap"/><c:showDLblsOverMax val="0"/>'
+            body = f"<c:plotArea>{plot}</c:plotArea>{tail}"
+        elif chart_type in _BAR:
+            direction, grouping = _BAR[chart_type]
+            cat, val = -2068027336, -2113994440
+            cat_pos, val_pos = ("l", "b") if direction == "bar" else ("b", "l")
+            overlap = '<c:overlap val="100"/>' if grouping == "stacked" else ""
+            plot = (f'<c:barChart><c:barDir val="{direction}"/><c:grouping val="{grouping}"/>'
+                    + self._sers_xml()
+                    + f'{overlap}<c:axId val="{cat}"/><c:axId val="{val}"/></c:barChart>'
+                    + _CAT_AX.format(cat=cat, val=val, pos=cat_pos, fmt="")
+                    + _VAL_AX.format(cat=cat, val=val, pos=val_pos, fmt="", scaling="<c:scaling/>", extra=""))
+            body = f'<c:plotArea>{plot}</c:plotArea><c:dispBlanksAs val="gap"/>'
+        elif chart_type in _AREA:
+            cat, val = -2101159928, -2100718248
+            plot = (f'<c:layout/><c:areaChart><c:grouping val="{_AREA[chart_type]}"/><c:varyColors val="0"/>'
+                    + self._sers_xml()
+                    + f'{_NO_DLBLS}<c:axId val="{cat}"/><c:axId val="{val}"/></c:areaChart>'
+                    + _CAT_AX.format(cat=cat, val=val, pos="b", fmt=_AREA_FMT)
+                    + _VAL_AX.format(cat=cat, val=val, pos="l", fmt=_AREA_FMT,
+                                     scaling='<c:scaling><c:orientation val="minMax"/></c:scaling>',
+                                     extra='<c:crossBetween val="midCat"/>'))
+            tail = _LEGEND + '<c:dispBlanksAs val="zero"/><c:showDLblsOverMax val="0"/>'
+            body = f"<c:plotArea>{plot}</c:plotArea>{tail}"
+            head = '<c:date1904 val="0"/><c:roundedCorners val="0"/>'
+        elif chart_type == XL_CHART_TYPE.PIE:
+            plot = f'<c:pieChart><c:varyColors val="1"/>{self._sers_xml(limit=1)}</c:pieChart>'
+            body = f'<c:plotArea>{plot}</c:plotArea><c:dispBlanksAs val="gap"/>'
+            head = ""
+        else:
+            raise NotImplementedError(f"NativeChartData 不支援圖表類型: {chart_type}")
+        return (f'{_CHART_HEAD}{head}<c:chart><c:autoTitleDeleted val="0"/>{body}'
+                f"</c:chart>{_CHART_TAIL}").encode("utf-8")
+
+    # ------------------------------------------------------------------
+    # 內嵌活頁簿
+    # ------------------------------------------------------------------
+
+    def _sheet_xml(self) -> str:
+        def cell(ref, value):
+            if value is None:
+                return ""
+            if _is_number(value):
+                return f'<c r="{ref}"><v>{value}</v></c>'
+            return f'<c r="{ref}" t="inlineStr"><is><t>{escape(str(value))}</t></is></c>'
+
+        letters = [column_letter(i + 2) for i in range(len(self.series))]
+        header = "".join(cell(f"{col}1", name) for col, (name, _) in zip(letters, self.series))
+        rows = [f'<row r="1">{header}</row>']
+        columns = [values for _, values in self.series]
+        for i, category in enumerate(self.categories):
+            r = i + 2
+            cells = [cell(f"A{r}", category)]
+            for col, values in zip(letters, columns):
+                if i < len(values):
+                    cells.append(cell(f"{col}{r}", values[i]))
+            rows.append(f'<row r="{r}">{"".join(cells)}</row>')
+        return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                f'<sheetData>{"".join(rows)}</sheetData></worksheet>')
+
+    @property
+    def xlsx_blob(self) -> bytes:
+        """內嵌活頁簿（.xlsx bytes），於記憶體中組出"""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, xml in _XLSX_STATIC.items():
+                zf.writestr(name, xml)
+            zf.writestr("xl/worksheets/sheet1.xml", self._sheet_xml())
+        return buffer.getvalue()
+
@@ -0,0 +1,149 @@
+"""
+大量資料點的折線 / 面積圖降採樣
+
+延遲與工作負載的追蹤資料每條數列有 10^5 ~ 10^6 個點，全部寫進原生圖表
+會讓 chart XML 與內嵌活頁簿膨脹到數 MB，且絕大多數點在投影片上不可見（圖寬只有數百像素）。
+在建立圖表之前，依圖寬換算點數上限，把每條數列縮減到上限內，並保留尖峰：
+
+- minmax：等寬分桶，每桶保留最小值與最大值（保證每個尖峰 / 谷底都留下，預設）
+- lttb：Largest-Triangle-Three-Buckets，每桶保留與前後點圍成最大三角形的點（曲線外觀較平順）
+
+類別圖的所有數列共用同一組類別，因此各數列分別挑點後取聯集，類別與數值一起抽取。
+點數未超過上限時原樣回傳（同一個 list 物件），小資料的輸出完全不變。
+
+單位一律為 pt（1 inch = 72 pt），python-pptx 呼叫端需自行換算。
+此模組不依賴 python-pptx / pywin32，兩種渲染路徑共用；numpy 只在需要降採樣時才載入。
+"""
+from typing import List, Optional, Sequence, Tuple
+
+PIXELS_PER_PT = 96 / 72    # 以 96 dpi 顯示時每 pt 的像素數
+POINTS_PER_PIXEL = 2       # 每個像素欄保留的點數（minmax 的最小值 + 最大值）
+MIN_POINTS = 16            # 點數上限的下限（很窄的圖也保留基本形狀）
+
+METHODS = ("minmax", "lttb")
+
+
+def point_budget(width_pt, points_per_pixel=POINTS_PER_PIXEL):
+    """
+    依圖表寬度換算每條數列的點數上限
+
+    Args:
+        width_pt: 圖表寬度（pt）
+        points_per_pixel: 每個像素欄保留的點數
+
+    Returns:
+        int: 點數上限
+    """
+    return max(MIN_POINTS, int(width_pt * PIXELS_PER_PT * points_per_pixel))
+
+
+def _as_float_array(values, n):
+    """數值 list → 長度 n 的 float 陣列（None 與不足的部分為 NaN）"""
+    import numpy as np
+
+    y = np.full(n, np.nan)
+    count = min(len(values), n)
+    if count:
+        y[:count] = np.array(values[:count], dtype=float)
+    return y
+
+
+def _minmax_indices(y, budget):
+    """等寬分桶，每桶取最小值與最大值的索引（含首尾點）"""
+    import numpy as np
+
+    n = len(y)
+    buckets = max(1, (budget - 2) // 2)
+    size = -(-(n - 2) // buckets)
+    # 中段補 NaN 成 buckets x size 矩陣，一次算出每桶的 argmin / argmax
+    inner = np.full(buckets * size, np.nan)
+    inner[:n - 2] = y[1:-1]
+    inner = inner.reshape(buckets, size)
+    nan = np.isnan(inner)
+    lo = np.where(nan, np.inf, inner).argmin(axis=1)
+    hi = np.where(nan, -np.inf, inner).argmax(axis=1)
+    offsets = np.arange(buckets) * size + 1
+    picked = np.concatenate(([0, n - 1], offsets + lo, offsets + hi))
+    return picked[picked < n]
+
+
+def _lttb_indices(y, budget):
+    """Largest-Triangle-Three-Buckets：每桶取與前一個選點、下一桶平均點圍成最大三角形的索引"""
+    import numpy as np
+
+    n = len(y)
+    buckets = max(1, budget - 2)
+    # NaN（缺值）以平均值參與面積計算，選到時仍輸出原本的缺值
+    filled = np.where(np.isnan(y), np.nanmean(y) if not np.isnan(y).all() else 0.0, y)
+    # n > budget 時每桶至少一個點；每桶的平均點以 reduceat 一次算完，最後一桶的「下一桶」為最後一點
+    edges = np.linspace(1, n - 1, buckets + 1).astype(np.int64)
+    starts = edges[:-1]
+    counts = np.diff(edges)
+    avg_x = starts + (counts - 1) / 2
+    avg_y = np.add.reduceat(filled[:n - 1], starts) / counts
+    next_x = np.append(avg_x[1:], n - 1)
+    next_y = np.append(avg_y[1:], filled[-1])
+
+    picked = [0]
+    a = 0
+    for i in range(buckets):
+        lo, hi = starts[i], edges[i + 1]
+        xs = np.arange(lo, hi)
+        area = np.abs((a - next_x[i]) * (filled[lo:hi] - filled[a]) - (a - xs) * (next_y[i] - filled[a]))
+        a = int(lo + area.argmax())
+        picked.append(a)
+    picked.append(n - 1)
+    return np.array(picked)
+
+
+def downsample_indices(columns, n, budget, method="minmax"):
+    """
+    挑出要保留的資料點索引（各數列分別挑點後取聯集）
+
+    Args:
+        columns: 各數列的數值（list，None 為缺值；較短的數列視為尾端缺值）
+        n: 資料點數（類別數）
+        budget: 每條數列的點數上限
+        method: minmax 或 lttb
+
+    Returns:
+        List[int]: 遞增的索引；不需降採樣時回傳 None
+    """
+    import numpy as np
+
+    if method not in METHODS:
+        raise ValueError(f"未知的降採樣方法: {method}（可用: {', '.join(METHODS)}）")
+    if n <= max(budget, MIN_POINTS):
+        return None
+    pick = _minmax_indices if method == "minmax" else _lttb_indices
+    selected = [pick(_as_float_array(values, n), budget) for values in columns]
+    return np.unique(np.concatenate(selected)).tolist()
+
+
+def downsample_chart(categories: Sequence, series: List[dict], budget: Optional[int],
+                     method: str = "minmax") -> Tuple[Sequence, List[dict]]:
+    """
+    類別圖資料降採樣：類別與各數列一起抽取
+
+    Args:
+        categories: X 軸類別
+        series: 資料序列 [{"name": ..., "values": [...], ...}, ...]（其他欄位原樣保留）
+        budget: 每條數列的點數上限（None 或 0 表示不降採樣）
+        method: minmax（保留每桶極值，預設）或 lttb
+
+    Returns:
+        (categories, series)：未超過上限時為原本的物件
+    """
+    count = max([len(categories)] + [len(s.get("values", [])) for s in series])
+    if not budget or count <= budget:
+        return categories, series
+    keep = downsample_indices([s.get("values", []) for s in series], count, budget, method)
+    if keep is None:
+        return categories, series
+    # 數值比類別多時類別補空（同圖表資料，不丟棄多出的數值）
+    categories = list(categories) + [None] * (count - len(categories))
+    reduced = []
+    for s in series:
+        values = s.get("values", [])
+        reduced.append({**s, "values": [values[i] for i in keep if i < len(values)]})
+    return [categories[i] for i in keep], reduced
@@ -0,0 +1,131 @@
+"""
+圖表類型 → 繪圖函數登錄表（延遲載入）
+
+登錄表只記錄「模組:函數」字串，第一次 get_drawer() 時才 import 對應的 draw_*.py，
+只畫流程圖的程序不會載入其他 30 個繪圖模組。
+
+第三方圖表可在程式中登錄：
+    from modules import register_drawer
+
+    register_drawer("radar_chart", "my_charts.radar:draw_radar")   # 延遲載入
+
+    @register_drawer("funnel")
+    def draw_funnel(slide, x, y, w, h, stages):
+        ...
+
+或在套件的 pyproject.toml 宣告 entry point（查不到類型時才會掃描）：
+    [project.entry-points."onepage_report.drawers"]
+    radar_chart = "my_charts.radar:draw_radar"
+
+繪圖函數的簽名同 modules/ 的 draw_*：draw_x(slide, x, y, w, h, ...)（英吋）。
+render_pptx 以 draw_x(slide, x, y, w, h, diagrams_content) 呼叫第三方類型；
+scripts/validate_json.py 驗證 slide_data 時，figure type 也接受登錄表中的第三方類型。
+"""
+import importlib
+from typing import Callable, Dict, List, Optional, Union
+
+ENTRY_POINT_GROUP = "onepage_report.drawers"
+
+# 內建圖表類型 → "模組:函數"（"." 開頭為 modules 套件內的相對模組）
+BUILTIN_DRAWERS = {
+    "before_after": ".draw_before_after:draw_before_after",
+    "architecture": ".draw_architecture:draw_architecture",
+    "metric_cards": ".draw_metric_cards:draw_metric_cards",
+    "comparison_table": ".draw_comparison_table:draw_comparison_table",
+    "icon_list": ".draw_icon_list:draw_icon_list",
+    "flow": ".draw_flow:draw_flow",
+    "flow_detailed": ".draw_flow_detailed:draw_flow_detailed",
+    "before_after_with_flow": ".draw_before_after_with_flow:draw_before_after_with_flow",
+    "platform_compare": ".draw_platform_compare:draw_platform_compare",
+    "line_chart": ".draw_line_chart:draw_line_chart",
+    "bar_chart": ".draw_bar_chart:draw_bar_chart",
+    "pie_chart": ".draw_pie_chart:draw_pie_chart",
+    "gantt_chart": ".draw_gantt_chart:draw_gantt_chart",
+    "architecture_enhanced": ".draw_architecture_enhanced:draw_architecture_enhanced",
+    "matrix_chart": ".draw_matrix_chart:draw_matrix_chart",
+    "mini_flow": ".draw_mini_flow:draw_mini_flow",
+    "mini_before_after": ".draw_mini_before_after:draw_mini_before_after",
+    "mini_layers": ".draw_mini_layers:draw_mini_layers",
+    "mini_timeline": ".draw_mini_timeline:draw_mini_timeline",
+    "mini_icon": ".draw_mini_icon:draw_mini_icon",
+    "glossary_card_with_diagram": ".draw_glossary_card_with_diagram:draw_glossary_card_with_diagram",
+    "glossary_card_text_only": ".draw_glossary_card_text_only:draw_glossary_card_text_only",
+    "glossary_page_with_diagrams": ".draw_glossary_page_with_diagrams:draw_glossary_page_with_diagrams",
+    "glossary_page_text_only": ".draw_glossary_page_text_only:draw_glossary_page_text_only",
+    "glossary_pages": ".draw_glossary_pages:draw_glossary_pages",
+    # diagrams_content 的別名（同 render_pptx.FIGURE_DISPATCH）
+    "comparison": ".draw_before_after:draw_before_after",
+    "timeline": ".draw_mini_timeline:draw_mini_timeline",
+}
+
+# 名稱 → "模組:函數" 或函數
+_drawers: Dict[str, Union[str, Callable]] = dict(BUILTIN_DRAWERS)
+_entry_points_loaded = False
+
+
+def register_drawer(name: str, drawer: Union[str, Callable, None] = None, replace: bool = False):
+    """
+    登錄圖表類型
+
+    Args:
+        name: 圖表類型名稱（diagrams_content 的 "type"）
+        drawer: 繪圖函數，或 "模組:函數" 字串（延遲到第一次使用才 import）；
+                省略時回傳 decorator
+        replace: 是否覆蓋已登錄的類型（含內建類型）
+
+    Returns:
+        drawer（作為 decorator 時回傳被裝飾的函數）
+    """
+    if drawer is None:
+        return lambda func: register_drawer(name, func, replace)
+    if isinstance(drawer, str) and ":" not in drawer:
+        raise ValueError(f"繪圖函數需為 '模組:函數' 格式: {drawer}")
+    if name in _drawers and not replace and _drawers[name] != drawer:
+        raise ValueError(f"圖表類型已登錄: {name}（覆蓋請加 replace=True）")
+    _drawers[name] = drawer
+    return drawer
+
+
+def unregister_drawer(name: str):
+    """移除登錄的圖表類型（不存在時忽略）"""
+    _drawers.pop(name, None)
+
+
+def get_drawer(name: str) -> Optional[Callable]:
+    """
+    取得圖表類型的繪圖函數（必要時 import 模組）
+
+    每次都從模組屬性取值，profiling 替換後的 draw_* 也會生效。
+
+    Args:
+        name: 圖表類型名稱
+
+    Returns:
+        繪圖函數；類型未登錄時回傳 None
+    """
+    drawer = _drawers.get(name)
+    if drawer is None and not _entry_points_loaded:
+        _load_entry_points()
+        drawer = _drawers.get(name)
+    if drawer is None or callable(drawer):
+        return drawer
+    module_name, _, attr = drawer.partition(":")
+    module = importlib.import_module(module_name, __package__)
+    return getattr(module, attr)
+
+
+def drawer_types() -> List[str]:
+    """所有已登錄的圖表類型（含 entry point）"""
+    if not _entry_points_loaded:
+        _load_entry_points()
+    return sorted(_drawers)
+
+
+def _load_entry_points():
+    """掃描已安裝套件的 onepage_report.drawers entry point（只做一次）"""
+    global _entry_points_loaded
+    _entry_points_loaded = True
+    from importlib.metadata import entry_points
+
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        _drawers.setdefault(ep.name, ep.value)
@@ -0,0 +1,250 @@
+"""
+離線文字自動縮放（auto-fit）
+在建立文字框之前估算文字所需空間，二分搜尋出能放進方塊的最大字體，
+避免「渲染 → 開 PowerPoint 檢查 → 重新渲染」的來回。
+
+單位一律為 pt（1 inch = 72 pt），python-pptx 呼叫端需自行換算。
+此模組不依賴 python-pptx / pywin32，兩種渲染路徑共用。
+"""
+import math
+import unicodedata
+from functools import lru_cache
+
+# === 字體約束（對應 SKILL.md「Yoga Layout 字體約束」）===
+MIN_FONT_SIZES = {
+    "title": 14,    # 標題
+    "body": 10,     # 本文
+    "caption": 8,   # 小字註解
+}
+
+# 其他角色對應到上述三種約束
+ROLE_ALIASES = {
+    "subtitle": "title",
+    "h2": "body",
+    "mono": "body",
+}
+
+# 角色最小字體（或起始字體，取較小者）仍放不下時，繼續縮小到它的 OVERFLOW_SCALE 倍：
+# 寧可字小一點也不要溢出方塊；放得下時一律取最大字體，不會無故低於角色最小字體
+OVERFLOW_SCALE = 0.75
+
+LINE_SPACING = 1.2    # 行高 = 字體大小 x 1.2
+FONT_STEP = 0.5       # 搜尋字體的最小步進（pt）
+BOLD_FACTOR = 1.05    # 粗體字寬放大比例
+
+# python-pptx 文字框預設內邊距（left, right, top, bottom），pt
+PPTX_TEXTBOX_MARGINS = (7.2, 7.2, 3.6, 3.6)
+
+# 窄字元（相對字寬 em）
+_NARROW_CHARS = set("il.,:;'|!`()[]{}")
+
+
+def min_font_size(role):
+    """
+    取得角色的最小字體
+
+    Args:
+        role: 文字角色（title / subtitle / h2 / body / caption / mono）
+
+    Returns:
+        float: 最小字體（pt）
+    """
+    role = ROLE_ALIASES.get(role, role)
+    return MIN_FONT_SIZES.get(role, MIN_FONT_SIZES["body"])
+
+
+def overflow_min_size(role, font_size):
+    """
+    auto-fit 縮小的下限：角色最小字體與起始字體取較小者，乘上 OVERFLOW_SCALE（對齊 FONT_STEP）
+
+    Args:
+        role: 文字角色
+        font_size: 起始字體（pt）
+
+    Returns:
+        float: 下限（pt）
+    """
+    floor = min(min_font_size(role), font_size) * OVERFLOW_SCALE
+    return math.floor(floor / FONT_STEP + 1e-9) * FONT_STEP
+
+
+def char_width_em(ch, mono=False):
+    """估算單一字元寬度（以 em 為單位）"""
+    if unicodedata.east_asian_width(ch) in ("W", "F"):
+        return 1.0
+    if ord(ch) > 0xFFFF:
+        return 1.0  # emoji 等補充平面字元
+    if mono:
+        return 0.55
+    if ch == " ":
+        return 0.3
+    if ch in _NARROW_CHARS:
+        return 0.28
+    if ch.isupper() or ch.isdigit():
+        return 0.62
+    return 0.52
+
+
+def _is_wide(ch):
+    return unicodedata.east_asian_width(ch) in ("W", "F") or ord(ch) > 0xFFFF
+
+
+def _tokenize(line):
+    """切成可換行的單位：CJK 逐字、英文以單字（含尾端空白）為單位"""
+    tokens = []
+    current = ""
+    for ch in line:
+        if _is_wide(ch):
+            if current:
+                tokens.append(current)
+                current = ""
+            tokens.append(ch)
+        elif ch == " ":
+            current += ch
+            tokens.append(current)
+            current = ""
+        else:
+            current += ch
+    if current:
+        tokens.append(current)
+    return tokens
+
+
+def _text_width(text, font_size, bold=False, mono=False):
+    width = sum(char_width_em(ch, mono) for ch in text) * font_size
+    return width * BOLD_FACTOR if bold else width
+
+
+def wrap_lines(text, max_width, font_size, bold=False, mono=False):
+    """
+    依可用寬度將文字折行（貪婪演算法，與 PowerPoint 自動換行相近）
+
+    Args:
+        text: 文字內容（可含換行）
+        max_width: 可用寬度（pt）
+        font_size: 字體大小（pt）
+        bold: 是否粗體
+        mono: 是否等寬字體
+
+    Returns:
+        list: 折行後的每一行
+    """
+    lines = []
+    for paragraph in text.split("\n"):
+        line = ""
+        line_width = 0.0
+        for token in _tokenize(paragraph):
+            token_width = _text_width(token, font_size, bold, mono)
+            if line and line_width + _text_width(token.rstrip(), font_size, bold, mono) > max_width:
+                lines.append(line)
+                line, line_width = "", 0.0
+            if token_width > max_width:
+                # 單字比整行還寬：逐字切開
+                for ch in token:
+                    ch_width = _text_width(ch, font_size, bold, mono)
+                    if line and line_width + ch_width > max_width:
+                        lines.append(line)
+                        line, line_width = "", 0.0
+                    line += ch
+                    line_width += ch_width
+                continue
+            line += token
+            line_width += token_width
+        lines.append(line)
+    return lines
+
+
+def measure_text(text, max_width, font_size, bold=False, mono=False,
+                 line_spacing=LINE_SPACING, paragraph_spacing=0):
+    """
+    估算文字在指定寬度下的尺寸
+
+    Args:
+        text: 文字內容
+        max_width: 可用寬度（pt）
+        font_size: 字體大小（pt）
+        bold: 是否粗體
+        mono: 是否等寬字體
+        line_spacing: 行高倍數
+        paragraph_spacing: 段落後間距（pt）
+
+    Returns:
+        tuple: (寬度, 高度)（pt）
+    """
+    lines = wrap_lines(text, max_width, font_size, bold, mono)
+    width = max((_text_width(line, font_size, bold, mono) for line in lines), default=0.0)
+    paragraphs = text.count("\n") + 1
+    height = len(lines) * font_size * line_spacing + paragraph_spacing * (paragraphs - 1)
+    return width, height
+
+
+def text_fits(text, width, height, font_size, bold=False, mono=False,
+              line_spacing=LINE_SPACING, paragraph_spacing=0):
+    """檢查文字以指定字體是否放得進 width x height（pt，已扣除內邊距）"""
+    _, needed = measure_text(text, width, font_size, bold, mono,
+                             line_spacing, paragraph_spacing)
+    return needed <= height
+
+
+@lru_cache(maxsize=4096)
+def _fit_cached(text, width, height, max_size, min_size, bold, mono,
+                line_spacing, paragraph_spacing):
+    # 候選字體：min_size, min_size + step, ..., max_size
+    steps = int((max_size - min_size) / FONT_STEP + 1e-9)
+    lo, hi = 0, steps
+    if text_fits(text, width, height, max_size, bold, mono, line_spacing, paragraph_spacing):
+        return max_size
+    best = min_size
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        size = min_size + mid * FONT_STEP
+        if text_fits(text, width, height, size, bold, mono, line_spacing, paragraph_spacing):
+            best = size
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    return best
+
+
+def fit_font_size(text, width, height, font_size, role="body", bold=False,
+                  margins=(0, 0, 0, 0), mono=False, line_spacing=LINE_SPACING,
+                  paragraph_spacing=0, min_size=None):
+    """
+    計算能放進方塊的最大字體（不超過原本指定的字體）
+
+    Args:
+        text: 文字內容
+        width, height: 方塊寬高（pt，含內邊距）
+        font_size: 指定字體（搜尋上限）
+        role: 文字角色，決定縮小的下限（角色最小字體與 font_size 取較小者，再乘 OVERFLOW_SCALE）
+        bold: 是否粗體
+        margins: 內邊距 (left, right, top, bottom)（pt）
+        mono: 是否等寬字體
+        line_spacing: 行高倍數
+        paragraph_spacing: 段落後間距（pt）
+        min_size: 縮小的下限，None 時依 role 決定
+
+    Returns:
+        float: 字體大小（pt）；下限仍放不下時回傳下限
+    """
+    if not text:
+        return font_size
+    if min_size is None:
+        min_size = overflow_min_size(role, font_size)
+    min_size = min(min_size, font_size)
+
+    inner_width = max(width - margins[0] - margins[1], 1)
+    inner_height = max(height - margins[2] - margins[3], 1)
+    return _fit_cached(text, round(inner_width, 2), round(inner_height, 2),
+                       font_size, min_size, bool(bold), bool(mono),
+                       line_spacing, paragraph_spacing)
+
+
+def fit_cache_info():
+    """取得 auto-fit 快取統計"""
+    return _fit_cached.cache_info()
+
+
+def clear_fit_cache():
+    """清除 auto-fit 快取"""
+    _fit_cached.cache_clear()
@@ -0,0 +1,113 @@
+"""
+文字樣式登錄表
+
+常用的文字樣式（標題、區塊標題、內文、表頭、註解...）集中定義成 TextStyle，
+套用時每個 run 直接複製預先建立的 <a:rPr>（見 scene.pptx_backend.run_properties），
+不再對每個段落分別設定 size / bold / color / name。
+
+使用範例：
+    from modules._textstyles import text_style, set_paragraph_text
+
+    set_paragraph_text(tf.paragraphs[0], "問題痛點", text_style("section_title", color=ACCENT_ORANGE))
+    set_cell_text(table.cell(0, 0), "平台", "table_header")
+"""
+from functools import lru_cache
+
+from scene import TextStyle, add_styled_run
+
+from ._colors import COLOR_BLUE, COLOR_TEXT, COLOR_WHITE, FONT_NAME
+
+SUBTLE_GRAY = (100, 100, 100)
+
+TEXT_STYLES = {
+    "title": TextStyle(26, True, COLOR_TEXT, FONT_NAME),           # 頁面主標題
+    "subtitle": TextStyle(11, True, SUBTLE_GRAY, FONT_NAME),       # 副標題 / 靈感來源
+    "section_title": TextStyle(12, True, COLOR_BLUE, FONT_NAME),   # 區塊標題
+    "box_title": TextStyle(11, True, COLOR_BLUE, FONT_NAME),       # 內容方塊標題
+    "body": TextStyle(10, False, COLOR_TEXT, FONT_NAME),           # 內文
+    "body_bold": TextStyle(10, True, COLOR_TEXT, FONT_NAME),       # MTK 風格粗體內文
+    "table_header": TextStyle(10, True, COLOR_WHITE, FONT_NAME),   # 表頭（深色底）
+    "table_cell": TextStyle(9, True, COLOR_TEXT, FONT_NAME),       # 表格內容
+    "caption": TextStyle(9, True, SUBTLE_GRAY, FONT_NAME),         # 圖表 / 表格註解
+}
+
+
+@lru_cache(maxsize=None)
+def _resolve(name, overrides):
+    base = TEXT_STYLES[name]
+    return base._replace(**dict(overrides)) if overrides else base
+
+
+def text_style(name: str, **overrides) -> TextStyle:
+    """
+    取得具名樣式，可覆寫個別欄位
+
+    Args:
+        name: TEXT_STYLES 中的樣式名稱
+        **overrides: 覆寫欄位（size / bold / color / font / italic）
+
+    Returns:
+        TextStyle
+    """
+    if "color" in overrides and overrides["color"] is not None:
+        overrides["color"] = tuple(overrides["color"])
+    return _resolve(name, tuple(sorted(overrides.items())))
+
+
+def _as_style(style) -> TextStyle:
+    return text_style(style) if isinstance(style, str) else style
+
+
+def set_paragraph_text(paragraph, text: str, style, align=None):
+    """
+    將文字以指定樣式加入段落（換行 → 段內換行）
+
+    Args:
+        paragraph: python-pptx 段落（通常是新建、尚無文字的段落）
+        text: 文字
+        style: TextStyle 或 TEXT_STYLES 名稱
+        align: PP_ALIGN（可選）
+    """
+    style = _as_style(style)
+    for i, line in enumerate(str(text).split("\n")):
+        if i > 0:
+            paragraph.add_line_break()
+        if line:
+            add_styled_run(paragraph, line, style)
+    if align is not None:
+        paragraph.alignment = align
+    return paragraph
+
+
+def set_text_frame_lines(tf, lines, style, space_after=None, align=None):
+    """
+    每行一個段落寫入 text_frame（從第一個段落開始）
+
+    Args:
+        tf: python-pptx TextFrame
+        lines: 文字列表
+        style: TextStyle 或 TEXT_STYLES 名稱
+        space_after: 段後間距（Pt，可選）
+        align: PP_ALIGN（可選）
+    """
+    style = _as_style(style)
+    for i, line in enumerate(lines):
+        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+        set_paragraph_text(p, line, style, align)
+        if space_after is not None:
+            p.space_after = space_after
+    return tf
+
+
+def set_cell_text(cell, text: str, style):
+    """
+    設定表格儲存格文字（取代原有內容；換行 → 新段落，與 cell.text 相同）
+
+    Args:
+        cell: python-pptx 表格儲存格
+        text: 文字
+        style: TextStyle 或 TEXT_STYLES 名稱
+    """
+    tf = cell.text_frame
+    tf.clear()
+    return set_text_frame_lines(tf, str(text).split("\n"), style)
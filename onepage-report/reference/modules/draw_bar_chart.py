@@ -1,9 +1,9 @@
 """長條圖（原生圖表）"""
 from pptx.util import Inches, Pt
-from pptx.chart.data import CategoryChartData
 from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
 
-from ._colors import FONT_NAME
+from ._chartxml import NativeChartData
+from ._colors import COLOR_TEXT, FONT_NAME
 
 
 def draw_bar_chart(slide, left, top, width, height, title, categories, series,
@@ -22,11 +22,7 @@ def draw_bar_chart(slide, left, top, width, height, title, categories, series,
         show_data_labels: 是否顯示資料標籤
         horizontal: 是否水平顯示
     """
-    chart_data = CategoryChartData()
-    chart_data.categories = categories
-
-    for s in series:
-        chart_data.add_series(s["name"], s["values"])
+    chart_data = NativeChartData(categories, series)
 
     chart_type = XL_CHART_TYPE.BAR_CLUSTERED if horizontal else XL_CHART_TYPE.COLUMN_CLUSTERED
 
@@ -39,6 +35,7 @@ def draw_bar_chart(slide, left, top, width, height, title, categories, series,
     chart.chart_title.text_frame.paragraphs[0].font.size = Pt(12)
     chart.chart_title.text_frame.paragraphs[0].font.bold = True
     chart.chart_title.text_frame.paragraphs[0].font.name = FONT_NAME
+    chart.chart_title.text_frame.paragraphs[0].font.color.rgb = COLOR_TEXT
 
     chart.has_legend = show_legend
     if show_legend:
@@ -47,8 +44,8 @@ def draw_bar_chart(slide, left, top, width, height, title, categories, series,
 
     for i, s in enumerate(series):
         if "color" in s and i < len(chart.series):
-            for point in chart.series[i].points:
-                point.format.fill.solid()
-                point.format.fill.fore_color.rgb = s["color"]
+            fill = chart.series[i].format.fill
+            fill.solid()
+            fill.fore_color.rgb = s["color"]
 
     return graphic_frame
@@ -1,10 +1,32 @@
 """前後對比圖"""
-from pptx.util import Inches, Pt
-from pptx.enum.shapes import MSO_SHAPE
+from scene import Scene, TextStyle, para, text_frame, flush_pptx
 
 from ._colors import COLOR_RED, COLOR_GREEN, COLOR_BLUE, COLOR_GRAY_BG, COLOR_TEXT, FONT_NAME
 
 
+def build_before_after(scene, left, top, width, height, before_title, before_items, after_title, after_items):
+    """
+    產生前後對比圖的 scene 節點（參數同 draw_before_after，scene 單位為吋）
+    """
+    box_width = (width - 0.4) / 2
+    item_style = TextStyle(9, False, COLOR_TEXT, FONT_NAME)
+
+    sides = [
+        (left, before_title, before_items, COLOR_RED),
+        (left + box_width + 0.4, after_title, after_items, COLOR_GREEN),
+    ]
+    for x, title, items, color in sides:
+        scene.rounded_rect(x, top, box_width, height, fill=COLOR_GRAY_BG, line=color, line_width=2)
+        scene.textbox(x + 0.1, top + 0.1, box_width - 0.2, 0.3,
+                      para(title, TextStyle(11, True, color, FONT_NAME)))
+        scene.textbox(x + 0.1, top + 0.4, box_width - 0.2, height - 0.5,
+                      text_frame([para(f"• {item}", item_style) for item in items], word_wrap=True))
+
+    # 中間箭頭
+    scene.shape("RIGHT_ARROW", left + box_width + 0.1, top + height/2 - 0.12, 0.2, 0.24, fill=COLOR_BLUE)
+    return scene
+
+
 def draw_before_after(slide, left, top, width, height, before_title, before_items, after_title, after_items):
     """
     繪製前後對比圖
@@ -18,86 +40,6 @@ def draw_before_after(slide, left, top, width, height, before_title, before_item
         after_title: 右側標題（如「導入 SDK 後」）
         after_items: 右側項目列表
     """
-    box_width = (width - 0.4) / 2
-
-    # 左側區塊
-    before_box = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        Inches(left), Inches(top),
-        Inches(box_width), Inches(height)
-    )
-    before_box.fill.solid()
-    before_box.fill.fore_color.rgb = COLOR_GRAY_BG
-    before_box.line.color.rgb = COLOR_RED
-    before_box.line.width = Pt(2)
-
-    before_title_box = slide.shapes.add_textbox(
-        Inches(left + 0.1), Inches(top + 0.1),
-        Inches(box_width - 0.2), Inches(0.3)
-    )
-    tf = before_title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = before_title
-    p.font.size = Pt(11)
-    p.font.bold = True
-    p.font.color.rgb = COLOR_RED
-    p.font.name = FONT_NAME
-
-    before_content = slide.shapes.add_textbox(
-        Inches(left + 0.1), Inches(top + 0.4),
-        Inches(box_width - 0.2), Inches(height - 0.5)
-    )
-    tf = before_content.text_frame
-    tf.word_wrap = True
-    for i, item in enumerate(before_items):
-        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-        p.text = f"• {item}"
-        p.font.size = Pt(9)
-        p.font.color.rgb = COLOR_TEXT
-        p.font.name = FONT_NAME
-
-    # 右側區塊
-    after_box = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        Inches(left + box_width + 0.4), Inches(top),
-        Inches(box_width), Inches(height)
-    )
-    after_box.fill.solid()
-    after_box.fill.fore_color.rgb = COLOR_GRAY_BG
-    after_box.line.color.rgb = COLOR_GREEN
-    after_box.line.width = Pt(2)
-
-    after_title_box = slide.shapes.add_textbox(
-        Inches(left + box_width + 0.5), Inches(top + 0.1),
-        Inches(box_width - 0.2), Inches(0.3)
-    )
-    tf = after_title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = after_title
-    p.font.size = Pt(11)
-    p.font.bold = True
-    p.font.color.rgb = COLOR_GREEN
-    p.font.name = FONT_NAME
-
-    after_content = slide.shapes.add_textbox(
-        Inches(left + box_width + 0.5), Inches(top + 0.4),
-        Inches(box_width - 0.2), Inches(height - 0.5)
-    )
-    tf = after_content.text_frame
-    tf.word_wrap = True
-    for i, item in enumerate(after_items):
-        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-        p.text = f"• {item}"
-        p.font.size = Pt(9)
-        p.font.color.rgb = COLOR_TEXT
-        p.font.name = FONT_NAME
-
-    # 中間箭頭
-    arrow = slide.shapes.add_shape(
-        MSO_SHAPE.RIGHT_ARROW,
-        Inches(left + box_width + 0.1), Inches(top + height/2 - 0.12),
-        Inches(0.2), Inches(0.24)
-    )
-    arrow.fill.solid()
-    arrow.fill.fore_color.rgb = COLOR_BLUE
-    arrow.line.fill.background()
+    scene = build_before_after(Scene(unit="in"), left, top, width, height,
+                               before_title, before_items, after_title, after_items)
+    flush_pptx(scene, slide)
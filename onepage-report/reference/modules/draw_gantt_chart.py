@@ -1,170 +1,356 @@
-"""甘特圖"""
-from pptx.util import Inches, Pt
-from pptx.enum.shapes import MSO_SHAPE
-from pptx.enum.text import PP_ALIGN
-from pptx.dml.color import RGBColor
+"""
+甘特圖（泳道分組、收合彙總、依可用空間控制細節）
+
+任務少時每個任務一列；從專案管理工具匯出的計畫動輒上千個任務，
+逐列繪製會讓列高小於一個像素、形狀數暴增。因此先規劃「列」再繪製：
+
+    1. 日期一次換算：所有起訖日與里程碑以 numpy datetime64 向量化轉成天數
+    2. 泳道：task["group"] 相同的任務歸為一個泳道（依首次出現順序），
+       泳道標題列顯示整組的起訖範圍；collapsed 指定的泳道收合成一條彙總列
+       （起訖取最早 / 最晚，進度依工期加權）
+    3. 細節層級：列高不得低於 MIN_ROW_HEIGHT，列數超過時依序
+       a. 由大到小自動收合泳道
+       b. 連續的列合併成彙總列（「任務 A 等 N 項」）
+       時間刻度與里程碑同樣依圖寬限制數量（刻度改用月 / 季 / 年，重疊的里程碑只畫一個）
+    4. 續頁（可選）：不自動收合，列依每頁可容納的數量分頁，每頁重複標題與時間刻度
+
+形狀數因此只與可用空間有關，與任務數無關（2,000 個任務的計畫仍是一頁可讀的甘特圖）。
+
+使用範例：
+    from modules import draw_gantt_chart
+
+    draw_gantt_chart(slide, 0.5, 1.0, 12, 5.5, "專案時程", tasks)
+    draw_gantt_chart(slide, 0.5, 1.0, 12, 5.5, "專案時程", tasks, collapsed=["驗證"],
+                     continuation=lambda page: add_slide(f"專案時程（續 {page}）"))
+"""
 from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from scene import Scene, TextStyle, para, text_frame, flush_pptx
 
 from ._colors import COLOR_RED, COLOR_BLUE, COLOR_GRAY_DARK, COLOR_TEXT, FONT_NAME
 
+_GRID_COLOR = (220, 220, 220)
+_BAR_BG_COLOR = (230, 230, 230)
+_LANE_BG_COLOR = (245, 245, 245)
 
-def draw_gantt_chart(slide, left, top, width, height, title, tasks, milestones=None,
-                     time_unit="week", show_today_line=True, show_progress=True):
+TITLE_HEIGHT = 0.35
+HEADER_HEIGHT = 0.3
+NAME_COL_WIDTH = 1.8
+MIN_ROW_HEIGHT = 0.16    # 吋；8pt 任務名稱可讀的最小列高
+MIN_BAR_WIDTH = 0.02     # 吋；長時程中只有一兩天的任務仍看得到
+MIN_TICK_WIDTH = 0.5     # 吋；刻度標籤的最小間距
+MILESTONE_SIZE = 0.2     # 吋；菱形寬高，間距小於此值的里程碑只畫一個
+
+# 刻度太密時改用的月份間隔（1 = 每月、3 = 每季、12 = 每年）
+_TICK_MONTHS = (1, 3, 6, 12, 24, 60)
+
+
+class GanttRow(NamedTuple):
+    """甘特圖的一列（start / end 為距離起始日的天數，含首尾）"""
+    name: str
+    start: int
+    end: int
+    progress: float          # 0~100
+    color: Tuple[int, int, int]
+    kind: str = "task"       # task / lane（展開泳道的標題列）/ summary（收合的泳道或合併的任務）
+    count: int = 1           # 涵蓋的任務數
+
+
+class GanttLane(NamedTuple):
+    """泳道（name 為 None 表示未分組的任務，不能收合）"""
+    name: Optional[str]
+    summary: GanttRow
+    rows: List[GanttRow]
+
+
+class GanttPlan(NamedTuple):
+    """日期換算後的甘特圖資料"""
+    min_date: datetime
+    total_days: int
+    lanes: List[GanttLane]
+    milestones: List[Tuple[int, Tuple[int, int, int]]]   # (天數, 顏色)
+
+
+class GanttPage(NamedTuple):
+    """一頁甘特圖要畫的列"""
+    page: int                # 從 1 開始
+    rows: List[GanttRow]
+
+
+def _day_numbers(dates: Sequence[str]):
+    """"YYYY-MM-DD" 字串 → 自 1970-01-01 起的天數（int64 陣列）"""
+    import numpy as np
+
+    return np.array(dates, dtype="datetime64[D]").astype(np.int64)
+
+
+def _summarize(name, start, end, progress, color, count, kind="summary") -> GanttRow:
+    """彙總列：起訖取最早 / 最晚，進度依工期加權"""
+    duration = end - start + 1
+    total = duration.sum()
+    weighted = float((progress * duration).sum() / total) if total > 0 else float(progress.mean())
+    return GanttRow(name, int(start.min()), int(end.max()), weighted, color, kind, count)
+
+
+def plan_gantt(tasks: List[Dict], milestones: Optional[List[Dict]] = None,
+               group_key: Optional[str] = "group") -> Optional[GanttPlan]:
     """
-    繪製甘特圖
+    日期換算與泳道分組
 
     Args:
-        slide: 投影片物件
-        left, top: 左上角位置（吋）
-        width, height: 寬高（吋）
-        title: 圖表標題
-        tasks: [{"name": "任務", "start": "2025-01-06", "end": "2025-01-19",
-                 "progress": 100, "color": COLOR_BLUE}, ...]
-        milestones: [{"name": "里程碑", "date": "2025-02-28", "color": COLOR_RED}, ...]
-        time_unit: "day" | "week" | "month"
-        show_today_line: 是否顯示今日線
-        show_progress: 是否顯示進度條
+        tasks: 任務列表（同 draw_gantt_chart）
+        milestones: 里程碑列表
+        group_key: 泳道欄位名稱（None = 不分組）
+
+    Returns:
+        GanttPlan；沒有任何日期時回傳 None
     """
-    def parse_date(date_str):
-        return datetime.strptime(date_str, "%Y-%m-%d")
-
-    all_dates = []
-    for t in tasks:
-        all_dates.append(parse_date(t["start"]))
-        all_dates.append(parse_date(t["end"]))
-    if milestones:
-        for m in milestones:
-            all_dates.append(parse_date(m["date"]))
-
-    min_date = min(all_dates)
-    max_date = max(all_dates)
-    total_days = (max_date - min_date).days + 1
-
-    title_height = 0.35
-    header_height = 0.3
-    name_col_width = 1.8
-    chart_left = left + name_col_width
-    chart_width = width - name_col_width
-    task_count = len(tasks)
-    task_height = (height - title_height - header_height) / task_count if task_count > 0 else 0.5
+    import numpy as np
 
-    # 標題
-    title_box = slide.shapes.add_textbox(
-        Inches(left), Inches(top), Inches(width), Inches(title_height)
+    milestones = milestones or []
+    starts = _day_numbers([t["start"] for t in tasks])
+    ends = _day_numbers([t["end"] for t in tasks])
+    marks = _day_numbers([m["date"] for m in milestones])
+    all_days = np.concatenate((starts, ends, marks))
+    if not len(all_days):
+        return None
+
+    min_day = int(all_days.min())
+    total_days = int(all_days.max()) - min_day + 1
+    starts -= min_day
+    ends -= min_day
+    progress = np.array([t.get("progress", 0) for t in tasks], dtype=float)
+    colors = [t.get("color", COLOR_BLUE) for t in tasks]
+    rows = [GanttRow(t["name"], int(s), int(e), float(p), c)
+            for t, s, e, p, c in zip(tasks, starts.tolist(), ends.tolist(), progress.tolist(), colors)]
+
+    # 泳道依首次出現順序；同泳道的任務維持原始順序
+    lane_names = [t.get(group_key) if group_key else None for t in tasks]
+    lane_index: Dict = {}
+    for name in lane_names:
+        lane_index.setdefault(name, len(lane_index))
+    codes = np.array([lane_index[name] for name in lane_names], dtype=np.int64)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.flatnonzero(np.diff(codes[order])) + 1 if len(order) else np.array([], dtype=np.int64)
+
+    lanes = []
+    for members in np.split(order, bounds) if len(order) else []:
+        name = lane_names[members[0]]
+        summary = _summarize(name, starts[members], ends[members], progress[members],
+                             colors[members[0]], len(members))
+        lanes.append(GanttLane(name, summary, [rows[i] for i in members.tolist()]))
+
+    marks = (marks - min_day).tolist()
+    return GanttPlan(
+        datetime(1970, 1, 1) + timedelta(days=min_day), total_days, lanes,
+        [(day, m.get("color", COLOR_RED)) for day, m in zip(marks, milestones)],
     )
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(12)
-    p.font.bold = True
-    p.font.color.rgb = COLOR_TEXT
-    p.font.name = FONT_NAME
 
-    header_top = top + title_height
 
-    # 計算時間刻度
+def _lane_rows(lane: GanttLane, collapsed: bool) -> List[GanttRow]:
+    if lane.name is None:
+        return lane.rows
+    if collapsed:
+        return [lane.summary._replace(name=f"{lane.name}（{lane.summary.count} 項）")]
+    return [lane.summary._replace(name=str(lane.name), kind="lane")] + lane.rows
+
+
+def _merge_rows(rows: List[GanttRow], max_rows: int) -> List[GanttRow]:
+    """連續的列平均分成 max_rows 組，每組合併成一條彙總列"""
+    import numpy as np
+
+    starts = np.array([r.start for r in rows])
+    ends = np.array([r.end for r in rows])
+    progress = np.array([r.progress for r in rows])
+    counts = np.array([r.count for r in rows])
+    merged = []
+    for group in np.array_split(np.arange(len(rows)), max_rows):
+        first = rows[group[0]]
+        if len(group) == 1:
+            merged.append(first)
+            continue
+        count = int(counts[group].sum())
+        merged.append(_summarize(f"{first.name} 等 {count} 項", starts[group], ends[group],
+                                 progress[group], first.color, count))
+    return merged
+
+
+def gantt_rows(plan: GanttPlan, max_rows: Optional[int] = None, collapsed=None) -> List[GanttRow]:
+    """
+    依可容納的列數決定要畫的列
+
+    Args:
+        plan: plan_gantt 的結果
+        max_rows: 最多幾列（None = 不限制）
+        collapsed: 要收合的泳道名稱列表，True = 全部收合
+
+    Returns:
+        list: GanttRow
+    """
+    folded = {lane.name for lane in plan.lanes if lane.name is not None
+              and (collapsed is True or (collapsed and lane.name in collapsed))}
+
+    def flatten():
+        return [row for lane in plan.lanes for row in _lane_rows(lane, lane.name in folded)]
+
+    rows = flatten()
+    if max_rows is None or len(rows) <= max_rows:
+        return rows
+
+    # a. 由大到小收合泳道（收合一個泳道省下 len(rows) 列）
+    count = len(rows)
+    for lane in sorted(plan.lanes, key=lambda lane: len(lane.rows), reverse=True):
+        if count <= max_rows:
+            break
+        if lane.name is not None and lane.name not in folded:
+            folded.add(lane.name)
+            count -= len(lane.rows)
+    rows = flatten()
+
+    # b. 仍放不下時合併連續的列
+    return rows if len(rows) <= max_rows else _merge_rows(rows, max(1, max_rows))
+
+
+def max_gantt_rows(height: float) -> int:
+    """高度（吋）可容納的列數（扣除標題與時間刻度）"""
+    return max(1, int((height - TITLE_HEIGHT - HEADER_HEIGHT) / MIN_ROW_HEIGHT + 1e-9))
+
+
+def paginate_gantt(tasks: List[Dict], milestones: Optional[List[Dict]] = None, height: float = 3.0,
+                   next_height: Optional[float] = None, group_key: Optional[str] = "group",
+                   collapsed=None, plan: Optional[GanttPlan] = None) -> List[GanttPage]:
+    """
+    續頁版本的列規劃：不自動收合，依每頁可容納的列數分頁
+
+    Args:
+        tasks, milestones, group_key, collapsed: 同 draw_gantt_chart
+        height: 第一頁的高度（吋）
+        next_height: 續頁的高度（None = 同第一頁）
+        plan: 已換算的 plan_gantt 結果（None = 由 tasks 換算）
+
+    Returns:
+        list: GanttPage（沒有任何日期時為空列表）
+    """
+    plan = plan or plan_gantt(tasks, milestones, group_key)
+    if plan is None:
+        return []
+    rows = gantt_rows(plan, collapsed=collapsed)
+    first = max_gantt_rows(height)
+    size = max_gantt_rows(height if next_height is None else next_height)
+    pages = [GanttPage(1, rows[:first])]
+    for start in range(first, len(rows), size):
+        pages.append(GanttPage(len(pages) + 1, rows[start:start + size]))
+    return pages
+
+
+def _ticks(min_date, max_date, total_days, time_unit, chart_width):
+    """時間刻度；週刻度超過圖寬可容納的數量時改用月 / 季 / 年"""
     if time_unit == "week":
-        current = min_date
         ticks = []
+        current = min_date
         while current <= max_date:
             ticks.append(current)
             current += timedelta(days=7)
         if ticks[-1] < max_date:
             ticks.append(max_date)
-    else:
-        tick_count = min(8, total_days)
-        ticks = [min_date + timedelta(days=i * total_days // tick_count) for i in range(tick_count + 1)]
+        max_ticks = max(2, int(chart_width / MIN_TICK_WIDTH))
+        if len(ticks) - 1 <= max_ticks:
+            return ticks, "%m/%d"
+        for months in _TICK_MONTHS:
+            ticks = [min_date]
+            year, month = min_date.year, min_date.month
+            while True:
+                month += 1
+                year, month = year + (month - 1) // 12, (month - 1) % 12 + 1
+                current = datetime(year, month, 1)
+                if current > max_date:
+                    break
+                if (year * 12 + month - 1) % months == 0:
+                    ticks.append(current)
+            if len(ticks) <= max_ticks:
+                break
+        if ticks[-1] < max_date:
+            ticks.append(max_date)
+        return ticks, "%Y/%m"
+    tick_count = min(8, total_days)
+    return [min_date + timedelta(days=i * total_days // tick_count) for i in range(tick_count + 1)], "%m/%d"
+
+
+def _draw_page(scene, left, top, width, height, title, plan, rows, time_unit, show_today_line,
+               show_progress, row_height=None):
+    """畫一頁甘特圖（row_height 為 None 時列高平均分配整個高度）"""
+    import numpy as np
+
+    min_date, total_days = plan.min_date, plan.total_days
+    max_date = min_date + timedelta(days=total_days - 1)
+    chart_left = left + NAME_COL_WIDTH
+    chart_width = width - NAME_COL_WIDTH
+    task_count = len(rows)
+    task_height = row_height or ((height - TITLE_HEIGHT - HEADER_HEIGHT) / task_count if task_count > 0 else 0.5)
+
+    # 標題
+    scene.textbox(left, top, width, TITLE_HEIGHT, para(title, TextStyle(12, True, COLOR_TEXT, FONT_NAME)))
+
+    header_top = top + TITLE_HEIGHT
 
     # 繪製時間刻度
+    ticks, label_format = _ticks(min_date, max_date, total_days, time_unit, chart_width)
+    tick_style = TextStyle(7, False, COLOR_GRAY_DARK, FONT_NAME)
     for i, tick_date in enumerate(ticks[:-1]):
         tick_x = chart_left + (tick_date - min_date).days / total_days * chart_width
-        next_tick_x = chart_left + (ticks[i + 1] - min_date).days / total_days * chart_width if i + 1 < len(ticks) else chart_left + chart_width
-
-        label_box = slide.shapes.add_textbox(
-            Inches(tick_x), Inches(header_top),
-            Inches(next_tick_x - tick_x), Inches(header_height)
-        )
-        tf = label_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = tick_date.strftime("%m/%d")
-        p.font.size = Pt(7)
-        p.font.color.rgb = COLOR_GRAY_DARK
-        p.font.name = FONT_NAME
-        p.alignment = PP_ALIGN.CENTER
-
-        line = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(tick_x), Inches(header_top + header_height),
-            Inches(0.01), Inches(height - title_height - header_height)
-        )
-        line.fill.solid()
-        line.fill.fore_color.rgb = RGBColor(220, 220, 220)
-        line.line.fill.background()
-
-    # 繪製任務
-    task_area_top = header_top + header_height
-    for i, task in enumerate(tasks):
+        next_tick_x = chart_left + (ticks[i + 1] - min_date).days / total_days * chart_width
+
+        scene.textbox(tick_x, header_top, next_tick_x - tick_x, HEADER_HEIGHT,
+                      para(tick_date.strftime(label_format), tick_style, "center"))
+
+        scene.rect(tick_x, header_top + HEADER_HEIGHT,
+                   0.01, height - TITLE_HEIGHT - HEADER_HEIGHT, fill=_GRID_COLOR)
+
+    # 繪製任務（位置一次算完）
+    task_area_top = header_top + HEADER_HEIGHT
+    name_style = TextStyle(8, False, COLOR_TEXT, FONT_NAME)
+    group_style = TextStyle(8, True, COLOR_TEXT, FONT_NAME)
+    starts = np.array([row.start for row in rows], dtype=float)
+    ends = np.array([row.end for row in rows], dtype=float)
+    bar_lefts = chart_left + starts / total_days * chart_width
+    bar_widths = np.maximum((ends - starts) / total_days * chart_width, MIN_BAR_WIDTH)
+    for i, (row, bar_left, bar_width) in enumerate(zip(rows, bar_lefts.tolist(), bar_widths.tolist())):
         task_top = task_area_top + i * task_height
-        task_start = parse_date(task["start"])
-        task_end = parse_date(task["end"])
-        color = task.get("color", COLOR_BLUE)
-        progress = task.get("progress", 0)
-
-        name_box = slide.shapes.add_textbox(
-            Inches(left), Inches(task_top),
-            Inches(name_col_width - 0.1), Inches(task_height)
-        )
-        tf = name_box.text_frame
-        tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.text = task["name"]
-        p.font.size = Pt(8)
-        p.font.color.rgb = COLOR_TEXT
-        p.font.name = FONT_NAME
-
-        start_offset = (task_start - min_date).days / total_days
-        end_offset = (task_end - min_date).days / total_days
-        bar_left = chart_left + start_offset * chart_width
-        bar_width = (end_offset - start_offset) * chart_width
+
+        if row.kind == "lane":
+            scene.rect(left, task_top, width, task_height, fill=_LANE_BG_COLOR)
+        scene.textbox(left, task_top, NAME_COL_WIDTH - 0.1, task_height,
+                      text_frame(para(row.name, name_style if row.kind == "task" else group_style),
+                                 word_wrap=True))
+
+        if row.kind == "lane":
+            # 泳道標題列：細長的範圍條
+            scene.rect(bar_left, task_top + task_height * 0.4, bar_width, task_height * 0.2, fill=row.color)
+            continue
+
         bar_top = task_top + task_height * 0.2
         bar_height = task_height * 0.6
 
-        bg_bar = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(bar_left), Inches(bar_top),
-            Inches(bar_width), Inches(bar_height)
-        )
-        bg_bar.fill.solid()
-        bg_bar.fill.fore_color.rgb = RGBColor(230, 230, 230)
-        bg_bar.line.fill.background()
-
-        if show_progress and progress > 0:
-            progress_width = bar_width * progress / 100
-            progress_bar = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                Inches(bar_left), Inches(bar_top),
-                Inches(progress_width), Inches(bar_height)
-            )
-            progress_bar.fill.solid()
-            progress_bar.fill.fore_color.rgb = color
-            progress_bar.line.fill.background()
-
-    # 繪製里程碑
-    if milestones:
-        for m in milestones:
-            m_date = parse_date(m["date"])
-            m_offset = (m_date - min_date).days / total_days
-            m_x = chart_left + m_offset * chart_width
-            m_color = m.get("color", COLOR_RED)
-
-            diamond = slide.shapes.add_shape(
-                MSO_SHAPE.DIAMOND,
-                Inches(m_x - 0.1), Inches(task_area_top - 0.05),
-                Inches(0.2), Inches(0.2)
-            )
-            diamond.fill.solid()
-            diamond.fill.fore_color.rgb = m_color
-            diamond.line.fill.background()
+        scene.rounded_rect(bar_left, bar_top, bar_width, bar_height, fill=_BAR_BG_COLOR)
+
+        if show_progress and row.progress > 0:
+            progress_width = bar_width * row.progress / 100
+            scene.rounded_rect(bar_left, bar_top, progress_width, bar_height, fill=row.color)
+
+    # 繪製里程碑（同一個菱形寬度內只畫第一個）
+    if plan.milestones:
+        days = np.array([day for day, _ in plan.milestones], dtype=float)
+        m_xs = chart_left + days / total_days * chart_width
+        if len(m_xs) > chart_width / MILESTONE_SIZE:
+            _, keep = np.unique(np.floor((m_xs - chart_left) / MILESTONE_SIZE), return_index=True)
+            keep = sorted(keep.tolist())
+        else:
+            keep = range(len(m_xs))
+        m_xs = m_xs.tolist()
+        for k in keep:
+            scene.shape("DIAMOND", m_xs[k] - MILESTONE_SIZE / 2, task_area_top - 0.05,
+                        MILESTONE_SIZE, MILESTONE_SIZE, fill=plan.milestones[k][1])
 
     # 今日線
     if show_today_line:
@@ -172,11 +358,91 @@ def draw_gantt_chart(slide, left, top, width, height, title, tasks, milestones=N
         if min_date <= today <= max_date:
             today_offset = (today - min_date).days / total_days
             today_x = chart_left + today_offset * chart_width
-            today_line = slide.shapes.add_shape(
-                MSO_SHAPE.RECTANGLE,
-                Inches(today_x), Inches(header_top),
-                Inches(0.02), Inches(height - title_height)
-            )
-            today_line.fill.solid()
-            today_line.fill.fore_color.rgb = COLOR_RED
-            today_line.line.fill.background()
+            scene.rect(today_x, header_top, 0.02, height - TITLE_HEIGHT, fill=COLOR_RED)
+    return scene
+
+
+def build_gantt_chart(scene, left, top, width, height, title, tasks, milestones=None,
+                      time_unit="week", show_today_line=True, show_progress=True,
+                      group_key="group", collapsed=None):
+    """
+    產生甘特圖的 scene 節點（參數同 draw_gantt_chart，scene 單位為吋；列數超過高度時收合 / 合併）
+    """
+    plan = plan_gantt(tasks, milestones, group_key)
+    if plan is None:
+        scene.textbox(left, top, width, TITLE_HEIGHT, para(title, TextStyle(12, True, COLOR_TEXT, FONT_NAME)))
+        return scene
+    rows = gantt_rows(plan, max_gantt_rows(height), collapsed)
+    return _draw_page(scene, left, top, width, height, title, plan, rows, time_unit,
+                      show_today_line, show_progress)
+
+
+def gantt_pages(left, top, width, height, title, tasks, milestones=None, time_unit="week",
+                show_today_line=True, show_progress=True, group_key="group", collapsed=None,
+                next_top=None, next_height=None) -> Iterator[Scene]:
+    """
+    續頁版本：逐頁產生 Scene（吋），第一頁位於 (left, top)，續頁位於 (left, next_top)
+
+    只有一頁時同 build_gantt_chart；多頁時各頁列高相同（不低於 MIN_ROW_HEIGHT）。
+    """
+    next_top = top if next_top is None else next_top
+    next_height = height if next_height is None else next_height
+    plan = plan_gantt(tasks, milestones, group_key)
+    pages = paginate_gantt(tasks, milestones, height, next_height, group_key, collapsed, plan)
+    if not pages:
+        yield build_gantt_chart(Scene(unit="in"), left, top, width, height, title, tasks, milestones,
+                                time_unit, show_today_line, show_progress, group_key, collapsed)
+        return
+    if len(pages) == 1:
+        yield _draw_page(Scene(unit="in"), left, top, width, height, title, plan, pages[0].rows,
+                         time_unit, show_today_line, show_progress)
+        return
+    # 各頁列高相同，取第一頁與續頁都放得下的值
+    row_height = min((h - TITLE_HEIGHT - HEADER_HEIGHT) / max_gantt_rows(h) for h in (height, next_height))
+    for page in pages:
+        page_top, page_height = (top, height) if page.page == 1 else (next_top, next_height)
+        yield _draw_page(Scene(unit="in"), left, page_top, width, page_height, title, plan, page.rows,
+                         time_unit, show_today_line, show_progress, row_height)
+
+
+def draw_gantt_chart(slide, left, top, width, height, title, tasks, milestones=None,
+                     time_unit="week", show_today_line=True, show_progress=True,
+                     group_key="group", collapsed=None, continuation=None,
+                     continuation_top=None, continuation_height=None):
+    """
+    繪製甘特圖
+
+    Args:
+        slide: 投影片物件
+        left, top: 左上角位置（吋）
+        width, height: 寬高（吋）
+        title: 圖表標題
+        tasks: [{"name": "任務", "start": "2025-01-06", "end": "2025-01-19",
+                 "progress": 100, "color": COLOR_BLUE, "group": "開發"}, ...]
+        milestones: [{"name": "里程碑", "date": "2025-02-28", "color": COLOR_RED}, ...]
+        time_unit: "day" | "week" | "month"
+        show_today_line: 是否顯示今日線
+        show_progress: 是否顯示進度條
+        group_key: 泳道欄位名稱（None = 不分組）
+        collapsed: 要收合成彙總列的泳道名稱列表，True = 全部收合
+        continuation: 續頁 callback（頁碼 → slide）；None 時放不下的列自動收合 / 合併在本頁
+        continuation_top, continuation_height: 續頁的甘特圖位置與高度（吋，None = 同本頁）
+
+    Returns:
+        list: 有畫甘特圖的投影片（第一個為 slide）
+    """
+    if continuation is None:
+        scene = build_gantt_chart(Scene(unit="in"), left, top, width, height, title, tasks,
+                                  milestones, time_unit, show_today_line, show_progress,
+                                  group_key, collapsed)
+        flush_pptx(scene, slide)
+        return [slide]
+
+    slides = []
+    for number, scene in enumerate(gantt_pages(left, top, width, height, title, tasks, milestones,
+                                               time_unit, show_today_line, show_progress, group_key,
+                                               collapsed, continuation_top, continuation_height), 1):
+        target = slide if number == 1 else continuation(number)
+        flush_pptx(scene, target)
+        slides.append(target)
+    return slides
@@ -1,9 +1,23 @@
 """純文字術語卡片"""
-from pptx.util import Inches, Pt
-from pptx.enum.shapes import MSO_SHAPE
+from scene import Scene, TextStyle, para, text_frame, flush_pptx
 
 from ._colors import COLOR_BLUE, COLOR_GRAY_BG, COLOR_TEXT, FONT_NAME
 
+_TERM_STYLE = TextStyle(9, True, COLOR_BLUE, FONT_NAME)
+_DESC_STYLE = TextStyle(7, False, COLOR_TEXT, FONT_NAME)
+
+
+def build_glossary_card_text_only(scene, left, top, width, height, term, desc):
+    """
+    產生純文字術語卡片的 scene 節點（參數同 draw_glossary_card_text_only，scene 單位為吋）
+    """
+    scene.rounded_rect(left, top, width, height,
+                       fill=COLOR_GRAY_BG, line=COLOR_BLUE, line_width=0.5)
+    scene.textbox(left + 0.08, top + 0.05, width - 0.16, 0.28, para(term, _TERM_STYLE))
+    scene.textbox(left + 0.08, top + 0.33, width - 0.16, height - 0.4,
+                  text_frame(para(desc, _DESC_STYLE), word_wrap=True))
+    return scene
+
 
 def draw_glossary_card_text_only(slide, left, top, width, height, term, desc):
     """
@@ -16,36 +30,5 @@ def draw_glossary_card_text_only(slide, left, top, width, height, term, desc):
         term: 術語名稱
         desc: 術語解釋（簡短版）
     """
-    card = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        Inches(left), Inches(top),
-        Inches(width), Inches(height)
-    )
-    card.fill.solid()
-    card.fill.fore_color.rgb = COLOR_GRAY_BG
-    card.line.color.rgb = COLOR_BLUE
-    card.line.width = Pt(0.5)
-
-    term_box = slide.shapes.add_textbox(
-        Inches(left + 0.08), Inches(top + 0.05),
-        Inches(width - 0.16), Inches(0.28)
-    )
-    tf = term_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = term
-    p.font.size = Pt(9)
-    p.font.bold = True
-    p.font.color.rgb = COLOR_BLUE
-    p.font.name = FONT_NAME
-
-    desc_box = slide.shapes.add_textbox(
-        Inches(left + 0.08), Inches(top + 0.33),
-        Inches(width - 0.16), Inches(height - 0.4)
-    )
-    tf = desc_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = desc
-    p.font.size = Pt(7)
-    p.font.color.rgb = COLOR_TEXT
-    p.font.name = FONT_NAME
+    scene = build_glossary_card_text_only(Scene(unit="in"), left, top, width, height, term, desc)
+    flush_pptx(scene, slide)
@@ -1,76 +1,66 @@
 """帶示意圖的術語卡片"""
-from pptx.util import Inches, Pt
-from pptx.enum.shapes import MSO_SHAPE
+from scene import Scene, TextStyle, para, text_frame, flush_pptx
 
 from ._colors import COLOR_BLUE, COLOR_GRAY_BG, COLOR_TEXT, FONT_NAME
-from .draw_mini_flow import draw_mini_flow
-from .draw_mini_before_after import draw_mini_before_after
-from .draw_mini_layers import draw_mini_layers
-from .draw_mini_timeline import draw_mini_timeline
-from .draw_mini_icon import draw_mini_icon
+from .draw_mini_flow import build_mini_flow
+from .draw_mini_before_after import build_mini_before_after
+from .draw_mini_layers import build_mini_layers
+from .draw_mini_timeline import build_mini_timeline
+from .draw_mini_icon import build_mini_icon
 
+_TERM_STYLE = TextStyle(11, True, COLOR_BLUE, FONT_NAME)
+_DESC_STYLE = TextStyle(9, False, COLOR_TEXT, FONT_NAME)
 
-def draw_glossary_card_with_diagram(slide, left, top, width, height, term, desc, diagram_type, diagram_params):
+# 未指定 diagram_height 時示意圖佔卡片高度的比例
+DIAGRAM_RATIO = 0.45
+
+
+def build_glossary_card_with_diagram(scene, left, top, width, height, term, desc, diagram_type,
+                                     diagram_params, diagram_height=None):
     """
-    繪製帶示意圖的術語卡片
+    產生帶示意圖術語卡片的 scene 節點（參數同 draw_glossary_card_with_diagram，scene 單位為吋）
 
-    Args:
-        slide: 投影片物件
-        left, top: 左上角位置（吋）
-        width, height: 寬高（吋）
-        term: 術語名稱
-        desc: 術語解釋
-        diagram_type: "flow" | "before_after" | "layers" | "timeline" | "icon"
-        diagram_params: 示意圖參數
+    diagram_height 可固定示意圖高度（吋），其餘高度留給說明文字；None 時為卡片高度的 45%。
     """
-    card = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        Inches(left), Inches(top),
-        Inches(width), Inches(height)
-    )
-    card.fill.solid()
-    card.fill.fore_color.rgb = COLOR_GRAY_BG
-    card.line.color.rgb = COLOR_BLUE
-    card.line.width = Pt(1)
+    scene.rounded_rect(left, top, width, height, fill=COLOR_GRAY_BG, line=COLOR_BLUE, line_width=1)
 
-    diagram_height = height * 0.45
+    if diagram_height is None:
+        diagram_height = height * DIAGRAM_RATIO
     diagram_top = top + 0.1
     diagram_left = left + 0.15
     diagram_width = width - 0.3
+    box = (diagram_left, diagram_top, diagram_width, diagram_height)
 
     if diagram_type == "flow":
-        draw_mini_flow(slide, diagram_left, diagram_top, diagram_width, diagram_height, diagram_params.get("nodes", []))
+        build_mini_flow(scene, *box, diagram_params.get("nodes", []))
     elif diagram_type == "before_after":
-        draw_mini_before_after(slide, diagram_left, diagram_top, diagram_width, diagram_height,
-                               diagram_params.get("before", ""), diagram_params.get("after", ""))
+        build_mini_before_after(scene, *box, diagram_params.get("before", ""), diagram_params.get("after", ""))
     elif diagram_type == "layers":
-        draw_mini_layers(slide, diagram_left, diagram_top, diagram_width, diagram_height, diagram_params.get("layers", []))
+        build_mini_layers(scene, *box, diagram_params.get("layers", []))
     elif diagram_type == "timeline":
-        draw_mini_timeline(slide, diagram_left, diagram_top, diagram_width, diagram_height, diagram_params.get("stages", []))
+        build_mini_timeline(scene, *box, diagram_params.get("stages", []))
     elif diagram_type == "icon":
-        draw_mini_icon(slide, diagram_left, diagram_top, diagram_width, diagram_height,
-                       diagram_params.get("icon_type", ""), diagram_params.get("label", ""))
+        build_mini_icon(scene, *box, diagram_params.get("icon_type", ""), diagram_params.get("label", ""))
+
+    scene.textbox(left + 0.1, top + diagram_height + 0.15, width - 0.2, 0.35, para(term, _TERM_STYLE))
+    scene.textbox(left + 0.1, top + diagram_height + 0.5, width - 0.2, height - diagram_height - 0.6,
+                  text_frame(para(desc, _DESC_STYLE), word_wrap=True))
+    return scene
 
-    term_box = slide.shapes.add_textbox(
-        Inches(left + 0.1), Inches(top + diagram_height + 0.15),
-        Inches(width - 0.2), Inches(0.35)
-    )
-    tf = term_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = term
-    p.font.size = Pt(11)
-    p.font.bold = True
-    p.font.color.rgb = COLOR_BLUE
-    p.font.name = FONT_NAME
 
-    desc_box = slide.shapes.add_textbox(
-        Inches(left + 0.1), Inches(top + diagram_height + 0.5),
-        Inches(width - 0.2), Inches(height - diagram_height - 0.6)
-    )
-    tf = desc_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = desc
-    p.font.size = Pt(9)
-    p.font.color.rgb = COLOR_TEXT
-    p.font.name = FONT_NAME
+def draw_glossary_card_with_diagram(slide, left, top, width, height, term, desc, diagram_type, diagram_params):
+    """
+    繪製帶示意圖的術語卡片
+
+    Args:
+        slide: 投影片物件
+        left, top: 左上角位置（吋）
+        width, height: 寬高（吋）
+        term: 術語名稱
+        desc: 術語解釋
+        diagram_type: "flow" | "before_after" | "layers" | "timeline" | "icon"
+        diagram_params: 示意圖參數
+    """
+    scene = build_glossary_card_with_diagram(Scene(unit="in"), left, top, width, height, term, desc,
+                                             diagram_type, diagram_params)
+    flush_pptx(scene, slide)
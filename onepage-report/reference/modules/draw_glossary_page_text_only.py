@@ -1,30 +1,22 @@
 """術語頁面（純文字版 16 格）"""
-from pptx.util import Inches, Pt
+from scene import Scene, TextStyle, para, flush_pptx
 
 from ._colors import COLOR_TEXT, FONT_NAME
-from .draw_glossary_card_text_only import draw_glossary_card_text_only
+from .draw_glossary_card_text_only import build_glossary_card_text_only
 
+_TITLE_STYLE = TextStyle(16, True, COLOR_TEXT, FONT_NAME)
 
-def draw_glossary_page_text_only(slide, title, terms):
-    """
-    繪製一頁 16 格純文字術語卡片（4 列 x 4 欄）
+# 每頁最多卡片數（4 列 x 4 欄）
+TERMS_PER_PAGE = 16
 
-    Args:
-        slide: 投影片物件
-        title: 頁面標題
-        terms: 最多 16 個術語，每個是 {
-            "term": "術語名稱",
-            "desc": "簡短解釋（<=50字）"
-        }
+
+def build_glossary_page_text_only(scene, title, terms):
     """
-    title_box = slide.shapes.add_textbox(Inches(0.3), Inches(0.1), Inches(12.7), Inches(0.35))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(16)
-    p.font.bold = True
-    p.font.color.rgb = COLOR_TEXT
-    p.font.name = FONT_NAME
+    產生 16 格純文字術語頁的 scene 節點（參數同 draw_glossary_page_text_only，scene 單位為吋）
+    """
+    if len(terms) > TERMS_PER_PAGE:
+        raise ValueError(f"術語 {len(terms)} 個超過單頁 {TERMS_PER_PAGE} 格，請改用 draw_glossary_pages 自動分頁")
+    scene.textbox(0.3, 0.1, 12.7, 0.35, para(title, _TITLE_STYLE))
 
     margin = 0.25
     gap = 0.1
@@ -33,14 +25,33 @@ def draw_glossary_page_text_only(slide, title, terms):
     card_width = (13.333 - margin * 2 - gap * (cols - 1)) / cols
     card_height = (7.5 - 0.5 - gap * (rows - 1)) / rows
 
-    for i, term_data in enumerate(terms[:16]):
+    for i, term_data in enumerate(terms):
         row = i // cols
         col = i % cols
         x = margin + col * (card_width + gap)
         y = 0.5 + row * (card_height + gap)
 
-        draw_glossary_card_text_only(
-            slide, x, y, card_width, card_height,
+        build_glossary_card_text_only(
+            scene, x, y, card_width, card_height,
             term_data.get("term", ""),
             term_data.get("desc", "")
         )
+    return scene
+
+
+def draw_glossary_page_text_only(slide, title, terms):
+    """
+    繪製一頁 16 格純文字術語卡片（4 列 x 4 欄）
+
+    卡片高度固定；術語較多或說明較長時改用 draw_glossary_pages（量測後自動分頁）。
+
+    Args:
+        slide: 投影片物件
+        title: 頁面標題
+        terms: 最多 16 個術語（超過時 ValueError），每個是 {
+            "term": "術語名稱",
+            "desc": "簡短解釋（<=50字）"
+        }
+    """
+    scene = build_glossary_page_text_only(Scene(unit="in"), title, terms)
+    flush_pptx(scene, slide)
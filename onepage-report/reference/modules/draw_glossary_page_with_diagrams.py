@@ -1,32 +1,22 @@
 """術語頁面（有圖片版 6 格）"""
-from pptx.util import Inches, Pt
+from scene import Scene, TextStyle, para, flush_pptx
 
 from ._colors import COLOR_TEXT, FONT_NAME
-from .draw_glossary_card_with_diagram import draw_glossary_card_with_diagram
+from .draw_glossary_card_with_diagram import build_glossary_card_with_diagram
 
+_TITLE_STYLE = TextStyle(18, True, COLOR_TEXT, FONT_NAME)
 
-def draw_glossary_page_with_diagrams(slide, title, terms):
-    """
-    繪製一頁 6 格有圖片的術語卡片（2 列 x 3 欄）
+# 每頁最多卡片數（2 列 x 3 欄）
+TERMS_PER_PAGE = 6
 
-    Args:
-        slide: 投影片物件
-        title: 頁面標題
-        terms: 最多 6 個術語，每個是 {
-            "term": "術語名稱",
-            "desc": "解釋",
-            "diagram_type": "flow|before_after|layers|timeline|icon",
-            "diagram_params": {...}
-        }
+
+def build_glossary_page_with_diagrams(scene, title, terms):
     """
-    title_box = slide.shapes.add_textbox(Inches(0.3), Inches(0.15), Inches(12.7), Inches(0.4))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(18)
-    p.font.bold = True
-    p.font.color.rgb = COLOR_TEXT
-    p.font.name = FONT_NAME
+    產生 6 格有圖片術語頁的 scene 節點（參數同 draw_glossary_page_with_diagrams，scene 單位為吋）
+    """
+    if len(terms) > TERMS_PER_PAGE:
+        raise ValueError(f"術語 {len(terms)} 個超過單頁 {TERMS_PER_PAGE} 格，請改用 draw_glossary_pages 自動分頁")
+    scene.textbox(0.3, 0.15, 12.7, 0.4, para(title, _TITLE_STYLE))
 
     margin = 0.3
     gap = 0.2
@@ -35,16 +25,37 @@ def draw_glossary_page_with_diagrams(slide, title, terms):
     card_width = (13.333 - margin * 2 - gap * (cols - 1)) / cols
     card_height = (7.5 - 0.6 - gap * (rows - 1)) / rows
 
-    for i, term_data in enumerate(terms[:6]):
+    for i, term_data in enumerate(terms):
         row = i // cols
         col = i % cols
         x = margin + col * (card_width + gap)
         y = 0.6 + row * (card_height + gap)
 
-        draw_glossary_card_with_diagram(
-            slide, x, y, card_width, card_height,
+        build_glossary_card_with_diagram(
+            scene, x, y, card_width, card_height,
             term_data.get("term", ""),
             term_data.get("desc", ""),
             term_data.get("diagram_type", "icon"),
             term_data.get("diagram_params", {})
         )
+    return scene
+
+
+def draw_glossary_page_with_diagrams(slide, title, terms):
+    """
+    繪製一頁 6 格有圖片的術語卡片（2 列 x 3 欄）
+
+    卡片高度固定；術語較多或說明較長時改用 draw_glossary_pages（量測後自動分頁）。
+
+    Args:
+        slide: 投影片物件
+        title: 頁面標題
+        terms: 最多 6 個術語（超過時 ValueError），每個是 {
+            "term": "術語名稱",
+            "desc": "解釋",
+            "diagram_type": "flow|before_after|layers|timeline|icon",
+            "diagram_params": {...}
+        }
+    """
+    scene = build_glossary_page_with_diagrams(Scene(unit="in"), title, terms)
+    flush_pptx(scene, slide)
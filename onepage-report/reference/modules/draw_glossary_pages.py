@@ -0,0 +1,290 @@
+"""
+術語附錄分頁（量測卡片高度後裝箱）
+
+draw_glossary_page_text_only / draw_glossary_page_with_diagrams 是固定格數的單頁版面，
+卡片高度固定，說明文字過長會溢出。這裡先以 _textfit 量測每張卡片實際需要的高度，
+再把不等高的卡片裝進各頁的欄位，使頁數最少：
+
+    1. 量測：說明文字依欄寬折行，卡片高度 = 固定部分（標題、示意圖）+ 文字高度
+    2. 依序填欄：保持原始順序，放不下就換下一欄
+    3. 裝箱：每一欄是容量為版面高度的箱子，卡片由高到低放進第一個放得下的欄
+       （first-fit decreasing）；只有頁數比依序填欄少時才採用，欄內仍依原始順序排列
+
+一張卡片比整欄還高時，說明文字在行邊界切成數張「（續）」卡片，術語不會被截掉。
+各頁的 slide XML 預設在本程序依序產生；頁數很多或指定 workers 時才在多個程序平行產生
+（glossary_slide_xmls），再由主程序貼上或串流寫出。開 process pool 時呼叫端需有
+if __name__ == "__main__" 保護（Windows / macOS 以 spawn 啟動子程序）。
+
+使用範例：
+    from modules import draw_glossary_pages
+
+    slides = draw_glossary_pages(prs, "附錄：術語", terms)                      # 純文字卡片
+    slides = draw_glossary_pages(prs, "附錄：術語圖解", terms, with_diagrams=True)
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, NamedTuple, Optional
+
+from scene import Scene, TextStyle, para
+from scene.ooxml_writer import scene_to_slide_xml, paste_slide_xml
+
+from ._colors import COLOR_TEXT, FONT_NAME
+from ._textfit import LINE_SPACING, PPTX_TEXTBOX_MARGINS, wrap_lines
+from .draw_glossary_card_text_only import build_glossary_card_text_only
+from .draw_glossary_card_with_diagram import build_glossary_card_with_diagram
+
+SLIDE_WIDTH = 13.333
+
+# 分頁後的示意圖固定高度（吋）；單頁 6 格版約 1.5 吋，縮小讓短說明的卡片每欄可放 3 張
+DIAGRAM_HEIGHT = 1.0
+
+# workers=None 時開 process pool 的最少頁數：每頁 XML 約 1~2 ms，
+# 以 spawn 啟動 pool（子程序重新載入 scene / python-pptx）約 0.8 s，數百頁以下依序產生較快
+PARALLEL_MIN_PAGES = 500
+
+# 續頁卡片的術語後綴
+CONTINUED_SUFFIX = "（續）"
+
+
+class GlossaryGrid(NamedTuple):
+    """術語頁的欄位版面（吋）與卡片文字尺寸"""
+    columns: int
+    margin: float
+    gap: float
+    top: float
+    bottom: float
+    title_top: float
+    title_size: float
+    desc_size: float
+    card_base: float      # 說明文字框與示意圖以外的卡片高度
+    desc_inset: float     # 說明文字框左右各內縮
+    diagram: float        # 示意圖高度（0 = 無示意圖）
+
+
+# 純文字卡片：4 欄，卡片排版同 build_glossary_card_text_only（說明 7pt，自 top+0.33 起）
+TEXT_GRID = GlossaryGrid(4, 0.25, 0.1, 0.5, 7.4, 0.1, 16, 7, 0.33 + 0.07, 0.08, 0.0)
+# 帶圖卡片：3 欄，卡片排版同 build_glossary_card_with_diagram（說明 9pt，自示意圖下 0.5 起）
+DIAGRAM_GRID = GlossaryGrid(3, 0.3, 0.2, 0.6, 7.4, 0.15, 18, 9, 0.5 + 0.1, 0.1, DIAGRAM_HEIGHT)
+
+
+class GlossaryCard(NamedTuple):
+    """量測後的卡片（height 為吋；part > 0 表示續卡）"""
+    index: int
+    part: int
+    term: str
+    desc: str
+    diagram_type: Optional[str]
+    diagram_params: Dict
+    height: float
+
+
+class GlossaryPage(NamedTuple):
+    """一頁術語卡片：columns[i] 為第 i 欄由上而下的卡片"""
+    columns: List[List[GlossaryCard]]
+
+
+def _grid(with_diagrams: bool) -> GlossaryGrid:
+    return DIAGRAM_GRID if with_diagrams else TEXT_GRID
+
+
+def card_width(grid: GlossaryGrid) -> float:
+    """卡片寬度（吋）"""
+    return (SLIDE_WIDTH - grid.margin * 2 - grid.gap * (grid.columns - 1)) / grid.columns
+
+
+def _desc_lines(desc: str, width: float, grid: GlossaryGrid) -> List[str]:
+    """說明文字依說明框寬度折行；段落結尾的行保留換行符號"""
+    inner = width * 72 - grid.desc_inset * 2 * 72 - PPTX_TEXTBOX_MARGINS[0] - PPTX_TEXTBOX_MARGINS[1]
+    lines = []
+    for paragraph in desc.split("\n"):
+        wrapped = wrap_lines(paragraph, inner, grid.desc_size) or [""]
+        wrapped[-1] += "\n"
+        lines.extend(wrapped)
+    lines[-1] = lines[-1][:-1]
+    return lines
+
+
+def _card_height(line_count: int, grid: GlossaryGrid, diagram: float) -> float:
+    text = line_count * grid.desc_size * LINE_SPACING + PPTX_TEXTBOX_MARGINS[2] + PPTX_TEXTBOX_MARGINS[3]
+    return grid.card_base + diagram + text / 72
+
+
+def measure_glossary_card(index: int, term_data: Dict, with_diagrams: bool = False) -> List[GlossaryCard]:
+    """
+    量測一個術語的卡片高度
+
+    說明文字超過一整欄時在行邊界切開，後續卡片的術語加上「（續）」且不畫示意圖。
+
+    Args:
+        index: 術語的原始順序
+        term_data: {"term": ..., "desc": ..., "diagram_type": ..., "diagram_params": {...}}
+        with_diagrams: 是否為帶圖卡片
+
+    Returns:
+        list: GlossaryCard（通常只有一張）
+    """
+    grid = _grid(with_diagrams)
+    term = term_data.get("term", "")
+    diagram_type = term_data.get("diagram_type", "icon") if with_diagrams else None
+    diagram_params = term_data.get("diagram_params", {}) if with_diagrams else {}
+    lines = _desc_lines(term_data.get("desc", ""), card_width(grid), grid)
+
+    line_height = grid.desc_size * LINE_SPACING / 72
+    cards = []
+    start = 0
+    while start < len(lines) or not cards:
+        part = len(cards)
+        diagram = grid.diagram if part == 0 else 0.0
+        per_card = max(1, int((grid.bottom - grid.top - _card_height(0, grid, diagram)) / line_height))
+        chunk = lines[start:start + per_card]
+        cards.append(GlossaryCard(index, part, term + CONTINUED_SUFFIX if part else term,
+                                  "".join(chunk).rstrip("\n"),
+                                  diagram_type if part == 0 else None,
+                                  diagram_params if part == 0 else {},
+                                  _card_height(len(chunk), grid, diagram)))
+        start += per_card
+    return cards
+
+
+def paginate_glossary(terms: List[Dict], with_diagrams: bool = False) -> List[GlossaryPage]:
+    """
+    量測術語卡片並裝箱成最少頁數
+
+    Args:
+        terms: 術語列表（格式同 draw_glossary_page_text_only / draw_glossary_page_with_diagrams）
+        with_diagrams: 是否為帶圖卡片
+
+    Returns:
+        list: GlossaryPage（所有術語都會出現，順序大致依原始順序）
+    """
+    grid = _grid(with_diagrams)
+    cards = [card for i, term_data in enumerate(terms)
+             for card in measure_glossary_card(i, term_data, with_diagrams)]
+
+    columns = _fill_columns(cards, grid)
+    packed = _fill_columns(sorted(cards, key=lambda c: -c.height), grid, first_fit=True)
+    if -(-len(packed) // grid.columns) < -(-len(columns) // grid.columns):
+        for column in packed:
+            column.sort(key=lambda c: (c.index, c.part))
+        columns = sorted(packed, key=lambda column: (column[0].index, column[0].part))
+    return [GlossaryPage(columns[i:i + grid.columns]) for i in range(0, len(columns), grid.columns)]
+
+
+def _fill_columns(cards: List[GlossaryCard], grid: GlossaryGrid, first_fit: bool = False) -> List[List[GlossaryCard]]:
+    """
+    將卡片依序放入欄位
+
+    first_fit=False 只看最後一欄（保持順序）；True 放進第一個放得下的欄。
+    """
+    capacity = grid.bottom - grid.top + 1e-6
+    columns: List[List[GlossaryCard]] = []
+    used: List[float] = []
+    for card in cards:
+        candidates = range(len(used)) if first_fit else range(len(used) - 1, len(used))
+        for i in candidates:
+            if i >= 0 and used[i] + grid.gap + card.height <= capacity:
+                columns[i].append(card)
+                used[i] += grid.gap + card.height
+                break
+        else:
+            columns.append([card])
+            used.append(card.height)
+    return columns
+
+
+def page_title(title: str, number: int, total: int) -> str:
+    """多頁時在標題後加上頁碼，例如「附錄：術語（2/5）」"""
+    return f"{title}（{number}/{total}）" if total > 1 else title
+
+
+def build_glossary_page(scene, title, page, with_diagrams=False):
+    """
+    產生一頁已分頁術語卡片的 scene 節點（scene 單位為吋）
+
+    Args:
+        scene: Scene 物件
+        title: 頁面標題
+        page: GlossaryPage
+        with_diagrams: 是否為帶圖卡片
+    """
+    grid = _grid(with_diagrams)
+    width = card_width(grid)
+    scene.textbox(0.3, grid.title_top, 12.7, grid.top - grid.title_top - 0.05,
+                  para(title, TextStyle(grid.title_size, True, COLOR_TEXT, FONT_NAME)))
+
+    for col, column in enumerate(page.columns):
+        x = grid.margin + col * (width + grid.gap)
+        y = grid.top
+        for card in column:
+            if card.diagram_type is not None:
+                build_glossary_card_with_diagram(scene, x, y, width, card.height, card.term, card.desc,
+                                                 card.diagram_type, card.diagram_params, grid.diagram)
+            elif with_diagrams:
+                # 續卡：沒有示意圖，說明緊接在術語下方
+                build_glossary_card_with_diagram(scene, x, y, width, card.height, card.term,
+                                                 card.desc, None, {}, 0.0)
+            else:
+                build_glossary_card_text_only(scene, x, y, width, card.height, card.term, card.desc)
+            y += card.height + grid.gap
+    return scene
+
+
+def _page_xml(job, with_diagrams: bool) -> str:
+    """單頁 scene → slide XML（可在子程序執行）"""
+    title, page = job
+    return scene_to_slide_xml(build_glossary_page(Scene(unit="in"), title, page, with_diagrams))
+
+
+def glossary_slide_xmls(title, pages, with_diagrams=False, workers=None) -> List[str]:
+    """
+    產生各頁的 slide XML（頁數很多或指定 workers 時平行產生）
+
+    Args:
+        title: 頁面標題（多頁時自動加上頁碼）
+        pages: paginate_glossary 的結果
+        with_diagrams: 是否為帶圖卡片
+        workers: 平行程序數（None = 頁數達 PARALLEL_MIN_PAGES 才開 CPU 數個程序，否則依序產生；
+                 1 = 不開 process pool）
+
+    Returns:
+        list: 依頁序的 slide XML，可交給 OoxmlDeckWriter.add_slide_xml 或 paste_slide_xml
+    """
+    jobs = [(page_title(title, i, len(pages)), page) for i, page in enumerate(pages, 1)]
+    render = partial(_page_xml, with_diagrams=with_diagrams)
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(jobs) >= PARALLEL_MIN_PAGES else 1
+    if len(jobs) > 1 and workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            return list(pool.map(render, jobs))
+    return [render(job) for job in jobs]
+
+
+def draw_glossary_pages(prs, title, terms, with_diagrams=False, layout_index=6, workers=None):
+    """
+    繪製術語附錄（自動分頁，不遺漏術語）
+
+    Args:
+        prs: Presentation 物件（在最後新增投影片）
+        title: 頁面標題（多頁時自動加上頁碼）
+        terms: 術語列表，每個是 {
+            "term": "術語名稱",
+            "desc": "解釋",
+            "diagram_type": "flow|before_after|layers|timeline|icon",  # 帶圖版
+            "diagram_params": {...}                                    # 帶圖版
+        }
+        with_diagrams: True 為帶圖卡片（3 欄），False 為純文字卡片（4 欄）
+        layout_index: 新投影片使用的版面配置（預設 6 = 空白）
+        workers: 平行程序數（None = 頁數達 PARALLEL_MIN_PAGES 才開 CPU 數個程序，否則依序產生；
+                 1 = 不開 process pool）
+
+    Returns:
+        list: 新增的投影片
+    """
+    pages = paginate_glossary(terms, with_diagrams)
+    slides = []
+    for slide_xml in glossary_slide_xmls(title, pages, with_diagrams, workers):
+        slide = prs.slides.add_slide(prs.slide_layouts[layout_index])
+        paste_slide_xml(slide, slide_xml)
+        slides.append(slide)
+    return slides
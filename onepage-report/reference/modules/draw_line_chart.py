@@ -1,13 +1,15 @@
 """折線圖（原生圖表）"""
 from pptx.util import Inches, Pt
-from pptx.chart.data import CategoryChartData
 from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
 
-from ._colors import FONT_NAME
+from ._chartxml import NativeChartData
+from ._colors import COLOR_TEXT, FONT_NAME
+from ._downsample import downsample_chart, point_budget
 
 
 def draw_line_chart(slide, left, top, width, height, title, categories, series,
-                    show_legend=True, show_data_labels=False, smooth=False):
+                    show_legend=True, show_data_labels=False, smooth=False,
+                    max_points=None, downsample="minmax"):
     """
     繪製折線圖（原生圖表）
 
@@ -21,12 +23,13 @@ def draw_line_chart(slide, left, top, width, height, title, categories, series,
         show_legend: 是否顯示圖例
         show_data_labels: 是否顯示資料標籤
         smooth: 是否平滑曲線
+        max_points: 每條數列的點數上限（預設依圖寬換算，0 表示不降採樣）
+        downsample: 降採樣方法 minmax（保留尖峰）或 lttb
     """
-    chart_data = CategoryChartData()
-    chart_data.categories = categories
-
-    for s in series:
-        chart_data.add_series(s["name"], s["values"])
+    if max_points is None:
+        max_points = point_budget(width * 72)
+    categories, series = downsample_chart(categories, series, max_points, downsample)
+    chart_data = NativeChartData(categories, series)
 
     chart_type = XL_CHART_TYPE.LINE_MARKERS_STACKED if not smooth else XL_CHART_TYPE.LINE_MARKERS
 
@@ -39,6 +42,7 @@ def draw_line_chart(slide, left, top, width, height, title, categories, series,
     chart.chart_title.text_frame.paragraphs[0].font.size = Pt(12)
     chart.chart_title.text_frame.paragraphs[0].font.bold = True
     chart.chart_title.text_frame.paragraphs[0].font.name = FONT_NAME
+    chart.chart_title.text_frame.paragraphs[0].font.color.rgb = COLOR_TEXT
 
     chart.has_legend = show_legend
     if show_legend:
@@ -1,55 +1,42 @@
 """迷你時間軸（用於術語卡片）"""
-from pptx.util import Inches, Pt
-from pptx.enum.shapes import MSO_SHAPE
-from pptx.enum.text import PP_ALIGN
-from pptx.dml.color import RGBColor
+from scene import Scene, TextStyle, para, text_frame, flush_pptx
 
 from ._colors import COLOR_BLUE, COLOR_WHITE, FONT_NAME
 
+_AXIS_COLOR = (100, 100, 100)
 
-def draw_mini_timeline(slide, left, top, width, height, stages):
-    """
-    繪製迷你時間軸（用於術語卡片內的示意圖）
 
-    Args:
-        slide: 投影片物件
-        left, top: 左上角位置（吋）
-        width, height: 寬高（吋）
-        stages: 階段列表，可以是字串或 dict {"text": "...", "color": ...}
+def build_mini_timeline(scene, left, top, width, height, stages):
+    """
+    產生迷你時間軸的 scene 節點（參數同 draw_mini_timeline，scene 單位為吋）
     """
     line_y = top + height * 0.6
     stage_count = len(stages)
     stage_width = width / stage_count
+    text_style = TextStyle(6, True, COLOR_WHITE, FONT_NAME)
 
     # 水平軸線
-    line = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(left), Inches(line_y),
-        Inches(width), Inches(0.02)
-    )
-    line.fill.solid()
-    line.fill.fore_color.rgb = RGBColor(100, 100, 100)
-    line.line.fill.background()
+    scene.rect(left, line_y, width, 0.02, fill=_AXIS_COLOR)
 
     for i, stage in enumerate(stages):
         x = left + i * stage_width
         color = stage.get("color", COLOR_BLUE) if isinstance(stage, dict) else COLOR_BLUE
         text = stage.get("text", stage) if isinstance(stage, dict) else str(stage)
 
-        box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(x + 0.02), Inches(top),
-            Inches(stage_width - 0.04), Inches(height * 0.5)
-        )
-        box.fill.solid()
-        box.fill.fore_color.rgb = color
-        box.line.fill.background()
-
-        tf = box.text_frame
-        p = tf.paragraphs[0]
-        p.text = text
-        p.font.size = Pt(6)
-        p.font.bold = True
-        p.font.color.rgb = COLOR_WHITE
-        p.font.name = FONT_NAME
-        p.alignment = PP_ALIGN.CENTER
+        scene.rounded_rect(x + 0.02, top, stage_width - 0.04, height * 0.5, fill=color,
+                           text=text_frame(para(text, text_style, "center")))
+    return scene
+
+
+def draw_mini_timeline(slide, left, top, width, height, stages):
+    """
+    繪製迷你時間軸（用於術語卡片內的示意圖）
+
+    Args:
+        slide: 投影片物件
+        left, top: 左上角位置（吋）
+        width, height: 寬高（吋）
+        stages: 階段列表，可以是字串或 dict {"text": "...", "color": ...}
+    """
+    scene = build_mini_timeline(Scene(unit="in"), left, top, width, height, stages)
+    flush_pptx(scene, slide)
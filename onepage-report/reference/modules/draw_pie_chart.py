@@ -1,9 +1,9 @@
 """圓餅圖（原生圖表）"""
 from pptx.util import Inches, Pt
-from pptx.chart.data import CategoryChartData
 from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
 
-from ._colors import FONT_NAME
+from ._chartxml import NativeChartData
+from ._colors import COLOR_TEXT, FONT_NAME
 
 
 def draw_pie_chart(slide, left, top, width, height, title, data,
@@ -20,9 +20,8 @@ def draw_pie_chart(slide, left, top, width, height, title, data,
         show_legend: 是否顯示圖例
         show_percentage: 是否顯示百分比
     """
-    chart_data = CategoryChartData()
-    chart_data.categories = [d["name"] for d in data]
-    chart_data.add_series("Values", [d["value"] for d in data])
+    chart_data = NativeChartData([d["name"] for d in data],
+                                 [{"name": "Values", "values": [d["value"] for d in data]}])
 
     x, y, cx, cy = Inches(left), Inches(top), Inches(width), Inches(height)
     graphic_frame = slide.shapes.add_chart(XL_CHART_TYPE.PIE, x, y, cx, cy, chart_data)
@@ -33,6 +32,7 @@ def draw_pie_chart(slide, left, top, width, height, title, data,
     chart.chart_title.text_frame.paragraphs[0].font.size = Pt(12)
     chart.chart_title.text_frame.paragraphs[0].font.bold = True
     chart.chart_title.text_frame.paragraphs[0].font.name = FONT_NAME
+    chart.chart_title.text_frame.paragraphs[0].font.color.rgb = COLOR_TEXT
 
     chart.has_legend = show_legend
     if show_legend:
@@ -1,32 +1,15 @@
 """平台對比圖"""
-from pptx.util import Inches, Pt
-from pptx.enum.shapes import MSO_SHAPE
-from pptx.enum.text import PP_ALIGN
-from pptx.dml.color import RGBColor
+from scene import Scene, TextStyle, para, text_frame, flush_pptx
 
 from ._colors import COLOR_GREEN, COLOR_BLUE, COLOR_ORANGE, COLOR_GRAY_BG, COLOR_TEXT, COLOR_WHITE, FONT_NAME
-from .draw_flow_detailed import draw_flow_detailed
+from .draw_flow_detailed import build_flow_detailed
 
+_DIFF_BG = (255, 243, 224)
 
-def draw_platform_compare(slide, left, top, width, height,
-                          platform_a, platform_b, differences=None):
-    """
-    繪製上下平台對比圖，每個平台內部有完整流程
 
-    Args:
-        slide: 投影片物件
-        left, top: 左上角位置（吋）
-        width, height: 寬高（吋）
-        platform_a: 上方平台 {
-            "name": "PC 平台",
-            "title": "AMD Anti-Lag 2 流程（已驗證有效）",
-            "color": COLOR_BLUE,
-            "flow_nodes": [...],
-            "arrow_labels": [...],
-            "summary": "效果：CS2 延遲降低 37%"
-        }
-        platform_b: 下方平台（同上格式）
-        differences: 差異標註列表 [{"item": "輸入方式", "a": "滑鼠", "b": "觸控"}, ...]
+def build_platform_compare(scene, left, top, width, height, platform_a, platform_b, differences=None):
+    """
+    產生平台對比圖的 scene 節點（參數同 draw_platform_compare，scene 單位為吋）
     """
     diff_width = 0 if not differences else 2.5
     platform_width = width - diff_width - 0.1
@@ -44,116 +27,62 @@ def draw_platform_compare(slide, left, top, width, height,
         arrow_labels = platform.get("arrow_labels", [])
         summary = platform.get("summary", "")
 
-        box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(left), Inches(y),
-            Inches(platform_width), Inches(platform_height)
-        )
-        box.fill.solid()
-        box.fill.fore_color.rgb = COLOR_GRAY_BG
-        box.line.color.rgb = color
-        box.line.width = Pt(2)
-
-        name_box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(left + 0.1), Inches(y + 0.08),
-            Inches(1.0), Inches(0.28)
-        )
-        name_box.fill.solid()
-        name_box.fill.fore_color.rgb = color
-        name_box.line.fill.background()
-
-        tf = name_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = name
-        p.font.size = Pt(9)
-        p.font.bold = True
-        p.font.color.rgb = COLOR_WHITE
-        p.font.name = FONT_NAME
-        p.alignment = PP_ALIGN.CENTER
-
-        title_box = slide.shapes.add_textbox(
-            Inches(left + 1.2), Inches(y + 0.08),
-            Inches(platform_width - 1.4), Inches(0.28)
-        )
-        tf = title_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(9)
-        p.font.bold = True
-        p.font.color.rgb = color
-        p.font.name = FONT_NAME
+        scene.rounded_rect(left, y, platform_width, platform_height,
+                           fill=COLOR_GRAY_BG, line=color, line_width=2)
+        scene.rounded_rect(left + 0.1, y + 0.08, 1.0, 0.28, fill=color,
+                           text=text_frame(para(name, TextStyle(9, True, COLOR_WHITE, FONT_NAME), "center")))
+        scene.textbox(left + 1.2, y + 0.08, platform_width - 1.4, 0.28,
+                      para(title, TextStyle(9, True, color, FONT_NAME)))
 
         if flow_nodes:
             flow_height = platform_height - 0.7 if summary else platform_height - 0.45
-            draw_flow_detailed(
-                slide, left=left + 0.1, top=y + 0.4,
-                width=platform_width - 0.2, height=flow_height,
-                nodes=flow_nodes, arrow_labels=arrow_labels, show_highlight=True
-            )
+            build_flow_detailed(scene, left + 0.1, y + 0.4, platform_width - 0.2, flow_height,
+                                flow_nodes, arrow_labels, show_highlight=True)
 
         if summary:
-            summary_box = slide.shapes.add_textbox(
-                Inches(left + 0.1), Inches(y + platform_height - 0.25),
-                Inches(platform_width - 0.2), Inches(0.2)
-            )
-            tf = summary_box.text_frame
-            p = tf.paragraphs[0]
-            p.text = summary
-            p.font.size = Pt(8)
-            p.font.bold = True
-            p.font.color.rgb = color
-            p.font.name = FONT_NAME
+            scene.textbox(left + 0.1, y + platform_height - 0.25, platform_width - 0.2, 0.2,
+                          para(summary, TextStyle(8, True, color, FONT_NAME)))
 
     if differences:
         diff_left = left + platform_width + 0.1
-        diff_box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(diff_left), Inches(top),
-            Inches(diff_width), Inches(height)
-        )
-        diff_box.fill.solid()
-        diff_box.fill.fore_color.rgb = RGBColor(255, 243, 224)
-        diff_box.line.color.rgb = COLOR_ORANGE
-        diff_box.line.width = Pt(1)
-
-        diff_title = slide.shapes.add_textbox(
-            Inches(diff_left + 0.1), Inches(top + 0.08),
-            Inches(diff_width - 0.2), Inches(0.25)
-        )
-        tf = diff_title.text_frame
-        p = tf.paragraphs[0]
-        p.text = "主要差異"
-        p.font.size = Pt(9)
-        p.font.bold = True
-        p.font.color.rgb = COLOR_ORANGE
-        p.font.name = FONT_NAME
+        scene.rounded_rect(diff_left, top, diff_width, height, fill=_DIFF_BG, line=COLOR_ORANGE, line_width=1)
+        scene.textbox(diff_left + 0.1, top + 0.08, diff_width - 0.2, 0.25,
+                      para("主要差異", TextStyle(9, True, COLOR_ORANGE, FONT_NAME)))
 
+        item_style = TextStyle(8, True, COLOR_TEXT, FONT_NAME)
+        a_style = TextStyle(7, False, COLOR_BLUE, FONT_NAME)
+        b_style = TextStyle(7, False, COLOR_GREEN, FONT_NAME)
         item_height = (height - 0.4) / len(differences)
         for j, diff in enumerate(differences):
             item_y = top + 0.35 + j * item_height
-            item_box = slide.shapes.add_textbox(
-                Inches(diff_left + 0.1), Inches(item_y),
-                Inches(diff_width - 0.2), Inches(item_height)
-            )
-            tf = item_box.text_frame
-            tf.word_wrap = True
+            scene.textbox(diff_left + 0.1, item_y, diff_width - 0.2, item_height, text_frame([
+                para(diff.get("item", ""), item_style),
+                para(f"PC: {diff.get('a', '')}", a_style),
+                para(f"手機: {diff.get('b', '')}", b_style),
+            ], word_wrap=True))
+    return scene
 
-            p = tf.paragraphs[0]
-            p.text = diff.get("item", "")
-            p.font.size = Pt(8)
-            p.font.bold = True
-            p.font.color.rgb = COLOR_TEXT
-            p.font.name = FONT_NAME
 
-            p2 = tf.add_paragraph()
-            p2.text = f"PC: {diff.get('a', '')}"
-            p2.font.size = Pt(7)
-            p2.font.color.rgb = COLOR_BLUE
-            p2.font.name = FONT_NAME
+def draw_platform_compare(slide, left, top, width, height,
+                          platform_a, platform_b, differences=None):
+    """
+    繪製上下平台對比圖，每個平台內部有完整流程
 
-            p3 = tf.add_paragraph()
-            p3.text = f"手機: {diff.get('b', '')}"
-            p3.font.size = Pt(7)
-            p3.font.color.rgb = COLOR_GREEN
-            p3.font.name = FONT_NAME
+    Args:
+        slide: 投影片物件
+        left, top: 左上角位置（吋）
+        width, height: 寬高（吋）
+        platform_a: 上方平台 {
+            "name": "PC 平台",
+            "title": "AMD Anti-Lag 2 流程（已驗證有效）",
+            "color": COLOR_BLUE,
+            "flow_nodes": [...],
+            "arrow_labels": [...],
+            "summary": "效果：CS2 延遲降低 37%"
+        }
+        platform_b: 下方平台（同上格式）
+        differences: 差異標註列表 [{"item": "輸入方式", "a": "滑鼠", "b": "觸控"}, ...]
+    """
+    scene = build_platform_compare(Scene(unit="in"), left, top, width, height,
+                                   platform_a, platform_b, differences)
+    flush_pptx(scene, slide)
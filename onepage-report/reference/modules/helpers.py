@@ -5,7 +5,9 @@
 from pptx.util import Inches, Pt
 from pptx.enum.shapes import MSO_SHAPE
 
-from ._colors import COLOR_BLUE, COLOR_GRAY_BG, COLOR_TEXT, FONT_NAME
+from ._colors import COLOR_BLUE, COLOR_GRAY_BG
+from ._textfit import fit_font_size, PPTX_TEXTBOX_MARGINS
+from ._textstyles import text_style, set_paragraph_text, set_text_frame_lines
 
 
 def add_section_title(slide, left, top, width, text, color=COLOR_BLUE):
@@ -23,13 +25,7 @@ def add_section_title(slide, left, top, width, text, color=COLOR_BLUE):
         Inches(left), Inches(top),
         Inches(width), Inches(0.35)
     )
-    tf = box.text_frame
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(12)
-    p.font.bold = True
-    p.font.color.rgb = color
-    p.font.name = FONT_NAME
+    set_paragraph_text(box.text_frame.paragraphs[0], text, text_style("section_title", color=color))
     return box
 
 
@@ -50,19 +46,13 @@ def add_bullet_list(slide, left, top, width, height, items, font_size=10):
     )
     tf = box.text_frame
     tf.word_wrap = True
-
-    for i, item in enumerate(items):
-        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-        p.text = f"• {item}"
-        p.font.size = Pt(font_size)
-        p.font.color.rgb = COLOR_TEXT
-        p.font.name = FONT_NAME
-        p.space_after = Pt(4)
-
+    set_text_frame_lines(tf, [f"• {item}" for item in items],
+                         text_style("body", size=font_size), space_after=Pt(4))
     return box
 
 
-def add_content_box(slide, left, top, width, height, title, content, title_color=COLOR_BLUE, bg_color=None):
+def add_content_box(slide, left, top, width, height, title, content, title_color=COLOR_BLUE, bg_color=None,
+                    font_size=9, autofit=True):
     """
     加入帶標題的內容方塊
 
@@ -74,6 +64,8 @@ def add_content_box(slide, left, top, width, height, title, content, title_color
         content: 內容（字串或列表）
         title_color: 標題顏色
         bg_color: 背景顏色（可選）
+        font_size: 內容字體大小（autofit 時為上限）
+        autofit: 內容放不下時自動縮小字體（下限見 _textfit.overflow_min_size）
     """
     if bg_color:
         bg = slide.shapes.add_shape(
@@ -90,13 +82,8 @@ def add_content_box(slide, left, top, width, height, title, content, title_color
         Inches(left + 0.1), Inches(top + 0.08),
         Inches(width - 0.2), Inches(0.3)
     )
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(11)
-    p.font.bold = True
-    p.font.color.rgb = title_color
-    p.font.name = FONT_NAME
+    set_paragraph_text(title_box.text_frame.paragraphs[0], title,
+                       text_style("box_title", color=title_color))
 
     # 內容
     content_box = slide.shapes.add_textbox(
@@ -107,15 +94,14 @@ def add_content_box(slide, left, top, width, height, title, content, title_color
     tf.word_wrap = True
 
     if isinstance(content, list):
-        for i, item in enumerate(content):
-            p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-            p.text = f"• {item}"
-            p.font.size = Pt(9)
-            p.font.color.rgb = COLOR_TEXT
-            p.font.name = FONT_NAME
+        lines = [f"• {item}" for item in content]
     else:
-        p = tf.paragraphs[0]
-        p.text = content
-        p.font.size = Pt(9)
-        p.font.color.rgb = COLOR_TEXT
-        p.font.name = FONT_NAME
+        lines = [content]
+
+    if autofit:
+        font_size = fit_font_size(
+            "\n".join(lines), (width - 0.2) * 72, (height - 0.5) * 72, font_size,
+            role="body", margins=PPTX_TEXTBOX_MARGINS
+        )
+
+    set_text_frame_lines(tf, lines, text_style("body", size=font_size))
@@ -5,6 +5,7 @@ pywin32 模組套件：用於 Phase 6 Render (pywin32 版本)
 此套件包含：
 - _colors_pywin32: 顏色常數與轉換函數（BGR 格式）
 - _shapes_pywin32: 基本形狀繪製函數
+- _shared: 載入與 python-pptx 路徑共用的純 Python 模組（不執行 modules/__init__）
 - _mcp_client: MCP Client 與 mcp-yogalayout 通訊
 - draw_flow_pywin32: 流程圖繪製
 - draw_before_after_pywin32: 前後對比圖繪製
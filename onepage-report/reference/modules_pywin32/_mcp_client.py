@@ -22,6 +22,8 @@ import os
 import time
 from typing import Optional, Dict, Any
 
+from tracing import span
+
 
 class MCPError(Exception):
     """MCP 通訊錯誤"""
@@ -147,25 +149,26 @@ class YogaLayoutClient:
             raise MCPError("MCP client not initialized. Call start() first.")
 
         # 呼叫工具
-        result = self._send_request("tools/call", {
-            "name": "layout.compute_slide_layout",
-            "arguments": {
-                "markdown_path": markdown_path,
-                "theme_path": theme_path,
-                "output_dir": output_dir,
-                "slide": {
-                    "aspect": aspect,
-                    "orientation": orientation,
-                    "unit": "pt"
-                },
-                "options": {
-                    "template": template,
-                    "density": density,
-                    "allow_two_column": True,
-                    "debug_dump": False
+        with span("layout_rpc", cat="layout", markdown_path=markdown_path):
+            result = self._send_request("tools/call", {
+                "name": "layout.compute_slide_layout",
+                "arguments": {
+                    "markdown_path": markdown_path,
+                    "theme_path": theme_path,
+                    "output_dir": output_dir,
+                    "slide": {
+                        "aspect": aspect,
+                        "orientation": orientation,
+                        "unit": "pt"
+                    },
+                    "options": {
+                        "template": template,
+                        "density": density,
+                        "allow_two_column": True,
+                        "debug_dump": False
+                    }
                 }
-            }
-        })
+            })
 
         if "error" in result:
             raise MCPError(f"Tool call failed: {result['error']}")
@@ -19,6 +19,9 @@ from ._colors_pywin32 import (
     COLOR_TEXT, COLOR_WHITE, COLOR_GRAY_LIGHT,
     FONT_NAME, get_text_color
 )
+from ._shared import load_shared
+
+fit_font_size = load_shared("_textfit").fit_font_size
 
 
 # =============================================================================
@@ -226,7 +229,8 @@ def add_textbox(slide, text, left, top, width, height,
                 color=None, font_name=None,
                 align=1, valign=1,
                 margin_left=6, margin_right=6,
-                margin_top=3, margin_bottom=3):
+                margin_top=3, margin_bottom=3,
+                role="body", autofit=True):
     """
     新增文字框
 
@@ -243,10 +247,19 @@ def add_textbox(slide, text, left, top, width, height,
         align: 水平對齊（1=左, 2=中, 3=右）
         valign: 垂直對齊（1=上, 2=中, 3=下）
         margin_*: 內邊距（pt）
+        role: 文字角色（title/body/caption），決定 auto-fit 縮小的下限
+        autofit: 文字放不下時自動縮小字體（角色最小字體仍放不下時再縮到其 3/4）
 
     Returns:
         Shape 物件
     """
+    if autofit:
+        font_size = fit_font_size(
+            text, width, height, font_size, role=role, bold=bold,
+            margins=(margin_left, margin_right, margin_top, margin_bottom),
+            mono=(font_name == "Consolas")
+        )
+
     # msoTextOrientationHorizontal = 1
     box = slide.Shapes.AddTextbox(1, left, top, width, height)
     tf = box.TextFrame
@@ -357,13 +370,15 @@ def add_content_box(slide, left, top, width, height,
     # 標題
     add_textbox(slide, title, left + 6, top + 4,
                 width - 12, 18,
-                font_size=title_size, bold=True, color=line_color, align=1)
+                font_size=title_size, bold=True, color=line_color, align=1,
+                role="title")
 
-    # 內容
+    # 內容（放不下時自動縮小字體）
     body_text = "\n".join(body_lines) if body_lines else ""
     add_textbox(slide, body_text, left + 6, top + 24,
                 width - 12, height - 28,
-                font_size=body_size, bold=False, color=COLOR_TEXT, align=1)
+                font_size=body_size, bold=False, color=COLOR_TEXT, align=1,
+                role="body")
 
     return rect
 
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+與 python-pptx 路徑共用的純 Python 模組（modules/_textfit.py、modules/_downsample.py）
+
+依檔案路徑直接載入，不執行 modules 套件的 __init__（套件登錄表與 python-pptx 都不必載入）。
+載入後以原本的名稱（modules._textfit ...）放進 sys.modules，
+之後 python-pptx 路徑 import 同一個模組時共用同一份（auto-fit 快取也共用）。
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+_MODULES_DIR = Path(__file__).resolve().parent.parent / "modules"
+
+
+def load_shared(name):
+    """
+    載入 modules/ 下不依賴 python-pptx 的模組
+
+    Args:
+        name: 模組名稱（例如 "_textfit"）
+
+    Returns:
+        module
+    """
+    qualified = f"modules.{name}"
+    module = sys.modules.get(qualified)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(qualified, _MODULES_DIR / f"{name}.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[qualified] = module
+        spec.loader.exec_module(module)
+    return module
@@ -17,6 +17,10 @@ from ._colors_pywin32 import (
     COLOR_BLUE, COLOR_GREEN, COLOR_RED, COLOR_ORANGE, COLOR_PURPLE,
     COLOR_WHITE, COLOR_TEXT, FONT_NAME
 )
+from ._shared import load_shared
+
+_downsample = load_shared("_downsample")
+downsample_chart, point_budget = _downsample.downsample_chart, _downsample.point_budget
 
 
 # =============================================================================
@@ -34,13 +38,124 @@ XL_AREA = 1
 XL_XY_SCATTER = -4169
 
 
+# =============================================================================
+# 圖表資料
+# =============================================================================
+
+def _col_letter(n):
+    """欄位字母（1 → A、27 → AA）"""
+    result = ""
+    while n > 0:
+        n, remainder = divmod(n - 1, 26)
+        result = chr(65 + remainder) + result
+    return result
+
+
+def _pad_categories(categories, series_list):
+    """類別比最長的數列少時補空類別（同 python-pptx 版本，多出的數值照樣畫出、不丟棄）"""
+    longest = max((len(series.get("values", [])) for series in series_list), default=0)
+    return list(categories) + [None] * (longest - len(categories))
+
+
+def _data_block(categories, series_list):
+    """
+    組出整份工作表資料（二維 tuple，含表頭列與類別欄）
+
+    A1 留空，第 1 列為數列名稱，A 欄為類別，缺值為 None（空儲存格）；
+    數值比類別多時類別補空儲存格。
+    """
+    names = tuple(series.get("name", f"Series {i + 1}") for i, series in enumerate(series_list))
+    columns = [list(series.get("values", [])) for series in series_list]
+    rows = [(None,) + names]
+    for i, cat in enumerate(_pad_categories(categories, series_list)):
+        rows.append((cat,) + tuple(values[i] if i < len(values) else None for values in columns))
+    return tuple(rows)
+
+
+def _activate_chart_data(chart_data):
+    """開啟內嵌活頁簿；優先使用不顯示 Excel 視窗的 ActivateChartDataWindow（Office 2013+）"""
+    try:
+        chart_data.ActivateChartDataWindow()
+    except Exception:
+        chart_data.Activate()
+    return chart_data.Workbook
+
+
+def _set_chart_data(chart, categories, series_list):
+    """
+    內部輔助函數：設定圖表資料
+
+    整份資料先在 Python 端組成二維 tuple，以單一 Range.Value 寫入工作表，
+    不再逐格呼叫 Cells(i, j).Value（每次都是一次跨行程 COM 呼叫）。
+
+    Args:
+        chart: Chart 物件
+        categories: 類別列表
+        series_list: 數列列表
+
+    Returns:
+        bool: 是否成功設定
+    """
+    if not categories or not series_list:
+        return False
+
+    block = _data_block(categories, series_list)
+    num_rows = len(block)
+    num_cols = len(block[0])
+
+    try:
+        # 方法 1：開啟內嵌活頁簿，一次寫入整塊資料
+        workbook = _activate_chart_data(chart.ChartData)
+        worksheet = workbook.Worksheets(1)
+
+        # 清除預設資料
+        used_range = worksheet.UsedRange
+        if used_range:
+            used_range.Clear()
+
+        data_range = worksheet.Range(f"A1:{_col_letter(num_cols)}{num_rows}")
+        data_range.Value = block
+        chart.SetSourceData(data_range)
+
+        workbook.Close(False)
+        return True
+
+    except Exception as e:
+        # 方法 2：使用 SeriesCollection（每個數列一次設定整列數值）
+        try:
+            while chart.SeriesCollection().Count > 0:
+                chart.SeriesCollection(1).Delete()
+
+            categories = tuple(_pad_categories(categories, series_list))
+            for series_info in series_list:
+                series = chart.SeriesCollection().NewSeries()
+                series.Name = series_info.get("name", "")
+                series.Values = tuple(series_info.get("values", []))
+                series.XValues = categories
+            return True
+
+        except Exception as inner_e:
+            print(f"警告：圖表資料設定失敗: {inner_e}")
+            return False
+
+
 # =============================================================================
 # 折線圖
 # =============================================================================
 
+def _chart_series(series_data, width, max_points, downsample):
+    """取出類別與數列，超過點數上限時降採樣（max_points 預設依圖寬換算，0 表示不降採樣）"""
+    categories = series_data.get("categories", [])
+    series_list = series_data.get("series", [])
+    if max_points is None:
+        max_points = point_budget(width)
+    return downsample_chart(categories, series_list, max_points, downsample)
+
+
 def draw_line_chart(slide, left, top, width, height,
                     series_data, title=None, show_legend=True,
-                    show_markers=True, show_data_labels=False):
+                    show_markers=True, show_data_labels=False,
+                    max_points=None, downsample="minmax"):
     """
     使用 pywin32 建立原生折線圖
 
@@ -60,6 +175,8 @@ def draw_line_chart(slide, left, top, width, height,
         show_legend: 是否顯示圖例
         show_markers: 是否顯示資料點標記
         show_data_labels: 是否顯示資料標籤
+        max_points: 每條數列的點數上限（預設依圖寬換算，0 表示不降採樣）
+        downsample: 降採樣方法 minmax（保留尖峰）或 lttb
 
     Returns:
         Shape 物件（圖表）
@@ -75,76 +192,13 @@ def draw_line_chart(slide, left, top, width, height,
     )
     chart = chart_shape.Chart
 
-    # 取得資料
-    categories = series_data.get("categories", [])
-    series_list = series_data.get("series", [])
+    # 取得資料（大量資料點先降採樣）
+    categories, series_list = _chart_series(series_data, width, max_points, downsample)
 
     if not categories or not series_list:
         return chart_shape
 
-    try:
-        # 方法 1：使用 ChartData.Activate 啟用編輯模式
-        chart.ChartData.Activate()
-        workbook = chart.ChartData.Workbook
-        worksheet = workbook.Worksheets(1)
-
-        # 清除預設資料（保留第一列第一欄空白）
-        used_range = worksheet.UsedRange
-        if used_range:
-            used_range.Clear()
-
-        # 寫入類別（第一欄，從第二列開始）
-        for i, cat in enumerate(categories):
-            worksheet.Cells(i + 2, 1).Value = cat
-
-        # 寫入數列（從第二欄開始）
-        for col_idx, series in enumerate(series_list):
-            # 數列名稱（第一列）
-            worksheet.Cells(1, col_idx + 2).Value = series.get("name", f"Series {col_idx + 1}")
-
-            # 數列數值
-            values = series.get("values", [])
-            for row_idx, val in enumerate(values):
-                worksheet.Cells(row_idx + 2, col_idx + 2).Value = val
-
-        # 設定資料範圍（使用 A1 表示法）
-        num_rows = len(categories) + 1
-        num_cols = len(series_list) + 1
-
-        # 計算欄位字母（A, B, C, ...）
-        def col_letter(n):
-            result = ""
-            while n > 0:
-                n, remainder = divmod(n - 1, 26)
-                result = chr(65 + remainder) + result
-            return result
-
-        end_col = col_letter(num_cols)
-        range_str = f"A1:{end_col}{num_rows}"
-
-        # 使用 SetSourceData 設定資料範圍
-        data_range = worksheet.Range(range_str)
-        chart.SetSourceData(data_range)
-
-        workbook.Close(False)
-
-    except Exception as e:
-        # 方法 2：如果上述方法失敗，嘗試使用 SeriesCollection 直接設定
-        try:
-            # 清除現有的數列
-            while chart.SeriesCollection().Count > 0:
-                chart.SeriesCollection(1).Delete()
-
-            # 添加新數列
-            for series_info in series_list:
-                series = chart.SeriesCollection().NewSeries()
-                series.Name = series_info.get("name", "")
-                series.Values = series_info.get("values", [])
-                series.XValues = categories
-
-        except Exception as inner_e:
-            # 如果兩種方法都失敗，返回帶有預設資料的圖表
-            print(f"警告：圖表資料設定失敗: {inner_e}")
+    _set_chart_data(chart, categories, series_list)
 
     # 設定標題
     if title:
@@ -184,80 +238,6 @@ def draw_line_chart(slide, left, top, width, height,
 # 長條圖
 # =============================================================================
 
-def _set_chart_data(chart, categories, series_list):
-    """
-    內部輔助函數：設定圖表資料
-
-    Args:
-        chart: Chart 物件
-        categories: 類別列表
-        series_list: 數列列表
-
-    Returns:
-        bool: 是否成功設定
-    """
-    if not categories or not series_list:
-        return False
-
-    try:
-        # 方法 1：使用 ChartData.Activate 啟用編輯模式
-        chart.ChartData.Activate()
-        workbook = chart.ChartData.Workbook
-        worksheet = workbook.Worksheets(1)
-
-        # 清除預設資料
-        used_range = worksheet.UsedRange
-        if used_range:
-            used_range.Clear()
-
-        # 寫入類別（第一欄，從第二列開始）
-        for i, cat in enumerate(categories):
-            worksheet.Cells(i + 2, 1).Value = cat
-
-        # 寫入數列（從第二欄開始）
-        for col_idx, series in enumerate(series_list):
-            worksheet.Cells(1, col_idx + 2).Value = series.get("name", f"Series {col_idx + 1}")
-            values = series.get("values", [])
-            for row_idx, val in enumerate(values):
-                worksheet.Cells(row_idx + 2, col_idx + 2).Value = val
-
-        # 設定資料範圍（使用 A1 表示法）
-        num_rows = len(categories) + 1
-        num_cols = len(series_list) + 1
-
-        def col_letter(n):
-            result = ""
-            while n > 0:
-                n, remainder = divmod(n - 1, 26)
-                result = chr(65 + remainder) + result
-            return result
-
-        end_col = col_letter(num_cols)
-        range_str = f"A1:{end_col}{num_rows}"
-        data_range = worksheet.Range(range_str)
-        chart.SetSourceData(data_range)
-
-        workbook.Close(False)
-        return True
-
-    except Exception as e:
-        # 方法 2：使用 SeriesCollection
-        try:
-            while chart.SeriesCollection().Count > 0:
-                chart.SeriesCollection(1).Delete()
-
-            for series_info in series_list:
-                series = chart.SeriesCollection().NewSeries()
-                series.Name = series_info.get("name", "")
-                series.Values = series_info.get("values", [])
-                series.XValues = categories
-            return True
-
-        except Exception as inner_e:
-            print(f"警告：圖表資料設定失敗: {inner_e}")
-            return False
-
-
 def draw_bar_chart(slide, left, top, width, height,
                    series_data, title=None, show_legend=True,
                    horizontal=False, stacked=False):
@@ -381,7 +361,8 @@ def draw_pie_chart(slide, left, top, width, height,
 # =============================================================================
 
 def draw_area_chart(slide, left, top, width, height,
-                    series_data, title=None, show_legend=True):
+                    series_data, title=None, show_legend=True,
+                    max_points=None, downsample="minmax"):
     """
     使用 pywin32 建立面積圖
 
@@ -392,6 +373,8 @@ def draw_area_chart(slide, left, top, width, height,
         series_data: 資料字典（同 draw_line_chart）
         title: 圖表標題
         show_legend: 是否顯示圖例
+        max_points: 每條數列的點數上限（預設依圖寬換算，0 表示不降採樣）
+        downsample: 降採樣方法 minmax（保留尖峰）或 lttb
 
     Returns:
         Shape 物件（圖表）
@@ -403,9 +386,8 @@ def draw_area_chart(slide, left, top, width, height,
     )
     chart = chart_shape.Chart
 
-    # 取得資料
-    categories = series_data.get("categories", [])
-    series_list = series_data.get("series", [])
+    # 取得資料（大量資料點先降採樣）
+    categories, series_list = _chart_series(series_data, width, max_points, downsample)
 
     # 設定資料
     _set_chart_data(chart, categories, series_list)
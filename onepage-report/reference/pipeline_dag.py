@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+"""
+Pipeline DAG 執行器（內容指紋、未變更即略過、獨立步驟平行執行）
+
+SKILL.md 的 pipeline 把每個 phase 寫到 ./output/phase{N}/，但 RESUME_FROM 只是手動的整數，
+沒有人知道哪些輸出已經過期。這裡把腳本化的步驟描述成 DAG：
+
+    Step(name, run, inputs, outputs, code, params, after)
+
+相依關係由檔案推導（某步驟的 input 是另一步驟的 output，或位於其輸出目錄內），
+after 可補上沒有檔案連結的先後順序（例如先驗證再渲染）。
+
+每個步驟的指紋 = 步驟名稱 + 指令 / 參數 + 各 input 的內容雜湊 + 程式（code）的內容雜湊。
+指紋與上次成功時相同、且輸出檔仍與當時一致，就略過該步驟。上游重跑後輸出內容沒變時，
+下游的指紋也不變，會在該處停止（early cutoff）。
+
+run 的三種形式：
+    list / tuple - 指令列（subprocess，輸出寫到 <state_dir>/logs/<name>.log）
+    callable     - 同一程序內的函數（在執行緒中執行）
+    None         - 外部步驟（例如 MCP yogalayout、subagent）：輸出由別人產生，
+                   輸入變了而輸出沒更新時回報「過期」並擋下下游
+
+準備好的步驟以執行緒池平行執行（subprocess 為獨立程序，不受 GIL 限制）。
+狀態（指紋、輸出雜湊、耗時）在每個步驟完成後寫入 <state_dir>/state.json；
+檔案雜湊以 (大小, mtime) 快取，未變更的大檔不會重算。
+
+使用範例：
+    from pipeline_dag import Step, PipelineExecutor
+
+    steps = [
+        Step("yoga", [sys.executable, "yoga_converter.py", ...],
+             inputs=["output/phase5/one_page.md"], outputs=["output/one_page_yoga.md"],
+             code=["scripts/yoga_converter.py"]),
+        ...
+    ]
+    results = PipelineExecutor(steps, "output/.pipeline").run()
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Union
+
+from tracing import span
+
+# 狀態格式版本（格式變更時遞增，舊狀態視為全部過期）
+STATE_VERSION = 1
+
+_CHUNK = 1 << 20
+
+# 步驟結果狀態
+RAN = "ran"              # 已執行
+SKIPPED = "skipped"      # 指紋未變，略過
+ADOPTED = "adopted"      # 外部步驟：採用新的輸出
+FAILED = "failed"        # 執行失敗
+STALE = "stale"          # 外部步驟：輸入已變但輸出未更新
+MISSING = "missing"      # 外部步驟：輸出不存在
+BLOCKED = "blocked"      # 上游失敗 / 過期，未執行
+
+_DONE = (RAN, SKIPPED, ADOPTED)
+
+
+class Step(NamedTuple):
+    """DAG 中的一個步驟（路徑相對於 PipelineExecutor 的 root）"""
+    name: str
+    run: Union[Sequence[str], Callable[[], None], None]
+    inputs: Sequence[str] = ()
+    outputs: Sequence[str] = ()
+    code: Sequence[str] = ()
+    params: Optional[Dict] = None
+    after: Sequence[str] = ()
+    hint: str = ""               # 外部步驟過期 / 缺少時的提示
+
+
+class StepResult(NamedTuple):
+    """單一步驟的執行結果"""
+    name: str
+    status: str
+    seconds: float = 0.0
+    message: str = ""
+
+
+def _inside(path: str, directory: str) -> bool:
+    return path == directory or path.startswith(directory.rstrip("/") + "/")
+
+
+class PipelineExecutor:
+    """
+    依相依順序執行步驟，略過指紋未變的步驟
+
+    Args:
+        steps: Step 列表
+        state_dir: 狀態目錄（state.json、logs/）
+        root: 步驟路徑的基準目錄（預設目前目錄）
+        workers: 同時執行的步驟數（None = CPU 數；1 = 依序執行）
+    """
+
+    def __init__(self, steps: Iterable[Step], state_dir: str, root: str = ".",
+                 workers: Optional[int] = None):
+        self.steps: Dict[str, Step] = {}
+        for step in steps:
+            if step.name in self.steps:
+                raise ValueError(f"步驟名稱重複: {step.name}")
+            self.steps[step.name] = step
+        self.root = Path(root)
+        self.state_dir = Path(state_dir)
+        self.workers = workers or os.cpu_count() or 1
+        self.deps = self._dependencies()
+        self._lock = threading.Lock()
+        self._state = self._load_state()
+
+    # === 圖 ===
+
+    def _dependencies(self) -> Dict[str, Set[str]]:
+        producers = [(out, step.name) for step in self.steps.values() for out in step.outputs]
+        deps = {}
+        for step in self.steps.values():
+            found = {name for inp in step.inputs for out, name in producers
+                     if name != step.name and (_inside(inp, out) or _inside(out, inp))}
+            unknown = [name for name in step.after if name not in self.steps]
+            if unknown:
+                raise ValueError(f"{step.name}: 未知的相依步驟 {', '.join(unknown)}")
+            deps[step.name] = found | set(step.after)
+        self._check_cycles(deps)
+        return deps
+
+    def _check_cycles(self, deps: Dict[str, Set[str]]):
+        visiting, done = set(), set()
+
+        def visit(name, trail):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"步驟相依形成循環: {' → '.join(trail + [name])}")
+            visiting.add(name)
+            for dep in sorted(deps[name]):
+                visit(dep, trail + [name])
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.steps:
+            visit(name, [])
+
+    def upstream(self, names: Iterable[str]) -> Set[str]:
+        """names 與其所有上游步驟"""
+        pending, found = list(names), set()
+        while pending:
+            name = pending.pop()
+            if name not in found:
+                found.add(name)
+                pending.extend(self.deps[name])
+        return found
+
+    # === 狀態與雜湊 ===
+
+    def _load_state(self) -> Dict:
+        try:
+            state = json.loads((self.state_dir / "state.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            state = {}
+        if state.get("version") != STATE_VERSION:
+            state = {"version": STATE_VERSION, "steps": {}, "files": {}}
+        return state
+
+    def _save_state(self):
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        path = self.state_dir / "state.json"
+        tmp = path.with_suffix(".tmp")
+        # 寫入與 replace 都在鎖內：多個步驟同時完成時共用同一個 tmp 檔
+        with self._lock:
+            tmp.write_text(json.dumps(self._state, ensure_ascii=False, indent=1), encoding="utf-8")
+            os.replace(tmp, path)
+
+    def file_digest(self, rel: str) -> Optional[str]:
+        """
+        檔案或目錄的內容雜湊（目錄含所有檔案的相對路徑與內容，略過 __pycache__）
+
+        Returns:
+            str: sha256 hex；不存在時為 None
+        """
+        path = self.root / rel
+        if path.is_dir():
+            h = hashlib.sha256(b"dir")
+            for child in sorted(p for p in path.rglob("*") if p.is_file() and "__pycache__" not in p.parts):
+                name = child.relative_to(path).as_posix()
+                h.update(name.encode("utf-8"))
+                h.update(self.file_digest(f"{rel.rstrip('/')}/{name}").encode())
+            return h.hexdigest()
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        cached = self._state["files"].get(rel)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        with self._lock:
+            self._state["files"][rel] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    def fingerprint(self, step: Step) -> str:
+        """步驟指紋：名稱、指令 / 參數、輸入與程式的內容雜湊"""
+        command = list(step.run) if isinstance(step.run, (list, tuple)) else getattr(step.run, "__qualname__", None)
+        payload = {
+            "name": step.name,
+            "command": command,
+            "params": step.params,
+            "inputs": {rel: self.file_digest(rel) for rel in step.inputs},
+            "code": {rel: self.file_digest(rel) for rel in step.code},
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def _output_digests(self, step: Step) -> Dict[str, Optional[str]]:
+        return {rel: self.file_digest(rel) for rel in step.outputs}
+
+    def _up_to_date(self, step: Step, fingerprint: str, outputs: Dict) -> bool:
+        record = self._state["steps"].get(step.name)
+        return (record is not None and record["fingerprint"] == fingerprint
+                and None not in outputs.values() and record["outputs"] == outputs)
+
+    def _record(self, step: Step, fingerprint: str, seconds: float):
+        outputs = self._output_digests(step)
+        with self._lock:
+            self._state["steps"][step.name] = {
+                "fingerprint": fingerprint, "outputs": outputs,
+                "seconds": round(seconds, 3), "finished": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            }
+        self._save_state()
+
+    # === 執行 ===
+
+    def stale_steps(self) -> Set[str]:
+        """
+        不執行任何步驟，列出需要重跑的步驟（上游過期時下游一律視為過期）
+        """
+        stale = set()
+        for name in self._order():
+            step = self.steps[name]
+            if self.deps[name] & stale or not self._up_to_date(step, self.fingerprint(step),
+                                                                self._output_digests(step)):
+                stale.add(name)
+        return stale
+
+    def _order(self) -> List[str]:
+        order, done = [], set()
+        while len(order) < len(self.steps):
+            ready = [n for n in self.steps if n not in done and self.deps[n] <= done]
+            order.extend(ready)
+            done.update(ready)
+        return order
+
+    def _execute(self, step: Step, force: bool) -> StepResult:
+        """執行單一步驟（在工作執行緒中）"""
+        with span(f"step:{step.name}", cat="pipeline") as s:
+            fingerprint = self.fingerprint(step)
+            outputs = self._output_digests(step)
+            if not force and self._up_to_date(step, fingerprint, outputs):
+                s.set(status=SKIPPED)
+                return StepResult(step.name, SKIPPED)
+
+            if step.run is None:
+                status = self._check_external(step, fingerprint, outputs)
+                s.set(status=status)
+                return StepResult(step.name, status, 0.0, "" if status == ADOPTED else step.hint)
+
+            start = time.perf_counter()
+            try:
+                if callable(step.run):
+                    step.run()
+                else:
+                    self._run_command(step)
+            except Exception as e:
+                s.set(status=FAILED)
+                return StepResult(step.name, FAILED, time.perf_counter() - start, str(e))
+            seconds = time.perf_counter() - start
+            missing = [rel for rel in step.outputs if not (self.root / rel).exists()]
+            if missing:
+                s.set(status=FAILED)
+                return StepResult(step.name, FAILED, seconds, f"未產生輸出: {', '.join(missing)}")
+            self._record(step, fingerprint, seconds)
+            s.set(status=RAN)
+            return StepResult(step.name, RAN, seconds)
+
+    def _check_external(self, step: Step, fingerprint: str, outputs: Dict) -> str:
+        """外部步驟：輸出是別人產生的，只判斷能否採用"""
+        if None in outputs.values():
+            return MISSING
+        record = self._state["steps"].get(step.name)
+        if record is not None and record["fingerprint"] != fingerprint and record["outputs"] == outputs:
+            return STALE
+        self._record(step, fingerprint, 0.0)
+        return ADOPTED
+
+    def _run_command(self, step: Step):
+        log_dir = self.state_dir / "logs"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        log_path = log_dir / f"{step.name.replace(':', '_')}.log"
+        with open(log_path, "w", encoding="utf-8") as log:
+            code = subprocess.call(list(step.run), cwd=self.root, stdout=log, stderr=subprocess.STDOUT)
+        if code != 0:
+            tail = log_path.read_text(encoding="utf-8", errors="replace").strip().splitlines()[-5:]
+            raise RuntimeError(f"結束碼 {code}（{log_path}）\n" + "\n".join(tail))
+
+    def run(self, force: Iterable[str] = (), only: Optional[Iterable[str]] = None) -> List[StepResult]:
+        """
+        執行 DAG
+
+        Args:
+            force: 強制重跑的步驟（其下游會因指紋變化或輸出改變而跟著判斷）
+            only: 只執行這些步驟與其上游（None = 全部）
+
+        Returns:
+            list: StepResult（依完成順序）
+        """
+        selected = self.upstream(only) if only is not None else set(self.steps)
+        force = set(force)
+        remaining = {name: set(self.deps[name]) & selected for name in selected}
+        results: List[StepResult] = []
+        done: Set[str] = set()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            running = {}
+            while remaining or running:
+                for name in [n for n, deps in remaining.items() if deps <= done]:
+                    del remaining[name]
+                    running[pool.submit(self._execute, self.steps[name], name in force)] = name
+                if not running:
+                    # 其餘步驟的上游未完成（失敗 / 過期）
+                    for name in sorted(remaining):
+                        blockers = sorted(self.deps[name] & selected - done)
+                        results.append(StepResult(name, BLOCKED, 0.0, f"等待: {', '.join(blockers)}"))
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:  # 指紋計算等非步驟本身的錯誤
+                        result = StepResult(name, FAILED, 0.0, f"{type(e).__name__}: {e}")
+                    results.append(result)
+                    if result.status in _DONE:
+                        done.add(result.name)
+        self._save_state()
+        return results
+
+
+def format_results(results: Sequence[StepResult]) -> str:
+    """結果表（步驟、狀態、耗時、訊息）"""
+    width = max((len(r.name) for r in results), default=4)
+    lines = []
+    for r in results:
+        seconds = f"{r.seconds:7.2f}s" if r.status == RAN or r.status == FAILED else " " * 8
+        message = r.message.splitlines()[0] if r.message else ""
+        lines.append(f"  {r.name:<{width}}  {r.status:<8} {seconds}  {message}".rstrip())
+    return "\n".join(lines)
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+無頭投影片預覽（不需要 PowerPoint）
+
+以 Pillow 把投影片畫成 PNG，供審稿與自動檢查在 Linux 上直接看輸出：
+
+    PPTX  → scene.pptx_import.slide_to_scene → scene.raster_backend
+    layout.json + content_data → PptxLayoutRenderer（記憶體中）→ 同上
+
+只涵蓋繪圖函數用到的形狀（見 scene/pptx_import.py）；字型依 raster_backend 的
+FONT_FILES 對應並快取。縮圖預設 scale=0.25（960x540 pt → 240x135 px）、不做反鋸齒，
+50 頁約 1 秒內；縮圖中過小的文字畫成橫條（greek_below）。
+
+使用方式：
+    from preview import preview_pptx, contact_sheet
+
+    images = preview_pptx("final.pptx", output_dir="./preview")
+    contact_sheet(images).save("./preview/sheet.png")
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from pptx import Presentation
+
+from scene.pptx_import import slide_background, slide_to_scene
+from scene.raster_backend import scene_to_image
+from tracing import span
+
+EMU_PER_PT = 12700
+
+# 縮圖預設倍率（每 pt 像素數）
+THUMBNAIL_SCALE = 0.25
+
+
+def render_slide(slide, width: float, height: float, scale: float = THUMBNAIL_SCALE,
+                 supersample: int = 1):
+    """
+    將單張 python-pptx 投影片畫成 Pillow Image
+
+    Args:
+        slide: python-pptx Slide
+        width, height: 投影片大小（pt）
+        scale: 每 pt 的像素數
+        supersample: 反鋸齒倍數（縮圖用 1 即可）
+
+    Returns:
+        PIL.Image.Image
+    """
+    return scene_to_image(slide_to_scene(slide), width, height, scale,
+                          background=slide_background(slide), supersample=supersample)
+
+
+def preview_presentation(prs, output_dir: Optional[str] = None, scale: float = THUMBNAIL_SCALE,
+                         supersample: int = 1, slides: Optional[Sequence[int]] = None,
+                         prefix: str = "slide") -> List:
+    """
+    將 Presentation 的每一頁畫成 Image（可同時寫成 <prefix>_NN.png）
+
+    Args:
+        prs: python-pptx Presentation
+        output_dir: 輸出目錄（None = 不寫檔）
+        scale: 每 pt 的像素數
+        supersample: 反鋸齒倍數
+        slides: 只畫這些頁（從 1 開始；None = 全部）
+        prefix: 檔名前綴
+
+    Returns:
+        list: PIL Image（依頁序）
+    """
+    width, height = prs.slide_width / EMU_PER_PT, prs.slide_height / EMU_PER_PT
+    wanted = set(slides) if slides else None
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    images = []
+    for number, slide in enumerate(prs.slides, 1):
+        if wanted is not None and number not in wanted:
+            continue
+        with span("preview:slide", cat="render", slide=number):
+            image = render_slide(slide, width, height, scale, supersample)
+        if output_dir:
+            image.save(Path(output_dir) / f"{prefix}_{number:02d}.png", "PNG")
+        images.append(image)
+    return images
+
+
+def preview_pptx(path: str, output_dir: Optional[str] = None, **kwargs) -> List:
+    """讀取 PPTX 並畫出每一頁（參數同 preview_presentation）"""
+    with span("preview:load", cat="io", path=str(path)):
+        prs = Presentation(path)
+    return preview_presentation(prs, output_dir, **kwargs)
+
+
+def preview_layout(pages: Iterable[Dict], content_data: Dict, output_dir: Optional[str] = None,
+                   **kwargs) -> List:
+    """
+    由 layout.json 的各頁與 content_data 直接產生預覽（不存 PPTX、不開 PowerPoint）
+
+    Args:
+        pages: layout.json 的頁面列表（單頁格式傳 [layout]）
+        content_data: render_from_json.convert_slide_data_to_content_data 的結果
+        output_dir: 輸出目錄（None = 不寫檔）
+        **kwargs: 同 preview_presentation
+
+    Returns:
+        list: PIL Image（依頁序）
+    """
+    from render_pptx import PptxLayoutRenderer
+
+    renderer = PptxLayoutRenderer()
+    renderer.create_presentation()
+    with span("preview:render_layout", cat="render"):
+        for page in pages:
+            renderer.render_from_layout(page, content_data)
+    return preview_presentation(renderer.prs, output_dir, **kwargs)
+
+
+def contact_sheet(images: Sequence, columns: int = 5, gap: int = 8, background=(64, 64, 64)):
+    """
+    將多張縮圖排成一張總覽圖（依序由左至右、由上至下）
+
+    Args:
+        images: PIL Image 列表（大小以第一張為準）
+        columns: 每列張數
+        gap: 間距（像素）
+        background: 底色
+
+    Returns:
+        PIL.Image.Image
+    """
+    from PIL import Image
+
+    if not images:
+        return Image.new("RGB", (1, 1), background)
+    cell_w, cell_h = images[0].size
+    columns = max(1, min(columns, len(images)))
+    rows = (len(images) + columns - 1) // columns
+    sheet = Image.new("RGB", (columns * (cell_w + gap) + gap, rows * (cell_h + gap) + gap), background)
+    for index, image in enumerate(images):
+        row, col = divmod(index, columns)
+        if image.size != (cell_w, cell_h):
+            image = image.resize((cell_w, cell_h))
+        sheet.paste(image.convert("RGB"), (gap + col * (cell_w + gap), gap + row * (cell_h + gap)))
+    return sheet
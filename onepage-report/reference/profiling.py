@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+"""
+圖表繪製成本分析（per-element render profiler）
+
+包裝 modules/ 與 modules_pywin32/ 所有 draw_* 函數，每次呼叫記錄：
+    shapes     - 新增的形狀數
+    text_runs  - 新增的文字 run 數
+    wall_ms    - 耗時（含巢狀呼叫；self_ms 為扣除巢狀 draw_* 後的自身耗時）
+    alloc_kb   - 呼叫期間淨配置的 Python 記憶體（tracemalloc，可關閉）
+
+並依圖表函數與投影片彙總，找出哪些圖表類型值得簡化或快取。
+第一個參數是 Presentation 的繪圖函數（例如 draw_glossary_pages 自行新增投影片）
+改以整份簡報計數，投影片欄位記錄新增的頁碼範圍（例如 "12-15"）。
+
+使用方式：
+    from profiling import enable_profiling, disable_profiling
+
+    profiler = enable_profiling()
+    ...  # 正常渲染
+    disable_profiling()
+    profiler.print_report()
+    profiler.save("draw_profile.json")
+
+CLI 透過 --profile out.json 啟用（見 add_profile_argument）。
+包裝是以替換模組屬性的方式進行，disable_profiling() 會還原所有原始函數。
+"""
+
+import importlib
+import json
+import os
+import pkgutil
+import sys
+import time
+from collections import defaultdict
+from functools import wraps
+from typing import Dict, List, Optional
+
+from tracing import span
+
+# 要包裝的繪圖套件（名稱 → 後端）
+DRAWER_PACKAGES = {
+    "modules": "pptx",
+    "modules_pywin32": "com",
+}
+
+# python-pptx 形狀元素（含群組內的子形狀）
+_PPTX_SHAPE_XPATH = ".//p:sp | .//p:cxnSp | .//p:pic | .//p:graphicFrame | .//p:grpSp"
+
+
+def _pptx_counts(slide):
+    """python-pptx：回傳 (形狀數, 文字 run 數)"""
+    tree = slide.shapes._spTree
+    return len(tree.xpath(_PPTX_SHAPE_XPATH)), len(tree.xpath(".//a:r"))
+
+
+def _com_counts(slide):
+    """pywin32 COM：回傳 (形狀數, 文字 run 數)"""
+    shapes = slide.Shapes
+    runs = 0
+    for i in range(1, shapes.Count + 1):
+        shape = shapes.Item(i)
+        try:
+            if shape.HasTextFrame and shape.TextFrame.HasText:
+                runs += shape.TextFrame.TextRange.Runs().Count
+        except Exception:
+            continue
+    return shapes.Count, runs
+
+
+def _slide_counts(slide):
+    """依 slide 物件類型計算形狀數與文字 run 數，無法判斷時回傳 (0, 0)"""
+    try:
+        if hasattr(slide, "shapes"):
+            return _pptx_counts(slide)
+        if hasattr(slide, "Shapes"):
+            return _com_counts(slide)
+    except Exception:
+        pass
+    return 0, 0
+
+
+def _deck_slides(target):
+    """第一個參數是 Presentation 時回傳其投影片列表，是投影片（或無法判斷）時回傳 None"""
+    try:
+        if hasattr(target, "slide_layouts"):
+            return list(target.slides)
+        if hasattr(target, "Slides") and not hasattr(target, "Shapes"):
+            return [target.Slides.Item(i) for i in range(1, target.Slides.Count + 1)]
+    except Exception:
+        pass
+    return None
+
+
+def _target_counts(target):
+    """回傳 (形狀數, 文字 run 數, 投影片數)；Presentation 時加總所有投影片（投影片數為 None 表示目標是投影片）"""
+    slides = _deck_slides(target)
+    if slides is None:
+        return _slide_counts(target) + (None,)
+    shapes = runs = 0
+    for slide in slides:
+        slide_shapes, slide_runs = _slide_counts(slide)
+        shapes += slide_shapes
+        runs += slide_runs
+    return shapes, runs, len(slides)
+
+
+def _target_key(target, slides_before: Optional[int], slides_after: Optional[int]) -> str:
+    """投影片頁碼；Presentation 時為新增投影片的頁碼範圍（沒有新增時為 "deck"）"""
+    if slides_before is None or slides_after is None:
+        return _slide_key(target)
+    if slides_after <= slides_before:
+        return "deck"
+    if slides_after == slides_before + 1:
+        return str(slides_after)
+    return f"{slides_before + 1}-{slides_after}"
+
+
+def _slide_key(slide) -> str:
+    """取得投影片識別（1-based 頁碼）"""
+    try:
+        if hasattr(slide, "SlideIndex"):
+            return str(slide.SlideIndex)
+        slides = slide.part.package.presentation_part.presentation.slides
+        return str(slides.index(slide) + 1)
+    except Exception:
+        return "?"
+
+
+class _Frame:
+    """呼叫堆疊上的一筆紀錄（用於扣除巢狀呼叫）"""
+
+    __slots__ = ("child_ms", "child_shapes", "child_runs")
+
+    def __init__(self):
+        self.child_ms = 0.0
+        self.child_shapes = 0
+        self.child_runs = 0
+
+
+class DrawProfiler:
+    """收集 draw_* 呼叫紀錄並彙總"""
+
+    def __init__(self, track_memory: bool = True):
+        self.track_memory = track_memory
+        self.calls: List[Dict] = []
+        self._stack: List[_Frame] = []
+        self._patched = []   # [(module, attr, original)]
+        self._started_tracemalloc = False
+
+    # ------------------------------------------------------------------
+    # 安裝 / 移除
+    # ------------------------------------------------------------------
+
+    def install(self):
+        """載入繪圖套件並替換所有 draw_* 函數"""
+        import tracemalloc
+
+        originals = {}
+        for package_name, backend in DRAWER_PACKAGES.items():
+            try:
+                package = importlib.import_module(package_name)
+            except ImportError:
+                continue
+            for info in pkgutil.iter_modules(package.__path__):
+                if info.name.startswith("draw_"):
+                    try:
+                        importlib.import_module(f"{package_name}.{info.name}")
+                    except ImportError:
+                        continue
+            for module_name, module in list(sys.modules.items()):
+                if module is None or not module_name.startswith(package_name + "."):
+                    continue
+                for attr, value in vars(module).items():
+                    if (attr.startswith("draw_") and callable(value)
+                            and getattr(value, "__module__", None) == module_name):
+                        originals[value] = self._wrap(value, backend)
+
+        # 替換所有已載入模組中的引用（含 renderer 以 from-import 取得的名稱）
+        for module in list(sys.modules.values()):
+            namespace = getattr(module, "__dict__", None)
+            if not namespace:
+                continue
+            for attr, value in list(namespace.items()):
+                if attr.startswith("draw_") and callable(value) and value in originals:
+                    setattr(module, attr, originals[value])
+                    self._patched.append((module, attr, value))
+
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        return self
+
+    def uninstall(self):
+        """還原原始函數"""
+        for module, attr, original in reversed(self._patched):
+            setattr(module, attr, original)
+        self._patched = []
+        if self._started_tracemalloc:
+            import tracemalloc
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _wrap(self, func, backend: str):
+        import tracemalloc  # 只在啟用 --profile 時載入（CLI 冷啟動不需要）
+
+        name = func.__name__
+        profiler = self
+
+        @wraps(func)
+        def wrapper(slide, *args, **kwargs):
+            outer_start = time.perf_counter()
+            shapes_before, runs_before, slides_before = _target_counts(slide)
+            mem_before = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+            frame = _Frame()
+            profiler._stack.append(frame)
+            start = time.perf_counter()
+            try:
+                with span(f"draw:{name}", cat="draw", backend=backend):
+                    return func(slide, *args, **kwargs)
+            finally:
+                wall_ms = (time.perf_counter() - start) * 1000
+                profiler._stack.pop()
+                shapes_after, runs_after, slides_after = _target_counts(slide)
+                mem_after = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+                shapes = shapes_after - shapes_before
+                runs = runs_after - runs_before
+                if profiler._stack:
+                    # 巢狀呼叫的計數成本也從父呼叫的自身耗時扣除
+                    parent = profiler._stack[-1]
+                    parent.child_ms += (time.perf_counter() - outer_start) * 1000
+                    parent.child_shapes += shapes
+                    parent.child_runs += runs
+                profiler.calls.append({
+                    "drawer": name,
+                    "backend": backend,
+                    "slide": _target_key(slide, slides_before, slides_after),
+                    "depth": len(profiler._stack),
+                    "shapes": shapes,
+                    "self_shapes": shapes - frame.child_shapes,
+                    "text_runs": runs,
+                    "self_text_runs": runs - frame.child_runs,
+                    "wall_ms": round(wall_ms, 3),
+                    "self_ms": round(wall_ms - frame.child_ms, 3),
+                    "alloc_kb": round((mem_after - mem_before) / 1024, 1),
+                })
+
+        wrapper.__wrapped_drawer__ = func
+        return wrapper
+
+    # ------------------------------------------------------------------
+    # 彙總
+    # ------------------------------------------------------------------
+
+    def _aggregate(self, key: str) -> Dict[str, Dict]:
+        """依欄位彙總（calls / shapes / text_runs / wall_ms 使用自身值，避免巢狀重複計算）"""
+        groups = defaultdict(lambda: {"calls": 0, "shapes": 0, "text_runs": 0,
+                                      "wall_ms": 0.0, "alloc_kb": 0.0})
+        for call in self.calls:
+            g = groups[f"{call['drawer']} [{call['backend']}]" if key == "drawer" else call[key]]
+            g["calls"] += 1
+            g["shapes"] += call["self_shapes"]
+            g["text_runs"] += call["self_text_runs"]
+            g["wall_ms"] += call["self_ms"]
+            if call["depth"] == 0:
+                g["alloc_kb"] += call["alloc_kb"]
+        for g in groups.values():
+            g["wall_ms"] = round(g["wall_ms"], 3)
+            g["alloc_kb"] = round(g["alloc_kb"], 1)
+            g["ms_per_call"] = round(g["wall_ms"] / g["calls"], 3)
+        return dict(sorted(groups.items(), key=lambda kv: -kv[1]["wall_ms"]))
+
+    def report(self) -> Dict:
+        """
+        產生彙總報告
+
+        Returns:
+            dict: {"by_drawer": {...}, "by_slide": {...}, "calls": [...]}
+        """
+        return {
+            "by_drawer": self._aggregate("drawer"),
+            "by_slide": self._aggregate("slide"),
+            "calls": list(self.calls),
+        }
+
+    def print_report(self, top: int = 15):
+        """輸出依圖表函數與投影片彙總的表格"""
+        report = self.report()
+        print("\n[profile] 繪圖成本（依圖表函數，自身耗時排序）")
+        print(f"{'drawer':<44}{'calls':>6}{'shapes':>8}{'runs':>7}{'ms':>10}{'ms/call':>9}{'KB':>9}")
+        for name, g in list(report["by_drawer"].items())[:top]:
+            print(f"{name:<44}{g['calls']:>6}{g['shapes']:>8}{g['text_runs']:>7}"
+                  f"{g['wall_ms']:>10.1f}{g['ms_per_call']:>9.2f}{g['alloc_kb']:>9.1f}")
+        print("\n[profile] 繪圖成本（依投影片）")
+        print(f"{'slide':<8}{'calls':>6}{'shapes':>8}{'runs':>7}{'ms':>10}")
+        for slide, g in sorted(report["by_slide"].items(), key=lambda kv: (len(kv[0]), kv[0])):
+            print(f"{slide:<8}{g['calls']:>6}{g['shapes']:>8}{g['text_runs']:>7}{g['wall_ms']:>10.1f}")
+
+    def save(self, output_path: str) -> str:
+        """寫入 JSON 報告，回傳輸出路徑"""
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        os.makedirs(output_dir, exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        return output_path
+
+
+# 全域 profiler（None = 停用）
+_profiler: Optional[DrawProfiler] = None
+
+
+def enable_profiling(track_memory: bool = True) -> DrawProfiler:
+    """
+    啟用繪圖成本分析
+
+    Args:
+        track_memory: 是否以 tracemalloc 記錄記憶體配置（會讓渲染變慢）
+
+    Returns:
+        DrawProfiler 物件
+    """
+    global _profiler
+    if _profiler is not None:
+        return _profiler
+    _profiler = DrawProfiler(track_memory).install()
+    return _profiler
+
+
+def disable_profiling() -> Optional[DrawProfiler]:
+    """停用分析並還原原始函數，回傳 profiler（未啟用時回傳 None）"""
+    global _profiler
+    if _profiler is None:
+        return None
+    profiler, _profiler = _profiler, None
+    profiler.uninstall()
+    return profiler
+
+
+def finish_profiling(output_path: Optional[str] = None) -> Optional[DrawProfiler]:
+    """停用分析、輸出報告表格，並在指定路徑時寫入 JSON"""
+    profiler = disable_profiling()
+    if profiler is None:
+        return None
+    profiler.print_report()
+    if output_path:
+        profiler.save(output_path)
+        print(f"[profile] 報告已儲存: {output_path}")
+    return profiler
+
+
+def add_profile_argument(parser):
+    """為 argparse parser 加入 --profile 參數"""
+    parser.add_argument(
+        "--profile", metavar="OUT_JSON",
+        help="記錄每個 draw_* 呼叫的形狀數、文字 run、耗時與記憶體，並輸出 JSON 報告"
+    )
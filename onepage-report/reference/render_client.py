@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+本機渲染服務的用戶端（見 render_service.py）
+
+與服務分開成獨立模組：用戶端只需要 http.client，不載入 multiprocessing / http.server，
+呼叫端（每天啟動上千次的 orchestrator 腳本）的冷啟動維持最小。
+
+使用方式：
+    from render_client import ServiceClient, QueueFull
+
+    client = ServiceClient("unix:/tmp/onepage-render.sock")
+    job = client.result("render", {"layout": "layout.json", "data": "slide_data.json",
+                                    "output": "final.pptx"}, priority="batch")
+    if job["status"] == "failed":
+        print(job["error"])
+
+服務啟動時產生一次性的 token，寫在 token_path(address)（只有目前使用者可讀）；
+用戶端自動讀取並放在 X-Render-Token 標頭，其他網頁或使用者無法冒用服務寫檔。
+"""
+
+import http.client
+import json
+import os
+import socket
+import tempfile
+import time
+from typing import Dict, Optional, Tuple
+
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+
+# 服務 token 的 HTTP 標頭
+TOKEN_HEADER = "X-Render-Token"
+
+# 優先序（數字小的先執行）
+PRIORITIES = {"interactive": 0, "normal": 1, "batch": 2}
+
+# 工作狀態
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# 工作種類 → 路徑參數（用戶端轉成絕對路徑，服務的工作目錄可能不同）
+JOB_PATH_PARAMS = {
+    "render": ("layout", "data", "output", "script"),
+    "preview": ("output_dir", "pptx", "layout", "data"),
+    "layout": ("one_page", "diagrams", "output", "content_json", "diagrams_structured"),
+    "extract_pdf": ("pdf", "output_dir"),
+    "extract_pptx": ("pptx", "output_dir"),
+    "validate": ("layout", "data"),
+}
+
+
+class QueueFull(Exception):
+    """佇列已滿（背壓）：retry_after 為建議的重試秒數"""
+
+    def __init__(self, priority: str, limit: int, retry_after: float):
+        super().__init__(f"{priority} 佇列已滿（上限 {limit}），請 {retry_after:.0f} 秒後重試")
+        self.priority = priority
+        self.limit = limit
+        self.retry_after = retry_after
+
+
+def parse_address(address: str) -> Tuple[str, object]:
+    """'unix:/path' → ("unix", path)；'host:port' / 'port' → ("tcp", (host, port))"""
+    if address.startswith("unix:"):
+        return "unix", address[len("unix:"):]
+    host, _, port = address.rpartition(":")
+    return "tcp", (host or "127.0.0.1", int(port))
+
+
+def token_path(address: str) -> str:
+    """服務 token 檔：Unix socket 旁的 <socket>.token；TCP 為暫存目錄下的 onepage-render-<host>-<port>.token"""
+    family, target = parse_address(address)
+    if family == "unix":
+        return target + ".token"
+    host, port = target
+    return os.path.join(tempfile.gettempdir(), f"onepage-render-{host}-{port}.token")
+
+
+def read_token(address: str) -> Optional[str]:
+    """讀取服務 token（服務未啟動時回傳 None）"""
+    try:
+        with open(token_path(address), encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class ServiceClient:
+    """
+    渲染服務用戶端
+
+    Args:
+        address: 服務位址（'host:port' 或 'unix:/path'）
+        timeout: 單次請求的逾時秒數（需大於 wait）
+        token: 服務 token（None = 讀取 token_path(address)）
+    """
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, timeout: float = 330.0, token: Optional[str] = None):
+        self.address = address
+        self.timeout = timeout
+        self.token = token
+
+    def _request(self, method: str, path: str, payload: Optional[Dict] = None) -> Dict:
+        family, target = parse_address(self.address)
+        conn = (_UnixConnection(target, self.timeout) if family == "unix"
+                else http.client.HTTPConnection(*target, timeout=self.timeout))
+        try:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else None
+            headers = {"Content-Type": "application/json"}
+            token = self.token or read_token(self.address)
+            if token:
+                headers[TOKEN_HEADER] = token
+            conn.request(method, path, body, headers)
+            response = conn.getresponse()
+            data = json.loads(response.read() or b"{}")
+        finally:
+            conn.close()
+        if response.status == 503:
+            raise QueueFull((payload or {}).get("priority", "normal"), data.get("limit", 0),
+                            data.get("retry_after", 1.0))
+        if response.status >= 400:
+            raise ValueError(data.get("error", f"HTTP {response.status}"))
+        return data
+
+    def submit(self, kind: str, params: Dict, priority: str = "normal", wait: Optional[float] = None) -> Dict:
+        """
+        提交工作（路徑參數轉成絕對路徑，服務的工作目錄可能不同）
+
+        Args:
+            kind: 工作種類
+            params: 參數
+            priority: interactive / normal / batch
+            wait: 最多等待幾秒（None = 立即回傳排隊中的紀錄）
+
+        Returns:
+            dict: 工作紀錄（status 為 queued / running / done / failed）
+
+        Raises:
+            QueueFull: 服務佇列已滿（retry_after 秒後再試）
+            ValueError: 參數錯誤
+        """
+        params = dict(params)
+        for name in JOB_PATH_PARAMS.get(kind, ()):
+            if isinstance(params.get(name), str):
+                params[name] = os.path.abspath(params[name])
+        return self._request("POST", "/jobs", {"kind": kind, "params": params, "priority": priority, "wait": wait})
+
+    def job(self, job_id: str, wait: Optional[float] = None) -> Dict:
+        return self._request("GET", f"/jobs/{job_id}" + (f"?wait={wait}" if wait else ""))
+
+    def result(self, kind: str, params: Dict, priority: str = "normal", poll: float = 30.0) -> Dict:
+        """提交並等到工作完成（佇列已滿時依 Retry-After 退避重試）"""
+        while True:
+            try:
+                job = self.submit(kind, params, priority, wait=poll)
+                break
+            except QueueFull as e:
+                time.sleep(e.retry_after)
+        while job["status"] in (QUEUED, RUNNING):
+            job = self.job(job["id"], wait=poll)
+        return job
+
+    def metrics(self) -> Dict:
+        return self._request("GET", "/metrics")
+
+    def health(self) -> bool:
+        try:
+            return bool(self._request("GET", "/health").get("ok"))
+        except (OSError, ValueError):
+            return False
+
+    def shutdown(self):
+        self._request("POST", "/shutdown", {})
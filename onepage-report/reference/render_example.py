@@ -13,6 +13,8 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.dml import MSO_LINE_DASH_STYLE
 import re
 
+from scene import Scene, TableStyle, TextStyle, fit_table, flush_pptx
+
 # =============================================================================
 # 顏色定義 (MTK 風格)
 # =============================================================================
@@ -285,36 +287,15 @@ def add_section_title(slide, left, top, width, text, color=ACCENT_BLUE):
     return box
 
 
-def set_cell_text(cell, text, font_size=9, bold=True, color=DARK_GRAY):
-    cell.text = text
-    for paragraph in cell.text_frame.paragraphs:
-        paragraph.font.size = Pt(font_size)
-        paragraph.font.bold = bold
-        paragraph.font.color.rgb = color
-        paragraph.font.name = FONT_NAME
-
-
 def add_table(slide, left, top, width, height, headers, data, header_color=ACCENT_BLUE):
-    rows = len(data) + 1
-    cols = len(headers)
-    table = slide.shapes.add_table(
-        rows, cols,
-        Inches(left), Inches(top), Inches(width), Inches(height)
-    ).table
-
-    for i, header in enumerate(headers):
-        set_cell_text(table.cell(0, i), header, font_size=9, bold=True, color=WHITE)
-        table.cell(0, i).fill.solid()
-        table.cell(0, i).fill.fore_color.rgb = header_color
-
-    for row_idx, row_data in enumerate(data):
-        for col_idx, cell_text in enumerate(row_data):
-            set_cell_text(table.cell(row_idx + 1, col_idx), cell_text, font_size=8, bold=True)
-            if row_idx % 2 == 0:
-                table.cell(row_idx + 1, col_idx).fill.solid()
-                table.cell(row_idx + 1, col_idx).fill.fore_color.rgb = RGBColor(245, 245, 245)
-
-    return table
+    style = TableStyle(
+        header=TextStyle(9, True, WHITE, FONT_NAME), body=TextStyle(8, True, DARK_GRAY, FONT_NAME),
+        header_fill=header_color, band_fills=(RGBColor(245, 245, 245), WHITE), align="left",
+    )
+    node = fit_table(headers, data, left * 72, top * 72, width * 72, height * 72, style=style)
+    scene = Scene(unit="pt")
+    scene.add(node)
+    return flush_pptx(scene, slide)[0].table
 
 
 # =============================================================================
@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+"""
+Phase 6 Renderer using python-pptx（跨平台版本）
+
+對應 render_pywin32.LayoutRenderer 的 python-pptx 實作：
+讀取 layout.json（pt 座標）與 content_data，使用 modules/ 的圖表函數繪製。
+不需要 PowerPoint / pywin32，可在 Linux 上執行（LAYOUT_ENGINE = pptx_shapes）。
+
+使用方式：
+    renderer = PptxLayoutRenderer()
+    renderer.create_presentation()
+    renderer.render_from_layout(layout, content_data)
+    renderer.save("output.pptx")
+
+diagrams_content 的 type 不在 FIGURE_DISPATCH 時，改用 modules.register_drawer 登錄的第三方繪圖函數，
+以 drawer(slide, x, y, w, h, dc) 呼叫（繪圖模組第一次使用時才 import）。
+
+多版本批次（地區版、語系版）可共用圖表片段快取，相同圖表只畫一次：
+    renderer = PptxLayoutRenderer(fragment_cache=FragmentCache(disk_dir=".fragment_cache"))
+"""
+
+import os
+from typing import Dict, Any, Optional
+
+from pptx import Presentation
+from pptx.util import Inches, Pt
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.text import PP_ALIGN
+
+from tracing import span
+from fragment_cache import FragmentCache, fragment_key
+from figure_export import (
+    comparison_args, flow_nodes, platform_args, timeline_stages, architecture_layers, pie_data
+)
+from scene import Scene, TableStyle, TextStyle, flush_pptx, paginate_table
+from modules._colors import (
+    COLOR_TEXT, COLOR_WHITE, COLOR_GRAY_BG, COLOR_BLUE,
+    BG_COLOR, ACCENT_BLUE, ACCENT_ORANGE, FONT_NAME
+)
+from modules._textfit import fit_font_size, PPTX_TEXTBOX_MARGINS
+from modules._tracking import set_current_slide, track_element
+from modules.helpers import add_content_box
+from modules import BUILTIN_DRAWERS, get_drawer
+
+
+# 16:9 投影片尺寸（pt）
+SLIDE_WIDTH_PT = 960
+SLIDE_HEIGHT_PT = 540
+
+# 角色對應樣式（與 render_pywin32.ROLE_STYLES 相同）
+ROLE_STYLES = {
+    "title": {"size": 20, "bold": True, "color": COLOR_TEXT},
+    "subtitle": {"size": 14, "bold": True, "color": RGBColor(0x66, 0x66, 0x66)},
+    "h2": {"size": 10, "bold": True, "color": ACCENT_BLUE},
+    "body": {"size": 8, "bold": False, "color": COLOR_TEXT},
+    "caption": {"size": 10, "bold": False, "color": RGBColor(0x88, 0x88, 0x88)},
+    "mono": {"size": 10, "bold": False, "color": COLOR_TEXT, "font": "Consolas"},
+}
+
+# 表格樣式（與 draw_comparison_table 相同配色）
+TABLE_STYLE = TableStyle(
+    header=TextStyle(9, True, COLOR_WHITE, FONT_NAME),
+    body=TextStyle(9, False, COLOR_TEXT, FONT_NAME),
+    header_fill=COLOR_BLUE,
+    band_fills=(COLOR_GRAY_BG, COLOR_WHITE),
+)
+
+# 表格續頁：表格起點與下方保留（pt）
+CONTINUATION_TOP = 50
+CONTINUATION_BOTTOM = 20
+
+# 圖表類型 → 渲染方法名稱
+FIGURE_DISPATCH = {
+    "before_after": "_render_comparison",
+    "comparison": "_render_comparison",
+    "flow": "_render_flow_diagram",
+    "platform_compare": "_render_platform_compare",
+    "timeline": "_render_timeline",
+    "architecture": "_render_architecture",
+    "line_chart": "_render_line_chart",
+    "bar_chart": "_render_bar_chart",
+    "pie_chart": "_render_pie_chart",
+    "gantt_chart": "_render_gantt_chart",
+}
+
+
+def pt_to_in(value: float) -> float:
+    """將 pt 轉換為英吋"""
+    return value / 72
+
+
+class PptxLayoutRenderer:
+    """
+    Phase 6 python-pptx 渲染器
+
+    流程：
+    1. create_presentation() - 建立 16:9 空白簡報
+    2. render_from_layout() - 根據 layout.json 渲染一頁
+    3. save() - 儲存 PPTX
+    """
+
+    @staticmethod
+    def _normalize_id(elem_id: str) -> str:
+        """移除 'fig:' 前綴，統一 ID 格式"""
+        return elem_id[4:] if elem_id.startswith("fig:") else elem_id
+
+    def __init__(self, fragment_cache: Optional[FragmentCache] = None):
+        """
+        Args:
+            fragment_cache: 圖表片段快取（None = 每次都重新繪製）
+        """
+        self.prs = None
+        self.fragment_cache = fragment_cache
+        self._current_slide_index = 0
+        self._slide_size = (SLIDE_WIDTH_PT, SLIDE_HEIGHT_PT)
+
+    def create_presentation(self):
+        """建立 16:9 空白簡報"""
+        self.prs = Presentation()
+        self.prs.slide_width = Inches(13.333)
+        self.prs.slide_height = Inches(7.5)
+        return self.prs
+
+    def render_from_layout(
+        self,
+        layout_data: Dict[str, Any],
+        content_data: Optional[Dict[str, Any]] = None
+    ):
+        """
+        根據 layout.json 渲染投影片
+
+        Args:
+            layout_data: layout.json 內容（單頁）
+            content_data: render_from_json 轉換後的內容資料
+
+        Returns:
+            Slide 物件
+        """
+        if self.prs is None:
+            raise RuntimeError("請先呼叫 create_presentation()")
+        if content_data is None:
+            content_data = {}
+
+        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        set_current_slide(self._current_slide_index)
+        self._current_slide_index += 1
+
+        slide_size = layout_data.get("slide", {})
+        width_pt = slide_size.get("w_pt", SLIDE_WIDTH_PT)
+        height_pt = slide_size.get("h_pt", SLIDE_HEIGHT_PT)
+        self._slide_size = (width_pt, height_pt)
+        self._add_background(slide)
+
+        for elem in layout_data.get("elements", []):
+            self._render_element(slide, elem, content_data)
+
+        return slide
+
+    def _add_background(self, slide, track: bool = True):
+        """加入整頁背景矩形"""
+        width_pt, height_pt = self._slide_size
+        bg = slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, 0, 0,
+            Inches(pt_to_in(width_pt)), Inches(pt_to_in(height_pt))
+        )
+        bg.fill.solid()
+        bg.fill.fore_color.rgb = BG_COLOR
+        bg.line.fill.background()
+        if track:
+            track_element("background", 0, 0, pt_to_in(width_pt), pt_to_in(height_pt), "background")
+
+    def _render_element(self, slide, elem: Dict[str, Any], content_data: Dict[str, Any]):
+        """渲染單一元素（座標由 pt 轉為英吋）"""
+        box = elem.get("box") or elem.get("bounding_box", {})
+        x = pt_to_in(box.get("x", 0))
+        y = pt_to_in(box.get("y", 0))
+        w = pt_to_in(box.get("w", 100))
+        h = pt_to_in(box.get("h", 50))
+
+        kind = elem.get("kind", "text")
+        role = elem.get("role", "body")
+        elem_id = elem.get("id", "")
+
+        with span(f"render:{kind}", cat="render", id=elem_id):
+            if kind == "text":
+                self._render_text(slide, x, y, w, h, role, elem_id, content_data)
+            elif kind == "bullets":
+                self._render_bullets(slide, x, y, w, h, elem_id, content_data)
+            elif kind == "table":
+                self._render_table(slide, x, y, w, h, elem_id, content_data)
+            elif kind == "figure":
+                self._render_figure(slide, x, y, w, h, elem, content_data)
+            elif kind == "callout":
+                self._render_callout(slide, x, y, w, h, elem_id, content_data)
+            else:
+                return
+        track_element(elem_id or kind, x, y, w, h, "diagram" if kind == "figure" else "text")
+
+    def _add_text(self, slide, text, x, y, w, h, size, bold=False, color=COLOR_TEXT,
+                  font_name=FONT_NAME, align=PP_ALIGN.LEFT, role="body"):
+        """新增文字框（放不下時自動縮小字體）"""
+        size = fit_font_size(text, w * 72, h * 72, size, role=role, bold=bold,
+                             margins=PPTX_TEXTBOX_MARGINS, mono=(font_name == "Consolas"))
+        box = slide.shapes.add_textbox(Inches(x), Inches(y), Inches(w), Inches(h))
+        tf = box.text_frame
+        tf.word_wrap = True
+        for i, line in enumerate(text.split("\n")):
+            p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+            p.text = line
+            p.font.size = Pt(size)
+            p.font.bold = bold
+            p.font.color.rgb = color
+            p.font.name = font_name
+            p.alignment = align
+        return box
+
+    def _render_text(self, slide, x, y, w, h, role, elem_id, content_data):
+        """渲染文字元素"""
+        text = content_data.get("texts", {}).get(elem_id, "") or elem_id
+        style = ROLE_STYLES.get(role, ROLE_STYLES["body"])
+        self._add_text(
+            slide, text, x, y, w, h, style["size"], bold=style["bold"],
+            color=style["color"], font_name=style.get("font", FONT_NAME),
+            align=PP_ALIGN.LEFT if role in ("body", "caption") else PP_ALIGN.CENTER,
+            role=role
+        )
+
+    def _render_bullets(self, slide, x, y, w, h, elem_id, content_data):
+        """渲染區塊（標題 + 項目符號）"""
+        items = content_data.get("items", {}).get(elem_id, []) or [elem_id]
+        title = content_data.get("texts", {}).get(f"{elem_id}:title", "")
+        add_content_box(slide, x, y, w, h, title, items,
+                        title_color=ACCENT_BLUE, bg_color=COLOR_WHITE)
+
+    def _render_table(self, slide, x, y, w, h, elem_id, content_data):
+        """渲染表格（單一原生表格；放不下的列移到續頁，續頁重複表頭）"""
+        table_data = content_data.get("tables", {}).get(elem_id) or {
+            "headers": ["欄位"], "rows": [[elem_id]]
+        }
+        headers = table_data.get("headers", [])
+        if not headers:
+            return
+
+        _, height_pt = self._slide_size
+        pages = paginate_table(
+            headers, table_data.get("rows", []), x * 72, y * 72, w * 72, h * 72,
+            style=TABLE_STYLE, next_y=CONTINUATION_TOP,
+            next_height=height_pt - CONTINUATION_TOP - CONTINUATION_BOTTOM
+        )
+        for page in pages:
+            target = slide if page.page == 1 else self._add_continuation_slide(
+                f"{elem_id}（續 {page.page}）")
+            scene = Scene(unit="pt")
+            scene.add(page.node)
+            flush_pptx(scene, target)
+
+    def _add_continuation_slide(self, title: str):
+        """在簡報末尾新增續頁（背景 + 標題），回傳 Slide"""
+        width_pt, _ = self._slide_size
+        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        self._current_slide_index += 1
+        # 續頁不納入排版審查（追蹤的仍是原投影片）
+        self._add_background(slide, track=False)
+        self._add_text(slide, title, pt_to_in(30), pt_to_in(10), pt_to_in(width_pt - 60),
+                       pt_to_in(30), 18, bold=True, role="title")
+        return slide
+
+    def _render_callout(self, slide, x, y, w, h, elem_id, content_data):
+        """渲染 Callout 註解"""
+        text = content_data.get("texts", {}).get(elem_id, "") or elem_id
+        box = slide.shapes.add_shape(
+            MSO_SHAPE.ROUNDED_RECTANGLE, Inches(x), Inches(y), Inches(w), Inches(h)
+        )
+        box.fill.solid()
+        box.fill.fore_color.rgb = RGBColor(0xFF, 0xF8, 0xE1)
+        box.line.color.rgb = ACCENT_ORANGE
+        box.line.width = Pt(1.5)
+        self._add_text(slide, f"💡 {text}", x + 0.1, y + 0.05, w - 0.2, h - 0.1, 9,
+                       color=ACCENT_ORANGE)
+
+    # =========================================================================
+    # 圖表渲染
+    # =========================================================================
+
+    def _get_diagram_data(self, elem_id: str, content_data: Dict) -> Dict:
+        """從 content_data 取得圖表資料（統一 ID 正規化）"""
+        return content_data.get("diagrams_content", {}).get(self._normalize_id(elem_id), {})
+
+    def _render_figure(self, slide, x, y, w, h, elem, content_data):
+        """依 diagrams_content 的 type 分派到對應的圖表函數"""
+        elem_id = elem.get("id", "")
+        dc = self._get_diagram_data(elem_id, content_data)
+        method_name = FIGURE_DISPATCH.get(dc.get("type"))
+        if method_name is None and dc.get("type") not in BUILTIN_DRAWERS and get_drawer(dc.get("type", "")):
+            method_name = "_render_registered"
+        if method_name:
+            def draw():
+                getattr(self, method_name)(slide, x, y, w, h, elem_id, dc)
+
+            # 甘特圖續頁會新增投影片，無法由片段快取重播
+            if self.fragment_cache is None or dc.get("overflow"):
+                draw()
+            else:
+                key = fragment_key(dc.get("type"), dc, (w * 72, h * 72))
+                self.fragment_cache.render(slide, key, (x * 72, y * 72), draw)
+        else:
+            self._render_placeholder(slide, x, y, w, h, elem_id, elem.get("alt", ""))
+
+    def _render_comparison(self, slide, x, y, w, h, elem_id, dc):
+        get_drawer("before_after")(slide, x, y, w, h, *comparison_args(dc))
+
+    def _render_flow_diagram(self, slide, x, y, w, h, elem_id, dc):
+        nodes = flow_nodes(dc)
+        if nodes:
+            get_drawer("flow")(slide, x, y, w, h, nodes)
+        else:
+            self._render_placeholder(slide, x, y, w, h, elem_id, "流程圖")
+
+    def _render_platform_compare(self, slide, x, y, w, h, elem_id, dc):
+        get_drawer("platform_compare")(slide, x, y, w, h, *platform_args(dc))
+
+    def _render_timeline(self, slide, x, y, w, h, elem_id, dc):
+        stages = timeline_stages(dc)
+        if stages:
+            get_drawer("timeline")(slide, x, y, w, h, stages)
+        else:
+            self._render_placeholder(slide, x, y, w, h, elem_id, "時間軸")
+
+    def _render_architecture(self, slide, x, y, w, h, elem_id, dc):
+        layers = architecture_layers(dc)
+        if layers:
+            get_drawer("architecture")(slide, x, y, w, h, layers)
+        else:
+            self._render_placeholder(slide, x, y, w, h, elem_id, "架構圖")
+
+    def _render_line_chart(self, slide, x, y, w, h, elem_id, dc):
+        get_drawer("line_chart")(slide, x, y, w, h, dc.get("title", ""),
+                                 dc.get("categories", []), dc.get("series", []),
+                                 max_points=dc.get("max_points"), downsample=dc.get("downsample", "minmax"))
+
+    def _render_bar_chart(self, slide, x, y, w, h, elem_id, dc):
+        get_drawer("bar_chart")(slide, x, y, w, h, dc.get("title", ""),
+                                dc.get("categories", []), dc.get("series", []))
+
+    def _render_pie_chart(self, slide, x, y, w, h, elem_id, dc):
+        get_drawer("pie_chart")(slide, x, y, w, h, dc.get("title", ""), pie_data(dc))
+
+    def _render_gantt_chart(self, slide, x, y, w, h, elem_id, dc):
+        """甘特圖；overflow 為 true 時放不下的列移到續頁，否則收合泳道 / 合併列留在本頁"""
+        _, height_pt = self._slide_size
+        continuation = None
+        if dc.get("overflow"):
+            def continuation(page):
+                return self._add_continuation_slide(f"{elem_id}（續 {page}）")
+
+        get_drawer("gantt_chart")(
+            slide, x, y, w, h, dc.get("title", ""), dc.get("tasks", []), dc.get("milestones"),
+            dc.get("time_unit", "week"), dc.get("show_today_line", True), dc.get("show_progress", True),
+            group_key=dc.get("group_key", "group"), collapsed=dc.get("collapsed"),
+            continuation=continuation, continuation_top=pt_to_in(CONTINUATION_TOP),
+            continuation_height=pt_to_in(height_pt - CONTINUATION_TOP - CONTINUATION_BOTTOM)
+        )
+
+    def _render_registered(self, slide, x, y, w, h, elem_id, dc):
+        """第三方登錄的圖表類型（modules.register_drawer）：直接傳入 diagrams_content"""
+        get_drawer(dc["type"])(slide, x, y, w, h, dc)
+
+    def _render_placeholder(self, slide, x, y, w, h, elem_id, alt):
+        """渲染佔位框"""
+        box = slide.shapes.add_shape(
+            MSO_SHAPE.ROUNDED_RECTANGLE, Inches(x), Inches(y), Inches(w), Inches(h)
+        )
+        box.fill.solid()
+        box.fill.fore_color.rgb = COLOR_GRAY_BG
+        box.line.color.rgb = RGBColor(0x9E, 0x9E, 0x9E)
+        text = f"[圖表: {alt}]" if alt else f"[{elem_id}]"
+        self._add_text(slide, text, x + 0.1, y + h / 2 - 0.15, w - 0.2, 0.3, 10,
+                       color=RGBColor(0x9E, 0x9E, 0x9E), align=PP_ALIGN.CENTER)
+
+    # =========================================================================
+    # 儲存
+    # =========================================================================
+
+    def save(self, path: str) -> str:
+        """儲存簡報，回傳絕對路徑"""
+        if self.prs is None:
+            raise RuntimeError("沒有簡報可儲存")
+        abs_path = os.path.abspath(path)
+        with span("save", cat="save", path=abs_path):
+            self.prs.save(abs_path)
+        return abs_path
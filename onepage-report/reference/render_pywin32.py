@@ -21,6 +21,11 @@ import json
 import re
 from typing import Dict, Any, List, Optional
 
+from tracing import span
+from scene.com_backend import flush_com
+from scene.nodes import Scene, TextStyle
+from scene.tables import TableStyle, paginate_table
+
 # pywin32 COM API
 try:
     import win32com.client as win32
@@ -66,6 +71,7 @@ FIGURE_DISPATCH = {
     "line_chart": "_render_line_chart",
     "bar_chart": "_render_bar_chart",
     "pie_chart": "_render_pie_chart",
+    "gantt_chart": "_render_gantt_chart",
 }
 
 
@@ -87,6 +93,19 @@ ROLE_STYLES = {
     "mono": {"size": 10, "bold": False, "color": COLOR_TEXT, "font": "Consolas"},
 }
 
+# 表格樣式（RGB；flush_com 會轉為 BGR）
+TABLE_STYLE = TableStyle(
+    header=TextStyle(9, True, (0x33, 0x33, 0x33), FONT_NAME),
+    body=TextStyle(8, False, (0x33, 0x33, 0x33), FONT_NAME),
+    header_fill=(0xF5, 0xF5, 0xF5),
+    band_fills=((0xFF, 0xFF, 0xFF), (0xFA, 0xFA, 0xFA)),
+    border=(0xE0, 0xE0, 0xE0),
+)
+
+# 表格續頁：表格起點與下方保留（pt）
+CONTINUATION_TOP = 50
+CONTINUATION_BOTTOM = 20
+
 # 區塊顏色對應
 SECTION_COLORS = {
     "技術": ACCENT_BLUE,
@@ -138,6 +157,7 @@ class LayoutRenderer:
         self.prs = None
         self.mcp_client = None
         self._current_slide_index = 0
+        self._slide_size = (SLIDE_WIDTH_PT, SLIDE_HEIGHT_PT)
 
     def create_presentation(self):
         """
@@ -225,6 +245,7 @@ class LayoutRenderer:
         slide_size = layout_data.get("slide", {})
         width_pt = slide_size.get("w_pt", SLIDE_WIDTH_PT)
         height_pt = slide_size.get("h_pt", SLIDE_HEIGHT_PT)
+        self._slide_size = (width_pt, height_pt)
 
         # 加入背景
         add_background(slide, width_pt, height_pt, BG_COLOR)
@@ -263,16 +284,17 @@ class LayoutRenderer:
         elem_id = elem.get("id", "")
 
         # 根據類型渲染
-        if kind == "text":
-            self._render_text(slide, x, y, w, h, role, elem_id, content_data)
-        elif kind == "bullets":
-            self._render_bullets(slide, x, y, w, h, elem_id, content_data)
-        elif kind == "table":
-            self._render_table(slide, x, y, w, h, elem_id, content_data)
-        elif kind == "figure":
-            self._render_figure(slide, x, y, w, h, elem, content_data)
-        elif kind == "callout":
-            self._render_callout(slide, x, y, w, h, elem_id, content_data)
+        with span(f"render:{kind}", cat="render", id=elem_id):
+            if kind == "text":
+                self._render_text(slide, x, y, w, h, role, elem_id, content_data)
+            elif kind == "bullets":
+                self._render_bullets(slide, x, y, w, h, elem_id, content_data)
+            elif kind == "table":
+                self._render_table(slide, x, y, w, h, elem_id, content_data)
+            elif kind == "figure":
+                self._render_figure(slide, x, y, w, h, elem, content_data)
+            elif kind == "callout":
+                self._render_callout(slide, x, y, w, h, elem_id, content_data)
 
     def _render_text(
         self,
@@ -296,7 +318,8 @@ class LayoutRenderer:
             bold=style["bold"],
             color=style["color"],
             font_name=style.get("font", FONT_NAME),
-            align=1 if role in ["body", "caption"] else 2
+            align=1 if role in ["body", "caption"] else 2,
+            role=role
         )
 
     def _render_bullets(
@@ -328,7 +351,7 @@ class LayoutRenderer:
         elem_id: str,
         content_data: Dict
     ):
-        """渲染表格"""
+        """渲染表格（單一原生表格；放不下的列移到續頁，續頁重複表頭）"""
         # 取得表格資料
         table_data = self._get_content_table(elem_id, content_data)
         if not table_data:
@@ -344,30 +367,27 @@ class LayoutRenderer:
         if not headers:
             return
 
-        col_count = len(headers)
-        row_count = len(rows) + 1  # +1 for header
-        col_width = w / col_count
-        row_height = h / row_count
-
-        # 表頭
-        for i, header in enumerate(headers):
-            cell_x = x + i * col_width
-            add_rect(slide, cell_x, y, col_width, row_height,
-                    line_color=COLOR_GRAY_LIGHT, fill_color=COLOR_GRAY_BG)
-            add_textbox(slide, header, cell_x + 4, y + 2,
-                       col_width - 8, row_height - 4,
-                       font_size=9, bold=True, color=COLOR_TEXT, align=2)
-
-        # 資料列
-        for row_idx, row in enumerate(rows):
-            row_y = y + (row_idx + 1) * row_height
-            for col_idx, cell in enumerate(row):
-                cell_x = x + col_idx * col_width
-                add_rect(slide, cell_x, row_y, col_width, row_height,
-                        line_color=COLOR_GRAY_LIGHT, fill_color=COLOR_WHITE)
-                add_textbox(slide, str(cell), cell_x + 4, row_y + 2,
-                           col_width - 8, row_height - 4,
-                           font_size=8, color=COLOR_TEXT, align=2)
+        _, height_pt = self._slide_size
+        pages = paginate_table(
+            headers, rows, x, y, w, h, style=TABLE_STYLE,
+            next_y=CONTINUATION_TOP,
+            next_height=height_pt - CONTINUATION_TOP - CONTINUATION_BOTTOM
+        )
+        for page in pages:
+            target = slide if page.page == 1 else self._add_continuation_slide(
+                f"{elem_id}（續 {page.page}）")
+            scene = Scene(unit="pt")
+            scene.add(page.node)
+            flush_com(scene, target)
+
+    def _add_continuation_slide(self, title: str):
+        """在簡報末尾新增續頁（背景 + 標題），回傳 Slide"""
+        width_pt, height_pt = self._slide_size
+        slide = self.prs.Slides.Add(self.prs.Slides.Count + 1, 12)
+        self._current_slide_index += 1
+        add_background(slide, width_pt, height_pt, BG_COLOR)
+        add_slide_title(slide, title, width=width_pt - 60)
+        return slide
 
     def _render_figure(
         self,
@@ -474,6 +494,39 @@ class LayoutRenderer:
             default_data = {"labels": ["A", "B", "C"], "values": [40, 35, 25]}
             draw_pie_chart(slide, x, y, w, h, default_data, title=elem_id)
 
+    def _render_gantt_chart(self, slide, x, y, w, h, elem_id, content_data):
+        """
+        渲染甘特圖（版面同 render_pptx：modules.draw_gantt_chart 產生 scene，flush_com 輸出）
+
+        overflow 為 true 時放不下的列移到續頁，否則收合泳道 / 合併列留在本頁。
+        """
+        # draw_gantt_chart 的顏色常數來自 python-pptx，只在用到甘特圖時才載入
+        from modules.draw_gantt_chart import build_gantt_chart, gantt_pages
+
+        dc = self._get_diagram_data(elem_id, content_data)
+        tasks = dc.get("tasks", [])
+        if not tasks:
+            self._render_placeholder(slide, x, y, w, h, elem_id, "甘特圖")
+            return
+        options = dict(time_unit=dc.get("time_unit", "week"), show_today_line=dc.get("show_today_line", True),
+                       show_progress=dc.get("show_progress", True), group_key=dc.get("group_key", "group"),
+                       collapsed=dc.get("collapsed"))
+        left, top, width, height = (v / 72 for v in (x, y, w, h))
+        title, milestones = dc.get("title", ""), dc.get("milestones")
+        if not dc.get("overflow"):
+            scene = build_gantt_chart(Scene(unit="in"), left, top, width, height, title, tasks,
+                                      milestones, **options)
+            flush_com(scene, slide)
+            return
+
+        _, height_pt = self._slide_size
+        pages = gantt_pages(left, top, width, height, title, tasks, milestones, **options,
+                            next_top=CONTINUATION_TOP / 72,
+                            next_height=(height_pt - CONTINUATION_TOP - CONTINUATION_BOTTOM) / 72)
+        for number, scene in enumerate(pages, 1):
+            target = slide if number == 1 else self._add_continuation_slide(f"{elem_id}（續 {number}）")
+            flush_com(scene, target)
+
     def _render_flow_diagram(self, slide, x, y, w, h, elem_id, content_data):
         """渲染流程圖"""
         flow_data = self._get_content_flow(elem_id, content_data)
@@ -645,7 +698,8 @@ class LayoutRenderer:
             raise RuntimeError("沒有簡報可儲存")
 
         abs_path = os.path.abspath(path)
-        self.prs.SaveAs(abs_path)
+        with span("save", cat="save", path=abs_path):
+            self.prs.SaveAs(abs_path)
         print(f"已儲存：{abs_path}")
 
         if auto_close:
@@ -0,0 +1,730 @@
+# -*- coding: utf-8 -*-
+"""
+本機渲染服務（常駐 worker、優先序佇列、背壓、相同工作合併）
+
+每個呼叫端各自啟動 render_from_json / preview_slides / extract_* 時，每次都要重付
+直譯器啟動、import python-pptx（~110 ms）與重建快取的成本。這裡改成一個常駐服務：
+
+    - worker 程序預先 import 渲染模組，並各自保留一份圖表片段快取（FragmentCache）
+    - 工作依優先序排程（interactive > normal > batch），同優先序先進先出
+    - 每個優先序的佇列有上限，滿了直接拒絕（HTTP 503 + Retry-After），呼叫端自行退避
+    - 相同的工作（種類、參數、輸入檔 size/mtime 都相同）在排隊或執行中時合併成同一個，
+      後到的高優先序請求會把排隊中的工作提前
+    - 每個工作記錄等待 / 執行時間與 worker PID，/metrics 提供彙總
+
+工作種類（參數即處理函數的參數，見 JOB_KINDS）：
+    render       - layout.json + slide_data.json → PPTX（python-pptx；engine="pywin32" 用 PowerPoint）
+    preview      - PPTX 或 layout.json + slide_data.json → 每頁 PNG
+    layout       - Phase 5 markdown → yoga markdown + content.json（yoga_converter）
+    extract_pdf  - PDF → text.md / images/
+    extract_pptx - PPTX → text.md / images/
+    validate     - 檢查 layout.json / slide_data.json
+
+通訊為 HTTP/JSON，可聽 localhost 埠或 Unix socket：
+    POST /jobs            {"kind", "params", "priority", "wait"} → 工作紀錄（202；wait 秒內完成則 200）
+    GET  /jobs/<id>?wait= → 工作紀錄
+    GET  /metrics         → 服務與各工作種類的統計
+    GET  /health
+    POST /shutdown
+
+服務可以寫入任意路徑，因此只接受本機用戶端（render_client.ServiceClient）：
+    - 除 /health 外都要帶 X-Render-Token，token 在啟動時產生並寫入 token_path(address)（權限 0600）
+    - 帶 Origin 標頭的請求一律拒絕（瀏覽器送出的跨來源請求）
+    - POST 必須是 Content-Type: application/json（瀏覽器不經 preflight 只能送 text/plain 等簡單類型）
+
+使用方式：
+    service = RenderService(workers=2)
+    service.start()
+    serve(service, "127.0.0.1:8765")          # 或 "unix:/tmp/onepage-render.sock"
+
+    client = ServiceClient("127.0.0.1:8765")        # render_client.py
+    job = client.submit("preview", {"pptx": "final.pptx", "output_dir": "preview"},
+                        priority="interactive", wait=60)
+"""
+
+import contextlib
+import hashlib
+import heapq
+import hmac
+import importlib
+import inspect
+import io
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import secrets
+import socketserver
+import sys
+import threading
+import time
+import traceback
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from render_client import (DEFAULT_ADDRESS, DONE, FAILED, PRIORITIES, QUEUED, RUNNING, TOKEN_HEADER, QueueFull,
+                           parse_address, token_path)
+from tracing import span
+
+REFERENCE_DIR = Path(__file__).parent
+SCRIPTS_DIR = REFERENCE_DIR.parent / "scripts"
+
+# 各優先序的佇列上限
+DEFAULT_QUEUE_LIMITS = {"interactive": 16, "normal": 128, "batch": 1024}
+
+# worker 啟動時預先載入的模組（載入失敗的略過，例如非 Windows 沒有 pywin32）
+WARM_MODULES = ("render_pptx", "preview", "render_from_json", "yoga_converter",
+                "extract_pptx", "modules.draw_line_chart", "modules.draw_bar_chart", "modules.draw_pie_chart")
+
+# 保留的已完成工作數 / 每個工作保留的輸出尾段 / 每種工作保留的耗時樣本數
+HISTORY = 1000
+LOG_TAIL = 4000
+SAMPLES = 512
+# 拒絕請求前最多讀掉多少請求內容（超過時直接關閉連線）
+_REJECT_DRAIN_BYTES = 1 << 16
+
+
+# ---------------------------------------------------------------------------
+# 工作種類（在 worker 程序內執行）
+# ---------------------------------------------------------------------------
+
+# worker 程序內的狀態（片段快取）
+_worker_state: Dict = {}
+
+
+def _job_render(layout: str, data: str, output: str, script: Optional[str] = None,
+                engine: str = "pptx") -> Dict:
+    from render_from_json import convert_slide_data_to_content_data, generate_script, load_json
+
+    if engine == "pywin32":
+        from render_from_json import render
+        render(layout, data, output, script)
+        return {"output": output}
+    if engine != "pptx":
+        raise ValueError(f"未知的渲染引擎: {engine}")
+
+    from modules._tracking import reset_element_tracker
+    from render_pptx import PptxLayoutRenderer
+
+    layout_json = load_json(layout)
+    slide_data = load_json(data)
+    pages = layout_json.get("pages", [layout_json])
+    content_data = convert_slide_data_to_content_data(slide_data)
+    reset_element_tracker()     # 追蹤資料是模組層級的，常駐程序每個工作都要清掉
+    renderer = PptxLayoutRenderer(fragment_cache=_worker_state.get("fragment_cache"))
+    renderer.create_presentation()
+    for page in pages:
+        renderer.render_from_layout(page, content_data)
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    renderer.save(output)
+    if script:
+        generate_script(slide_data, script)
+    return {"output": output, "pages": len(pages)}
+
+
+def _job_preview(output_dir: str, pptx: Optional[str] = None, layout: Optional[str] = None,
+                 data: Optional[str] = None, scale: Optional[float] = None, supersample: int = 1,
+                 slides: Optional[List[int]] = None, sheet: bool = False) -> Dict:
+    from preview import THUMBNAIL_SCALE, contact_sheet, preview_layout, preview_pptx
+
+    options = dict(scale=scale or THUMBNAIL_SCALE, supersample=supersample, slides=slides)
+    if pptx:
+        images = preview_pptx(pptx, output_dir, **options)
+    elif layout and data:
+        from modules._tracking import reset_element_tracker
+        from render_from_json import convert_slide_data_to_content_data, load_json
+
+        reset_element_tracker()
+        layout_json = load_json(layout)
+        content_data = convert_slide_data_to_content_data(load_json(data))
+        images = preview_layout(layout_json.get("pages", [layout_json]), content_data, output_dir, **options)
+    else:
+        raise ValueError("preview 需要 pptx，或 layout + data")
+    if sheet and images:
+        contact_sheet(images).save(Path(output_dir) / "sheet.png", "PNG")
+    return {"output_dir": output_dir, "pages": len(images)}
+
+
+def _job_layout(one_page: str, diagrams: str, output: str, content_json: Optional[str] = None,
+                mode: str = "one_page", diagrams_structured: Optional[str] = None) -> Dict:
+    from yoga_converter import convert_files
+
+    return convert_files(one_page, diagrams, output, content_json, mode, diagrams_structured)
+
+
+def _job_extract_pdf(pdf: str, output_dir: str, pages: Optional[str] = None, ocr: bool = False) -> Dict:
+    from extract_pdf import extract_pdf
+
+    return extract_pdf(pdf, output_dir, pages, ocr)
+
+
+def _job_extract_pptx(pptx: str, output_dir: str, slides: Optional[str] = None) -> Dict:
+    from extract_pptx import extract_pptx
+
+    return extract_pptx(pptx, output_dir, slides)
+
+
+def _job_validate(layout: str, data: str) -> Dict:
+    from render_from_json import validate_inputs
+
+    return {"valid": validate_inputs(layout, data)}
+
+
+class JobKind(NamedTuple):
+    """一種工作：處理函數與其輸入檔參數（路徑參數見 render_client.JOB_PATH_PARAMS）"""
+    handler: Callable
+    inputs: Tuple[str, ...]     # 輸入檔參數（內容變了就不是同一個工作）
+
+
+JOB_KINDS = {
+    "render": JobKind(_job_render, ("layout", "data")),
+    "preview": JobKind(_job_preview, ("pptx", "layout", "data")),
+    "layout": JobKind(_job_layout, ("one_page", "diagrams", "diagrams_structured")),
+    "extract_pdf": JobKind(_job_extract_pdf, ("pdf",)),
+    "extract_pptx": JobKind(_job_extract_pptx, ("pptx",)),
+    "validate": JobKind(_job_validate, ("layout", "data")),
+}
+
+
+def _warm_worker(modules: Sequence[str], fragment_cache_dir: Optional[str]):
+    """worker 啟動：預先 import 渲染模組、建立片段快取"""
+    for path in (str(SCRIPTS_DIR), str(REFERENCE_DIR)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            continue
+    from fragment_cache import FragmentCache
+    _worker_state["fragment_cache"] = FragmentCache(disk_dir=fragment_cache_dir)
+
+
+def _worker_pid() -> int:
+    return os.getpid()
+
+
+def _execute(kind: str, params: Dict) -> Dict:
+    """在 worker 執行一個工作（stdout 收集成 log，例外轉成 error 字串）"""
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    result = error = None
+    try:
+        with contextlib.redirect_stdout(buffer):
+            result = JOB_KINDS[kind].handler(**params)
+        result = json.loads(json.dumps(result, ensure_ascii=False, default=str))
+    except (Exception, SystemExit):       # 抽取腳本缺少套件時會 sys.exit
+        error = traceback.format_exc(limit=8)
+    return {
+        "result": result,
+        "error": error,
+        "log": buffer.getvalue()[-LOG_TAIL:],
+        "run_ms": round((time.perf_counter() - start) * 1000, 2),
+        "pid": os.getpid(),
+    }
+
+
+# ---------------------------------------------------------------------------
+# 排程
+# ---------------------------------------------------------------------------
+
+def job_key(kind: str, params: Dict) -> str:
+    """工作的合併 key：種類 + 參數 + 輸入檔的 (size, mtime)"""
+    stats = {}
+    for name in JOB_KINDS[kind].inputs:
+        path = params.get(name)
+        if path:
+            try:
+                st = os.stat(path)
+                stats[name] = [st.st_size, st.st_mtime_ns]
+            except OSError:
+                stats[name] = None
+    payload = json.dumps([kind, params, stats], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class Job:
+    """服務中的一個工作（狀態由 RenderService 在鎖內更新）"""
+
+    __slots__ = ("id", "kind", "params", "priority", "key", "status", "submitted", "started",
+                 "finished", "result", "error", "log", "pid", "run_ms", "merged", "done")
+
+    def __init__(self, kind: str, params: Dict, priority: str, key: str):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.params = params
+        self.priority = priority
+        self.key = key
+        self.status = QUEUED
+        self.submitted = time.time()
+        self.started = self.finished = None
+        self.result = self.error = self.log = self.pid = self.run_ms = None
+        self.merged = 0             # 合併進來的重複請求數
+        self.done = threading.Event()
+
+    def to_dict(self) -> Dict:
+        now = time.time()
+        wait_end = self.started or (self.finished if self.status == FAILED else None) or now
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "priority": self.priority,
+            "params": self.params,
+            "merged": self.merged,
+            "wait_ms": round((wait_end - self.submitted) * 1000, 2),
+            "run_ms": self.run_ms,
+            "total_ms": round(((self.finished or now) - self.submitted) * 1000, 2),
+            "pid": self.pid,
+            "result": self.result,
+            "error": self.error,
+            "log": self.log,
+        }
+
+
+class RenderService:
+    """
+    常駐 worker pool + 優先序佇列
+
+    Args:
+        workers: worker 程序數
+        queue_limits: 各優先序的排隊上限（未指定的用 DEFAULT_QUEUE_LIMITS）
+        warm_modules: worker 預先 import 的模組
+        fragment_cache_dir: 片段快取的磁碟層目錄（worker 共用；None = 只用各自的記憶體層）
+    """
+
+    def __init__(self, workers: int = 1, queue_limits: Optional[Dict[str, int]] = None,
+                 warm_modules: Sequence[str] = WARM_MODULES, fragment_cache_dir: Optional[str] = None):
+        self.workers = max(1, workers)
+        self.queue_limits = dict(DEFAULT_QUEUE_LIMITS, **(queue_limits or {}))
+        self.warm_modules = tuple(warm_modules)
+        self.fragment_cache_dir = fragment_cache_dir
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[int, int, Job]] = []
+        self._seq = itertools.count()
+        self._jobs: Dict[str, Job] = {}
+        self._history: deque = deque()
+        self._inflight: Dict[str, Job] = {}
+        self._queued = {name: 0 for name in PRIORITIES}
+        self._running = 0
+        self._counters = {"submitted": 0, "merged": 0, "rejected": 0, "done": 0, "failed": 0}
+        self._samples: Dict[str, Dict[str, deque]] = {}
+        self._pids = set()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._closing = False
+        self._dispatcher: Optional[threading.Thread] = None
+        self._started_at = time.time()
+
+    # ------------------------------------------------------------------
+    # 生命週期
+    # ------------------------------------------------------------------
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        # 服務本身有多個執行緒，fork 不安全；spawn 較慢但只在啟動（或 worker 異常後重建）時付一次
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker, initargs=(self.warm_modules, self.fragment_cache_dir),
+        )
+        # 同時送出 workers 個小工作，讓每個 worker 都先啟動並完成預載
+        with span("service:warm", cat="render", workers=self.workers):
+            pids = {future.result() for future in [pool.submit(_worker_pid) for _ in range(self.workers)]}
+        with self._cond:
+            self._pids = pids
+        return pool
+
+    def start(self) -> "RenderService":
+        """啟動 worker（完成預載後才回傳）與排程執行緒"""
+        self._pool = self._new_pool()
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="render-dispatch", daemon=True)
+        self._dispatcher.start()
+        return self
+
+    def close(self, cancel_queued: bool = True):
+        """停止排程並關閉 worker（執行中的工作會做完）"""
+        with self._cond:
+            self._closing = True
+            if cancel_queued:
+                for _, _, job in self._heap:
+                    if job.status == QUEUED:
+                        self._queued[job.priority] -= 1
+                        self._finish(job, error="服務關閉，工作已取消")
+                self._heap.clear()
+            self._cond.notify_all()
+        if self._dispatcher is not None:
+            self._dispatcher.join()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+
+    # ------------------------------------------------------------------
+    # 提交 / 查詢
+    # ------------------------------------------------------------------
+
+    def submit(self, kind: str, params: Optional[Dict] = None, priority: str = "normal") -> Tuple[Job, bool]:
+        """
+        提交工作
+
+        Args:
+            kind: 工作種類（JOB_KINDS）
+            params: 處理函數的參數
+            priority: interactive / normal / batch
+
+        Returns:
+            (Job, 是否合併到既有的工作)
+
+        Raises:
+            ValueError: 種類、參數或優先序錯誤
+            QueueFull: 該優先序的佇列已滿
+        """
+        params = dict(params or {})
+        if kind not in JOB_KINDS:
+            raise ValueError(f"未知的工作種類: {kind}（可用: {', '.join(sorted(JOB_KINDS))}）")
+        if priority not in PRIORITIES:
+            raise ValueError(f"未知的優先序: {priority}（可用: {', '.join(PRIORITIES)}）")
+        try:
+            inspect.signature(JOB_KINDS[kind].handler).bind(**params)
+        except TypeError as e:
+            raise ValueError(f"{kind} 參數錯誤: {e}") from None
+        key = job_key(kind, params)
+
+        with self._cond:
+            if self._closing:
+                raise QueueFull(priority, 0, 1.0)
+            existing = self._inflight.get(key)
+            if existing is not None:
+                existing.merged += 1
+                self._counters["merged"] += 1
+                if existing.status == QUEUED and PRIORITIES[priority] < PRIORITIES[existing.priority]:
+                    # 提前：舊的 heap 項目在取出時因優先序不符而略過
+                    self._queued[existing.priority] -= 1
+                    self._queued[priority] += 1
+                    existing.priority = priority
+                    heapq.heappush(self._heap, (PRIORITIES[priority], next(self._seq), existing))
+                    self._cond.notify_all()
+                return existing, True
+
+            limit = self.queue_limits[priority]
+            if self._queued[priority] >= limit:
+                self._counters["rejected"] += 1
+                raise QueueFull(priority, limit, self._retry_after(priority))
+
+            job = Job(kind, params, priority, key)
+            self._jobs[job.id] = job
+            self._inflight[key] = job
+            self._queued[priority] += 1
+            self._counters["submitted"] += 1
+            heapq.heappush(self._heap, (PRIORITIES[priority], next(self._seq), job))
+            self._cond.notify_all()
+            return job, False
+
+    def job(self, job_id: str) -> Optional[Job]:
+        with self._cond:
+            return self._jobs.get(job_id)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """等待工作完成（逾時回傳目前狀態）"""
+        job = self.job(job_id)
+        if job is not None:
+            job.done.wait(timeout)
+        return job
+
+    def _retry_after(self, priority: str) -> float:
+        """估計排在前面的工作做完所需的秒數"""
+        ahead = sum(n for name, n in self._queued.items() if PRIORITIES[name] <= PRIORITIES[priority])
+        runs = [ms for samples in self._samples.values() for ms in samples["run"]]
+        mean_s = (sum(runs) / len(runs) / 1000) if runs else 1.0
+        return max(1.0, round(ahead * mean_s / self.workers, 1))
+
+    # ------------------------------------------------------------------
+    # 排程
+    # ------------------------------------------------------------------
+
+    def _next_job(self) -> Optional[Job]:
+        """取出最高優先序的排隊工作（呼叫端持有鎖）"""
+        while self._heap:
+            rank, _, job = heapq.heappop(self._heap)
+            if job.status == QUEUED and rank == PRIORITIES[job.priority]:
+                return job
+        return None
+
+    def _dispatch_loop(self):
+        while True:
+            with self._cond:
+                while not self._closing and (self._running >= self.workers or not self._heap
+                                             or self._pool is None):
+                    self._cond.wait()
+                if self._closing:
+                    return
+                job = self._next_job()
+                if job is None:
+                    continue
+                self._queued[job.priority] -= 1
+                self._running += 1
+                job.status = RUNNING
+                job.started = time.time()
+                pool = self._pool
+            try:
+                future = pool.submit(_execute, job.kind, job.params)
+            except RuntimeError as e:     # BrokenProcessPool / 已關閉
+                self._on_broken_pool(job, e, pool)
+                continue
+            future.add_done_callback(lambda f, job=job, pool=pool: self._on_done(job, f, pool))
+
+    def _on_done(self, job: Job, future, pool: ProcessPoolExecutor):
+        try:
+            outcome = future.result()
+        except BrokenProcessPool as e:    # worker 異常結束
+            self._on_broken_pool(job, e, pool)
+            return
+        except BaseException as e:
+            outcome = {"result": None, "error": repr(e), "log": "", "run_ms": None, "pid": None}
+        with self._cond:
+            self._running -= 1
+            job.pid, job.run_ms, job.log = outcome["pid"], outcome["run_ms"], outcome["log"]
+            self._finish(job, outcome["result"], outcome["error"])
+            self._cond.notify_all()
+
+    def _on_broken_pool(self, job: Job, error: Exception, pool: ProcessPoolExecutor):
+        """
+        worker 異常結束：該工作失敗，在背景重建 pool 後繼續排程
+
+        同一個壞掉的 pool 上所有執行中的工作都會收到例外，只有第一個負責重建。
+        """
+        with self._cond:
+            self._running -= 1
+            self._finish(job, error=f"worker 異常結束: {error!r}")
+            rebuild = self._pool is pool and not self._closing
+            if rebuild:
+                self._pool = None
+            self._cond.notify_all()
+        if rebuild:
+            pool.shutdown(wait=False, cancel_futures=True)
+            threading.Thread(target=self._rebuild_pool, name="render-rebuild", daemon=True).start()
+
+    def _rebuild_pool(self):
+        pool = self._new_pool()
+        with self._cond:
+            self._pool = pool
+            self._cond.notify_all()
+
+    def _finish(self, job: Job, result=None, error: Optional[str] = None):
+        """記錄結果並保留最近 HISTORY 筆（呼叫端持有鎖）"""
+        job.result, job.error = result, error
+        job.status = FAILED if error else DONE
+        job.finished = time.time()
+        if self._inflight.get(job.key) is job:
+            del self._inflight[job.key]
+        self._counters["failed" if error else "done"] += 1
+        if job.started is not None and not error:
+            samples = self._samples.setdefault(job.kind, {"run": deque(maxlen=SAMPLES),
+                                                          "wait": deque(maxlen=SAMPLES)})
+            samples["run"].append(job.run_ms or 0.0)
+            samples["wait"].append((job.started - job.submitted) * 1000)
+        self._history.append(job.id)
+        while len(self._history) > HISTORY:
+            self._jobs.pop(self._history.popleft(), None)
+        job.done.set()
+
+    # ------------------------------------------------------------------
+    # 統計
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> Dict:
+        with self._cond:
+            kinds = {}
+            for kind, samples in sorted(self._samples.items()):
+                runs, waits = sorted(samples["run"]), sorted(samples["wait"])
+                kinds[kind] = {
+                    "count": len(runs),
+                    "run_p50_ms": round(_percentile(runs, 50), 2),
+                    "run_p99_ms": round(_percentile(runs, 99), 2),
+                    "wait_p50_ms": round(_percentile(waits, 50), 2),
+                    "wait_p99_ms": round(_percentile(waits, 99), 2),
+                }
+            return {
+                "uptime_s": round(time.time() - self._started_at, 1),
+                "workers": self.workers,
+                "worker_pids": sorted(self._pids),
+                "running": self._running,
+                "queued": dict(self._queued),
+                "queue_limits": dict(self.queue_limits),
+                **self._counters,
+                "kinds": kinds,
+            }
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    """已排序樣本的最近序位百分位數（沒有樣本時回傳 0）"""
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, math.ceil(pct * len(ordered) / 100) - 1))
+    return ordered[index]
+
+
+# ---------------------------------------------------------------------------
+# HTTP 介面
+# ---------------------------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "onepage-render/1"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def service(self) -> RenderService:
+        return self.server.service
+
+    def address_string(self) -> str:
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _reject(self, status: int, error: str):
+        # 讀掉（不解析）小型請求內容，client 送完才收到回應，不會在寫入時遇到 broken pipe；
+        # 過大的內容不讀，直接關閉連線
+        length = int(self.headers.get("Content-Length") or 0)
+        if 0 < length <= _REJECT_DRAIN_BYTES:
+            self.rfile.read(length)
+        self.close_connection = True
+        self._send(status, {"error": error}, {"Connection": "close"})
+
+    def _authorized(self) -> bool:
+        """拒絕瀏覽器跨來源請求與 token 不符的請求（已回應錯誤時回傳 False）"""
+        if self.headers.get("Origin") is not None:
+            self._reject(403, "不接受瀏覽器的跨來源請求")
+            return False
+        if not hmac.compare_digest(self.headers.get(TOKEN_HEADER, "").encode("utf-8"),
+                                   self.server.token.encode("utf-8")):
+            self._reject(403, f"缺少或錯誤的 {TOKEN_HEADER}（見 {token_path(self.server.address)}）")
+            return False
+        return True
+
+    def _body(self) -> Dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}") if length else {}
+
+    def _job_response(self, job: Job, wait: Optional[float], created: bool = False):
+        if wait:
+            job.done.wait(min(float(wait), 300.0))
+        status = 200 if job.done.is_set() or not created else 202
+        self._send(status, job.to_dict())
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path == "/health":
+            self._send(200, {"ok": True})
+        elif not self._authorized():
+            return
+        elif url.path == "/metrics":
+            self._send(200, self.service.metrics())
+        elif url.path.startswith("/jobs/"):
+            job = self.service.job(url.path[len("/jobs/"):])
+            if job is None:
+                self._send(404, {"error": "找不到工作（可能已超過保留筆數）"})
+            else:
+                self._job_response(job, (query.get("wait") or [None])[0])
+        else:
+            self._send(404, {"error": f"未知的路徑: {url.path}"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if not self._authorized():
+            return
+        if self.headers.get_content_type() != "application/json":
+            self._reject(415, "Content-Type 必須是 application/json")
+            return
+        try:
+            body = self._body()
+        except ValueError as e:
+            self._send(400, {"error": f"JSON 格式錯誤: {e}"})
+            return
+        if not isinstance(body, dict):
+            self._send(400, {"error": "請求內容需為 JSON 物件"})
+            return
+        if url.path == "/jobs":
+            try:
+                with span("service:submit", cat="render", kind=body.get("kind")):
+                    job, merged = self.service.submit(body.get("kind"), body.get("params"),
+                                                      body.get("priority", "normal"))
+            except QueueFull as e:
+                self._send(503, {"error": str(e), "limit": e.limit, "retry_after": e.retry_after},
+                           {"Retry-After": str(int(e.retry_after + 0.999))})
+                return
+            except ValueError as e:
+                self._send(400, {"error": str(e)})
+                return
+            self._job_response(job, body.get("wait"), created=True)
+        elif url.path == "/shutdown":
+            self._send(200, {"ok": True})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        else:
+            self._send(404, {"error": f"未知的路徑: {url.path}"})
+
+
+class _TCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+    class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+else:   # Windows
+    _UnixServer = None
+
+
+def make_server(service: RenderService, address: str = DEFAULT_ADDRESS, verbose: bool = False):
+    """建立 HTTP server 並寫入 token 檔（尚未開始服務；呼叫 serve_forever()）"""
+    family, target = parse_address(address)
+    if family == "unix":
+        if _UnixServer is None:
+            raise ValueError("此平台不支援 Unix socket，請改用 host:port")
+        if os.path.exists(target):
+            os.unlink(target)
+        server = _UnixServer(target, _Handler)
+    else:
+        server = _TCPServer(target, _Handler)
+    server.service = service
+    server.verbose = verbose
+    server.address = address
+    server.token = secrets.token_urlsafe(32)
+    path = token_path(address)
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(server.token)
+    return server
+
+
+def serve(service: RenderService, address: str = DEFAULT_ADDRESS, verbose: bool = False):
+    """在目前執行緒提供服務，直到 POST /shutdown 或 KeyboardInterrupt"""
+    server = make_server(service, address, verbose)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        family, target = parse_address(address)
+        if family == "unix" and os.path.exists(target):
+            os.unlink(target)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(token_path(address))
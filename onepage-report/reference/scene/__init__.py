@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Scene graph：與後端無關的中間表示（IR）
+
+繪圖函數把圖形描述成 Scene（矩形、圓角矩形、文字 run、連接線、折線、表格，樣式皆已決定），
+再由 backend 一次輸出。同一份圖表邏輯可輸出到 python-pptx、PowerPoint COM 或 SVG，
+也方便批次處理、快取與比對。
+
+├── nodes.py          # Scene、ShapeNode、ConnectorNode、TableNode、TextStyle...
+├── pptx_backend.py   # flush_pptx(scene, slide)
+├── com_backend.py    # flush_com(scene, slide)
+├── svg_backend.py    # scene_to_svg(scene) / save_svg(scene, path)
+├── ooxml_writer.py   # scene_to_slide_xml(scene) / OoxmlDeckWriter（直接串流寫出 .pptx）/ paste_slide_xml
+├── tables.py         # fit_table / paginate_table：表格量測列高、分頁（續頁重複表頭）
+├── charts.py         # line_chart / bar_chart / pie_chart：原生圖表的向量版本（SVG / PNG 用）
+├── raster_backend.py # scene_to_image(scene)：不需 cairosvg，直接以 Pillow 點陣化
+├── themes.py         # 主題檔（角色 → 顏色 / 字體）；apply_theme / theme_slide_xml 換樣式不重新排版
+└── pptx_import.py    # slide_to_scene(slide)：已產生的投影片轉回 Scene（預覽用）
+
+使用範例：
+    from scene import Scene, TextStyle, para, text_frame, flush_pptx
+
+    scene = Scene(unit="in")
+    scene.rounded_rect(1, 1, 2, 0.8, fill=(33, 150, 243),
+                       text=text_frame(para("節點", TextStyle(9, True, (255, 255, 255)), "center"),
+                                       word_wrap=True))
+    flush_pptx(scene, slide)
+
+已改用 Scene 的繪圖函數提供 build_* 版本（只產生節點、不碰 slide），例如
+modules.draw_flow_detailed.build_flow_detailed。
+
+大量頁數（附錄、術語表）可跳過 python-pptx 物件樹，直接寫出 slide XML：
+    with OoxmlDeckWriter("appendix.pptx") as deck:
+        deck.add_slide(scene)
+
+套件本身不預先載入任何 backend：`from scene import flush_pptx` 第一次存取時才 import 對應的子模組
+（PEP 562 __getattr__）。COM 渲染器只用 nodes / tables / com_backend，不需要 python-pptx、lxml、Pillow。
+"""
+
+
+import importlib
+
+# 子模組 → 套件層級匯出的名稱（第一次存取時才 import）
+_EXPORTS = {
+    ".nodes": ("Scene", "ShapeNode", "ConnectorNode", "PathNode", "TableNode", "TableCell",
+               "TextStyle", "Run", "Paragraph", "TextFrame", "para", "text_frame", "GEOMETRIES"),
+    ".pptx_backend": ("flush_pptx", "add_styled_run", "run_properties"),
+    ".com_backend": ("flush_com",),
+    ".svg_backend": ("scene_to_svg", "save_svg"),
+    ".ooxml_writer": ("scene_to_slide_xml", "paste_slide_xml", "text_body_xml", "rpr_xml", "table_xml",
+                      "OoxmlDeckWriter"),
+    ".tables": ("TableStyle", "TablePage", "DEFAULT_TABLE_STYLE", "measure_row_height", "table_node", "fit_table",
+                "paginate_table"),
+    ".charts": ("ChartStyle", "DEFAULT_CHART_STYLE", "CHART_PALETTE", "parse_color", "nice_ticks", "line_chart",
+                "bar_chart", "pie_chart"),
+    ".raster_backend": ("scene_to_image", "save_png"),
+    ".pptx_import": ("slide_to_scene", "slide_background"),
+    ".themes": ("Theme", "StyleMap", "DEFAULT_THEME", "load_theme", "style_map", "apply_theme", "theme_slide_xml",
+                "check_contrast"),
+}
+
+_LAZY = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""
+向量圖表：折線圖、長條圖、圓餅圖 → Scene
+
+原生圖表（modules.draw_line_chart 等）只能由 PowerPoint / python-pptx 繪製，
+SVG / PNG 輸出需要一份等價的向量版本：折線為 PathNode、長條為矩形、
+圓餅為多邊形扇形，軸線、格線、刻度、圖例都是一般節點。
+
+資料格式與原生圖表相同，座標一律為 pt；回傳的 Scene 可直接交給任何 backend。
+
+使用範例：
+    from scene import line_chart, scene_to_svg
+
+    scene = line_chart(0, 0, 480, 270, "延遲趨勢", ["W1", "W2", "W3"],
+                       [{"name": "延遲", "values": [80, 65, 45]}])
+    svg = scene_to_svg(scene, 480, 270)
+"""
+
+import math
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from modules._textfit import LINE_SPACING, _text_width
+
+from .nodes import Color, Scene, TextStyle, para, text_frame
+
+# 預設範本佈景主題的 accent1~6（與原生圖表的預設配色相同）
+CHART_PALETTE = (
+    (79, 129, 189), (192, 80, 77), (155, 187, 89),
+    (128, 100, 162), (75, 172, 198), (247, 150, 70),
+)
+
+# 折線資料點超過此數量時不畫標記
+MAX_MARKERS = 60
+
+_NO_MARGINS = (0, 0, 0, 0)
+
+
+class ChartStyle(NamedTuple):
+    """圖表樣式（不可變）"""
+    title: TextStyle = TextStyle(12, True, (51, 51, 51))
+    label: TextStyle = TextStyle(8, False, (89, 89, 89))
+    axis: Color = (191, 191, 191)
+    grid: Color = (230, 230, 230)
+    palette: Tuple[Color, ...] = CHART_PALETTE
+    line_width: float = 2.0
+
+
+DEFAULT_CHART_STYLE = ChartStyle()
+
+
+def parse_color(value) -> Optional[Color]:
+    """(r, g, b) / [r, g, b] / "#RRGGBB" → (r, g, b)，無法解析回傳 None"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        text = value.lstrip("#")
+        if len(text) != 6:
+            return None
+        try:
+            return (int(text[0:2], 16), int(text[2:4], 16), int(text[4:6], 16))
+        except ValueError:
+            return None
+    try:
+        return (int(value[0]), int(value[1]), int(value[2]))
+    except (TypeError, IndexError, ValueError):
+        return None
+
+
+def nice_ticks(low: float, high: float, count: int = 5) -> List[float]:
+    """
+    座標軸刻度（1 / 2 / 5 x 10^n 的間距，涵蓋 [low, high]）
+
+    Args:
+        low, high: 資料範圍
+        count: 大約的刻度數
+
+    Returns:
+        list: 由小到大的刻度值
+    """
+    if high < low:
+        low, high = high, low
+    if high == low:
+        high = low + 1
+    raw = (high - low) / max(count, 1)
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw)
+    start = math.floor(low / step) * step
+    ticks = []
+    value = start
+    while value < high + step * 0.5:
+        ticks.append(round(value, 10))
+        value += step
+    if ticks[-1] < high:
+        ticks.append(round(value, 10))
+    return ticks
+
+
+def _fmt(value: float) -> str:
+    return f"{value:,.0f}" if float(value).is_integer() else f"{value:,.2f}".rstrip("0").rstrip(".")
+
+
+def _label(scene, x, y, w, h, text, style, align="center", anchor="middle"):
+    scene.textbox(x, y, w, h, text_frame(para(text, style, align), word_wrap=False,
+                                         anchor=anchor, margins=_NO_MARGINS))
+
+
+def _series_color(series: dict, index: int, style: ChartStyle) -> Color:
+    return parse_color(series.get("color")) or style.palette[index % len(style.palette)]
+
+
+def _frame(scene, x, y, w, h, title, legend, style, legend_right=False):
+    """
+    標題與圖例，回傳剩下的繪圖區 (x, y, w, h)
+
+    legend: [(名稱, 顏色), ...]
+    """
+    if title:
+        title_h = style.title.size * LINE_SPACING * 1.3
+        _label(scene, x, y, w, title_h, title, style.title)
+        y += title_h
+        h -= title_h
+
+    if not legend:
+        return x, y, w, h
+
+    size = style.label.size
+    swatch = size * 0.8
+    row_h = size * LINE_SPACING * 1.4
+    if legend_right:
+        legend_w = min(w * 0.35, max(_text_width(name, size) for name, _ in legend) + swatch * 2 + 8)
+        ly = y + max(0.0, (h - row_h * len(legend)) / 2)
+        lx = x + w - legend_w
+        for name, color in legend:
+            scene.rect(lx, ly + (row_h - swatch) / 2, swatch, swatch, fill=color)
+            _label(scene, lx + swatch * 1.6, ly, legend_w - swatch * 1.6, row_h, name, style.label, "left")
+            ly += row_h
+        return x, y, w - legend_w - 6, h
+
+    widths = [swatch * 1.6 + _text_width(name, size) + swatch * 1.5 for name, _ in legend]
+    lx = x + max(0.0, (w - sum(widths)) / 2)
+    ly = y + h - row_h
+    for (name, color), item_w in zip(legend, widths):
+        scene.rect(lx, ly + (row_h - swatch) / 2, swatch, swatch, fill=color)
+        _label(scene, lx + swatch * 1.6, ly, item_w - swatch * 1.6, row_h, name, style.label, "left")
+        lx += item_w
+    return x, y, w, h - row_h
+
+
+def _axes(scene, x, y, w, h, categories, low, high, style, slot_labels=True):
+    """
+    Y 軸刻度與格線、X 軸類別標籤，回傳 (plot_x, plot_y, plot_w, plot_h, 數值→y 函數)
+    """
+    ticks = nice_ticks(low, high)
+    size = style.label.size
+    tick_w = max(_text_width(_fmt(t), size) for t in ticks) + 6
+    cat_h = size * LINE_SPACING * 1.5 if categories else 0
+    px, py, pw, ph = x + tick_w, y + size * 0.6, w - tick_w - 4, h - cat_h - size * 0.6
+    lo, hi = ticks[0], ticks[-1]
+
+    def to_y(value):
+        return py + ph - (value - lo) / (hi - lo) * ph
+
+    for tick in ticks:
+        ty = to_y(tick)
+        scene.connector(px, ty, px + pw, ty, color=style.axis if tick == lo else style.grid, width=0.75)
+        _label(scene, x, ty - size, tick_w - 4, size * 2, _fmt(tick), style.label, "right")
+
+    if categories:
+        slot = pw / len(categories)
+        # 類別太多時每隔幾個標一次，避免重疊
+        widest = max(_text_width(str(c), size) for c in categories) + 4
+        every = max(1, math.ceil(widest / slot))
+        for i in range(0, len(categories), every):
+            cx = px + slot * (i + 0.5) if slot_labels else px + (pw * i / max(len(categories) - 1, 1))
+            _label(scene, cx - slot * every / 2, py + ph + 2, slot * every, cat_h - 2,
+                   str(categories[i]), style.label, anchor="top")
+    return px, py, pw, ph, to_y
+
+
+def _value_range(series: Sequence[dict], stacked=False) -> Tuple[float, float]:
+    values = [v for s in series for v in s.get("values", []) if v is not None]
+    if stacked:
+        values = [sum(vals) for vals in zip(*(s.get("values", []) for s in series))]
+    if not values:
+        return 0.0, 1.0
+    return min(0.0, min(values)), max(0.0, max(values))
+
+
+def line_chart(x: float, y: float, w: float, h: float, title: str, categories: Sequence,
+               series: Sequence[dict], style: ChartStyle = DEFAULT_CHART_STYLE,
+               show_legend: bool = True, markers: Optional[bool] = None) -> Scene:
+    """
+    折線圖
+
+    Args:
+        x, y, w, h: 圖表區域（pt）
+        title: 標題（空字串 = 不顯示）
+        categories: X 軸類別
+        series: [{"name": "...", "values": [...], "color": ...}, ...]
+        style: ChartStyle
+        show_legend: 是否顯示圖例（底部）
+        markers: 是否畫資料點（None = 點數不超過 MAX_MARKERS 時畫）
+
+    Returns:
+        Scene（單位 pt）
+    """
+    scene = Scene(unit="pt")
+    colors = [_series_color(s, i, style) for i, s in enumerate(series)]
+    legend = [(str(s.get("name", "")), c) for s, c in zip(series, colors)] if show_legend else []
+    fx, fy, fw, fh = _frame(scene, x, y, w, h, title, legend, style)
+    low, high = _value_range(series)
+    px, py, pw, ph, to_y = _axes(scene, fx, fy, fw, fh, categories, low, high, style)
+
+    count = max(len(categories), max((len(s.get("values", [])) for s in series), default=0), 1)
+    slot = pw / count
+    for s, color in zip(series, colors):
+        points = [(px + slot * (i + 0.5), to_y(v)) for i, v in enumerate(s.get("values", []))
+                  if v is not None]
+        if len(points) >= 2:
+            scene.path(points, line=color, line_width=style.line_width)
+        show_markers = markers if markers is not None else len(points) <= MAX_MARKERS
+        if show_markers:
+            r = style.line_width * 1.5
+            for mx, my in points:
+                scene.shape("OVAL", mx - r, my - r, r * 2, r * 2, fill=color)
+    return scene
+
+
+def bar_chart(x: float, y: float, w: float, h: float, title: str, categories: Sequence,
+              series: Sequence[dict], style: ChartStyle = DEFAULT_CHART_STYLE,
+              show_legend: bool = True, stacked: bool = False) -> Scene:
+    """
+    直條圖（群組或堆疊）
+
+    Args:
+        x, y, w, h: 圖表區域（pt）
+        title: 標題
+        categories: X 軸類別
+        series: [{"name": "...", "values": [...], "color": ...}, ...]
+        style: ChartStyle
+        show_legend: 是否顯示圖例（底部）
+        stacked: 是否堆疊
+
+    Returns:
+        Scene（單位 pt）
+    """
+    scene = Scene(unit="pt")
+    colors = [_series_color(s, i, style) for i, s in enumerate(series)]
+    legend = [(str(s.get("name", "")), c) for s, c in zip(series, colors)] if show_legend else []
+    fx, fy, fw, fh = _frame(scene, x, y, w, h, title, legend, style)
+    low, high = _value_range(series, stacked)
+    px, py, pw, ph, to_y = _axes(scene, fx, fy, fw, fh, categories, low, high, style)
+
+    count = max(len(categories), 1)
+    slot = pw / count
+    group_w = slot * 0.7  # 兩側各留 15% 間隔（原生圖表 gapWidth 約 150%）
+    bar_w = group_w if stacked else group_w / max(len(series), 1)
+    base = to_y(0)
+    for i in range(count):
+        offset = 0.0
+        for j, (s, color) in enumerate(zip(series, colors)):
+            values = s.get("values", [])
+            value = values[i] if i < len(values) and values[i] is not None else 0
+            if stacked:
+                top, bottom = to_y(offset + value), to_y(offset)
+                bx = px + slot * i + (slot - group_w) / 2
+                offset += value
+            else:
+                top, bottom = to_y(value), base
+                bx = px + slot * i + (slot - group_w) / 2 + bar_w * j
+            if top != bottom:
+                scene.rect(bx, min(top, bottom), bar_w, abs(bottom - top), fill=color)
+    return scene
+
+
+def _wedge(cx, cy, r, start, end) -> List[Tuple[float, float]]:
+    """扇形多邊形（角度為弧度，0 = 12 點鐘方向、順時針）"""
+    steps = max(2, int(math.degrees(end - start) / 3) + 1)
+    points = [(cx, cy)] if end - start < math.tau - 1e-9 else []
+    for k in range(steps + 1):
+        angle = start + (end - start) * k / steps
+        points.append((cx + r * math.sin(angle), cy - r * math.cos(angle)))
+    return points
+
+
+def pie_chart(x: float, y: float, w: float, h: float, title: str, data: Sequence[dict],
+              style: ChartStyle = DEFAULT_CHART_STYLE, show_legend: bool = True,
+              show_percentage: bool = True) -> Scene:
+    """
+    圓餅圖（第一塊從 12 點鐘方向開始、順時針，同原生圖表）
+
+    Args:
+        x, y, w, h: 圖表區域（pt）
+        title: 標題
+        data: [{"name": "項目", "value": 45, "color": ...}, ...]
+        style: ChartStyle
+        show_legend: 是否顯示圖例（右側）
+        show_percentage: 扇形上是否標示百分比
+
+    Returns:
+        Scene（單位 pt）
+    """
+    scene = Scene(unit="pt")
+    colors = [parse_color(d.get("color")) or style.palette[i % len(style.palette)]
+              for i, d in enumerate(data)]
+    legend = [(str(d.get("name", "")), c) for d, c in zip(data, colors)] if show_legend else []
+    fx, fy, fw, fh = _frame(scene, x, y, w, h, title, legend, style, legend_right=True)
+
+    values = [max(float(d.get("value") or 0), 0.0) for d in data]
+    total = sum(values)
+    if total <= 0:
+        return scene
+    r = min(fw, fh) / 2 * 0.9
+    cx, cy = fx + fw / 2, fy + fh / 2
+    label_style = TextStyle(style.label.size, True, (255, 255, 255), style.label.font)
+    angle = 0.0
+    for value, color in zip(values, colors):
+        if value <= 0:
+            continue
+        sweep = value / total * math.tau
+        scene.polygon(_wedge(cx, cy, r, angle, angle + sweep), fill=color, line=(255, 255, 255),
+                      line_width=0.75)
+        if show_percentage and sweep > 0.25:
+            mid = angle + sweep / 2
+            lx, ly = cx + r * 0.62 * math.sin(mid), cy - r * 0.62 * math.cos(mid)
+            size = label_style.size
+            _label(scene, lx - size * 2.5, ly - size, size * 5, size * 2,
+                   f"{value / total:.0%}", label_style)
+        angle += sweep
+    return scene
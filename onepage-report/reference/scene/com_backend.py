@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Scene graph → PowerPoint COM（pywin32）
+
+將 Scene 節點依序新增到 COM Slide。座標本來就是 pt，不需換算；
+顏色在此轉為 COM 使用的 BGR 整數。
+
+文字框先一次寫入全部文字，再以 Characters(start, length) 套用各 run 的樣式，
+減少逐段落的 COM 往返。Characters 的位置以 UTF-16 code unit 計算（emoji 等 U+FFFF 以上的字元佔 2）。
+"""
+
+# MsoAutoShapeType
+_GEOM_TYPES = {
+    "RECTANGLE": 1,
+    "ROUNDED_RECTANGLE": 5,
+    "OVAL": 9,
+    "DIAMOND": 4,
+    "CHEVRON": 52,
+    "ISOSCELES_TRIANGLE": 7,
+    "RIGHT_ARROW": 33,
+    "LEFT_ARROW": 34,
+    "UP_ARROW": 35,
+    "DOWN_ARROW": 36,
+}
+
+# ppParagraphAlignment
+_ALIGN = {"left": 1, "center": 2, "right": 3}
+# msoAnchorTop / Middle / Bottom
+_ANCHOR = {"top": 1, "middle": 3, "bottom": 4}
+
+_MSO_TRUE = -1
+_MSO_FALSE = 0
+
+# ppBorderTop / Left / Bottom / Right
+_CELL_BORDERS = (1, 2, 3, 4)
+# 表格框線粗細（pt，同 ooxml_writer 的 6350 EMU）
+_TABLE_BORDER_WIDTH = 0.5
+
+
+def to_bgr(color) -> int:
+    """(r, g, b) → COM BGR 整數"""
+    r, g, b = color
+    return r + (g << 8) + (b << 16)
+
+
+def _utf16_len(text: str) -> int:
+    """COM 字串長度（UTF-16 code unit 數）"""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def apply_text_frame(tf, frame):
+    """
+    將 TextFrame 寫入 COM TextFrame
+
+    Args:
+        tf: COM TextFrame
+        frame: scene.TextFrame
+    """
+    if frame.word_wrap is not None:
+        tf.WordWrap = _MSO_TRUE if frame.word_wrap else _MSO_FALSE
+    if frame.anchor is not None:
+        tf.VerticalAnchor = _ANCHOR[frame.anchor]
+    if frame.margins is not None:
+        tf.MarginLeft, tf.MarginRight, tf.MarginTop, tf.MarginBottom = frame.margins
+
+    # PowerPoint 段落以 \r 分隔、段內換行為 \v
+    paragraphs = ["".join(run.text.replace("\n", "\v") for run in p.runs) for p in frame.paragraphs]
+    text_range = tf.TextRange
+    text_range.Text = "\r".join(paragraphs)
+
+    start = 1
+    for index, paragraph in enumerate(frame.paragraphs, 1):
+        if paragraph.align is not None or paragraph.space_after is not None:
+            fmt = text_range.Paragraphs(index).ParagraphFormat
+            if paragraph.align is not None:
+                fmt.Alignment = _ALIGN[paragraph.align]
+            if paragraph.space_after is not None:
+                fmt.SpaceAfter = paragraph.space_after
+        for run in paragraph.runs:
+            length = _utf16_len(run.text)
+            if length:
+                font = text_range.Characters(start, length).Font
+                style = run.style
+                font.Size = style.size
+                font.Bold = _MSO_TRUE if style.bold else _MSO_FALSE
+                font.Italic = _MSO_TRUE if style.italic else _MSO_FALSE
+                font.Color.RGB = to_bgr(style.color)
+                font.Name = style.font
+            start += length
+        start += 1  # 段落分隔符號
+
+
+def _flush_shape(shapes, node):
+    if node.geom == "TEXTBOX":
+        # msoTextOrientationHorizontal = 1
+        shape = shapes.AddTextbox(1, node.x, node.y, node.w, node.h)
+    else:
+        shape = shapes.AddShape(_GEOM_TYPES[node.geom], node.x, node.y, node.w, node.h)
+        if node.fill is None:
+            shape.Fill.Visible = _MSO_FALSE
+        else:
+            shape.Fill.ForeColor.RGB = to_bgr(node.fill)
+            shape.Fill.Solid()
+        if node.line is None:
+            shape.Line.Visible = _MSO_FALSE
+        else:
+            shape.Line.ForeColor.RGB = to_bgr(node.line)
+            if node.line_width is not None:
+                shape.Line.Weight = node.line_width
+            if node.dash is not None:
+                shape.Line.DashStyle = node.dash
+    if node.name:
+        shape.Name = node.name
+    if node.text is not None:
+        apply_text_frame(shape.TextFrame, node.text)
+    return shape
+
+
+def _flush_connector(shapes, node):
+    line = shapes.AddLine(node.x1, node.y1, node.x2, node.y2)
+    line.Line.ForeColor.RGB = to_bgr(node.color)
+    line.Line.Weight = node.width
+    if node.dash is not None:
+        line.Line.DashStyle = node.dash
+    # msoArrowheadTriangle = 3
+    if node.end_arrow:
+        line.Line.EndArrowheadStyle = 3
+    if node.begin_arrow:
+        line.Line.BeginArrowheadStyle = 3
+    return line
+
+
+def _flush_path(shapes, node):
+    """折線 / 多邊形（AddPolyline；封閉路徑需重複起點）"""
+    points = list(node.points)
+    if node.closed and points[0] != points[-1]:
+        points.append(points[0])
+    shape = shapes.AddPolyline(tuple(points))
+    if node.fill is None or not node.closed:
+        shape.Fill.Visible = _MSO_FALSE
+    else:
+        shape.Fill.ForeColor.RGB = to_bgr(node.fill)
+        shape.Fill.Solid()
+    if node.line is None:
+        shape.Line.Visible = _MSO_FALSE
+    else:
+        shape.Line.ForeColor.RGB = to_bgr(node.line)
+        if node.line_width is not None:
+            shape.Line.Weight = node.line_width
+        if node.dash is not None:
+            shape.Line.DashStyle = node.dash
+    if node.name:
+        shape.Name = node.name
+    return shape
+
+
+def _flush_table(shapes, node):
+    rows, cols = len(node.rows), len(node.col_widths)
+    shape = shapes.AddTable(rows, cols, node.x, node.y, node.w, node.h)
+    table = shape.Table
+    for c, width in enumerate(node.col_widths, 1):
+        table.Columns(c).Width = width
+    for r, height in enumerate(node.row_heights, 1):
+        table.Rows(r).Height = height
+    for r, row in enumerate(node.rows, 1):
+        for c, cell_node in enumerate(row, 1):
+            cell_shape = table.Cell(r, c).Shape
+            if cell_node.fill is not None:
+                cell_shape.Fill.ForeColor.RGB = to_bgr(cell_node.fill)
+                cell_shape.Fill.Solid()
+            if node.border is not None:
+                cell = table.Cell(r, c)
+                for side in _CELL_BORDERS:
+                    border = cell.Borders(side)
+                    border.Visible = _MSO_TRUE
+                    border.ForeColor.RGB = to_bgr(node.border)
+                    border.Weight = _TABLE_BORDER_WIDTH
+            apply_text_frame(cell_shape.TextFrame, cell_node.text)
+    return shape
+
+
+_FLUSH = {
+    "shape": _flush_shape,
+    "connector": _flush_connector,
+    "path": _flush_path,
+    "table": _flush_table,
+}
+
+
+def flush_com(scene, slide) -> list:
+    """
+    將 scene 輸出到 COM 投影片
+
+    Args:
+        scene: Scene 物件（座標 pt）
+        slide: pywin32 Slide 物件
+
+    Returns:
+        list: 依序建立的 COM Shape
+    """
+    shapes = slide.Shapes
+    return [_FLUSH[node.kind](shapes, node) for node in scene]
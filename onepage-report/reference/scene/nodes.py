@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+Scene graph 節點定義
+
+繪圖函數先把圖形描述成節點（座標與樣式都已決定），再交給 backend 一次輸出。
+節點種類：shape（幾何形狀 / 文字框）、connector（直線）、path（折線 / 多邊形）、table。
+節點座標一律為 pt；Scene 可指定輸入單位（吋或 pt），於加入節點時換算。
+
+顏色為 (r, g, b) tuple（python-pptx 的 RGBColor 本身就是 tuple，可直接傳入）。
+虛線樣式使用 Office MsoLineDashStyle 數值（python-pptx 與 COM 共用）：
+    1=實線, 2=方形點, 3=圓形點, 4=虛線, 5=虛線點, 7=長虛線
+"""
+
+from typing import List, NamedTuple, Optional, Tuple
+
+Color = Tuple[int, int, int]
+
+DEFAULT_FONT = "Microsoft JhengHei"
+
+# 支援的幾何形狀（名稱同 python-pptx MSO_SHAPE）
+GEOMETRIES = {
+    "RECTANGLE", "ROUNDED_RECTANGLE", "OVAL", "DIAMOND", "CHEVRON", "ISOSCELES_TRIANGLE",
+    "RIGHT_ARROW", "LEFT_ARROW", "UP_ARROW", "DOWN_ARROW", "TEXTBOX",
+}
+
+_UNIT_SCALE = {"pt": 1.0, "in": 72.0}
+
+
+class TextStyle(NamedTuple):
+    """已決定的文字樣式（不可變，可作為快取 key）"""
+    size: float
+    bold: bool = False
+    color: Color = (51, 51, 51)
+    font: str = DEFAULT_FONT
+    italic: bool = False
+
+
+class Run(NamedTuple):
+    """同一樣式的一段文字（可含換行）"""
+    text: str
+    style: TextStyle
+
+
+class Paragraph(NamedTuple):
+    """段落"""
+    runs: Tuple[Run, ...]
+    align: Optional[str] = None        # "left" / "center" / "right"，None = 不設定
+    space_after: Optional[float] = None  # pt
+
+
+class TextFrame(NamedTuple):
+    """文字框內容與版面設定"""
+    paragraphs: Tuple[Paragraph, ...]
+    word_wrap: Optional[bool] = None   # None = 沿用 backend 預設
+    anchor: Optional[str] = None       # "top" / "middle" / "bottom"
+    margins: Optional[Tuple[float, float, float, float]] = None  # (left, right, top, bottom) pt
+
+
+def _color(value) -> Optional[Color]:
+    return None if value is None else (int(value[0]), int(value[1]), int(value[2]))
+
+
+def para(text: str, style: TextStyle, align: Optional[str] = None,
+         space_after: Optional[float] = None) -> Paragraph:
+    """建立單一 run 的段落"""
+    return Paragraph((Run(text, style),), align, space_after)
+
+
+def text_frame(paragraphs, word_wrap: Optional[bool] = None, anchor: Optional[str] = None,
+               margins=None) -> TextFrame:
+    """建立文字框（paragraphs 可為單一 Paragraph 或列表）"""
+    if isinstance(paragraphs, Paragraph):
+        paragraphs = (paragraphs,)
+    return TextFrame(tuple(paragraphs), word_wrap, anchor, margins)
+
+
+class ShapeNode:
+    """幾何形狀或文字框（geom="TEXTBOX" 時不設定填充與邊框）"""
+
+    __slots__ = ("geom", "x", "y", "w", "h", "fill", "line", "line_width", "dash", "text", "name")
+    kind = "shape"
+
+    def __init__(self, geom, x, y, w, h, fill=None, line=None, line_width=None,
+                 dash=None, text=None, name=None):
+        if geom not in GEOMETRIES:
+            raise ValueError(f"不支援的形狀: {geom}")
+        self.geom = geom
+        self.x, self.y, self.w, self.h = x, y, w, h
+        self.fill = _color(fill)          # None = 無填充
+        self.line = _color(line)          # None = 無邊框
+        self.line_width = line_width      # pt，None = 預設粗細
+        self.dash = dash
+        self.text: Optional[TextFrame] = text
+        self.name = name
+
+    def key(self) -> tuple:
+        """內容摘要（用於比對與快取）"""
+        return (self.kind, self.geom, round(self.x, 2), round(self.y, 2), round(self.w, 2),
+                round(self.h, 2), self.fill, self.line, self.line_width, self.dash, self.text)
+
+
+class ConnectorNode:
+    """直線連接線"""
+
+    __slots__ = ("x1", "y1", "x2", "y2", "color", "width", "dash", "end_arrow", "begin_arrow", "name")
+    kind = "connector"
+
+    def __init__(self, x1, y1, x2, y2, color=(0, 0, 0), width=1.0, dash=None,
+                 end_arrow=False, begin_arrow=False, name=None):
+        self.x1, self.y1, self.x2, self.y2 = x1, y1, x2, y2
+        self.color = _color(color)
+        self.width = width
+        self.dash = dash
+        self.end_arrow = end_arrow
+        self.begin_arrow = begin_arrow
+        self.name = name
+
+    def key(self) -> tuple:
+        return (self.kind, round(self.x1, 2), round(self.y1, 2), round(self.x2, 2), round(self.y2, 2),
+                self.color, self.width, self.dash, self.end_arrow, self.begin_arrow)
+
+
+class PathNode:
+    """折線 / 多邊形（points 為 [(x, y), ...]；closed=True 時首尾相連，可填充）"""
+
+    __slots__ = ("points", "closed", "fill", "line", "line_width", "dash", "name")
+    kind = "path"
+
+    def __init__(self, points, closed=False, fill=None, line=(0, 0, 0), line_width=1.0,
+                 dash=None, name=None):
+        if len(points) < 2:
+            raise ValueError("路徑至少需要 2 個點")
+        self.points = [(float(px), float(py)) for px, py in points]
+        self.closed = closed
+        self.fill = _color(fill)          # None = 無填充（未封閉的折線一律不填充）
+        self.line = _color(line)          # None = 無邊框
+        self.line_width = line_width
+        self.dash = dash
+        self.name = name
+
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """外框 (x, y, w, h)"""
+        xs = [px for px, _ in self.points]
+        ys = [py for _, py in self.points]
+        return min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys)
+
+    def key(self) -> tuple:
+        return (self.kind, tuple((round(px, 2), round(py, 2)) for px, py in self.points),
+                self.closed, self.fill, self.line, self.line_width, self.dash)
+
+
+class TableCell(NamedTuple):
+    """表格儲存格"""
+    text: TextFrame
+    fill: Optional[Color] = None
+
+
+class TableNode:
+    """原生表格（rows 為 TableCell 的二維列表）"""
+
+    __slots__ = ("x", "y", "w", "h", "rows", "col_widths", "row_heights", "border", "name")
+    kind = "table"
+
+    def __init__(self, x, y, w, h, rows, col_widths=None, row_heights=None,
+                 border=(200, 200, 200), name=None):
+        self.x, self.y, self.w, self.h = x, y, w, h
+        self.rows: List[List[TableCell]] = rows
+        cols = len(rows[0]) if rows else 0
+        self.col_widths = col_widths or ([w / cols] * cols if cols else [])
+        self.row_heights = row_heights or ([h / len(rows)] * len(rows) if rows else [])
+        self.border = _color(border)
+        self.name = name
+
+    def key(self) -> tuple:
+        return (self.kind, round(self.x, 2), round(self.y, 2), round(self.w, 2), round(self.h, 2),
+                tuple(tuple(r) for r in self.rows), tuple(self.col_widths), tuple(self.row_heights),
+                self.border)
+
+
+class Scene:
+    """
+    保留式 scene graph：依加入順序保存節點（即 z-order）
+
+    Args:
+        unit: 輸入座標單位，"in"（python-pptx 繪圖函數）或 "pt"（pywin32 / layout.json）
+    """
+
+    def __init__(self, unit: str = "pt"):
+        self.scale = _UNIT_SCALE[unit]
+        self.nodes: List = []
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def _pt(self, *values):
+        return [v * self.scale for v in values]
+
+    def add(self, node):
+        """加入已建立的節點（座標需為 pt）"""
+        self.nodes.append(node)
+        return node
+
+    def shape(self, geom, x, y, w, h, fill=None, line=None, line_width=None, dash=None,
+              text=None, name=None) -> ShapeNode:
+        """加入幾何形狀"""
+        x, y, w, h = self._pt(x, y, w, h)
+        return self.add(ShapeNode(geom, x, y, w, h, fill, line, line_width, dash, text, name))
+
+    def rect(self, x, y, w, h, **kwargs) -> ShapeNode:
+        return self.shape("RECTANGLE", x, y, w, h, **kwargs)
+
+    def rounded_rect(self, x, y, w, h, **kwargs) -> ShapeNode:
+        return self.shape("ROUNDED_RECTANGLE", x, y, w, h, **kwargs)
+
+    def textbox(self, x, y, w, h, text, name=None) -> ShapeNode:
+        """加入文字框（text 為 TextFrame / Paragraph）"""
+        if isinstance(text, Paragraph):
+            text = text_frame(text)
+        return self.shape("TEXTBOX", x, y, w, h, text=text, name=name)
+
+    def connector(self, x1, y1, x2, y2, **kwargs) -> ConnectorNode:
+        """加入連接線"""
+        x1, y1, x2, y2 = self._pt(x1, y1, x2, y2)
+        return self.add(ConnectorNode(x1, y1, x2, y2, **kwargs))
+
+    def path(self, points, **kwargs) -> PathNode:
+        """加入折線 / 多邊形（points 使用輸入單位）"""
+        return self.add(PathNode([self._pt(px, py) for px, py in points], **kwargs))
+
+    def polygon(self, points, **kwargs) -> PathNode:
+        return self.path(points, closed=True, **kwargs)
+
+    def table(self, x, y, w, h, rows, col_widths=None, row_heights=None, **kwargs) -> TableNode:
+        """加入表格（col_widths / row_heights 使用輸入單位）"""
+        x, y, w, h = self._pt(x, y, w, h)
+        if col_widths:
+            col_widths = self._pt(*col_widths)
+        if row_heights:
+            row_heights = self._pt(*row_heights)
+        return self.add(TableNode(x, y, w, h, rows, col_widths, row_heights, **kwargs))
+
+    def extend(self, other: "Scene"):
+        """合併另一個 scene 的節點（保持順序）"""
+        self.nodes.extend(other.nodes)
+
+    def stats(self) -> dict:
+        """節點統計：{kind: 數量, "text_runs": N}"""
+        counts = {}
+        runs = 0
+        for node in self.nodes:
+            counts[node.kind] = counts.get(node.kind, 0) + 1
+            if node.kind == "shape" and node.text:
+                runs += sum(len(p.runs) for p in node.text.paragraphs)
+            elif node.kind == "table":
+                runs += sum(len(p.runs) for row in node.rows for cell in row
+                            for p in cell.text.paragraphs)
+        counts["text_runs"] = runs
+        return counts
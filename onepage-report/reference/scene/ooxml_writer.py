@@ -0,0 +1,598 @@
+# -*- coding: utf-8 -*-
+"""
+Scene graph → OOXML（直接寫 ppt/slides/slideN.xml）
+
+大量產生投影片（例如 200 頁的附錄術語表）時，python-pptx 逐一建立 lxml 物件、
+逐段落設定字型的成本會主導 CPU 時間。這裡改用預先組好的 XML 片段，
+把 Scene 直接序列化成 slide XML 字串，並逐頁串流寫入輸出 zip，
+記憶體用量不隨頁數增加。
+
+python-pptx 只負責產生套件骨架（母片、版面配置、佈景主題、投影片尺寸），
+最後再補上 presentation.xml 的 sldIdLst、關聯與 [Content_Types].xml。
+
+使用範例：
+    from scene import Scene, OoxmlDeckWriter
+
+    with OoxmlDeckWriter("appendix.pptx") as deck:
+        for page in paginate_glossary(terms):
+            scene = build_glossary_page(Scene(unit="in"), "附錄：術語", page)
+            deck.add_slide(scene)
+
+輸出結果與 flush_pptx 相同（同樣的幾何、p:style 與 run 樣式），
+可用 python-pptx 重新開啟或交給 PowerPoint 後續處理。
+"""
+
+import io
+import os
+import re
+import zipfile
+from functools import lru_cache
+from xml.sax.saxutils import escape, quoteattr
+
+from lxml import etree
+from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.util import Pt
+
+_EMU_PER_PT = 12700
+
+_NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+_NS_CT = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+_REL_SLIDE = _NS_R + "/slide"
+_REL_SLIDE_LAYOUT = _NS_R + "/slideLayout"
+_CT_SLIDE = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+
+# 骨架中會在 close() 時改寫的 part
+_PRESENTATION = "ppt/presentation.xml"
+_PRESENTATION_RELS = "ppt/_rels/presentation.xml.rels"
+_CONTENT_TYPES = "[Content_Types].xml"
+_APP_PROPS = "docProps/app.xml"
+# sldSz@type → (cx, cy) EMU
+_SLIDE_SIZE_TYPES = {
+    "screen4x3": ("9144000", "6858000"),
+    "screen16x9": ("9144000", "5143500"),
+    "screen16x10": ("9144000", "5715000"),
+}
+
+# MSO_SHAPE 名稱 → prstGeom
+_PRST = {
+    "RECTANGLE": "rect",
+    "ROUNDED_RECTANGLE": "roundRect",
+    "OVAL": "ellipse",
+    "DIAMOND": "diamond",
+    "CHEVRON": "chevron",
+    "ISOSCELES_TRIANGLE": "triangle",
+    "RIGHT_ARROW": "rightArrow",
+    "LEFT_ARROW": "leftArrow",
+    "UP_ARROW": "upArrow",
+    "DOWN_ARROW": "downArrow",
+}
+# python-pptx 新增形狀時使用的名稱前綴
+_SHAPE_NAMES = {
+    "RECTANGLE": "Rectangle",
+    "ROUNDED_RECTANGLE": "Rounded Rectangle",
+    "OVAL": "Oval",
+    "DIAMOND": "Diamond",
+    "CHEVRON": "Chevron",
+    "ISOSCELES_TRIANGLE": "Isosceles Triangle",
+    "RIGHT_ARROW": "Right Arrow",
+    "LEFT_ARROW": "Left Arrow",
+    "UP_ARROW": "Up Arrow",
+    "DOWN_ARROW": "Down Arrow",
+    "TEXTBOX": "TextBox",
+}
+# MsoLineDashStyle → prstDash
+_DASH = {1: "solid", 2: "sysDash", 3: "sysDot", 4: "dash", 5: "dashDot", 6: "lgDashDotDot",
+         7: "lgDash", 8: "lgDashDot"}
+_ALIGN = {"left": "l", "center": "ctr", "right": "r"}
+_ANCHOR = {"top": "t", "middle": "ctr", "bottom": "b"}
+
+# XML 1.0 不允許的控制字元（\t \n \r 除外）
+_INVALID_XML_CHARS = dict.fromkeys(c for c in range(32) if c not in (9, 10, 13))
+
+# ---- 預先組好的 XML 片段 ----
+
+_SLIDE_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<p:sld xmlns:a="{_NS_A}" xmlns:p="{_NS_P}" xmlns:r="{_NS_R}"><p:cSld>'
+)
+_BACKGROUND = ('<p:bg><p:bgPr><a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+               '<a:effectLst/></p:bgPr></p:bg>')
+_TREE_HEAD = ('<p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/>'
+              '</p:nvGrpSpPr><p:grpSpPr/>')
+_SLIDE_TAIL = ('</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr>'
+               '</p:sld>')
+# paste_slide_xml：重新編號的 cNvPr 與略過的群組屬性
+_CNV_PR = f"{{{_NS_P}}}cNvPr"
+_TREE_PROPS = (f"{{{_NS_P}}}nvGrpSpPr", f"{{{_NS_P}}}grpSpPr")
+
+_SLIDE_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<Relationships xmlns="{_NS_PKG_REL}"><Relationship Id="rId1" '
+    f'Type="{_REL_SLIDE_LAYOUT}" Target="{{layout}}"/></Relationships>'
+)
+
+_XFRM = '<a:xfrm{flip}><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+
+_SHAPE_STYLE = ('<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+                '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+                '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+                '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>')
+_CONNECTOR_STYLE = ('<p:style><a:lnRef idx="2"><a:schemeClr val="accent1"/></a:lnRef>'
+                    '<a:fillRef idx="0"><a:schemeClr val="accent1"/></a:fillRef>'
+                    '<a:effectRef idx="1"><a:schemeClr val="accent1"/></a:effectRef>'
+                    '<a:fontRef idx="minor"><a:schemeClr val="tx1"/></a:fontRef></p:style>')
+
+_SP = ('<p:sp><p:nvSpPr><p:cNvPr id="{id}" name={name}/><p:cNvSpPr{txbox}/><p:nvPr/></p:nvSpPr>'
+       '<p:spPr>{xfrm}<a:prstGeom prst="{prst}"><a:avLst/></a:prstGeom>{paint}</p:spPr>'
+       '{style}{body}</p:sp>')
+_CUST_SP = ('<p:sp><p:nvSpPr><p:cNvPr id="{id}" name={name}/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+            '<p:spPr>{xfrm}<a:custGeom><a:avLst/><a:gdLst/><a:ahLst/><a:cxnLst/>'
+            '<a:rect l="l" t="t" r="r" b="b"/><a:pathLst><a:path w="{cx}" h="{cy}">{path}</a:path>'
+            '</a:pathLst></a:custGeom>{paint}</p:spPr>' + _SHAPE_STYLE + '{body}</p:sp>')
+_CXN_SP = ('<p:cxnSp><p:nvCxnSpPr><p:cNvPr id="{id}" name={name}/><p:cNvCxnSpPr/><p:nvPr/>'
+           '</p:nvCxnSpPr><p:spPr>{xfrm}<a:prstGeom prst="line"><a:avLst/></a:prstGeom>{line}'
+           '</p:spPr>' + _CONNECTOR_STYLE + '</p:cxnSp>')
+_GRAPHIC_FRAME = (
+    '<p:graphicFrame><p:nvGraphicFramePr><p:cNvPr id="{id}" name={name}/><p:cNvGraphicFramePr>'
+    '<a:graphicFrameLocks noGrp="1"/></p:cNvGraphicFramePr><p:nvPr/></p:nvGraphicFramePr>'
+    '<p:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></p:xfrm><a:graphic>'
+    '<a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table"><a:tbl>'
+    '<a:tblPr firstRow="1" bandRow="1"><a:tableStyleId>{{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}}'
+    '</a:tableStyleId></a:tblPr><a:tblGrid>{grid}</a:tblGrid>{rows}</a:tbl></a:graphicData>'
+    '</a:graphic></p:graphicFrame>'
+)
+
+
+def _emu(value: float) -> int:
+    # 與 python-pptx 的 Pt() 相同（截斷），輸出才會與 flush_pptx 一致
+    return int(value * _EMU_PER_PT)
+
+
+def _hex(color) -> str:
+    return "%02X%02X%02X" % tuple(color)
+
+
+def _text(value: str) -> str:
+    return escape(value.translate(_INVALID_XML_CHARS))
+
+
+@lru_cache(maxsize=None)
+def _solid_fill(color) -> str:
+    return f'<a:solidFill><a:srgbClr val="{_hex(color)}"/></a:solidFill>'
+
+
+@lru_cache(maxsize=None)
+def rpr_xml(style) -> str:
+    """TextStyle → <a:rPr> 片段（同一樣式只組一次；python-pptx backend 也共用此片段）"""
+    attrs = f' sz="{int(round(style.size * 100))}"'
+    if style.bold:
+        attrs += ' b="1"'
+    if style.italic:
+        attrs += ' i="1"'
+    # ea 也要指定，否則中文字會落回佈景主題的東亞字型
+    font = quoteattr(style.font)
+    return (f'<a:rPr{attrs}>{_solid_fill(tuple(style.color))}'
+            f'<a:latin typeface={font}/><a:ea typeface={font}/></a:rPr>')
+
+
+@lru_cache(maxsize=None)
+def _shape_paint(fill, line, line_width, dash) -> str:
+    """形狀的填充與邊框片段"""
+    out = _solid_fill(fill) if fill is not None else "<a:noFill/>"
+    if line is None:
+        return out + "<a:ln><a:noFill/></a:ln>"
+    width = f' w="{_emu(line_width)}"' if line_width is not None else ""
+    dash_xml = f'<a:prstDash val="{_DASH[dash]}"/>' if dash in _DASH else ""
+    return out + f"<a:ln{width}>{_solid_fill(line)}{dash_xml}</a:ln>"
+
+
+@lru_cache(maxsize=None)
+def _connector_line(color, width, dash, begin_arrow, end_arrow) -> str:
+    dash_xml = f'<a:prstDash val="{_DASH[dash]}"/>' if dash in _DASH else ""
+    head = '<a:headEnd type="triangle"/>' if begin_arrow else ""
+    tail = '<a:tailEnd type="triangle"/>' if end_arrow else ""
+    return f'<a:ln w="{_emu(width)}">{_solid_fill(color)}{dash_xml}{head}{tail}</a:ln>'
+
+
+def _runs_xml(runs) -> str:
+    out = []
+    for run in runs:
+        rpr = rpr_xml(run.style)
+        for i, line in enumerate(run.text.split("\n")):
+            if i > 0:
+                out.append("<a:br/>")
+            if line:
+                out.append(f"<a:r>{rpr}<a:t>{_text(line)}</a:t></a:r>")
+    return "".join(out)
+
+
+def _paragraph_xml(paragraph, default_align=None) -> str:
+    align = paragraph.align or default_align
+    attrs = f' algn="{_ALIGN[align]}"' if align is not None else ""
+    space = ""
+    if paragraph.space_after is not None:
+        space = f'<a:spcAft><a:spcPts val="{int(round(paragraph.space_after * 100))}"/></a:spcAft>'
+    if attrs or space:
+        ppr = f"<a:pPr{attrs}>{space}</a:pPr>" if space else f"<a:pPr{attrs}/>"
+    else:
+        ppr = ""
+    return f"<a:p>{ppr}{_runs_xml(paragraph.runs)}</a:p>"
+
+
+def _body_pr(frame, defaults: dict, auto_fit: bool) -> str:
+    attrs = dict(defaults)
+    if frame is not None:
+        if frame.word_wrap is not None:
+            attrs["wrap"] = "square" if frame.word_wrap else "none"
+        if frame.anchor is not None:
+            attrs["anchor"] = _ANCHOR[frame.anchor]
+        if frame.margins is not None:
+            left, right, top, bottom = frame.margins
+            attrs.update(lIns=_emu(left), tIns=_emu(top), rIns=_emu(right), bIns=_emu(bottom))
+    attr_xml = "".join(f' {k}="{v}"' for k, v in attrs.items())
+    return f"<a:bodyPr{attr_xml}><a:spAutoFit/></a:bodyPr>" if auto_fit else f"<a:bodyPr{attr_xml}/>"
+
+
+def text_body_xml(frame, tag: str = "p:txBody", is_textbox: bool = False) -> str:
+    """
+    TextFrame → <p:txBody> / <a:txBody>
+
+    預設值與 python-pptx 新增的形狀相同：文字框不折行並自動調整大小，
+    一般形狀垂直置中、第一段水平置中。
+
+    Args:
+        frame: scene.TextFrame（None 時輸出空段落）
+        tag: 外層標籤（形狀為 p:txBody，表格儲存格為 a:txBody）
+        is_textbox: 是否為文字框
+
+    Returns:
+        str: XML 片段
+    """
+    if tag == "a:txBody":
+        # 表格儲存格的內邊距與垂直對齊寫在 a:tcPr（見 _tc_pr）
+        body_pr = "<a:bodyPr/>"
+        default_align = None
+    elif is_textbox:
+        body_pr = _body_pr(frame, {"wrap": "none"}, auto_fit=True)
+        default_align = None
+    else:
+        body_pr = _body_pr(frame, {"rtlCol": "0", "anchor": "ctr"}, auto_fit=False)
+        default_align = "center"
+
+    if frame is None or not frame.paragraphs:
+        paragraphs = '<a:p><a:pPr algn="ctr"/></a:p>' if default_align else "<a:p/>"
+    else:
+        paragraphs = "".join(
+            _paragraph_xml(p, default_align if i == 0 else None)
+            for i, p in enumerate(frame.paragraphs)
+        )
+    return f"<{tag}>{body_pr}<a:lstStyle/>{paragraphs}</{tag}>"
+
+
+def _shape_xml(node, shape_id: int) -> str:
+    is_textbox = node.geom == "TEXTBOX"
+    name = quoteattr(node.name or f"{_SHAPE_NAMES[node.geom]} {shape_id - 1}")
+    xfrm = _XFRM.format(flip="", x=_emu(node.x), y=_emu(node.y), cx=_emu(node.w), cy=_emu(node.h))
+    if is_textbox:
+        return _SP.format(
+            id=shape_id, name=name, txbox=' txBox="1"', xfrm=xfrm, prst="rect",
+            paint="<a:noFill/>", style="",
+            body=text_body_xml(node.text, is_textbox=True),
+        )
+    return _SP.format(
+        id=shape_id, name=name, txbox="", xfrm=xfrm, prst=_PRST[node.geom],
+        paint=_shape_paint(node.fill, node.line, node.line_width, node.dash),
+        style=_SHAPE_STYLE, body=text_body_xml(node.text),
+    )
+
+
+def _connector_xml(node, shape_id: int) -> str:
+    flip = ""
+    if node.x2 < node.x1:
+        flip += ' flipH="1"'
+    if node.y2 < node.y1:
+        flip += ' flipV="1"'
+    xfrm = _XFRM.format(
+        flip=flip, x=_emu(min(node.x1, node.x2)), y=_emu(min(node.y1, node.y2)),
+        cx=_emu(abs(node.x2 - node.x1)), cy=_emu(abs(node.y2 - node.y1)),
+    )
+    return _CXN_SP.format(
+        id=shape_id, name=quoteattr(node.name or f"Connector {shape_id - 1}"), xfrm=xfrm,
+        line=_connector_line(node.color, node.width, node.dash, node.begin_arrow, node.end_arrow),
+    )
+
+
+def _path_xml(node, shape_id: int) -> str:
+    """PathNode → 自訂幾何（custGeom）形狀，結構同 python-pptx 的 freeform"""
+    xs = [_emu(px) for px, _ in node.points]
+    ys = [_emu(py) for _, py in node.points]
+    left, top = min(xs), min(ys)
+    cx, cy = max(xs) - left, max(ys) - top
+    points = [f'<a:pt x="{x - left}" y="{y - top}"/>' for x, y in zip(xs, ys)]
+    path = f"<a:moveTo>{points[0]}</a:moveTo>" + "".join(f"<a:lnTo>{pt}</a:lnTo>" for pt in points[1:])
+    if node.closed:
+        path += "<a:close/>"
+    fill = node.fill if node.closed else None
+    return _CUST_SP.format(
+        id=shape_id, name=quoteattr(node.name or f"Freeform {shape_id - 1}"),
+        xfrm=_XFRM.format(flip="", x=left, y=top, cx=cx, cy=cy), cx=cx, cy=cy, path=path,
+        paint=_shape_paint(fill, node.line, node.line_width, node.dash),
+        body=text_body_xml(None),
+    )
+
+
+@lru_cache(maxsize=None)
+def _cell_borders(color) -> str:
+    """儲存格四邊框線（同一顏色只組一次）"""
+    if color is None:
+        return ""
+    line = f'w="6350">{_solid_fill(color)}'
+    return "".join(f"<a:{side} {line}</a:{side}>" for side in ("lnL", "lnR", "lnT", "lnB"))
+
+
+def _tc_pr(cell, borders: str) -> str:
+    attrs = ""
+    frame = cell.text
+    if frame is not None:
+        if frame.margins is not None:
+            left, right, top, bottom = frame.margins
+            attrs = f' marL="{_emu(left)}" marR="{_emu(right)}" marT="{_emu(top)}" marB="{_emu(bottom)}"'
+        if frame.anchor is not None:
+            attrs += f' anchor="{_ANCHOR[frame.anchor]}"'
+    fill = _solid_fill(tuple(cell.fill)) if cell.fill is not None else ""
+    if not (borders or fill):
+        return f"<a:tcPr{attrs}/>"
+    return f"<a:tcPr{attrs}>{borders}{fill}</a:tcPr>"
+
+
+def table_xml(node, shape_id: int) -> str:
+    """
+    TableNode → <p:graphicFrame>（整份表格一次組成字串）
+
+    Args:
+        node: TableNode
+        shape_id: 投影片內的 shape id
+
+    Returns:
+        str: XML 片段（不含命名空間宣告）
+    """
+    grid = "".join(f'<a:gridCol w="{_emu(w)}"/>' for w in node.col_widths)
+    borders = _cell_borders(node.border)
+    rows = []
+    for row, height in zip(node.rows, node.row_heights):
+        cells = "".join(
+            f"<a:tc>{text_body_xml(cell.text, tag='a:txBody')}{_tc_pr(cell, borders)}</a:tc>"
+            for cell in row
+        )
+        rows.append(f'<a:tr h="{_emu(height)}">{cells}</a:tr>')
+    return _GRAPHIC_FRAME.format(
+        id=shape_id, name=quoteattr(node.name or f"Table {shape_id - 1}"),
+        x=_emu(node.x), y=_emu(node.y), cx=_emu(node.w), cy=_emu(node.h),
+        grid=grid, rows="".join(rows),
+    )
+
+
+_SERIALIZE = {
+    "shape": _shape_xml,
+    "connector": _connector_xml,
+    "path": _path_xml,
+    "table": table_xml,
+}
+
+
+def scene_to_slide_xml(scene, background=None) -> str:
+    """
+    將 scene 序列化成 slide XML（ppt/slides/slideN.xml 的內容）
+
+    Args:
+        scene: Scene 物件
+        background: 投影片背景色 (r, g, b)，None 則沿用母片
+
+    Returns:
+        str: slide XML
+    """
+    parts = [_SLIDE_HEAD]
+    if background is not None:
+        parts.append(_BACKGROUND.format(color=_hex(background)))
+    parts.append(_TREE_HEAD)
+    # id 1 保留給 spTree 本身
+    parts.extend(_SERIALIZE[node.kind](node, shape_id) for shape_id, node in enumerate(scene, 2))
+    parts.append(_SLIDE_TAIL)
+    return "".join(parts)
+
+
+def paste_slide_xml(slide, slide_xml: str) -> int:
+    """
+    將 scene_to_slide_xml 產生的形狀貼到 python-pptx 投影片（接在既有形狀之後）
+
+    slide XML 可在子程序平行產生，主程序只需解析與附加，不必逐一建立 python-pptx 形狀。
+    shape id 接續投影片上既有的最大 id 重新編號。
+
+    Args:
+        slide: 投影片物件
+        slide_xml: scene_to_slide_xml 的結果
+
+    Returns:
+        int: 貼上的形狀數
+    """
+    tree = slide.shapes._spTree
+    next_id = max((int(c.get("id")) for c in tree.iter(_CNV_PR)), default=1) + 1
+    source = parse_xml(slide_xml.encode("utf-8")).find(f"{{{_NS_P}}}cSld/{{{_NS_P}}}spTree")
+    shapes = [child for child in source if child.tag not in _TREE_PROPS]
+    for shape in shapes:
+        for c_nv_pr in shape.iter(_CNV_PR):
+            c_nv_pr.set("id", str(next_id))
+            next_id += 1
+        tree.append(shape)
+    return len(shapes)
+
+
+class OoxmlDeckWriter:
+    """
+    逐頁串流寫出 .pptx
+
+    每次 add_slide() 都會立即把 slide XML 壓縮寫入 zip，不保留已寫出的投影片；
+    close() 時才寫入 presentation.xml、關聯與 content types。
+    輸出到路徑時先寫入同目錄的 .tmp 檔，close() 完成後才取代目標檔；
+    with 區塊內發生例外時改呼叫 abort()，捨棄寫到一半的簡報（原本的目標檔不受影響）。
+
+    Args:
+        path: 輸出 .pptx 路徑（或可寫入的 file-like 物件）
+        width, height: 投影片尺寸（pt，預設 16:9 的 960 x 540）
+        template: 母片範本 .pptx（None 使用 python-pptx 預設範本，範本不可含投影片）
+        layout_index: 投影片使用的版面配置（預設 6 = 空白）
+    """
+
+    def __init__(self, path, width: float = 960, height: float = 540, template=None,
+                 layout_index: int = 6):
+        prs = Presentation(template)
+        if len(prs.slides):
+            raise ValueError("範本不可包含投影片")
+        prs.slide_width = Pt(width)
+        prs.slide_height = Pt(height)
+        layout_partname = prs.slide_layouts[layout_index].part.partname
+        self._layout_target = "../" + layout_partname.split("/ppt/", 1)[1]
+
+        buffer = io.BytesIO()
+        prs.save(buffer)
+        self._scaffold = zipfile.ZipFile(buffer)
+
+        if isinstance(path, (str, os.PathLike)):
+            self._path = os.fspath(path)
+            self._tmp = self._path + ".tmp"
+            self._zip = zipfile.ZipFile(self._tmp, "w", zipfile.ZIP_DEFLATED)
+        else:
+            self._path = self._tmp = None
+            self._zip = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+        self._deferred = {}
+        for name in self._scaffold.namelist():
+            if name in (_PRESENTATION, _PRESENTATION_RELS, _CONTENT_TYPES, _APP_PROPS):
+                self._deferred[name] = self._scaffold.read(name)
+            else:
+                self._zip.writestr(name, self._scaffold.read(name))
+        self._scaffold.close()
+        self.slide_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def add_slide(self, scene, background=None) -> int:
+        """
+        新增一頁投影片並立即寫入 zip
+
+        Args:
+            scene: Scene 物件
+            background: 背景色 (r, g, b)
+
+        Returns:
+            int: 投影片編號（從 1 開始）
+        """
+        return self.add_slide_xml(scene_to_slide_xml(scene, background))
+
+    def add_slide_xml(self, slide_xml: str) -> int:
+        """寫入已序列化的 slide XML（例如快取結果），回傳投影片編號"""
+        if self._zip is None:
+            raise RuntimeError("OoxmlDeckWriter 已關閉")
+        number = self.slide_count + 1
+        self._zip.writestr(f"ppt/slides/slide{number}.xml", slide_xml)
+        self._zip.writestr(f"ppt/slides/_rels/slide{number}.xml.rels",
+                           _SLIDE_RELS.format(layout=self._layout_target))
+        self.slide_count = number
+        return number
+
+    def _presentation_parts(self):
+        """補上 sldIdLst、投影片關聯與 content types"""
+        rels = etree.fromstring(self._deferred[_PRESENTATION_RELS])
+        used = [int(m.group(1)) for r in rels
+                for m in [re.match(r"rId(\d+)$", r.get("Id", ""))] if m]
+        next_rid = max(used, default=0) + 1
+        rel_ids = []
+        for number in range(1, self.slide_count + 1):
+            rel_id = f"rId{next_rid + number - 1}"
+            etree.SubElement(rels, f"{{{_NS_PKG_REL}}}Relationship", Id=rel_id,
+                             Type=_REL_SLIDE, Target=f"slides/slide{number}.xml")
+            rel_ids.append(rel_id)
+
+        presentation = etree.fromstring(self._deferred[_PRESENTATION])
+        # 範本存檔時 python-pptx 可能已留下空的 sldIdLst：沿用同一個元素，不能再插入第二個
+        sld_id_lst = presentation.find(f"{{{_NS_P}}}sldIdLst")
+        if sld_id_lst is not None:
+            for child in list(sld_id_lst):
+                sld_id_lst.remove(child)
+        elif rel_ids:
+            sld_id_lst = etree.Element(f"{{{_NS_P}}}sldIdLst")
+            # sldIdLst 必須緊接在 sldMasterIdLst / notesMasterIdLst / handoutMasterIdLst 之後
+            anchor = None
+            for tag in ("sldMasterIdLst", "notesMasterIdLst", "handoutMasterIdLst"):
+                found = presentation.find(f"{{{_NS_P}}}{tag}")
+                if found is not None:
+                    anchor = found
+            if anchor is None:
+                presentation.insert(0, sld_id_lst)
+            else:
+                anchor.addnext(sld_id_lst)
+        for offset, rel_id in enumerate(rel_ids):
+            etree.SubElement(sld_id_lst, f"{{{_NS_P}}}sldId", {"id": str(256 + offset), f"{{{_NS_R}}}id": rel_id})
+
+        # 範本的 sldSz@type（預設 screen4x3）只在尺寸相符時保留，其餘視為自訂尺寸
+        sld_sz = presentation.find(f"{{{_NS_P}}}sldSz")
+        if sld_sz is not None and sld_sz.get("type") is not None:
+            if (sld_sz.get("cx"), sld_sz.get("cy")) != _SLIDE_SIZE_TYPES.get(sld_sz.get("type")):
+                del sld_sz.attrib["type"]
+
+        types = etree.fromstring(self._deferred[_CONTENT_TYPES])
+        for number in range(1, self.slide_count + 1):
+            etree.SubElement(types, f"{{{_NS_CT}}}Override",
+                             PartName=f"/ppt/slides/slide{number}.xml", ContentType=_CT_SLIDE)
+
+        def dump(element):
+            return etree.tostring(element, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+        parts = {
+            _PRESENTATION: dump(presentation),
+            _PRESENTATION_RELS: dump(rels),
+            _CONTENT_TYPES: dump(types),
+        }
+        if _APP_PROPS in self._deferred:
+            parts[_APP_PROPS] = re.sub(rb"<Slides>\d+</Slides>",
+                                       f"<Slides>{self.slide_count}</Slides>".encode(),
+                                       self._deferred[_APP_PROPS])
+        return parts
+
+    def close(self):
+        """寫入剩餘的套件 part 並關閉 zip（可重複呼叫）"""
+        if self._zip is None:
+            return
+        try:
+            for name, data in self._presentation_parts().items():
+                self._zip.writestr(name, data)
+        except BaseException:
+            self.abort()
+            raise
+        self._zip.close()
+        self._zip = None
+        self._deferred = {}
+        if self._tmp is not None:
+            os.replace(self._tmp, self._path)
+
+    def abort(self):
+        """捨棄寫到一半的簡報：刪除暫存檔，不寫出目標檔（file-like 輸出的內容不完整，由呼叫端丟棄）"""
+        if self._zip is None:
+            return
+        self._zip.close()
+        self._zip = None
+        self._deferred = {}
+        if self._tmp is not None and os.path.exists(self._tmp):
+            os.remove(self._tmp)
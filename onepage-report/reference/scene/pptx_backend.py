@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+Scene graph → python-pptx
+
+將 Scene 節點依序新增到 python-pptx 的 Slide。
+
+文字樣式不逐一設定 font.size / bold / color / name：每個 TextStyle 只解析一次成
+<a:rPr> 元素（與 ooxml_writer 共用同一片段），新增 run 時直接複製，一個 run 一次操作。
+"""
+
+from copy import deepcopy
+from functools import lru_cache
+
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_CONNECTOR, MSO_SHAPE
+from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.text.text import _Run
+from pptx.util import Pt
+
+from .ooxml_writer import rpr_xml, table_xml
+
+_ALIGN = {"left": PP_ALIGN.LEFT, "center": PP_ALIGN.CENTER, "right": PP_ALIGN.RIGHT}
+_ANCHOR = {"top": MSO_ANCHOR.TOP, "middle": MSO_ANCHOR.MIDDLE, "bottom": MSO_ANCHOR.BOTTOM}
+
+
+@lru_cache(maxsize=None)
+def run_properties(style):
+    """TextStyle → 共用的 <a:rPr> 元素（只解析一次，套用時複製）"""
+    return parse_xml(rpr_xml(style).replace("<a:rPr", f"<a:rPr {nsdecls('a')}", 1))
+
+
+def add_styled_run(paragraph, text: str, style):
+    """
+    在段落末尾新增一個已套用樣式的 run
+
+    Args:
+        paragraph: python-pptx 段落
+        text: 文字（不含換行）
+        style: scene.TextStyle
+
+    Returns:
+        python-pptx run（與 paragraph.add_run() 相同型別）
+    """
+    r = paragraph._p.add_r()
+    r.insert(0, deepcopy(run_properties(style)))
+    r.text = text
+    return _Run(r, paragraph)
+
+
+def _apply_runs(paragraph, runs):
+    """每個 run 新增一次，樣式直接寫在 run 上"""
+    for run in runs:
+        lines = run.text.split("\n")
+        for i, line in enumerate(lines):
+            if i > 0:
+                paragraph.add_line_break()
+            if line:
+                add_styled_run(paragraph, line, run.style)
+
+
+def apply_text_frame(tf, frame):
+    """
+    將 TextFrame 寫入 python-pptx text_frame
+
+    Args:
+        tf: python-pptx TextFrame
+        frame: scene.TextFrame
+    """
+    if frame.word_wrap is not None:
+        tf.word_wrap = frame.word_wrap
+    if frame.anchor is not None:
+        tf.vertical_anchor = _ANCHOR[frame.anchor]
+    if frame.margins is not None:
+        left, right, top, bottom = frame.margins
+        tf.margin_left, tf.margin_right = Pt(left), Pt(right)
+        tf.margin_top, tf.margin_bottom = Pt(top), Pt(bottom)
+
+    for i, paragraph in enumerate(frame.paragraphs):
+        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+        if paragraph.align is not None:
+            p.alignment = _ALIGN[paragraph.align]
+        if paragraph.space_after is not None:
+            p.space_after = Pt(paragraph.space_after)
+        _apply_runs(p, paragraph.runs)
+
+
+def _set_arrowheads(connector, node):
+    ln = connector.line._get_or_add_ln()
+    if node.begin_arrow:
+        ln.append(ln.makeelement(qn("a:headEnd"), {"type": "triangle"}))
+    if node.end_arrow:
+        ln.append(ln.makeelement(qn("a:tailEnd"), {"type": "triangle"}))
+
+
+def _flush_shape(shapes, node):
+    if node.geom == "TEXTBOX":
+        shape = shapes.add_textbox(Pt(node.x), Pt(node.y), Pt(node.w), Pt(node.h))
+    else:
+        shape = shapes.add_shape(getattr(MSO_SHAPE, node.geom),
+                                 Pt(node.x), Pt(node.y), Pt(node.w), Pt(node.h))
+        if node.fill is None:
+            shape.fill.background()
+        else:
+            shape.fill.solid()
+            shape.fill.fore_color.rgb = RGBColor(*node.fill)
+        if node.line is None:
+            shape.line.fill.background()
+        else:
+            shape.line.color.rgb = RGBColor(*node.line)
+            if node.line_width is not None:
+                shape.line.width = Pt(node.line_width)
+            if node.dash is not None:
+                shape.line.dash_style = node.dash
+    if node.name:
+        shape.name = node.name
+    if node.text is not None:
+        apply_text_frame(shape.text_frame, node.text)
+    return shape
+
+
+def _flush_connector(shapes, node):
+    connector = shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Pt(node.x1), Pt(node.y1),
+                                     Pt(node.x2), Pt(node.y2))
+    connector.line.color.rgb = RGBColor(*node.color)
+    connector.line.width = Pt(node.width)
+    if node.dash is not None:
+        connector.line.dash_style = node.dash
+    if node.begin_arrow or node.end_arrow:
+        _set_arrowheads(connector, node)
+    return connector
+
+
+def _flush_path(shapes, node):
+    """折線 / 多邊形（freeform，頂點直接以 EMU 指定）"""
+    points = [(Pt(px), Pt(py)) for px, py in node.points]
+    builder = shapes.build_freeform(points[0][0], points[0][1], scale=1.0)
+    builder.add_line_segments(points[1:], close=node.closed)
+    shape = builder.convert_to_shape()
+    if node.fill is None or not node.closed:
+        shape.fill.background()
+    else:
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = RGBColor(*node.fill)
+    if node.line is None:
+        shape.line.fill.background()
+    else:
+        shape.line.color.rgb = RGBColor(*node.line)
+        if node.line_width is not None:
+            shape.line.width = Pt(node.line_width)
+        if node.dash is not None:
+            shape.line.dash_style = node.dash
+    if node.name:
+        shape.name = node.name
+    return shape
+
+
+def _flush_table(shapes, node):
+    """整份表格組成一段 XML 後一次加入（不逐格透過 python-pptx API 設定）"""
+    xml = table_xml(node, shapes._next_shape_id)
+    frame = parse_xml(xml.replace("<p:graphicFrame", f"<p:graphicFrame {nsdecls('a', 'p')}", 1))
+    shapes._spTree.insert_element_before(frame, "p:extLst")
+    return shapes._shape_factory(frame)
+
+
+_FLUSH = {
+    "shape": _flush_shape,
+    "connector": _flush_connector,
+    "path": _flush_path,
+    "table": _flush_table,
+}
+
+
+def flush_pptx(scene, slide) -> list:
+    """
+    將 scene 輸出到 python-pptx 投影片
+
+    Args:
+        scene: Scene 物件
+        slide: python-pptx Slide
+
+    Returns:
+        list: 依序建立的 python-pptx shape
+    """
+    shapes = slide.shapes
+    return [_FLUSH[node.kind](shapes, node) for node in scene]
@@ -0,0 +1,508 @@
+# -*- coding: utf-8 -*-
+"""
+python-pptx 投影片 → Scene（反向匯入）
+
+讀取已產生的 PPTX 形狀樹，轉回 Scene 節點，再交給 raster_backend / svg_backend
+輸出預覽，不需要 PowerPoint。只涵蓋繪圖函數實際用到的形狀：
+
+    p:sp        預設幾何（矩形、圓角矩形、橢圓、菱形、箭頭...）、文字框、freeform
+    p:cxnSp     直線連接線（含箭頭、虛線）
+    p:grpSp     群組（攤平，子形狀座標依群組變換）
+    表格        TableNode
+    原生圖表    scene.charts 的向量版本（讀取圖表資料重畫，沿用標題、文字與數列的顏色）
+    圖片        灰色佔位框
+
+直接讀 XML（不透過 python-pptx 的屬性物件），主題色（schemeClr）依母片的佈景主題解析。
+不支援旋轉與漸層（漸層取第一個色標）。
+"""
+
+import colorsys
+from functools import lru_cache
+from typing import Dict, Optional
+
+from pptx.oxml.ns import qn as _qn
+
+from .charts import DEFAULT_CHART_STYLE, ChartStyle, bar_chart, line_chart, pie_chart
+from .nodes import (DEFAULT_FONT, Paragraph, PathNode, Run, Scene, ShapeNode, TableCell, TableNode,
+                    TextFrame, TextStyle)
+from .ooxml_writer import _DASH, _PRST
+
+_EMU_PER_PT = 12700
+
+# 標籤名稱換算很頻繁（每個形狀數十次），快取結果
+qn = lru_cache(maxsize=None)(_qn)
+
+_GEOM_BY_PRST = {prst: geom for geom, prst in _PRST.items()}
+_DASH_BY_PRST = {prst: dash for dash, prst in _DASH.items()}
+_ALIGN = {"l": "left", "ctr": "center", "r": "right", "just": "left", "dist": "center"}
+_ANCHOR = {"t": "top", "ctr": "middle", "b": "bottom"}
+_DEFAULT_INSETS = (91440, 91440, 45720, 45720)
+
+# python-pptx 預設範本（Office 佈景主題）的色彩配置
+_DEFAULT_THEME = {
+    "dk1": (0, 0, 0), "lt1": (255, 255, 255), "dk2": (31, 73, 125), "lt2": (238, 236, 225),
+    "accent1": (79, 129, 189), "accent2": (192, 80, 77), "accent3": (155, 187, 89),
+    "accent4": (128, 100, 162), "accent5": (75, 172, 198), "accent6": (247, 150, 70),
+    "hlink": (0, 0, 255), "folHlink": (128, 0, 128),
+}
+_SCHEME_ALIAS = {"bg1": "lt1", "tx1": "dk1", "bg2": "lt2", "tx2": "dk2"}
+
+_URI_TABLE = "http://schemas.openxmlformats.org/drawingml/2006/table"
+_URI_CHART = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+_R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+_PICTURE_FILL = (230, 230, 230)
+_PICTURE_LINE = (180, 180, 180)
+
+_theme_cache: Dict[str, Dict] = {}
+
+
+def _pt(emu) -> float:
+    return int(emu) / _EMU_PER_PT
+
+
+def _hex_color(value: str):
+    return (int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16))
+
+
+def _theme_colors(slide) -> Dict:
+    """母片佈景主題的色彩配置（依 theme part 快取）"""
+    try:
+        from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+        master_part = slide.part.slide_layout.slide_master.part
+        theme_part = master_part.part_related_by(RT.THEME)
+    except (KeyError, AttributeError):
+        return _DEFAULT_THEME
+    key = str(theme_part.partname)
+    if key not in _theme_cache:
+        from lxml import etree
+
+        colors = dict(_DEFAULT_THEME)
+        scheme = etree.fromstring(theme_part.blob).find(".//" + qn("a:clrScheme"))
+        if scheme is not None:
+            for entry in scheme:
+                name = etree.QName(entry).localname
+                for child in entry:
+                    value = child.get("val") if child.tag == qn("a:srgbClr") else child.get("lastClr")
+                    if value:
+                        colors[name] = _hex_color(value)
+        _theme_cache[key] = colors
+    return _theme_cache[key]
+
+
+class _Importer:
+    """單張投影片的匯入狀態（主題色、群組變換）"""
+
+    def __init__(self, slide):
+        self.slide = slide
+        self.theme = _theme_colors(slide)
+
+    # ------------------------------------------------------------------
+    # 顏色、填充、線條
+    # ------------------------------------------------------------------
+
+    def color(self, element):
+        """a:srgbClr / a:schemeClr / a:sysClr（含 lumMod / lumOff / shade / tint）→ (r, g, b)"""
+        if element is None:
+            return None
+        tag = element.tag
+        if tag == qn("a:srgbClr"):
+            rgb = _hex_color(element.get("val"))
+        elif tag == qn("a:schemeClr"):
+            name = element.get("val")
+            rgb = self.theme.get(_SCHEME_ALIAS.get(name, name), (0, 0, 0))
+        elif tag == qn("a:sysClr"):
+            rgb = _hex_color(element.get("lastClr", "000000"))
+        elif tag == qn("a:prstClr"):
+            rgb = (0, 0, 0) if element.get("val") == "black" else (255, 255, 255)
+        else:
+            return None
+        return _modify(rgb, element)
+
+    def fill(self, parent, style=None, ref="a:fillRef"):
+        """spPr / tcPr / a:ln 內的填充；沒有填充元素時依 p:style 的參照"""
+        if parent is not None:
+            for child in parent:
+                if child.tag == qn("a:noFill"):
+                    return None
+                if child.tag == qn("a:solidFill"):
+                    return self.color(child[0] if len(child) else None)
+                if child.tag == qn("a:gradFill"):
+                    gs = child.find(".//" + qn("a:gs"))
+                    return self.color(gs[0] if gs is not None and len(gs) else None)
+        if style is not None:
+            reference = style.find(qn(ref))
+            if reference is not None and reference.get("idx", "0") != "0" and len(reference):
+                return self.color(reference[0])
+        return None
+
+    def line(self, sp_pr, style):
+        """(顏色, 寬度 pt, 虛線樣式, 起點箭頭, 終點箭頭)"""
+        ln = sp_pr.find(qn("a:ln")) if sp_pr is not None else None
+        if ln is not None and (ln.find(qn("a:noFill")) is not None or ln.find(qn("a:solidFill")) is not None):
+            color = self.fill(ln)
+        else:
+            color = self.fill(None, style, "a:lnRef")
+        width = _pt(ln.get("w")) if ln is not None and ln.get("w") else None
+        dash = begin = end = None
+        if ln is not None:
+            prst_dash = ln.find(qn("a:prstDash"))
+            if prst_dash is not None:
+                dash = _DASH_BY_PRST.get(prst_dash.get("val"))
+            head, tail = ln.find(qn("a:headEnd")), ln.find(qn("a:tailEnd"))
+            begin = head is not None and head.get("type", "none") != "none"
+            end = tail is not None and tail.get("type", "none") != "none"
+        return color, width, dash, bool(begin), bool(end)
+
+    # ------------------------------------------------------------------
+    # 文字
+    # ------------------------------------------------------------------
+
+    def run_style(self, rpr, base: TextStyle) -> TextStyle:
+        if rpr is None:
+            return base
+        size = int(rpr.get("sz")) / 100 if rpr.get("sz") else base.size
+        bold = rpr.get("b") in ("1", "true") if rpr.get("b") is not None else base.bold
+        italic = rpr.get("i") in ("1", "true") if rpr.get("i") is not None else base.italic
+        color = self.fill(rpr) or base.color
+        font = base.font
+        for tag in ("a:ea", "a:latin"):
+            typeface = rpr.find(qn(tag))
+            if typeface is not None and not typeface.get("typeface", "+").startswith("+"):
+                font = typeface.get("typeface")
+                break
+        return TextStyle(size, bold, color, font, italic)
+
+    def text_frame(self, tx_body, default_color) -> Optional[TextFrame]:
+        if tx_body is None:
+            return None
+        base = TextStyle(18, False, default_color, DEFAULT_FONT)
+        paragraphs = []
+        has_text = False
+        for p in tx_body.iter(qn("a:p")):
+            ppr = p.find(qn("a:pPr"))
+            style = self.run_style(ppr.find(qn("a:defRPr")) if ppr is not None else None, base)
+            align = _ALIGN.get(ppr.get("algn")) if ppr is not None else None
+            runs = []
+            for child in p:
+                if child.tag in (qn("a:r"), qn("a:fld")):
+                    text = child.findtext(qn("a:t")) or ""
+                    has_text = has_text or bool(text)
+                    runs.append(Run(text, self.run_style(child.find(qn("a:rPr")), style)))
+                elif child.tag == qn("a:br"):
+                    if runs:
+                        runs[-1] = Run(runs[-1].text + "\n", runs[-1].style)
+                    else:
+                        runs.append(Run("\n", style))
+            if not runs:
+                runs.append(Run("", style))  # 空段落仍佔一行高度
+            paragraphs.append(Paragraph(tuple(runs), align))
+        if not has_text:
+            return None
+
+        body_pr = tx_body.find(qn("a:bodyPr"))
+        wrap = anchor = margins = None
+        if body_pr is not None:
+            if body_pr.get("wrap") is not None:
+                wrap = body_pr.get("wrap") != "none"
+            anchor = _ANCHOR.get(body_pr.get("anchor"))
+            insets = [body_pr.get(name) for name in ("lIns", "rIns", "tIns", "bIns")]
+            if any(value is not None for value in insets):
+                margins = tuple(_pt(value if value is not None else default)
+                                for value, default in zip(insets, _DEFAULT_INSETS))
+        return TextFrame(tuple(paragraphs), wrap, anchor, margins)
+
+    # ------------------------------------------------------------------
+    # 形狀
+    # ------------------------------------------------------------------
+
+    def add_tree(self, scene, tree, transform):
+        for element in tree:
+            tag = element.tag
+            if tag == qn("p:sp"):
+                self.add_sp(scene, element, transform)
+            elif tag == qn("p:cxnSp"):
+                self.add_connector(scene, element, transform)
+            elif tag == qn("p:grpSp"):
+                self.add_group(scene, element, transform)
+            elif tag == qn("p:graphicFrame"):
+                self.add_graphic_frame(scene, element, transform)
+            elif tag == qn("p:pic"):
+                box = _box(element.find(qn("p:spPr")), transform)
+                if box is not None:
+                    scene.add(ShapeNode("RECTANGLE", *box, fill=_PICTURE_FILL, line=_PICTURE_LINE,
+                                        line_width=0.75))
+
+    def add_sp(self, scene, sp, transform):
+        sp_pr = sp.find(qn("p:spPr"))
+        box = _box(sp_pr, transform)
+        if box is None:
+            return  # 沿用版面配置區位置的 placeholder，預覽不處理
+        style = sp.find(qn("p:style"))
+        is_textbox = sp.find(qn("p:nvSpPr") + "/" + qn("p:cNvSpPr")).get("txBox") == "1"
+        font_ref = style.find(qn("a:fontRef")) if style is not None else None
+        text_color = (self.color(font_ref[0]) if font_ref is not None and len(font_ref)
+                      else self.theme["dk1"])
+        text = self.text_frame(sp.find(qn("p:txBody")), text_color)
+
+        cust_geom = sp_pr.find(qn("a:custGeom"))
+        if cust_geom is not None:
+            fill = self.fill(sp_pr, style)
+            line, width, dash, _, _ = self.line(sp_pr, style)
+            for points, closed in _cust_paths(cust_geom, box):
+                scene.add(PathNode(points, closed, fill, line, width, dash))
+            if text is not None:
+                scene.add(ShapeNode("TEXTBOX", *box, text=text))
+            return
+
+        prst = sp_pr.find(qn("a:prstGeom"))
+        geom = _GEOM_BY_PRST.get(prst.get("prst") if prst is not None else "rect", "RECTANGLE")
+        fill = self.fill(sp_pr, style)
+        line, width, dash, _, _ = self.line(sp_pr, style)
+        if is_textbox and fill is None and line is None:
+            if text is not None:
+                scene.add(ShapeNode("TEXTBOX", *box, text=text))
+            return
+        if is_textbox and text is not None and text.word_wrap is None:
+            text = text._replace(word_wrap=False)
+        scene.add(ShapeNode(geom, *box, fill=fill, line=line, line_width=width, dash=dash, text=text))
+
+    def add_connector(self, scene, cxn, transform):
+        sp_pr = cxn.find(qn("p:spPr"))
+        box = _box(sp_pr, transform)
+        if box is None:
+            return
+        x, y, w, h = box
+        xfrm = sp_pr.find(qn("a:xfrm"))
+        x1, x2 = (x + w, x) if xfrm.get("flipH") == "1" else (x, x + w)
+        y1, y2 = (y + h, y) if xfrm.get("flipV") == "1" else (y, y + h)
+        color, width, dash, begin, end = self.line(sp_pr, cxn.find(qn("p:style")))
+        if color is not None:
+            scene.connector(x1, y1, x2, y2, color=color, width=width or 0.75, dash=dash,
+                            begin_arrow=begin, end_arrow=end)
+
+    def add_group(self, scene, grp, transform):
+        xfrm = grp.find(qn("p:grpSpPr") + "/" + qn("a:xfrm"))
+        if xfrm is None:
+            self.add_tree(scene, grp, transform)
+            return
+        off, ext = xfrm.find(qn("a:off")), xfrm.find(qn("a:ext"))
+        ch_off, ch_ext = xfrm.find(qn("a:chOff")), xfrm.find(qn("a:chExt"))
+        ox, oy = transform(_pt(off.get("x")), _pt(off.get("y")))
+        sx = sy = 1.0
+        cx = cy = 0.0
+        if ch_off is not None and ch_ext is not None:
+            cx, cy = _pt(ch_off.get("x")), _pt(ch_off.get("y"))
+            if int(ch_ext.get("cx")):
+                sx = int(ext.get("cx")) / int(ch_ext.get("cx"))
+            if int(ch_ext.get("cy")):
+                sy = int(ext.get("cy")) / int(ch_ext.get("cy"))
+        outer_scale = getattr(transform, "scale", (1.0, 1.0))
+        scale = (outer_scale[0] * sx, outer_scale[1] * sy)
+
+        def inner(px, py):
+            return ox + (px - cx) * scale[0], oy + (py - cy) * scale[1]
+
+        inner.scale = scale
+        self.add_tree(scene, grp, inner)
+
+    def add_graphic_frame(self, scene, frame, transform):
+        xfrm = frame.find(qn("p:xfrm"))
+        box = _box_from_xfrm(xfrm, transform)
+        if box is None:
+            return
+        data = frame.find(".//" + qn("a:graphicData"))
+        uri = data.get("uri") if data is not None else None
+        if uri == _URI_TABLE:
+            self.add_table(scene, data.find(qn("a:tbl")), box)
+        elif uri == _URI_CHART:
+            chart_ref = data[0] if len(data) else None
+            if chart_ref is not None and chart_ref.get(_R_ID):
+                self.add_chart(scene, chart_ref.get(_R_ID), box)
+
+    def add_table(self, scene, tbl, box):
+        x, y, w, h = box
+        col_widths = [_pt(col.get("w")) for col in tbl.iter(qn("a:gridCol"))]
+        rows, heights = [], []
+        border = None
+        for tr in tbl.iter(qn("a:tr")):
+            cells = []
+            for tc in tr.iter(qn("a:tc")):
+                tc_pr = tc.find(qn("a:tcPr"))
+                if border is None and tc_pr is not None:
+                    ln = tc_pr.find(qn("a:lnB"))
+                    border = self.fill(ln) if ln is not None else None
+                text = self.text_frame(tc.find(qn("a:txBody")), self.theme["dk1"])
+                if text is None:
+                    text = TextFrame(())
+                margins = None
+                if tc_pr is not None:
+                    insets = [tc_pr.get(name) for name in ("marL", "marR", "marT", "marB")]
+                    if any(value is not None for value in insets):
+                        margins = tuple(_pt(value if value is not None else default)
+                                        for value, default in zip(insets, _DEFAULT_INSETS))
+                    anchor = _ANCHOR.get(tc_pr.get("anchor"))
+                    text = text._replace(word_wrap=True, anchor=anchor or "top", margins=margins)
+                cells.append(TableCell(text, self.fill(tc_pr)))
+            rows.append(cells)
+            heights.append(_pt(tr.get("h")))
+        if rows:
+            scene.add(TableNode(x, y, w, sum(heights), rows, col_widths, heights, border=border))
+
+    def add_chart(self, scene, r_id, box):
+        try:
+            chart = self.slide.part.related_part(r_id).chart
+        except (KeyError, AttributeError):
+            return
+        x, y, w, h = box
+        title = ""
+        if chart.has_title and chart.chart_title.has_text_frame:
+            title = chart.chart_title.text_frame.text
+        plot = chart.plots[0] if len(chart.plots) else None
+        if plot is None:
+            return
+        style = self.chart_style(chart._chartSpace)
+        categories = [str(c) for c in plot.categories]
+        chart_type = str(chart.chart_type)
+        line = "LINE" in chart_type or "RADAR" in chart_type or "XY" in chart_type
+        series = []
+        for s in plot.series:
+            item = {"name": s.name, "values": list(s.values)}
+            color = self.series_color(s._element, line)
+            if color is not None:
+                item["color"] = color
+            series.append(item)
+        if "PIE" in chart_type or "DOUGHNUT" in chart_type:
+            values = series[0]["values"] if series else []
+            colors = self.point_colors(plot.series[0]._element) if series else {}
+            data = [{"name": c, "value": v or 0} for c, v in zip(categories, values)]
+            for i, item in enumerate(data):
+                color = colors.get(i, series[0].get("color"))
+                if color is not None:
+                    item["color"] = color
+            scene.extend(pie_chart(x, y, w, h, title, data, style))
+        elif "BAR" in chart_type or "COLUMN" in chart_type:
+            scene.extend(bar_chart(x, y, w, h, title, categories, series, style, stacked="STACKED" in chart_type))
+        else:
+            scene.extend(line_chart(x, y, w, h, title, categories, series, style))
+
+    def chart_style(self, chart_space) -> ChartStyle:
+        """
+        圖表的文字樣式：c:chartSpace/c:txPr 的顏色與字型套用到座標軸與圖例文字，
+        c:title 的 defRPr / rPr 套用到標題
+
+        座標軸與圖例維持 ChartStyle 的字級（預覽圖表比原生圖表小，原生預設的 18 pt 會擠滿繪圖區）。
+        """
+        default = DEFAULT_CHART_STYLE
+        shared = chart_space.find(f"{qn('c:txPr')}//{qn('a:defRPr')}")
+        label = self.run_style(shared, default.label)._replace(size=default.label.size, bold=default.label.bold)
+        title = default.title._replace(color=self.fill(shared) or default.title.color)
+        element = chart_space.find(f"{qn('c:chart')}/{qn('c:title')}")
+        if element is not None:
+            for rpr in (element.find(f".//{qn('a:defRPr')}"), element.find(f".//{qn('a:r')}/{qn('a:rPr')}")):
+                title = self.run_style(rpr, title)
+        return default._replace(title=title, label=label)
+
+    def series_color(self, ser, line: bool):
+        """數列 c:spPr 的顏色（折線取線條色、其他取填充色；沒有指定時回傳 None）"""
+        sp_pr = ser.find(qn("c:spPr"))
+        if sp_pr is None:
+            return None
+        if line:
+            ln = sp_pr.find(qn("a:ln"))
+            return self.fill(ln) if ln is not None else None
+        return self.fill(sp_pr)
+
+    def point_colors(self, ser) -> Dict[int, tuple]:
+        """c:dPt 個別資料點的填充色 {索引: 顏色}（圓餅圖的扇形）"""
+        colors = {}
+        for point in ser.iter(qn("c:dPt")):
+            idx = point.find(qn("c:idx"))
+            color = self.fill(point.find(qn("c:spPr")))
+            if idx is not None and color is not None:
+                colors[int(idx.get("val"))] = color
+        return colors
+
+
+def _modify(rgb, element):
+    """套用 DrawingML 的顏色修飾（lumMod / lumOff / shade / tint）"""
+    if not len(element):
+        return rgb
+    r, g, b = (c / 255 for c in rgb)
+    for mod in element:
+        name = mod.tag.rsplit("}", 1)[-1]
+        value = int(mod.get("val", "100000")) / 100000
+        if name in ("lumMod", "lumOff"):
+            h, l, s = colorsys.rgb_to_hls(r, g, b)
+            l = min(1.0, l * value) if name == "lumMod" else min(1.0, l + value)
+            r, g, b = colorsys.hls_to_rgb(h, l, s)
+        elif name == "shade":
+            r, g, b = r * value, g * value, b * value
+        elif name == "tint":
+            r, g, b = (1 - (1 - c) * value for c in (r, g, b))
+    return tuple(max(0, min(255, int(round(c * 255)))) for c in (r, g, b))
+
+
+def _identity(px, py):
+    return px, py
+
+
+_identity.scale = (1.0, 1.0)
+
+
+def _box_from_xfrm(xfrm, transform):
+    if xfrm is None:
+        return None
+    off, ext = xfrm.find(qn("a:off")), xfrm.find(qn("a:ext"))
+    if off is None or ext is None:
+        return None
+    x, y = transform(_pt(off.get("x")), _pt(off.get("y")))
+    sx, sy = transform.scale
+    return x, y, _pt(ext.get("cx")) * sx, _pt(ext.get("cy")) * sy
+
+
+def _box(sp_pr, transform):
+    return _box_from_xfrm(sp_pr.find(qn("a:xfrm")) if sp_pr is not None else None, transform)
+
+
+def _cust_paths(cust_geom, box):
+    """custGeom 的 moveTo / lnTo 路徑 → [(points, closed)]（曲線以端點近似）"""
+    x, y, w, h = box
+    out = []
+    for path in cust_geom.iter(qn("a:path")):
+        pw = int(path.get("w", "0")) or 1
+        ph = int(path.get("h", "0")) or 1
+        points, closed = [], False
+        for command in path:
+            name = command.tag.rsplit("}", 1)[-1]
+            if name == "close":
+                closed = True
+                continue
+            for pt in command.iter(qn("a:pt")):
+                points.append((x + int(pt.get("x")) / pw * w, y + int(pt.get("y")) / ph * h))
+        if len(points) >= 2:
+            out.append((points, closed))
+    return out
+
+
+def slide_background(slide):
+    """投影片背景色（p:bg 的單色填充；沒有設定時回傳白色）"""
+    importer = _Importer(slide)
+    bg_pr = slide._element.find(qn("p:cSld") + "/" + qn("p:bg") + "/" + qn("p:bgPr"))
+    return (importer.fill(bg_pr) if bg_pr is not None else None) or (255, 255, 255)
+
+
+def slide_to_scene(slide) -> Scene:
+    """
+    將 python-pptx 投影片的形狀樹轉為 Scene（單位 pt）
+
+    Args:
+        slide: python-pptx Slide
+
+    Returns:
+        Scene
+    """
+    scene = Scene(unit="pt")
+    _Importer(slide).add_tree(scene, slide.shapes._spTree, _identity)
+    return scene
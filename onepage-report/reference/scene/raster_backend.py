@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""
+Scene graph → 點陣圖（Pillow）
+
+不經過 SVG 與 cairosvg，直接把節點畫到 Pillow Image，可用於 PNG 圖表、
+投影片縮圖與視覺比對。版面（折行、對齊、箭頭幾何）與 svg_backend 共用同一套計算，
+兩種輸出的位置一致。
+
+字型依 TextStyle.font 對應到系統字型檔（FONT_FILES），找不到時依序嘗試
+FALLBACK_FONTS；也可用環境變數 ONEPAGE_FONT 指定一個字型檔覆蓋全部。
+字型物件依 (檔案, 像素大小) 快取，同一程序內只載入一次。
+
+Pillow 的多邊形沒有反鋸齒，預設以 2 倍解析度繪製後縮小（supersample）。
+縮圖中小到無法閱讀的文字（greek_below）只畫成淡色橫條，省去字形點陣化。
+"""
+
+import math
+import os
+from functools import lru_cache
+
+from modules._textfit import _text_width
+
+from .svg_backend import ROUNDED_RADIUS, layout_text, outline_points
+
+# 字型名稱 → 候選字型檔（一般, 粗體）
+FONT_FILES = {
+    "Microsoft JhengHei": [
+        ("C:/Windows/Fonts/msjh.ttc", "C:/Windows/Fonts/msjhbd.ttc"),
+        ("/System/Library/Fonts/PingFang.ttc", "/System/Library/Fonts/PingFang.ttc"),
+        ("/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+         "/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc"),
+        ("/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
+         "/usr/share/fonts/noto-cjk/NotoSansCJK-Bold.ttc"),
+        ("/usr/share/fonts/truetype/wqy/wqy-microhei.ttc", "/usr/share/fonts/truetype/wqy/wqy-microhei.ttc"),
+    ],
+    "Consolas": [
+        ("C:/Windows/Fonts/consola.ttf", "C:/Windows/Fonts/consolab.ttf"),
+        ("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
+         "/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf"),
+    ],
+}
+
+FALLBACK_FONTS = [
+    ("C:/Windows/Fonts/msjh.ttc", "C:/Windows/Fonts/msjhbd.ttc"),
+    ("/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+     "/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc"),
+    ("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"),
+    ("C:/Windows/Fonts/arial.ttf", "C:/Windows/Fonts/arialbd.ttf"),
+]
+
+# 虛線樣式 → (線段, 間隔)，單位為線寬倍數
+_DASH = {2: (1, 1), 3: (0.5, 1.5), 4: (4, 2), 5: (4, 2), 6: (4, 2), 7: (8, 3)}
+
+
+@lru_cache(maxsize=None)
+def _font_file(name: str, bold: bool):
+    override = os.environ.get("ONEPAGE_FONT")
+    if override:
+        return override
+    for regular, bold_file in FONT_FILES.get(name, []) + FALLBACK_FONTS:
+        path = bold_file if bold else regular
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@lru_cache(maxsize=256)
+def get_font(name: str, size_px: int, bold: bool = False):
+    """
+    取得 Pillow 字型（依字型檔與像素大小快取）
+
+    Args:
+        name: 字型名稱（TextStyle.font）
+        size_px: 像素大小
+        bold: 是否粗體
+
+    Returns:
+        PIL.ImageFont.FreeTypeFont
+    """
+    from PIL import ImageFont
+
+    path = _font_file(name, bold)
+    if path is not None:
+        return ImageFont.truetype(path, size_px)
+    try:
+        return ImageFont.load_default(size_px)
+    except TypeError:  # Pillow < 10.1 的預設字型不能指定大小
+        return ImageFont.load_default()
+
+
+class _Canvas:
+    """以 pt 座標繪圖（內部換算為像素）"""
+
+    def __init__(self, image, scale: float, greek_px: float = 0.0):
+        from PIL import ImageDraw
+
+        self.image = image
+        self.draw = ImageDraw.Draw(image)
+        self.scale = scale
+        self.greek_px = greek_px
+
+    def px(self, value: float) -> float:
+        return value * self.scale
+
+    def width(self, line_width) -> int:
+        return max(1, int(round((line_width if line_width is not None else 0.75) * self.scale)))
+
+    def box(self, x, y, w, h):
+        s = self.scale
+        x0, y0 = x * s, y * s
+        return [x0, y0, max(x0, (x + w) * s - 1), max(y0, (y + h) * s - 1)]
+
+    def points(self, points):
+        s = self.scale
+        return [(px * s, py * s) for px, py in points]
+
+    def dashed(self, points, color, width: int, dash, closed=False):
+        """以線段模擬虛線（Pillow 沒有 dash 樣式）"""
+        on, off = _DASH.get(dash, (1, 0))
+        on, off = on * width * 2, off * width * 2
+        if closed:
+            points = list(points) + [points[0]]
+        if not off:
+            self.draw.line(points, fill=color, width=width, joint="curve")
+            return
+        phase = 0.0
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            length = math.hypot(x2 - x1, y2 - y1)
+            pos = 0.0
+            while pos < length:
+                period_pos = (phase + pos) % (on + off)
+                step = (on - period_pos) if period_pos < on else (on + off - period_pos)
+                end = min(length, pos + step)
+                if period_pos < on:
+                    a, b = pos / length, end / length
+                    self.draw.line([(x1 + (x2 - x1) * a, y1 + (y2 - y1) * a),
+                                    (x1 + (x2 - x1) * b, y1 + (y2 - y1) * b)], fill=color, width=width)
+                pos = end
+            phase = (phase + length) % (on + off)
+
+
+def _outline(canvas, node):
+    x, y, w, h = node.x, node.y, node.w, node.h
+    points = outline_points(node)
+    if points is None:
+        points = [(x, y), (x + w, y), (x + w, y + h), (x, y + h)]
+    return canvas.points(points)
+
+
+def _raster_shape(canvas, node):
+    draw = canvas.draw
+    if node.geom != "TEXTBOX" and (node.fill is not None or node.line is not None):
+        width = canvas.width(node.line_width) if node.line is not None else 0
+        solid_line = node.line if node.dash in (None, 1) else None
+        box = canvas.box(node.x, node.y, node.w, node.h)
+        if node.geom == "RECTANGLE":
+            draw.rectangle(box, fill=node.fill, outline=solid_line, width=width)
+        elif node.geom == "ROUNDED_RECTANGLE":
+            radius = canvas.px(max(0.0, min(node.w, node.h)) * ROUNDED_RADIUS)
+            draw.rounded_rectangle(box, radius, fill=node.fill, outline=solid_line, width=width)
+        elif node.geom == "OVAL":
+            draw.ellipse(box, fill=node.fill, outline=solid_line, width=width)
+        else:
+            points = _outline(canvas, node)
+            draw.polygon(points, fill=node.fill)
+            if solid_line is not None:
+                draw.line(points + [points[0]], fill=solid_line, width=width, joint="curve")
+        if node.line is not None and solid_line is None:
+            canvas.dashed(_outline(canvas, node), node.line, width, node.dash, closed=True)
+    if node.text is not None:
+        _raster_text(canvas, node.text, node.x, node.y, node.w, node.h, node.geom == "TEXTBOX")
+
+
+def _greek_line(canvas, tx, baseline, align, runs):
+    """字小到無法辨識時，以淡色橫條代表一行文字（縮圖用，不需點陣化字形）"""
+    widths = [_text_width(text, style.size, style.bold) for text, style in runs]
+    total = sum(widths)
+    left = tx - total / 2 if align == "center" else (tx - total if align == "right" else tx)
+    for (text, style), width in zip(runs, widths):
+        if text.strip():
+            color = tuple((c + 255 * 2) // 3 for c in style.color)  # 與白色混合，接近縮小後的字色
+            canvas.draw.rectangle(canvas.box(left, baseline - style.size * 0.7, width, style.size * 0.6),
+                                  fill=color)
+        left += width
+
+
+def _raster_text(canvas, frame, x, y, w, h, is_textbox):
+    draw = canvas.draw
+    for tx, baseline, align, runs in layout_text(frame, x, y, w, h, is_textbox):
+        if canvas.px(max(style.size for _, style in runs)) < canvas.greek_px:
+            _greek_line(canvas, tx, baseline, align, runs)
+            continue
+        fonts = [get_font(style.font, max(1, int(round(canvas.px(style.size)))), style.bold)
+                 for _, style in runs]
+        widths = [font.getlength(text) for (text, _), font in zip(runs, fonts)]
+        total = sum(widths)
+        cursor = canvas.px(tx)
+        if align == "center":
+            cursor -= total / 2
+        elif align == "right":
+            cursor -= total
+        by = canvas.px(baseline)
+        for (text, style), font, width in zip(runs, fonts, widths):
+            draw.text((cursor, by), text, font=font, fill=tuple(style.color), anchor="ls")
+            cursor += width
+
+
+def _arrowhead(canvas, tip, tail, color, width):
+    (x2, y2), (x1, y1) = tip, tail
+    angle = math.atan2(y2 - y1, x2 - x1)
+    size = max(width * 3, canvas.px(4))
+    left = (x2 - size * math.cos(angle - 0.45), y2 - size * math.sin(angle - 0.45))
+    right = (x2 - size * math.cos(angle + 0.45), y2 - size * math.sin(angle + 0.45))
+    canvas.draw.polygon([(x2, y2), left, right], fill=color)
+
+
+def _raster_connector(canvas, node):
+    width = canvas.width(node.width)
+    start, end = canvas.points([(node.x1, node.y1), (node.x2, node.y2)])
+    canvas.dashed([start, end], node.color, width, node.dash)
+    if node.end_arrow:
+        _arrowhead(canvas, end, start, node.color, width)
+    if node.begin_arrow:
+        _arrowhead(canvas, start, end, node.color, width)
+
+
+def _raster_path(canvas, node):
+    points = canvas.points(node.points)
+    if node.closed and node.fill is not None:
+        canvas.draw.polygon(points, fill=node.fill)
+    if node.line is not None:
+        canvas.dashed(points, node.line, canvas.width(node.line_width), node.dash, closed=node.closed)
+
+
+def _raster_table(canvas, node):
+    cy = node.y
+    for row, row_h in zip(node.rows, node.row_heights):
+        cx = node.x
+        for cell, col_w in zip(row, node.col_widths):
+            canvas.draw.rectangle(canvas.box(cx, cy, col_w, row_h), fill=cell.fill,
+                                  outline=node.border, width=canvas.width(0.5) if node.border else 0)
+            _raster_text(canvas, cell.text, cx, cy, col_w, row_h, is_textbox=False)
+            cx += col_w
+        cy += row_h
+
+
+_RENDER = {
+    "shape": _raster_shape,
+    "connector": _raster_connector,
+    "path": _raster_path,
+    "table": _raster_table,
+}
+
+
+def scene_to_image(scene, width: float = 960, height: float = 540, scale: float = 1.0,
+                   background=(255, 255, 255), supersample: int = 2, greek_below: float = 4.0):
+    """
+    將 scene 畫成 Pillow Image
+
+    Args:
+        scene: Scene 物件
+        width, height: 畫布大小（pt）
+        scale: 每 pt 的像素數（1.0 = 96 dpi 的 0.75 倍；2.0 適合高解析度圖表）
+        background: 背景色 (r, g, b)，None 為透明（RGBA）
+        supersample: 反鋸齒倍數（1 = 不做，速度最快）
+        greek_below: 輸出字高小於此像素數的文字畫成橫條（0 = 一律畫字形）
+
+    Returns:
+        PIL.Image.Image
+    """
+    from PIL import Image
+
+    supersample = max(1, int(supersample))
+    size = (max(1, int(round(width * scale))), max(1, int(round(height * scale))))
+    big = (size[0] * supersample, size[1] * supersample)
+    if background is None:
+        image = Image.new("RGBA", big, (255, 255, 255, 0))
+    else:
+        image = Image.new("RGB", big, tuple(background))
+    canvas = _Canvas(image, scale * supersample, greek_below * supersample)
+    for node in scene:
+        _RENDER[node.kind](canvas, node)
+    if supersample > 1:
+        image = image.reduce(supersample)
+    return image
+
+
+def save_png(scene, path: str, width: float = 960, height: float = 540, scale: float = 1.0,
+             background=(255, 255, 255), supersample: int = 2, greek_below: float = 4.0) -> str:
+    """將 scene 寫成 PNG 檔案，回傳路徑"""
+    scene_to_image(scene, width, height, scale, background, supersample, greek_below).save(path, "PNG")
+    return path
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+Scene graph → SVG
+
+不需要 PowerPoint 或 python-pptx，可用於預覽、diff 或網頁輸出。
+幾何與文字折行近似 PowerPoint 預設值（圓角 16.7%、文字框內邊距 7.2/3.6 pt），
+折行使用 modules._textfit.wrap_lines，與 auto-fit 的估算一致。
+layout_text / outline_points 也供 raster_backend 使用，兩者的版面相同。
+"""
+
+from xml.sax.saxutils import escape
+
+from modules._textfit import LINE_SPACING, PPTX_TEXTBOX_MARGINS, wrap_lines
+
+# 圓角矩形的圓角半徑（短邊的比例，PowerPoint 預設 adj = 16667）
+ROUNDED_RADIUS = 0.16667
+
+_DASH = {2: "2,2", 3: "1,2", 4: "6,3", 5: "6,3,1,3", 6: "6,3,1,3,1,3", 7: "10,4"}
+_TEXT_ANCHOR = {"left": "start", "center": "middle", "right": "end", None: "start"}
+
+
+def _hex(color) -> str:
+    return "#%02X%02X%02X" % tuple(color)
+
+
+def _stroke_attrs(color, width, dash) -> str:
+    if color is None:
+        return 'stroke="none"'
+    attrs = f'stroke="{_hex(color)}" stroke-width="{width if width is not None else 0.75:.2f}"'
+    if dash in _DASH:
+        attrs += f' stroke-dasharray="{_DASH[dash]}"'
+    return attrs
+
+
+def outline_points(node):
+    """
+    非矩形 / 橢圓幾何的多邊形頂點（pt）；SVG 與點陣 backend 共用
+
+    Returns:
+        list: [(x, y), ...]；RECTANGLE / ROUNDED_RECTANGLE / OVAL / TEXTBOX 回傳 None
+    """
+    x, y, w, h = node.x, node.y, node.w, node.h
+    if node.geom in ("RECTANGLE", "ROUNDED_RECTANGLE", "OVAL", "TEXTBOX"):
+        return None
+    if node.geom == "DIAMOND":
+        return [(x + w / 2, y), (x + w, y + h / 2), (x + w / 2, y + h), (x, y + h / 2)]
+    if node.geom == "CHEVRON":
+        d = min(w, h) * 0.5
+        return [(x, y), (x + w - d, y), (x + w, y + h / 2), (x + w - d, y + h), (x, y + h), (x + d, y + h / 2)]
+    if node.geom == "ISOSCELES_TRIANGLE":
+        return [(x + w / 2, y), (x + w, y + h), (x, y + h)]
+    # 方塊箭頭：以右箭頭為基準旋轉
+    horizontal = node.geom in ("RIGHT_ARROW", "LEFT_ARROW")
+    length, thick = (w, h) if horizontal else (h, w)
+    head = min(length, min(w, h) * 0.5)
+    shaft = thick * 0.25
+    base = [(0, shaft), (length - head, shaft), (length - head, 0), (length, thick / 2),
+            (length - head, thick), (length - head, thick - shaft), (0, thick - shaft)]
+    if node.geom == "RIGHT_ARROW":
+        return [(x + a, y + b) for a, b in base]
+    if node.geom == "LEFT_ARROW":
+        return [(x + w - a, y + b) for a, b in base]
+    if node.geom == "DOWN_ARROW":
+        return [(x + b, y + a) for a, b in base]
+    return [(x + b, y + h - a) for a, b in base]
+
+
+def _geometry(node, paint: str) -> str:
+    x, y, w, h = node.x, node.y, node.w, node.h
+    if node.geom == "RECTANGLE":
+        return f'<rect x="{x:.2f}" y="{y:.2f}" width="{w:.2f}" height="{h:.2f}" {paint}/>'
+    if node.geom == "ROUNDED_RECTANGLE":
+        r = min(w, h) * ROUNDED_RADIUS
+        return (f'<rect x="{x:.2f}" y="{y:.2f}" width="{w:.2f}" height="{h:.2f}" '
+                f'rx="{r:.2f}" {paint}/>')
+    if node.geom == "OVAL":
+        return (f'<ellipse cx="{x + w / 2:.2f}" cy="{y + h / 2:.2f}" rx="{w / 2:.2f}" '
+                f'ry="{h / 2:.2f}" {paint}/>')
+    coords = " ".join(f"{px:.2f},{py:.2f}" for px, py in outline_points(node))
+    return f'<polygon points="{coords}" {paint}/>'
+
+
+def _tspan(text, style) -> str:
+    attrs = (f'font-size="{style.size}" font-family="{escape(style.font)}" '
+             f'fill="{_hex(style.color)}"')
+    if style.bold:
+        attrs += ' font-weight="bold"'
+    if style.italic:
+        attrs += ' font-style="italic"'
+    return f"<tspan {attrs}>{escape(text)}</tspan>"
+
+
+def layout_text(frame, x, y, w, h, is_textbox):
+    """
+    將 TextFrame 排成逐行位置；SVG 與點陣 backend 共用
+
+    Returns:
+        list: [(tx, baseline, align, [(text, TextStyle), ...]), ...]，
+              tx 為對齊基準點（靠左 = 左緣、置中 = 中心、靠右 = 右緣）
+    """
+    left, right, top, bottom = frame.margins or PPTX_TEXTBOX_MARGINS
+    inner_w = max(w - left - right, 1)
+    wrap = frame.word_wrap if frame.word_wrap is not None else not is_textbox
+    anchor = frame.anchor or ("top" if is_textbox else "middle")
+
+    lines = []  # [(runs, align, line_height)]
+    for paragraph in frame.paragraphs:
+        if not paragraph.runs:
+            continue
+        size = max(run.style.size for run in paragraph.runs)
+        if len(paragraph.runs) == 1:
+            run = paragraph.runs[0]
+            texts = (wrap_lines(run.text, inner_w, run.style.size, run.style.bold) if wrap
+                     else run.text.split("\n"))
+            for text in texts:
+                lines.append(([(text, run.style)], paragraph.align, size * LINE_SPACING))
+        else:
+            lines.append(([(run.text.replace("\n", " "), run.style) for run in paragraph.runs],
+                          paragraph.align, size * LINE_SPACING))
+        if paragraph.space_after:
+            lines.append(([], None, paragraph.space_after))
+
+    total = sum(line[2] for line in lines)
+    if anchor == "middle":
+        cursor = y + top + (h - top - bottom - total) / 2
+    elif anchor == "bottom":
+        cursor = y + h - bottom - total
+    else:
+        cursor = y + top
+
+    out = []
+    for runs, align, line_height in lines:
+        cursor += line_height
+        if not runs:
+            continue
+        if align == "center":
+            tx = x + left + inner_w / 2
+        elif align == "right":
+            tx = x + w - right
+        else:
+            tx = x + left
+        # 基線約在行高的 80% 處
+        out.append((tx, cursor - line_height * 0.2, align, runs))
+    return out
+
+
+def _text(frame, x, y, w, h, is_textbox) -> str:
+    """將 TextFrame 排成 <text> 元素（每個 run 一個 tspan）"""
+    return "".join(
+        f'<text x="{tx:.2f}" y="{baseline:.2f}" text-anchor="{_TEXT_ANCHOR[align]}">'
+        + "".join(_tspan(text, style) for text, style in runs) + "</text>"
+        for tx, baseline, align, runs in layout_text(frame, x, y, w, h, is_textbox)
+    )
+
+
+def _svg_shape(node) -> str:
+    parts = []
+    is_textbox = node.geom == "TEXTBOX"
+    if not is_textbox:
+        fill = f'fill="{_hex(node.fill)}"' if node.fill is not None else 'fill="none"'
+        parts.append(_geometry(node, f"{fill} {_stroke_attrs(node.line, node.line_width, node.dash)}"))
+    if node.text is not None:
+        parts.append(_text(node.text, node.x, node.y, node.w, node.h, is_textbox))
+    return "".join(parts)
+
+
+def _svg_connector(node) -> str:
+    markers = ""
+    if node.end_arrow:
+        markers += ' marker-end="url(#arrow)"'
+    if node.begin_arrow:
+        markers += ' marker-start="url(#arrow)"'
+    return (f'<line x1="{node.x1:.2f}" y1="{node.y1:.2f}" x2="{node.x2:.2f}" y2="{node.y2:.2f}" '
+            f'{_stroke_attrs(node.color, node.width, node.dash)} '
+            f'style="color:{_hex(node.color)}"{markers}/>')
+
+
+def _svg_path(node) -> str:
+    coords = " ".join(f"{px:.2f},{py:.2f}" for px, py in node.points)
+    stroke = _stroke_attrs(node.line, node.line_width, node.dash)
+    if node.closed:
+        fill = _hex(node.fill) if node.fill is not None else "none"
+        return f'<polygon points="{coords}" fill="{fill}" {stroke}/>'
+    return f'<polyline points="{coords}" fill="none" {stroke} stroke-linejoin="round"/>'
+
+
+def _svg_table(node) -> str:
+    parts = []
+    cy = node.y
+    for row, row_h in zip(node.rows, node.row_heights):
+        cx = node.x
+        for cell, col_w in zip(row, node.col_widths):
+            fill = _hex(cell.fill) if cell.fill is not None else "none"
+            parts.append(f'<rect x="{cx:.2f}" y="{cy:.2f}" width="{col_w:.2f}" height="{row_h:.2f}" '
+                         f'fill="{fill}" {_stroke_attrs(node.border, 0.5, None)}/>')
+            parts.append(_text(cell.text, cx, cy, col_w, row_h, is_textbox=False))
+            cx += col_w
+        cy += row_h
+    return "".join(parts)
+
+
+_RENDER = {
+    "shape": _svg_shape,
+    "connector": _svg_connector,
+    "path": _svg_path,
+    "table": _svg_table,
+}
+
+
+def scene_to_svg(scene, width: float = 960, height: float = 540, background=None) -> str:
+    """
+    將 scene 轉為 SVG 字串
+
+    Args:
+        scene: Scene 物件
+        width, height: 畫布大小（pt，預設 16:9 投影片）
+        background: 背景色 (r, g, b)，None 為透明
+
+    Returns:
+        str: SVG 文件
+    """
+    body = []
+    if background is not None:
+        body.append(f'<rect width="100%" height="100%" fill="{_hex(background)}"/>')
+    body.extend(_RENDER[node.kind](node) for node in scene)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}pt" height="{height}pt" '
+        f'viewBox="0 0 {width} {height}">'
+        '<defs><marker id="arrow" viewBox="0 0 10 10" refX="9" refY="5" markerWidth="6" '
+        'markerHeight="6" orient="auto-start-reverse"><path d="M0,0 L10,5 L0,10 z" '
+        'fill="context-stroke"/></marker></defs>'
+        + "".join(body) + "</svg>"
+    )
+
+
+def save_svg(scene, path: str, width: float = 960, height: float = 540, background=None) -> str:
+    """將 scene 寫成 SVG 檔案，回傳路徑"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(scene_to_svg(scene, width, height, background))
+    return path
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+大型表格：量測列高、分頁、交替底色
+
+Phase 2 從 datasheet 擷取的表格常有上百列。這裡把表格一次建成原生 TableNode
+（python-pptx / OOXML 會一次輸出整份 a:tbl XML，COM 為單一 Table shape），
+不再每格各畫一個矩形加一個文字框。
+
+rows 可以是任意 iterable（例如 generator），分頁時逐列讀取，不需先載入整份資料；
+放不下的列自動移到續頁，每頁重複表頭。
+
+使用範例：
+    from scene import Scene, paginate_table, flush_pptx
+
+    for page in paginate_table(headers, rows, x=36, y=80, w=888, h=420,
+                               next_height=460):
+        slide = ...  # 第 1 頁用原投影片，之後新增續頁
+        scene = Scene(unit="pt")
+        scene.add(page.node)
+        flush_pptx(scene, slide)
+"""
+
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from modules._textfit import LINE_SPACING, wrap_lines
+
+from .nodes import Color, TableCell, TableNode, TextStyle, para, text_frame
+
+
+class TableStyle(NamedTuple):
+    """表格樣式（不可變）"""
+    header: TextStyle = TextStyle(9, True, (255, 255, 255))
+    body: TextStyle = TextStyle(9, False, (51, 51, 51))
+    header_fill: Optional[Color] = (33, 150, 243)
+    band_fills: Tuple[Optional[Color], ...] = ((245, 245, 245), (255, 255, 255))  # 資料列交替底色
+    border: Optional[Color] = (200, 200, 200)
+    align: str = "center"
+    margins: Tuple[float, float, float, float] = (3.6, 3.6, 1.8, 1.8)  # (left, right, top, bottom) pt
+    min_row_height: float = 14.0  # pt
+
+
+DEFAULT_TABLE_STYLE = TableStyle()
+
+
+class TablePage(NamedTuple):
+    """分頁結果"""
+    node: TableNode
+    page: int            # 從 1 開始
+    first_row: int       # 本頁第一列資料在整份資料中的索引
+    row_count: int       # 本頁資料列數（不含表頭）
+
+
+def measure_row_height(texts: Sequence, col_widths: Sequence[float], style: TextStyle,
+                       margins=DEFAULT_TABLE_STYLE.margins, min_height: float = 0.0) -> float:
+    """
+    估算一列的高度（取最高的儲存格）
+
+    Args:
+        texts: 各欄文字
+        col_widths: 各欄寬度（pt）
+        style: 文字樣式
+        margins: 儲存格內邊距 (left, right, top, bottom)
+        min_height: 最小列高
+
+    Returns:
+        float: 列高（pt）
+    """
+    left, right, top, bottom = margins
+    line_height = style.size * LINE_SPACING
+    lines = 1
+    for text, width in zip(texts, col_widths):
+        text = "" if text is None else str(text)
+        if text:
+            lines = max(lines, len(wrap_lines(text, max(width - left - right, 1), style.size, style.bold)))
+    return max(min_height, lines * line_height + top + bottom)
+
+
+def _cell(text, text_style: TextStyle, fill, style: TableStyle) -> TableCell:
+    frame = text_frame(para("" if text is None else str(text), text_style, style.align),
+                       word_wrap=True, anchor="middle", margins=style.margins)
+    return TableCell(frame, fill)
+
+
+def table_node(x: float, y: float, w: float, headers: Sequence, rows: Sequence[Sequence],
+               col_widths: Sequence[float], row_heights: Sequence[float], header_height: float,
+               style: TableStyle = DEFAULT_TABLE_STYLE, band_offset: int = 0) -> TableNode:
+    """
+    建立一個含表頭的 TableNode（座標 pt）
+
+    Args:
+        x, y, w: 位置與寬度
+        headers: 表頭文字（空列表 = 無表頭）
+        rows: 資料列
+        col_widths, row_heights: 欄寬、資料列高
+        header_height: 表頭列高
+        style: TableStyle
+        band_offset: 第一列資料的全域索引（續頁維持交替底色）
+    """
+    cells = []
+    heights = []
+    if headers:
+        cells.append([_cell(text, style.header, style.header_fill, style) for text in headers])
+        heights.append(header_height)
+    bands = style.band_fills or (None,)
+    for index, (row, height) in enumerate(zip(rows, row_heights), band_offset):
+        fill = bands[index % len(bands)]
+        padded = list(row) + [""] * (len(col_widths) - len(row))
+        cells.append([_cell(text, style.body, fill, style) for text in padded[:len(col_widths)]])
+        heights.append(height)
+    return TableNode(x, y, w, sum(heights), cells, list(col_widths), heights, border=style.border)
+
+
+def fit_table(headers: Sequence, rows: Iterable[Sequence], x: float, y: float, w: float, h: float,
+              col_widths: Optional[Sequence[float]] = None,
+              style: TableStyle = DEFAULT_TABLE_STYLE, stretch: bool = True) -> TableNode:
+    """
+    不分頁：所有列放在同一個表格（列高依內容量測）
+
+    Args:
+        headers: 表頭文字
+        rows: 資料列
+        x, y, w, h: 表格區域（pt）
+        col_widths: 欄寬（pt，None = 平均分配）
+        style: TableStyle
+        stretch: 總高度不足 h 時，等比例拉高各列填滿區域
+
+    Returns:
+        TableNode
+    """
+    rows = [list(row) for row in rows]
+    col_count = len(headers) if headers else (len(rows[0]) if rows else 1)
+    if not col_widths:
+        col_widths = [w / col_count] * col_count
+    header_height = (measure_row_height(headers, col_widths, style.header, style.margins,
+                                        style.min_row_height) if headers else 0.0)
+    heights = [measure_row_height(row, col_widths, style.body, style.margins, style.min_row_height)
+               for row in rows]
+    total = header_height + sum(heights)
+    scale = h / total if stretch and 0 < total < h else 1.0
+    return table_node(x, y, w, headers, rows, col_widths, [height * scale for height in heights],
+                      header_height * scale, style)
+
+
+def paginate_table(headers: Sequence, rows: Iterable[Sequence], x: float, y: float, w: float,
+                   h: float, col_widths: Optional[Sequence[float]] = None,
+                   style: TableStyle = DEFAULT_TABLE_STYLE, next_y: Optional[float] = None,
+                   next_height: Optional[float] = None, stretch: bool = True) -> Iterator[TablePage]:
+    """
+    依可用高度將表格分頁（每頁重複表頭），逐頁產生 TablePage
+
+    Args:
+        headers: 表頭文字
+        rows: 資料列（任意 iterable，逐列讀取）
+        x, y, w, h: 第一頁的表格區域（pt）
+        col_widths: 欄寬（pt，None = 平均分配）
+        style: TableStyle
+        next_y, next_height: 續頁的表格起點與可用高度（None = 同第一頁）
+        stretch: 整份表格只有一頁且高度不足 h 時，等比例拉高各列填滿區域
+
+    Yields:
+        TablePage
+    """
+    col_count = len(headers) if headers else None
+    next_y = y if next_y is None else next_y
+    next_height = h if next_height is None else next_height
+
+    rows = iter(rows)
+    pending = next(rows, None)
+    if col_count is None:
+        col_count = len(pending) if pending is not None else 1
+    if not col_widths:
+        col_widths = [w / col_count] * col_count
+    header_height = (measure_row_height(headers, col_widths, style.header, style.margins,
+                                        style.min_row_height) if headers else 0.0)
+
+    page = 1
+    first_row = 0
+    page_y, available = y, h
+    while True:
+        page_rows: List[Sequence] = []
+        heights: List[float] = []
+        used = header_height
+        while pending is not None:
+            height = measure_row_height(pending, col_widths, style.body, style.margins,
+                                        style.min_row_height)
+            height = max(style.min_row_height, min(height, available - header_height))
+            # 每頁至少放一列，避免超高的列造成無窮迴圈
+            if page_rows and used + height > available:
+                break
+            page_rows.append(pending)
+            heights.append(height)
+            used += height
+            pending = next(rows, None)
+
+        last = pending is None
+        if last and page == 1 and stretch and used < h:
+            scale = h / used if used else 1.0
+            heights = [height * scale for height in heights]
+            page_header_height = header_height * scale
+        else:
+            page_header_height = header_height
+        node = table_node(x, page_y, w, headers, page_rows, col_widths, heights,
+                          page_header_height, style, band_offset=first_row)
+        yield TablePage(node, page, first_row, len(page_rows))
+        if last:
+            return
+        first_row += len(page_rows)
+        page += 1
+        page_y, available = next_y, next_height
@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+"""
+主題（配色與字體）資料化：版面只算一次，換主題只換樣式綁定
+
+繪圖函數使用 modules/_colors.py 的常數（COLOR_BLUE、ACCENT_BLUE、BG_COLOR...），
+這些顏色在這裡對應到語意角色（blue、accent_blue、bg...）。主題檔只描述角色要換成什麼顏色：
+
+    {
+      "name": "dark",
+      "extends": "default.json",                 # 可選：先套用另一個主題檔（相對路徑）
+      "colors": {"bg": "#1E1E1E", "text": "#EEEEEE", "accent_blue": "#5DADE2",
+                 "#E6E6E6": "#3A3A3A"},            # 也可直接指定原始顏色
+      "text_colors": {"white": "#FFFFFF"},       # 可選：只套用在文字上的顏色
+      "fonts": {"body": "Noto Sans TC"}
+    }
+
+"colors" 同時替換填色、線條與文字；"text_colors" 只替換文字顏色（覆寫 "colors" 的設定）。
+同一個顏色常兼作底色與文字色（white 是卡片 / 表格底色，也是色塊標題上的字），
+深色主題把 white 底色換暗時，以 "text_colors" 讓色塊上的白字維持白色。
+
+換主題時不重新排版：
+    - apply_theme(scene, theme)        已建立的 Scene 換樣式（座標、文字折行沿用；任何 backend 皆可）
+    - theme_slide_xml(xml, theme)      已序列化的 slide XML 直接替換 srgbClr / typeface
+                                       （整份簡報見 deck_themes.theme_deck）
+
+同一個原始顏色對應多個角色時（例如 red 與 chart_red），主題只需設定其中一個；
+兩者設成不同顏色會引發 ValueError，因為從圖形上無法分辨原本是哪個角色。
+字體只依名稱替換，換字體後文字寬度可能不同，版面以原字體的量測為準。
+check_contrast(theme) 依 CONTRAST_PAIRS 檢查換色後的文字與底色對比（WCAG 2.x 對比值）。
+
+使用範例：
+    from scene.themes import load_theme, apply_theme
+
+    dark = load_theme("templates/themes/dark.json")
+    themed = apply_theme(build_flow(Scene(unit="in"), ...), dark)
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from .nodes import (Color, ConnectorNode, DEFAULT_FONT, Paragraph, PathNode, Run, Scene, ShapeNode, TableCell,
+                    TableNode, TextFrame, TextStyle)
+
+# 預設主題的角色 → 顏色（同 modules/_colors.py 與 modules_pywin32/_colors_pywin32.py）
+DEFAULT_COLORS = {
+    # 標準顏色（Material Design）
+    "red": "#F44336",
+    "green": "#4CAF50",
+    "blue": "#2196F3",
+    "orange": "#FF9800",
+    "purple": "#9C27B0",
+    "teal": "#009688",
+    "pink": "#E91E63",
+    "gray_bg": "#F5F5F5",
+    "gray_light": "#E0E0E0",
+    "gray": "#9E9E9E",
+    "gray_dark": "#616161",
+    "text": "#333333",
+    "white": "#FFFFFF",
+    "black": "#000000",
+    "accent": "#00796B",
+    "chart_blue": "#33B5E5",
+    # MTK 風格配色
+    "bg": "#FFF9E6",
+    "accent_blue": "#4682B4",
+    "accent_orange": "#E67E22",
+    "accent_green": "#27AE60",
+    "accent_purple": "#8E44AD",
+    "accent_red": "#C00000",
+}
+
+# 與其他角色同色的別名（_colors_pywin32.py 的 CHART_*）
+ROLE_ALIASES = {
+    "chart_red": "red",
+    "chart_green": "green",
+    "chart_orange": "orange",
+    "chart_purple": "purple",
+    "chart_accent": "accent",
+}
+
+# 預設主題的字體角色
+DEFAULT_FONTS = {
+    "body": DEFAULT_FONT,
+    "latin": "Segoe UI",
+    "mono": "Consolas",
+}
+
+# 內建繪圖函數實際使用的「文字角色 on 底色角色」組合與最低對比值
+# （WCAG 2.x：一般文字 4.5；粗體標題等大字 3）
+CONTRAST_PAIRS: Tuple[Tuple[str, str, float], ...] = (
+    ("text", "white", 4.5),         # 卡片、表格內文
+    ("text", "gray_bg", 4.5),       # 灰底卡片、表格斑馬列
+    ("text", "bg", 4.5),            # 投影片底色上的內文
+    ("gray_dark", "white", 4.5),    # 註解、圖說
+    ("gray_dark", "bg", 4.5),
+    ("accent_blue", "white", 3.0),  # 卡片標題
+    ("accent_blue", "bg", 3.0),     # 區塊標題
+    ("white", "blue", 3.0),         # 表頭、色塊標題
+)
+
+_HEX_RE = re.compile(r"^#?[0-9A-Fa-f]{6}$")
+
+
+class Theme(NamedTuple):
+    """主題：角色 → 顏色 / 字體（未列出的角色沿用預設主題；text_colors 只含覆寫文字色的角色）"""
+    name: str
+    colors: Dict[str, Color]
+    fonts: Dict[str, str]
+    text_colors: Dict[str, Color] = {}
+
+    def text_color(self, role: str) -> Color:
+        """角色用在文字上時的顏色"""
+        return self.text_colors.get(role, self.colors[role])
+
+
+class StyleMap(NamedTuple):
+    """主題相對於基準主題的替換表（原始值 → 新值，只含有變動的項目；text_colors 用於文字顏色）"""
+    colors: Dict[Color, Color]
+    fonts: Dict[str, str]
+    text_colors: Dict[Color, Color]
+
+    def __bool__(self):
+        return bool(self.colors or self.fonts or self.text_colors)
+
+    def fingerprint(self) -> str:
+        """替換表的指紋（快取 key 用）"""
+        payload = json.dumps([sorted(self.colors.items()), sorted(self.fonts.items()),
+                              sorted(self.text_colors.items())], ensure_ascii=False)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def _parse_hex(value) -> Color:
+    if isinstance(value, str) and _HEX_RE.match(value):
+        text = value.lstrip("#")
+        return int(text[0:2], 16), int(text[2:4], 16), int(text[4:6], 16)
+    if isinstance(value, (list, tuple)) and len(value) == 3:
+        return int(value[0]), int(value[1]), int(value[2])
+    raise ValueError(f"無法解析的顏色: {value!r}（需為 \"#RRGGBB\" 或 [r, g, b]）")
+
+
+DEFAULT_THEME = Theme("default", {role: _parse_hex(value) for role, value in DEFAULT_COLORS.items()},
+                      dict(DEFAULT_FONTS))
+
+
+def _role(name: str) -> str:
+    """角色名稱（別名換成正式名稱；原始顏色 "#RRGGBB" 原樣保留）"""
+    if _HEX_RE.match(name):
+        return "#" + name.lstrip("#").upper()
+    name = ROLE_ALIASES.get(name, name)
+    if name not in DEFAULT_COLORS:
+        raise ValueError(f"未知的顏色角色: {name}（可用: {', '.join(DEFAULT_COLORS)}，或直接寫 \"#RRGGBB\"）")
+    return name
+
+
+def theme_from_dict(data: Dict, base: Theme = DEFAULT_THEME, name: Optional[str] = None) -> Theme:
+    """
+    由主題檔內容建立 Theme（忽略 "extends"，由 load_theme 處理）
+
+    Args:
+        data: {"name": ..., "colors": {角色或 "#RRGGBB": 顏色}, "text_colors": {同 colors，只用於文字},
+               "fonts": {角色: 字體}}
+        base: 未列出的角色沿用的主題
+        name: 主題名稱（None = data["name"]）
+
+    Returns:
+        Theme
+
+    Raises:
+        ValueError: 未知的角色、無法解析的顏色、同色角色設成不同顏色
+    """
+    colors = dict(base.colors)
+    for key, value in (data.get("colors") or {}).items():
+        colors[_role(key)] = _parse_hex(value)
+    text_colors = dict(base.text_colors)
+    for key, value in (data.get("text_colors") or {}).items():
+        text_colors[_role(key)] = _parse_hex(value)
+    fonts = dict(base.fonts)
+    for key, value in (data.get("fonts") or {}).items():
+        if key not in DEFAULT_FONTS:
+            raise ValueError(f"未知的字體角色: {key}（可用: {', '.join(DEFAULT_FONTS)}）")
+        fonts[key] = str(value)
+    theme = Theme(name or data.get("name") or base.name, colors, fonts, text_colors)
+    style_map(theme)  # 及早檢查同色角色衝突
+    return theme
+
+
+def load_theme(source: Union[str, Path, Dict]) -> Theme:
+    """
+    讀取主題檔（支援 "extends" 繼承另一個主題檔）
+
+    Args:
+        source: 主題 JSON 路徑或已解析的 dict
+
+    Returns:
+        Theme（名稱預設為檔名）
+    """
+    if isinstance(source, dict):
+        return theme_from_dict(source)
+    path = Path(source)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    base = DEFAULT_THEME
+    parent = data.get("extends")
+    if parent and parent != "default":
+        base = load_theme(path.parent / parent)
+    return theme_from_dict(data, base, data.get("name") or path.stem)
+
+
+def style_map(theme: Theme, base: Theme = DEFAULT_THEME) -> StyleMap:
+    """
+    計算 theme 相對於 base 的替換表
+
+    角色顏色依 base 中的顏色對應；"#RRGGBB" 鍵直接以該顏色為原始值。
+    文字用的替換表為 colors 再套上 theme.text_colors（設回原色的項目移除）。
+
+    Raises:
+        ValueError: 同一個原始顏色被設成不同的新顏色
+    """
+    colors = _color_map(theme.name, theme.colors, base)
+    text_colors = dict(colors)
+    for original, color in _color_map(theme.name, theme.text_colors, base, keep_same=True).items():
+        if original == color:
+            text_colors.pop(original, None)
+        else:
+            text_colors[original] = color
+    fonts = {base.fonts[role]: font for role, font in theme.fonts.items()
+             if role in base.fonts and base.fonts[role] != font}
+    return StyleMap(colors, fonts, text_colors)
+
+
+def _color_map(name: str, roles: Dict[str, Color], base: Theme, keep_same: bool = False) -> Dict[Color, Color]:
+    """角色 → 顏色 換成 原始顏色 → 新顏色（keep_same=False 時略過未變動的項目）"""
+    colors: Dict[Color, Color] = {}
+    owners: Dict[Color, str] = {}
+    for role, color in roles.items():
+        original = _parse_hex(role) if role.startswith("#") else base.colors.get(role)
+        if original is None or (original == color and not keep_same):
+            continue
+        if original in colors and colors[original] != color:
+            raise ValueError(f"主題 {name}: {owners[original]} 與 {role} 原本同色，"
+                             f"不能設成不同顏色")
+        colors[original] = color
+        owners[original] = role
+    return colors
+
+
+def contrast_ratio(a: Color, b: Color) -> float:
+    """兩個顏色的 WCAG 2.x 對比值（1 ~ 21）"""
+    def luminance(color: Color) -> float:
+        channels = [c / 255 for c in color]
+        r, g, b = [c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4 for c in channels]
+        return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+    hi, lo = sorted((luminance(a), luminance(b)), reverse=True)
+    return (hi + 0.05) / (lo + 0.05)
+
+
+def check_contrast(theme: Theme, pairs=CONTRAST_PAIRS) -> List[str]:
+    """
+    檢查主題換色後的文字 / 底色對比
+
+    Args:
+        theme: 主題
+        pairs: (文字角色, 底色角色, 最低對比值) 清單
+
+    Returns:
+        List[str]: 對比不足的說明（空 list 表示全部通過）
+    """
+    problems = []
+    for text_role, fill_role, minimum in pairs:
+        ratio = contrast_ratio(theme.text_color(text_role), theme.colors[fill_role])
+        if ratio < minimum:
+            problems.append(f"主題 {theme.name}: {text_role} 文字在 {fill_role} 底色上對比 {ratio:.2f} < {minimum}")
+    return problems
+
+
+# ----------------------------------------------------------------------
+# Scene 換樣式
+# ----------------------------------------------------------------------
+
+class _Rebinder:
+    """依 StyleMap 複製節點；文字樣式等不可變物件以 memo 共用"""
+
+    def __init__(self, mapping: StyleMap):
+        self.colors = mapping.colors
+        self.text_colors = mapping.text_colors
+        self.fonts = mapping.fonts
+        self._frames: Dict[TextFrame, TextFrame] = {}
+        self._styles: Dict[TextStyle, TextStyle] = {}
+
+    def color(self, value: Optional[Color]) -> Optional[Color]:
+        return self.colors.get(value, value) if value is not None else None
+
+    def style(self, style: TextStyle) -> TextStyle:
+        themed = self._styles.get(style)
+        if themed is None:
+            color = self.text_colors.get(style.color, style.color) if style.color is not None else None
+            themed = style._replace(color=color, font=self.fonts.get(style.font, style.font))
+            self._styles[style] = themed
+        return themed
+
+    def frame(self, frame: Optional[TextFrame]) -> Optional[TextFrame]:
+        if frame is None:
+            return None
+        themed = self._frames.get(frame)
+        if themed is None:
+            paragraphs = tuple(Paragraph(tuple(Run(run.text, self.style(run.style)) for run in p.runs),
+                                         p.align, p.space_after)
+                               for p in frame.paragraphs)
+            themed = frame._replace(paragraphs=paragraphs)
+            self._frames[frame] = themed
+        return themed
+
+    def node(self, node):
+        if isinstance(node, ShapeNode):
+            return ShapeNode(node.geom, node.x, node.y, node.w, node.h, self.color(node.fill),
+                             self.color(node.line), node.line_width, node.dash, self.frame(node.text), node.name)
+        if isinstance(node, ConnectorNode):
+            return ConnectorNode(node.x1, node.y1, node.x2, node.y2, self.color(node.color), node.width,
+                                 node.dash, node.end_arrow, node.begin_arrow, node.name)
+        if isinstance(node, PathNode):
+            return PathNode(node.points, node.closed, self.color(node.fill), self.color(node.line),
+                            node.line_width, node.dash, node.name)
+        if isinstance(node, TableNode):
+            rows = [[TableCell(self.frame(cell.text), self.color(cell.fill)) for cell in row] for row in node.rows]
+            return TableNode(node.x, node.y, node.w, node.h, rows, node.col_widths, node.row_heights,
+                             self.color(node.border), node.name)
+        raise TypeError(f"不支援的節點: {type(node).__name__}")
+
+
+def apply_theme(scene: Scene, theme: Union[Theme, StyleMap], base: Theme = DEFAULT_THEME) -> Scene:
+    """
+    以主題重新綁定 scene 的顏色與字體（座標與文字內容不變，不重新排版）
+
+    Args:
+        scene: 以 base 配色建立的 Scene
+        theme: Theme 或 style_map() 的結果
+        base: 建立 scene 時使用的主題
+
+    Returns:
+        Scene：新的 Scene（與預設主題相同時直接回傳原 scene）
+    """
+    mapping = theme if isinstance(theme, StyleMap) else style_map(theme, base)
+    if not mapping:
+        return scene
+    rebinder = _Rebinder(mapping)
+    themed = Scene()
+    themed.scale = scene.scale
+    themed.nodes = [rebinder.node(node) for node in scene.nodes]
+    return themed
+
+
+# ----------------------------------------------------------------------
+# 已序列化的 slide XML 換樣式
+# ----------------------------------------------------------------------
+
+_SRGB_RE = re.compile(r'(<a:srgbClr val=")([0-9A-Fa-f]{6})(")')
+# 文字屬性區塊（其中的 srgbClr 是文字顏色）或其他位置的 srgbClr（填色 / 線條），一次掃描
+_COLOR_RE = re.compile(r'<a:(rPr|defRPr|endParaRPr)\b(?:[^>]*/>|.*?</a:\1>)|<a:srgbClr val="[0-9A-Fa-f]{6}"',
+                       re.DOTALL)
+_TYPEFACE_RE = re.compile(r'( typeface=")([^"]*)(")')
+
+
+def _xml_escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace('"', "&quot;")
+
+
+def theme_slide_xml(xml: str, theme: Union[Theme, StyleMap], base: Theme = DEFAULT_THEME) -> str:
+    """
+    替換 slide / chart XML 中的 srgbClr 與 typeface（不解析 XML，一次 regex 掃描）
+
+    文字屬性（a:rPr / a:defRPr / a:endParaRPr）內的顏色依文字替換表，其餘依填色替換表。
+
+    Args:
+        xml: scene_to_slide_xml 或 PowerPoint / python-pptx 存出的 part 內容
+        theme: Theme 或 style_map() 的結果
+        base: 產生 xml 時使用的主題
+
+    Returns:
+        str: 換過樣式的 XML
+    """
+    mapping = theme if isinstance(theme, StyleMap) else style_map(theme, base)
+    if not mapping:
+        return xml
+    if mapping.colors or mapping.text_colors:
+        colors = {"%02X%02X%02X" % old: "%02X%02X%02X" % new for old, new in mapping.colors.items()}
+        text_colors = {"%02X%02X%02X" % old: "%02X%02X%02X" % new for old, new in mapping.text_colors.items()}
+
+        def srgb(table, text):
+            return _SRGB_RE.sub(lambda m: m.group(1) + table.get(m.group(2).upper(), m.group(2)) + m.group(3), text)
+
+        xml = _COLOR_RE.sub(lambda m: srgb(text_colors if m.group(1) else colors, m.group(0)), xml)
+    if mapping.fonts:
+        fonts = {_xml_escape(old): _xml_escape(new) for old, new in mapping.fonts.items()}
+        xml = _TYPEFACE_RE.sub(lambda m: m.group(1) + fonts.get(m.group(2), m.group(2)) + m.group(3), xml)
+    return xml
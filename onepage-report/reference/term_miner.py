@@ -0,0 +1,351 @@
+"""
+術語候選串流探勘（Space-Saving top-k，固定記憶體）
+
+Phase 2 的 2.1.8 術語識別原本靠閱讀全部素材找出國中生看不懂的詞，素材一多就做不到。
+這裡逐段讀取抽取結果（citation_index.iter_file，不整份載入），把每段的候選詞
+分三類送進各自的 Space-Saving 計數器：
+
+    縮寫       FPS、SoC、NUMA（兩個以上大寫字母）
+    英文術語   latency、Click-to-Photon、Frame Pacing（英文單字與 2-3 字片語，去除停用字）
+    中文詞     2-4 字的中文 n-gram（遇到「的、了、是」等虛字即斷開）
+
+Space-Saving 只監看 capacity 個詞：新詞進來時取代目前次數最少的詞並繼承其次數
+（記為誤差上限），次數夠多的詞一定留在表中，記憶體與素材量無關。
+每個詞記錄被監看以來第一次出現的位置（誤差為 0 時即真正的首次出現），作為 terms.md 的來源。
+
+輸出前做子字串吸收：較短的詞若幾乎只出現在某個較長的候選詞裡（例如「幀率」只出現在
+「不掉幀率」中、pacing 只出現在 frame pacing 中），只保留較長的詞。
+
+使用範例：
+    from term_miner import mine_terms, format_terms_md
+
+    candidates = mine_terms(["./output/phase2/extracted", "./input/notes.md"], top=40)
+    Path("./output/phase2/terms.md").write_text(format_terms_md(candidates), encoding="utf-8")
+"""
+import heapq
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from citation_index import Passage, format_location, iter_file, material_files
+
+# 候選類別
+ACRONYM = "縮寫"
+LATIN = "英文術語"
+CJK = "中文詞"
+KINDS = (ACRONYM, LATIN, CJK)
+
+# 每類監看的詞數（記憶體上限）
+DEFAULT_CAPACITY = 5000
+
+# 中文 n-gram 長度上限
+MAX_NGRAM = 4
+
+# 接回長詞時的長度上限（字）
+MAX_CHAIN = 8
+
+# 英文片語長度上限（字數）
+MAX_PHRASE = 3
+
+# 較短候選的次數有這個比例以上出現在較長候選裡時，併入較長的詞
+ABSORB_RATIO = 0.8
+
+# 吸收前多取的倍數：一個 5 字的詞會產生 9 個 n-gram 片段
+POOL_FACTOR = 10
+
+_LATIN_RE = re.compile(r"[A-Za-z][A-Za-z0-9]*(?:[-+/][A-Za-z0-9]+)*")
+_HAN_RE = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff]+")
+
+# 中文虛字：n-gram 不跨過這些字（只收幾乎不會出現在術語中的字）
+STOP_CHARS = "的了是在和與及或也就都而並這那個於把被從之此該各每則但若如即又還很已再"
+_STOP_RE = re.compile(f"[{STOP_CHARS}]")
+
+# 英文停用字：不單獨成為候選，也不作為片語的頭尾
+STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "can", "do", "for", "from", "has", "have",
+    "if", "in", "into", "is", "it", "its", "no", "not", "of", "on", "or", "so", "than", "that", "the",
+    "their", "then", "there", "these", "this", "to", "was", "we", "were", "will", "with", "you", "your",
+}
+
+
+class TermCandidate(NamedTuple):
+    """術語候選"""
+    term: str
+    kind: str          # ACRONYM / LATIN / CJK
+    count: int         # 出現次數（Space-Saving 估計值，實際次數介於 count - error 與 count 之間）
+    error: int
+    pages: int         # 出現在幾個頁面 / 投影片 / 段落
+    location: str      # 首次出現位置（format_location 格式）
+
+
+class _Entry:
+    __slots__ = ("count", "error", "surface", "location", "pages", "last_page")
+
+    def __init__(self, count, error, surface, location, page):
+        self.count = count
+        self.error = error
+        self.surface = surface
+        self.location = location
+        self.pages = 1
+        self.last_page = page
+
+
+class SpaceSaving:
+    """
+    Space-Saving 計數器（Metwally et al.）：最多監看 capacity 個 key
+
+    heap 中每個 key 恰有一筆 (次數, key)，次數可能落後於實際值；
+    取最小值時遇到落後的項目就以實際次數放回，直到堆頂是真正的最小值。
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.entries: Dict[str, _Entry] = {}
+        self._heap: List[tuple] = []
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, key: str, weight: int, surface: str, location: Passage, page) -> None:
+        """
+        累加 key 的次數
+
+        Args:
+            key: 比對用的 key（英文為小寫）
+            weight: 這次增加的次數
+            surface: 顯示用的原始寫法（首次監看時記錄）
+            location: 出現的段落（首次監看時記錄）
+            page: 頁面識別（用於計算出現頁數）
+        """
+        entry = self.entries.get(key)
+        if entry is not None:
+            entry.count += weight
+            if entry.last_page != page:
+                entry.pages += 1
+                entry.last_page = page
+            return
+        if len(self.entries) < self.capacity:
+            self.entries[key] = _Entry(weight, 0, surface, location, page)
+            heapq.heappush(self._heap, (weight, key))
+            return
+        floor = self._pop_min()
+        self.entries[key] = _Entry(floor + weight, floor, surface, location, page)
+        heapq.heappush(self._heap, (floor + weight, key))
+
+    def _pop_min(self) -> int:
+        """移除次數最少的 key，回傳其次數"""
+        while True:
+            count, key = heapq.heappop(self._heap)
+            actual = self.entries[key].count
+            if actual == count:
+                del self.entries[key]
+                return count
+            heapq.heappush(self._heap, (actual, key))
+
+    def top(self, n: int) -> List[tuple]:
+        """次數最多的 n 個 (key, _Entry)"""
+        return heapq.nlargest(n, self.entries.items(), key=lambda item: item[1].count)
+
+
+def _page_id(passage: Passage):
+    if passage.page is not None:
+        return passage.path, passage.page
+    return passage.path, passage.line
+
+
+def _is_acronym(token: str) -> bool:
+    return sum(1 for c in token if c.isupper()) >= 2 and len(token) <= 10
+
+
+def _latin_terms(text: str):
+    """逐行取出 (key, 顯示寫法, 類別)：縮寫、英文單字與空白相連的 2-3 字片語"""
+    for line in text.split("\n"):
+        run: List[str] = []
+        previous_end = -1
+        for match in _LATIN_RE.finditer(line):
+            if run and line[previous_end:match.start()] != " ":
+                yield from _phrases(run)
+                run = []
+            run.append(match.group())
+            previous_end = match.end()
+        yield from _phrases(run)
+
+
+def _phrases(tokens: List[str]):
+    for i, token in enumerate(tokens):
+        lowered = token.lower()
+        if _is_acronym(token):
+            yield token, token, ACRONYM
+        elif lowered not in STOP_WORDS and len(token) >= 3:
+            yield lowered, token, LATIN
+        for n in range(2, MAX_PHRASE + 1):
+            words = tokens[i:i + n]
+            if len(words) < n or words[0].lower() in STOP_WORDS or words[-1].lower() in STOP_WORDS:
+                continue
+            phrase = " ".join(words)
+            yield phrase.lower(), phrase, LATIN
+
+
+def _cjk_terms(text: str, max_ngram: int):
+    for run in _HAN_RE.findall(text):
+        for segment in _STOP_RE.split(run):
+            for n in range(2, min(max_ngram, len(segment)) + 1):
+                for i in range(len(segment) - n + 1):
+                    yield segment[i:i + n]
+
+
+class TermMiner:
+    """
+    逐段餵入素材，固定記憶體統計術語候選
+
+    Args:
+        capacity: 每類監看的詞數
+        max_ngram: 中文 n-gram 長度上限
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, max_ngram: int = MAX_NGRAM):
+        self.counters = {kind: SpaceSaving(capacity) for kind in KINDS}
+        self.max_ngram = max_ngram
+        self.passages = 0
+
+    def feed(self, passage: Passage) -> None:
+        """統計一個段落（同段落內的次數先以 Counter 彙總，再整批送進計數器）"""
+        self.passages += 1
+        page = _page_id(passage)
+        text = unicodedata.normalize("NFKC", passage.text)
+
+        surfaces = {}
+        latin = Counter()
+        for key, surface, kind in _latin_terms(text):
+            latin[kind, key] += 1
+            surfaces.setdefault((kind, key), surface)
+        for (kind, key), count in latin.items():
+            self.counters[kind].add(key, count, surfaces[kind, key], passage, page)
+
+        counter = self.counters[CJK]
+        for key, count in Counter(_cjk_terms(text, self.max_ngram)).items():
+            counter.add(key, count, key, passage, page)
+
+    def feed_files(self, paths: Iterable[str]) -> None:
+        """
+        逐段讀取素材檔並統計
+
+        Args:
+            paths: 抽取結果目錄（遞迴找 text.md）或 .md / .txt 素材
+        """
+        for path in material_files(paths):
+            for passage in iter_file(path):
+                self.feed(passage)
+
+    def candidates(self, top: int = 40, min_count: int = 2) -> List[TermCandidate]:
+        """
+        各類別的前 top 個候選（已做子字串吸收）
+
+        Args:
+            top: 每類最多幾個
+            min_count: 最少出現次數（以 Space-Saving 保證的下限 count - error 判斷）
+
+        Returns:
+            list: TermCandidate，依類別（縮寫、英文術語、中文詞）再依次數排序
+        """
+        result = []
+        for kind in KINDS:
+            # 多取一些再吸收，吸收後仍能湊滿 top 個
+            pool = [(key, entry) for key, entry in self.counters[kind].top(top * POOL_FACTOR)
+                    if entry.count - entry.error >= min_count]
+            if kind == CJK:
+                pool = _chain(pool, self.max_ngram)
+            kept = [(key, entry) for key, entry in pool if not _absorbed(key, entry, pool, kind)]
+            result.extend(TermCandidate(entry.surface, kind, entry.count, entry.error, entry.pages,
+                                        format_location(entry.location))
+                          for key, entry in kept[:top])
+        return result
+
+
+def _chain(pool: List[tuple], max_ngram: int) -> List[tuple]:
+    """
+    接回超過 n-gram 長度的中文詞
+
+    「記憶體頻」與「憶體頻寬」前後重疊一字且次數相近時，合成「記憶體頻寬」
+    （次數取較小者），再以同樣方式接長，最長 MAX_CHAIN 字；原本的片段之後由 _absorbed 去除。
+    """
+    entries = dict(pool)
+    frontier = [key for key in entries if len(key) == max_ngram]
+    while frontier and len(frontier[0]) < MAX_CHAIN:
+        by_prefix: Dict[str, List[str]] = {}
+        for key in frontier:
+            by_prefix.setdefault(key[:-1], []).append(key)
+        grown = []
+        for key in frontier:
+            entry = entries[key]
+            for other in by_prefix.get(key[1:], ()):
+                merged = key + other[-1]
+                other_entry = entries[other]
+                if merged in entries or min(entry.count, other_entry.count) < \
+                        max(entry.count, other_entry.count) * ABSORB_RATIO:
+                    continue
+                low = entry if entry.count <= other_entry.count else other_entry
+                combined = _Entry(low.count, max(entry.error, other_entry.error), merged, entry.location,
+                                  low.last_page)
+                combined.pages = min(entry.pages, other_entry.pages)
+                entries[merged] = combined
+                grown.append(merged)
+        frontier = grown
+    return sorted(entries.items(), key=lambda item: -item[1].count)
+
+
+def _absorbed(key: str, entry: _Entry, pool: List[tuple], kind: str) -> bool:
+    """較長的候選幾乎涵蓋這個詞的所有出現時，視為其片段"""
+    for other, other_entry in pool:
+        if len(other) <= len(key) or other_entry.count < entry.count * ABSORB_RATIO:
+            continue
+        if kind == CJK and key in other:
+            return True
+        if kind == LATIN and f" {key} " in f" {other} ":
+            return True
+    return False
+
+
+def mine_terms(paths: Iterable[str], top: int = 40, min_count: int = 2, capacity: int = DEFAULT_CAPACITY,
+               max_ngram: int = MAX_NGRAM, miner: Optional[TermMiner] = None) -> List[TermCandidate]:
+    """
+    一次掃過素材，回傳術語候選
+
+    Args:
+        paths: 抽取結果目錄或 .md / .txt 素材
+        top: 每類最多幾個候選
+        min_count: 最少出現次數
+        capacity: 每類監看的詞數（記憶體上限）
+        max_ngram: 中文 n-gram 長度上限
+        miner: 沿用既有的 TermMiner（None = 新建）
+
+    Returns:
+        list: TermCandidate
+    """
+    miner = miner or TermMiner(capacity, max_ngram)
+    miner.feed_files(paths)
+    return miner.candidates(top, min_count)
+
+
+def format_terms_md(candidates: List[TermCandidate]) -> str:
+    """
+    輸出 terms.md（格式同 phases/phase2-input.md 2.1.8 的術語處理清單）
+
+    處理方式填「待定」、白話解釋留空，來源欄為首次出現位置與次數，
+    由 agent 或使用者刪去不需處理的詞並補上解釋。
+    """
+    lines = [
+        "# 術語處理清單",
+        "",
+        "> 由 mine_terms.py 自動產生的候選（依類別、出現次數排序）；請刪除不需處理的詞，",
+        "> 填寫處理方式（保留+解釋 / 改寫）與白話解釋。",
+        "",
+        "| 術語 | 處理方式 | 白話解釋 | 來源 |",
+        "|------|----------|----------|------|",
+    ]
+    for c in candidates:
+        approx = "≈" if c.error else ""
+        lines.append(f"| {c.term.replace('|', '/')} | 待定 | | {c.location}"
+                     f"（{c.kind}，{approx}{c.count} 次 / {c.pages} 處） |")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+Pipeline 階段追蹤（Chrome trace-event 格式）
+
+在轉換、佈局 RPC、內容對應、元素渲染、儲存、素材抽取等階段記錄 span，
+輸出可直接載入 Perfetto（https://ui.perfetto.dev）或 chrome://tracing 的 JSON。
+
+使用方式：
+    from tracing import span, start_tracing, stop_tracing
+
+    start_tracing("out.json")
+    with span("render:figure", cat="render", elem_id="fig:main"):
+        ...
+    stop_tracing()   # 寫入 out.json
+
+未啟用時 span() 回傳共用的空 context manager，成本只有一次全域變數檢查。
+CLI 透過 --trace out.json 啟用（見 add_trace_argument）。
+"""
+
+import json
+import os
+import threading
+import time
+from functools import wraps
+from typing import Optional
+
+
+class _NullSpan:
+    """未啟用追蹤時使用的空 span"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """記錄一個 complete event（ph = "X"）"""
+
+    __slots__ = ("tracer", "name", "cat", "args", "start")
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.add_event({
+            "name": self.name,
+            "cat": self.cat,
+            "ph": "X",
+            "ts": (self.start - self.tracer.origin) / 1000,
+            "dur": (end - self.start) / 1000,
+            "pid": self.tracer.pid,
+            "tid": threading.get_ident(),
+            "args": self.args,
+        })
+        return False
+
+    def set(self, **args):
+        """在 span 結束前補充參數（例如處理筆數）"""
+        self.args.update(args)
+
+
+class Tracer:
+    """收集 trace event 並輸出為 Chrome trace JSON"""
+
+    def __init__(self, output_path: str, process_name: Optional[str] = None):
+        self.output_path = output_path
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.events = []
+        self._lock = threading.Lock()
+        if process_name:
+            self.events.append({
+                "name": "process_name", "ph": "M", "pid": self.pid,
+                "args": {"name": process_name},
+            })
+
+    def add_event(self, event: dict):
+        with self._lock:
+            self.events.append(event)
+
+    def span(self, name: str, cat: str, args: dict) -> _Span:
+        return _Span(self, name, cat, args)
+
+    def instant(self, name: str, cat: str, args: dict):
+        self.add_event({
+            "name": name, "cat": cat, "ph": "i", "s": "t",
+            "ts": (time.perf_counter_ns() - self.origin) / 1000,
+            "pid": self.pid, "tid": threading.get_ident(), "args": args,
+        })
+
+    def save(self) -> str:
+        """寫入 trace JSON，回傳輸出路徑"""
+        output_dir = os.path.dirname(os.path.abspath(self.output_path))
+        os.makedirs(output_dir, exist_ok=True)
+        with self._lock:
+            data = {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+        with open(self.output_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        return self.output_path
+
+
+# 全域 tracer（None = 停用）
+_tracer: Optional[Tracer] = None
+
+
+def start_tracing(output_path: str, process_name: Optional[str] = None) -> Tracer:
+    """
+    啟用追蹤
+
+    Args:
+        output_path: trace JSON 輸出路徑
+        process_name: 顯示在 Perfetto 的程序名稱（可選）
+
+    Returns:
+        Tracer 物件
+    """
+    global _tracer
+    _tracer = Tracer(output_path, process_name)
+    return _tracer
+
+
+def stop_tracing() -> Optional[str]:
+    """停用追蹤並寫入檔案，回傳輸出路徑（未啟用時回傳 None）"""
+    global _tracer
+    if _tracer is None:
+        return None
+    tracer, _tracer = _tracer, None
+    path = tracer.save()
+    print(f"[tracing] trace 已儲存: {path}")
+    return path
+
+
+def is_tracing() -> bool:
+    """是否已啟用追蹤"""
+    return _tracer is not None
+
+
+def span(name: str, cat: str = "pipeline", **args):
+    """
+    建立 span（context manager）
+
+    Args:
+        name: span 名稱，例如 "convert"、"render:figure"
+        cat: 類別，例如 "convert"、"layout"、"render"、"extract"
+        **args: 附加參數（顯示於 Perfetto 詳細資訊）
+    """
+    if _tracer is None:
+        return _NULL_SPAN
+    return _tracer.span(name, cat, args)
+
+
+def instant(name: str, cat: str = "pipeline", **args):
+    """記錄瞬間事件"""
+    if _tracer is not None:
+        _tracer.instant(name, cat, args)
+
+
+def traced(name: Optional[str] = None, cat: str = "pipeline"):
+    """
+    函數裝飾器：將整個函數呼叫包成 span
+
+    用法：
+        @traced("layout_rpc", cat="layout")
+        def compute_layout(...): ...
+    """
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*a, **kw):
+            if _tracer is None:
+                return func(*a, **kw)
+            with _tracer.span(span_name, cat, {}):
+                return func(*a, **kw)
+        return wrapper
+    return decorator
+
+
+def add_trace_argument(parser):
+    """為 argparse parser 加入 --trace 參數"""
+    parser.add_argument(
+        "--trace", metavar="OUT_JSON",
+        help="輸出 Chrome trace-event JSON（可載入 Perfetto）"
+    )
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+投影片預覽的視覺回歸比對
+
+把 preview.py 畫出的 PNG 與基準圖逐張比較，找出版面變動的區域並輸出 HTML 報告：
+
+    1. 感知差異：逐像素計算 YIQ 色差（亮度權重最高，與人眼對亮度較敏感一致），
+       正規化到 0~1，超過 threshold 的像素視為變動
+    2. 分塊：影像切成 tile x tile 的方塊，以 reshape + sum 一次算出每塊的變動像素數
+       （全部是 NumPy 向量運算，不逐像素迴圈）；少於 min_pixels 的方塊視為雜訊
+    3. 區域：相鄰的變動方塊合併成矩形區域（x, y, w, h，像素）
+
+使用方式：
+    from visual_diff import compare_images, diff_image
+
+    result = compare_images(Image.open("baseline.png"), Image.open("current.png"))
+    if result.changed:
+        diff_image(baseline, current, result).save("diff.png")
+"""
+
+import html
+import os
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 預設門檻：YIQ 正規化色差（0~1）；0.1 約可忽略反鋸齒與字型 hinting 的微小差異
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_TILE = 16
+DEFAULT_MIN_PIXELS = 2
+
+# YIQ 色差的最大值（純黑 vs 純白），用於正規化
+_MAX_YIQ_DELTA = 35215.0
+
+_DIFF_COLOR = (255, 0, 0)
+_REGION_COLOR = (255, 0, 255)
+
+
+class DiffResult(NamedTuple):
+    """單張影像的比對結果"""
+    score: float                              # 變動像素比例（0~1）
+    max_delta: float                          # 最大感知差（0~1）
+    regions: List[Tuple[int, int, int, int]]  # 變動區域 (x, y, w, h)，像素
+    mask: Optional[np.ndarray]                # 變動像素遮罩（H x W bool；相同時為 None）
+    size_changed: bool = False                # 兩張影像大小不同
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.regions) or self.size_changed
+
+
+def _rgb_array(image) -> np.ndarray:
+    """PIL Image / ndarray → float32 H x W x 3（透明部分以白底合成）"""
+    if isinstance(image, np.ndarray):
+        return image[..., :3].astype(np.float32)
+    if image.mode in ("RGBA", "LA", "P"):
+        from PIL import Image
+
+        rgba = image.convert("RGBA")
+        canvas = Image.new("RGBA", rgba.size, (255, 255, 255, 255))
+        canvas.alpha_composite(rgba)
+        image = canvas
+    return np.asarray(image.convert("RGB"), dtype=np.float32)
+
+
+def perceptual_delta(baseline: np.ndarray, current: np.ndarray) -> np.ndarray:
+    """
+    逐像素 YIQ 感知色差（Kotsarenko & Ramos），正規化到 0~1
+
+    Args:
+        baseline, current: H x W x 3 float 陣列（0~255）
+
+    Returns:
+        np.ndarray: H x W float32
+    """
+    d = baseline - current
+    dr, dg, db = d[..., 0], d[..., 1], d[..., 2]
+    y = dr * 0.29889531 + dg * 0.58662247 + db * 0.11448223
+    i = dr * 0.59597799 - dg * 0.27417610 - db * 0.32180189
+    q = dr * 0.21147017 - dg * 0.52261711 + db * 0.31114694
+    return (0.5053 * y * y + 0.299 * i * i + 0.1957 * q * q) / _MAX_YIQ_DELTA
+
+
+def tile_counts(mask: np.ndarray, tile: int) -> np.ndarray:
+    """遮罩切成 tile x tile 方塊，回傳每塊的 True 數量（邊緣不足一塊時補零）"""
+    h, w = mask.shape
+    rows, cols = -(-h // tile), -(-w // tile)
+    padded = np.zeros((rows * tile, cols * tile), dtype=np.uint16)
+    padded[:h, :w] = mask
+    return padded.reshape(rows, tile, cols, tile).sum(axis=(1, 3))
+
+
+def _merge_tiles(flagged: np.ndarray, tile: int, width: int, height: int) -> List[Tuple[int, int, int, int]]:
+    """相鄰（含斜角）的變動方塊合併成外接矩形"""
+    seen = np.zeros_like(flagged, dtype=bool)
+    rows, cols = flagged.shape
+    regions = []
+    for r0, c0 in zip(*np.nonzero(flagged)):
+        if seen[r0, c0]:
+            continue
+        seen[r0, c0] = True
+        stack = [(r0, c0)]
+        top, left, bottom, right = r0, c0, r0, c0
+        while stack:
+            r, c = stack.pop()
+            top, bottom, left, right = min(top, r), max(bottom, r), min(left, c), max(right, c)
+            for nr in range(max(r - 1, 0), min(r + 2, rows)):
+                for nc in range(max(c - 1, 0), min(c + 2, cols)):
+                    if flagged[nr, nc] and not seen[nr, nc]:
+                        seen[nr, nc] = True
+                        stack.append((nr, nc))
+        x, y = int(left * tile), int(top * tile)
+        regions.append((x, y, min((right + 1) * tile, width) - x, min((bottom + 1) * tile, height) - y))
+    regions.sort(key=lambda box: (box[1], box[0]))
+    return regions
+
+
+def compare_images(baseline, current, threshold: float = DEFAULT_THRESHOLD, tile: int = DEFAULT_TILE,
+                   min_pixels: int = DEFAULT_MIN_PIXELS) -> DiffResult:
+    """
+    比較兩張影像
+
+    Args:
+        baseline, current: PIL Image 或 H x W x 3 陣列
+        threshold: 感知差門檻（0~1），超過視為變動像素
+        tile: 分塊大小（像素）
+        min_pixels: 方塊內變動像素達此數量才算變動區域
+
+    Returns:
+        DiffResult
+    """
+    a, b = _rgb_array(baseline), _rgb_array(current)
+    height, width = a.shape[:2]
+    if a.shape != b.shape:
+        return DiffResult(1.0, 1.0, [(0, 0, width, height)], None, size_changed=True)
+    if np.array_equal(a, b):
+        return DiffResult(0.0, 0.0, [], None)
+
+    delta = perceptual_delta(a, b)
+    mask = delta > threshold * threshold
+    counts = tile_counts(mask, tile)
+    regions = _merge_tiles(counts >= min_pixels, tile, width, height)
+    return DiffResult(float(mask.mean()), float(np.sqrt(delta.max())), regions, mask)
+
+
+def diff_image(baseline, current, result: DiffResult):
+    """
+    差異示意圖：基準圖淡化為灰階，變動像素標紅，變動區域加框
+
+    Args:
+        baseline, current: 比對的兩張影像
+        result: compare_images 的結果
+
+    Returns:
+        PIL.Image.Image
+    """
+    from PIL import Image, ImageDraw
+
+    if result.size_changed:
+        return (current if not isinstance(current, np.ndarray) else Image.fromarray(current)).convert("RGB")
+    a = _rgb_array(baseline)
+    luma = a[..., 0] * 0.299 + a[..., 1] * 0.587 + a[..., 2] * 0.114
+    faded = (luma * 0.3 + 255 * 0.7).astype(np.uint8)
+    out = np.repeat(faded[..., None], 3, axis=2)
+    if result.mask is not None:
+        out[result.mask] = _DIFF_COLOR
+    image = Image.fromarray(out)
+    draw = ImageDraw.Draw(image)
+    for x, y, w, h in result.regions:
+        draw.rectangle((x, y, x + w - 1, y + h - 1), outline=_REGION_COLOR)
+    return image
+
+
+# ----------------------------------------------------------------------
+# HTML 報告
+# ----------------------------------------------------------------------
+
+class SlideReport(NamedTuple):
+    """報告中的一列（一張投影片）"""
+    case: str
+    slide: int
+    status: str                 # "same" / "changed" / "added" / "removed"
+    score: float = 0.0
+    regions: int = 0
+    baseline: Optional[str] = None
+    current: Optional[str] = None
+    diff: Optional[str] = None
+
+
+_STATUS_LABEL = {"changed": "變動", "added": "新增頁", "removed": "缺少頁", "same": "相同"}
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="zh-Hant"><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 16px; background: #fafafa; }}
+table {{ border-collapse: collapse; }}
+td, th {{ border: 1px solid #ccc; padding: 4px 8px; vertical-align: top; }}
+tr.changed td.status, tr.added td.status, tr.removed td.status {{ color: #c00; font-weight: bold; }}
+img {{ max-width: 360px; border: 1px solid #999; }}
+</style></head><body>
+<h1>{title}</h1>
+<p>{summary}</p>
+<table>
+<tr><th>案例</th><th>頁</th><th>狀態</th><th>變動像素</th><th>區域</th><th>基準</th><th>目前</th><th>差異</th></tr>
+"""
+
+
+def write_html_report(reports: Sequence[SlideReport], path: str, title: str = "視覺回歸報告") -> str:
+    """
+    寫出 HTML 報告（變動的頁面排在前面；圖片以相對路徑連結）
+
+    Args:
+        reports: SlideReport 列表
+        path: 輸出的 .html 路徑
+        title: 報告標題
+
+    Returns:
+        str: 報告路徑
+    """
+    base = Path(path).parent
+    base.mkdir(parents=True, exist_ok=True)
+
+    def image_cell(image_path):
+        if not image_path:
+            return "<td></td>"
+        src = html.escape(Path(os.path.relpath(image_path, base)).as_posix())
+        return f'<td><a href="{src}"><img src="{src}" loading="lazy"></a></td>'
+
+    failed = [r for r in reports if r.status != "same"]
+    summary = f"共 {len(reports)} 頁，{len(failed)} 頁有差異"
+    rows = [_HTML_HEAD.format(title=html.escape(title), summary=summary)]
+    for report in sorted(reports, key=lambda r: (r.status == "same", r.case, r.slide)):
+        rows.append(
+            f'<tr class="{report.status}"><td>{html.escape(report.case)}</td><td>{report.slide}</td>'
+            f'<td class="status">{_STATUS_LABEL.get(report.status, report.status)}</td>'
+            f'<td>{report.score:.2%}</td><td>{report.regions}</td>'
+            + image_cell(report.baseline) + image_cell(report.current) + image_cell(report.diff) + "</tr>\n"
+        )
+    rows.append("</table></body></html>\n")
+    Path(path).write_text("".join(rows), encoding="utf-8")
+    return str(path)
@@ -27,17 +27,24 @@ import os
 import sys
 from pathlib import Path
 
-try:
-    import pdfplumber
-except ImportError:
-    print("Error: pdfplumber not installed. Run: pip install pdfplumber")
-    sys.exit(1)
+# 加入 reference 目錄到路徑（tracing）
+sys.path.insert(0, str(Path(__file__).parent.parent / "reference"))
+from tracing import span, start_tracing, stop_tracing, add_trace_argument
 
-try:
-    from PIL import Image
-except ImportError:
-    print("Error: Pillow not installed. Run: pip install Pillow")
-    sys.exit(1)
+
+def _load_pdfplumber():
+    """延遲載入 pdfplumber / Pillow（--help 與參數錯誤時不必付出載入成本）"""
+    try:
+        import pdfplumber
+    except ImportError:
+        print("Error: pdfplumber not installed. Run: pip install pdfplumber")
+        sys.exit(1)
+    try:
+        import PIL  # noqa: F401  pdfplumber 抽圖需要
+    except ImportError:
+        print("Error: Pillow not installed. Run: pip install Pillow")
+        sys.exit(1)
+    return pdfplumber
 
 
 def parse_page_range(range_str: str, total_pages: int) -> list[int]:
@@ -89,7 +96,8 @@ def ocr_image(image, lang='chi_tra+eng'):
     """
     try:
         import pytesseract
-        return pytesseract.image_to_string(image, lang=lang)
+        with span("ocr", cat="extract", lang=lang):
+            return pytesseract.image_to_string(image, lang=lang)
     except ImportError:
         print("Warning: pytesseract not installed. OCR skipped.")
         return ""
@@ -123,7 +131,8 @@ def extract_pdf(pdf_path: str, output_dir: str, page_range: str = None, use_ocr:
     images_dir.mkdir(exist_ok=True)
 
     # 開啟 PDF
-    pdf = pdfplumber.open(str(pdf_path))
+    with span("open_pdf", cat="extract", file=pdf_path.name):
+        pdf = _load_pdfplumber().open(str(pdf_path))
     total_pages = len(pdf.pages)
 
     # 解析頁碼範圍
@@ -153,86 +162,87 @@ def extract_pdf(pdf_path: str, output_dir: str, page_range: str = None, use_ocr:
         if page_idx >= len(pdf.pages):
             continue
 
-        page = pdf.pages[page_idx]
-
-        # 抽取文字
-        page_text = page.extract_text() or ""
-        char_count = len(page_text.strip())
+        with span("extract_page", cat="extract", page=page_num):
+            page = pdf.pages[page_idx]
 
-        # 抽取圖片
-        page_images = page.images
-        page_image_count = len(page_images)
+            # 抽取文字
+            page_text = page.extract_text() or ""
+            char_count = len(page_text.strip())
 
-        # 摘要
-        summary_content.append(f"| {page_num} | {char_count} | {page_image_count} |")
+            # 抽取圖片
+            page_images = page.images
+            page_image_count = len(page_images)
 
-        # 詳細內容
-        text_content.append(f"## Page {page_num}")
-        text_content.append(f"[來源：page={page_num}]")
-        text_content.append("")
+            # 摘要
+            summary_content.append(f"| {page_num} | {char_count} | {page_image_count} |")
 
-        if page_text.strip():
-            text_content.append("### 文字內容")
-            text_content.append("")
-            text_content.append(page_text.strip())
-            text_content.append("")
-        else:
-            text_content.append("### 文字內容")
-            text_content.append("（此頁無可抽取的文字）")
+            # 詳細內容
+            text_content.append(f"## Page {page_num}")
+            text_content.append(f"[來源：page={page_num}]")
             text_content.append("")
 
-            # 如果啟用 OCR 且無文字，嘗試 OCR
-            if use_ocr:
+            if page_text.strip():
+                text_content.append("### 文字內容")
+                text_content.append("")
+                text_content.append(page_text.strip())
+                text_content.append("")
+            else:
+                text_content.append("### 文字內容")
+                text_content.append("（此頁無可抽取的文字）")
+                text_content.append("")
+
+                # 如果啟用 OCR 且無文字，嘗試 OCR
+                if use_ocr:
+                    try:
+                        # 將頁面轉為圖片
+                        page_image = page.to_image(resolution=150)
+                        pil_image = page_image.original
+
+                        ocr_text = ocr_image(pil_image)
+                        if ocr_text.strip():
+                            text_content.append("### OCR 辨識結果")
+                            text_content.append("")
+                            text_content.append(ocr_text.strip())
+                            text_content.append("")
+                    except Exception as e:
+                        text_content.append(f"### OCR 失敗")
+                        text_content.append(f"錯誤：{str(e)}")
+                        text_content.append("")
+
+            # 抽取圖片
+            for img_idx, img in enumerate(page_images):
                 try:
-                    # 將頁面轉為圖片
+                    # 取得圖片邊界
+                    x0, y0, x1, y1 = img['x0'], img['top'], img['x1'], img['bottom']
+
+                    # 裁切頁面圖片
                     page_image = page.to_image(resolution=150)
-                    pil_image = page_image.original
+                    cropped = page_image.original.crop((
+                        int(x0 * 150 / 72),
+                        int(y0 * 150 / 72),
+                        int(x1 * 150 / 72),
+                        int(y1 * 150 / 72)
+                    ))
+
+                    # 儲存圖片
+                    image_filename = f"page{page_num}_img{img_idx + 1}.png"
+                    image_path = images_dir / image_filename
+                    cropped.save(str(image_path))
+
+                    image_count += 1
+                    text_content.append(f"### 圖片 {img_idx + 1}")
+                    text_content.append(f"[來源：page={page_num}, image={img_idx + 1}]")
+                    text_content.append("")
+                    text_content.append(f"![{image_filename}](images/{image_filename})")
+                    text_content.append("")
 
-                    ocr_text = ocr_image(pil_image)
-                    if ocr_text.strip():
-                        text_content.append("### OCR 辨識結果")
-                        text_content.append("")
-                        text_content.append(ocr_text.strip())
-                        text_content.append("")
                 except Exception as e:
-                    text_content.append(f"### OCR 失敗")
+                    text_content.append(f"### 圖片 {img_idx + 1} 抽取失敗")
                     text_content.append(f"錯誤：{str(e)}")
                     text_content.append("")
 
-        # 抽取圖片
-        for img_idx, img in enumerate(page_images):
-            try:
-                # 取得圖片邊界
-                x0, y0, x1, y1 = img['x0'], img['top'], img['x1'], img['bottom']
-
-                # 裁切頁面圖片
-                page_image = page.to_image(resolution=150)
-                cropped = page_image.original.crop((
-                    int(x0 * 150 / 72),
-                    int(y0 * 150 / 72),
-                    int(x1 * 150 / 72),
-                    int(y1 * 150 / 72)
-                ))
-
-                # 儲存圖片
-                image_filename = f"page{page_num}_img{img_idx + 1}.png"
-                image_path = images_dir / image_filename
-                cropped.save(str(image_path))
-
-                image_count += 1
-                text_content.append(f"### 圖片 {img_idx + 1}")
-                text_content.append(f"[來源：page={page_num}, image={img_idx + 1}]")
-                text_content.append("")
-                text_content.append(f"![{image_filename}](images/{image_filename})")
-                text_content.append("")
-
-            except Exception as e:
-                text_content.append(f"### 圖片 {img_idx + 1} 抽取失敗")
-                text_content.append(f"錯誤：{str(e)}")
-                text_content.append("")
-
-        text_content.append("---")
-        text_content.append("")
+            text_content.append("---")
+            text_content.append("")
 
     pdf.close()
 
@@ -283,12 +293,13 @@ def main():
     parser.add_argument("--pages", "-p", help="頁碼範圍（如 '1-3,7,10-12'）")
     parser.add_argument("--ocr", action="store_true", help="啟用 OCR（需安裝 pytesseract）")
     parser.add_argument("--list", "-l", action="store_true", help="只列出頁面清單，不抽取")
+    add_trace_argument(parser)
 
     args = parser.parse_args()
 
     # 只列出頁面清單
     if args.list:
-        pdf = pdfplumber.open(args.pdf_path)
+        pdf = _load_pdfplumber().open(args.pdf_path)
         print(f"檔案：{args.pdf_path}")
         print(f"總頁數：{len(pdf.pages)}")
         print("")
@@ -302,6 +313,9 @@ def main():
         pdf.close()
         return
 
+    if args.trace:
+        start_tracing(args.trace, "extract_pdf")
+
     # 抽取內容
     try:
         result = extract_pdf(args.pdf_path, args.output_dir, args.pages, args.ocr)
@@ -325,6 +339,8 @@ def main():
     except Exception as e:
         print(f"抽取失敗：{e}")
         sys.exit(1)
+    finally:
+        stop_tracing()
 
 
 if __name__ == "__main__":
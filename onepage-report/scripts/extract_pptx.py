@@ -21,12 +21,19 @@ import re
 import sys
 from pathlib import Path
 
-try:
-    from pptx import Presentation
-    from pptx.enum.shapes import MSO_SHAPE_TYPE
-except ImportError:
-    print("Error: python-pptx not installed. Run: pip install python-pptx")
-    sys.exit(1)
+# 加入 reference 目錄到路徑（tracing）
+sys.path.insert(0, str(Path(__file__).parent.parent / "reference"))
+from tracing import span, start_tracing, stop_tracing, add_trace_argument
+
+
+def _load_pptx():
+    """延遲載入 python-pptx（--help 與參數錯誤時不必付出載入成本）"""
+    try:
+        from pptx import Presentation
+    except ImportError:
+        print("Error: python-pptx not installed. Run: pip install python-pptx")
+        sys.exit(1)
+    return Presentation
 
 
 def parse_slide_range(range_str: str, total_slides: int) -> list[int]:
@@ -120,7 +127,9 @@ def extract_pptx(pptx_path: str, output_dir: str, slide_range: str = None) -> di
     images_dir.mkdir(exist_ok=True)
 
     # 載入 PPTX
-    prs = Presentation(str(pptx_path))
+    with span("open_pptx", cat="extract", file=pptx_path.name):
+        prs = _load_pptx()(str(pptx_path))
+    from pptx.enum.shapes import MSO_SHAPE_TYPE
     total_slides = len(prs.slides)
 
     # 解析投影片範圍
@@ -149,55 +158,56 @@ def extract_pptx(pptx_path: str, output_dir: str, slide_range: str = None) -> di
         if slide_idx >= len(prs.slides):
             continue
 
-        slide = prs.slides[slide_idx]
-        title = get_slide_title(slide)
-
-        # 摘要
-        summary_content.append(f"| {slide_num} | {title} |")
-
-        # 詳細內容
-        text_content.append(f"## Slide {slide_num}：{title}")
-        text_content.append("")
-
-        shape_num = 0
-        for shape in slide.shapes:
-            shape_num += 1
-
-            # 抽取文字
-            if shape.has_text_frame:
-                text = extract_shape_text(shape)
-                if text:
-                    text_content.append(f"### Shape {shape_num}")
-                    text_content.append(f"[來源：slide={slide_num}, shape={shape_num}]")
-                    text_content.append("")
-                    text_content.append(text)
-                    text_content.append("")
-
-            # 抽取圖片
-            if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                try:
-                    image = shape.image
-                    image_ext = image.ext
-                    image_filename = f"slide{slide_num}_shape{shape_num}.{image_ext}"
-                    image_path = images_dir / image_filename
-
-                    with open(image_path, "wb") as f:
-                        f.write(image.blob)
-
-                    image_count += 1
-                    text_content.append(f"### 圖片：{image_filename}")
-                    text_content.append(f"[來源：slide={slide_num}, shape={shape_num}]")
-                    text_content.append(f"")
-                    text_content.append(f"![{image_filename}](images/{image_filename})")
-                    text_content.append("")
-                except Exception as e:
-                    text_content.append(f"### 圖片抽取失敗")
-                    text_content.append(f"[來源：slide={slide_num}, shape={shape_num}]")
-                    text_content.append(f"錯誤：{str(e)}")
-                    text_content.append("")
-
-        text_content.append("---")
-        text_content.append("")
+        with span("extract_slide", cat="extract", slide=slide_num):
+            slide = prs.slides[slide_idx]
+            title = get_slide_title(slide)
+
+            # 摘要
+            summary_content.append(f"| {slide_num} | {title} |")
+
+            # 詳細內容
+            text_content.append(f"## Slide {slide_num}：{title}")
+            text_content.append("")
+
+            shape_num = 0
+            for shape in slide.shapes:
+                shape_num += 1
+
+                # 抽取文字
+                if shape.has_text_frame:
+                    text = extract_shape_text(shape)
+                    if text:
+                        text_content.append(f"### Shape {shape_num}")
+                        text_content.append(f"[來源：slide={slide_num}, shape={shape_num}]")
+                        text_content.append("")
+                        text_content.append(text)
+                        text_content.append("")
+
+                # 抽取圖片
+                if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+                    try:
+                        image = shape.image
+                        image_ext = image.ext
+                        image_filename = f"slide{slide_num}_shape{shape_num}.{image_ext}"
+                        image_path = images_dir / image_filename
+
+                        with open(image_path, "wb") as f:
+                            f.write(image.blob)
+
+                        image_count += 1
+                        text_content.append(f"### 圖片：{image_filename}")
+                        text_content.append(f"[來源：slide={slide_num}, shape={shape_num}]")
+                        text_content.append(f"")
+                        text_content.append(f"![{image_filename}](images/{image_filename})")
+                        text_content.append("")
+                    except Exception as e:
+                        text_content.append(f"### 圖片抽取失敗")
+                        text_content.append(f"[來源：slide={slide_num}, shape={shape_num}]")
+                        text_content.append(f"錯誤：{str(e)}")
+                        text_content.append("")
+
+            text_content.append("---")
+            text_content.append("")
 
     # 寫入檔案
     text_path = output_dir / "text.md"
@@ -244,12 +254,13 @@ def main():
     parser.add_argument("output_dir", help="輸出目錄")
     parser.add_argument("--slides", "-s", help="投影片範圍（如 '1-3,7,10-12'）")
     parser.add_argument("--list", "-l", action="store_true", help="只列出投影片清單，不抽取")
+    add_trace_argument(parser)
 
     args = parser.parse_args()
 
     # 只列出投影片清單
     if args.list:
-        prs = Presentation(args.pptx_path)
+        prs = _load_pptx()(args.pptx_path)
         print(f"檔案：{args.pptx_path}")
         print(f"總投影片數：{len(prs.slides)}")
         print("")
@@ -260,6 +271,9 @@ def main():
             print(f"| {i} | {title} |")
         return
 
+    if args.trace:
+        start_tracing(args.trace, "extract_pptx")
+
     # 抽取內容
     try:
         result = extract_pptx(args.pptx_path, args.output_dir, args.slides)
@@ -282,6 +296,8 @@ def main():
     except Exception as e:
         print(f"抽取失敗：{e}")
         sys.exit(1)
+    finally:
+        stop_tracing()
 
 
 if __name__ == "__main__":
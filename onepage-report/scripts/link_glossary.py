@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+link_glossary.py - 全份簡報的術語自動超連結
+
+用法:
+    python link_glossary.py \
+        --pptx final.pptx \
+        --glossary glossary.md \
+        --output final_linked.pptx
+
+術語頁須已在簡報中（draw_glossary_page_*）。預設由術語卡片標題找出每個術語的說明頁；
+也可用 --first-slide（第一張術語頁，從 1 開始）與 --per-page 依分頁順序指定。
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+REFERENCE_DIR = SCRIPT_DIR.parent / "reference"
+sys.path.insert(0, str(REFERENCE_DIR))
+
+from pptx import Presentation
+
+from tracing import span, start_tracing, stop_tracing, add_trace_argument
+from glossary_links import find_term_slides, glossary_targets, link_glossary_terms, parse_glossary
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="術語自動超連結 - 依 glossary.md 將簡報中的術語連到術語頁"
+    )
+    parser.add_argument("--pptx", required=True, help="輸入 PPTX 路徑")
+    parser.add_argument("--glossary", required=True, help="glossary.md 路徑")
+    parser.add_argument("--output", help="輸出 PPTX 路徑（預設覆寫輸入）")
+    parser.add_argument("--first-slide", type=int, help="第一張術語頁（從 1 開始；未指定時自動尋找）")
+    parser.add_argument("--per-page", type=int, default=16, help="每張術語頁的術語數（預設 16）")
+    add_trace_argument(parser)
+
+    args = parser.parse_args()
+    if args.trace:
+        start_tracing(args.trace, "link_glossary")
+
+    try:
+        with span("load_inputs", cat="io"):
+            prs = Presentation(args.pptx)
+            terms = [t["term"] for t in parse_glossary(Path(args.glossary).read_text(encoding="utf-8"))]
+
+        start = time.perf_counter()
+        if args.first_slide:
+            targets = glossary_targets(terms, args.first_slide - 1, args.per_page)
+        else:
+            targets = find_term_slides(prs, terms)
+        with span("link_terms", cat="render", terms=len(targets)):
+            stats = link_glossary_terms(prs, targets)
+        elapsed = time.perf_counter() - start
+
+        missing = len(terms) - len(targets)
+        print(f"[link_glossary] 術語 {len(terms)} 個（找到說明頁 {len(targets)} 個"
+              f"{f'，{missing} 個找不到' if missing else ''}）")
+        print(f"[link_glossary] 掃描 {stats.runs} 個 run，新增 {stats.links} 個連結、"
+              f"{stats.relationships} 個關聯（{elapsed:.2f}s）")
+
+        output = args.output or args.pptx
+        with span("save", cat="io"):
+            prs.save(output)
+        print(f"[link_glossary] 輸出: {output}")
+    finally:
+        stop_tracing()
+
+
+if __name__ == "__main__":
+    main()
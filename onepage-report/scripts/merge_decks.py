@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+merge_decks.py - 將多份一頁報告合併成一份審閱簡報
+
+用法:
+    python merge_decks.py --output review.pptx reports/a/final.pptx reports/b/final.pptx
+    python merge_decks.py --output review.pptx reports/          # 目錄：遞迴收集 *.pptx（依路徑排序）
+
+依參數順序合併；相同的圖片與母片 / 版面配置只保留一份。第一份簡報提供投影片大小與文件屬性。
+"""
+
+import argparse
+import sys
+import time
+import zipfile
+from pathlib import Path
+from typing import List
+
+SCRIPT_DIR = Path(__file__).parent
+REFERENCE_DIR = SCRIPT_DIR.parent / "reference"
+sys.path.insert(0, str(REFERENCE_DIR))
+
+from tracing import start_tracing, stop_tracing, add_trace_argument
+from deck_merge import merge_decks
+
+
+def collect_decks(inputs: List[str], output: str) -> List[Path]:
+    """展開目錄並排除輸出檔本身與 Office 暫存檔（~$*.pptx）"""
+    output_path = Path(output).resolve()
+    decks = []
+    for raw in inputs:
+        path = Path(raw)
+        found = sorted(path.rglob("*.pptx")) if path.is_dir() else [path]
+        decks.extend(p for p in found if not p.name.startswith("~$") and p.resolve() != output_path)
+    return decks
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="合併多份 PPTX - part 層級複製，去除重複的圖片與母片"
+    )
+    parser.add_argument("inputs", nargs="+", help="PPTX 檔案或目錄（依順序合併）")
+    parser.add_argument("--output", "-o", required=True, help="輸出 PPTX 路徑")
+    add_trace_argument(parser)
+
+    args = parser.parse_args()
+    decks = collect_decks(args.inputs, args.output)
+    if not decks:
+        parser.error("找不到任何 PPTX")
+    missing = [str(p) for p in decks if not p.exists()]
+    if missing:
+        parser.error(f"檔案不存在: {', '.join(missing)}")
+    if args.trace:
+        start_tracing(args.trace, "merge_decks")
+
+    try:
+        start = time.perf_counter()
+        stats = merge_decks([str(p) for p in decks], args.output)
+        elapsed = time.perf_counter() - start
+    except (ValueError, zipfile.BadZipFile) as e:
+        print(f"[merge_decks] 錯誤: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        stop_tracing()
+
+    size_kb = Path(args.output).stat().st_size / 1024
+    print(f"[merge_decks] {stats.decks} 份簡報、{stats.slides} 頁 → {args.output}"
+          f"（{size_kb:.0f} KB，{elapsed:.2f}s）")
+    print(f"[merge_decks] 寫出 {stats.parts} 個 part，共用 {stats.deduplicated} 個重複 part")
+
+
+if __name__ == "__main__":
+    main()
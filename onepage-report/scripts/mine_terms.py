@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+mine_terms.py - 從抽取結果串流找出術語候選，輸出 terms.md 初稿
+
+用法:
+    python mine_terms.py ./output/phase2/extracted notes.md --output ./output/phase2/terms.md
+    python mine_terms.py ./temp_extract --top 30 --min-count 3      # 輸出到 stdout
+
+一次掃過所有素材（逐段讀取 text.md，不整份載入），以固定大小的 Space-Saving 計數器
+統計縮寫、英文術語與中文詞，記憶體與素材頁數無關。
+輸出格式同 phases/phase2-input.md 2.1.8 的術語處理清單，來源欄為首次出現位置。
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+REFERENCE_DIR = SCRIPT_DIR.parent / "reference"
+sys.path.insert(0, str(REFERENCE_DIR))
+
+from tracing import span, start_tracing, stop_tracing, add_trace_argument
+from term_miner import DEFAULT_CAPACITY, MAX_NGRAM, TermMiner, format_terms_md
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="術語候選探勘 - 串流統計縮寫 / 英文術語 / 中文詞，輸出 terms.md 初稿"
+    )
+    parser.add_argument("paths", nargs="+", help="抽取結果目錄（遞迴找 text.md）或 .md / .txt 素材")
+    parser.add_argument("--output", "-o", help="輸出 terms.md（未指定時輸出到 stdout）")
+    parser.add_argument("--top", type=int, default=40, help="每類最多幾個候選（預設 40）")
+    parser.add_argument("--min-count", type=int, default=2, help="最少出現次數（預設 2）")
+    parser.add_argument("--capacity", type=int, default=DEFAULT_CAPACITY,
+                        help=f"每類監看的詞數，決定記憶體上限（預設 {DEFAULT_CAPACITY}）")
+    parser.add_argument("--max-ngram", type=int, default=MAX_NGRAM, help=f"中文 n-gram 長度上限（預設 {MAX_NGRAM}）")
+    add_trace_argument(parser)
+
+    args = parser.parse_args()
+    if args.trace:
+        start_tracing(args.trace, "mine_terms")
+    start = time.perf_counter()
+    miner = TermMiner(args.capacity, args.max_ngram)
+    try:
+        with span("mine_terms", cat="terms", paths=len(args.paths)):
+            try:
+                miner.feed_files(args.paths)
+            except ValueError as e:
+                parser.error(str(e))
+        with span("rank_terms", cat="terms"):
+            candidates = miner.candidates(args.top, args.min_count)
+    finally:
+        stop_tracing()
+
+    content = format_terms_md(candidates)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(content, encoding="utf-8")
+    else:
+        sys.stdout.write(content)
+    print(f"[mine_terms] {miner.passages} 個段落 → {len(candidates)} 個候選"
+          f"（{time.perf_counter() - start:.2f}s）{' → ' + args.output if args.output else ''}",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
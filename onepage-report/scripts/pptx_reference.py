@@ -9,6 +9,7 @@ MTK 風格：
 - 顏色區分區塊（藍/橙/綠/紫）
 - 表格支援
 - 統一字體 (Microsoft JhengHei)
+- 文字樣式由 modules._textstyles 登錄表提供（每個 run 一次套用預先建立的 rPr）
 """
 
 from pptx import Presentation
@@ -17,6 +18,18 @@ from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 
+import re
+import sys
+from pathlib import Path
+
+# 加入 reference 目錄到路徑（共用 auto-fit 引擎）
+sys.path.insert(0, str(Path(__file__).parent.parent / "reference"))
+from modules._textfit import fit_font_size, PPTX_TEXTBOX_MARGINS
+from modules._textstyles import text_style, set_paragraph_text, set_text_frame_lines
+from modules._textstyles import set_cell_text as _set_styled_cell_text
+from scene import Scene, TableStyle, add_styled_run, fit_table, flush_pptx
+from glossary_links import find_term_slides, link_glossary_terms, parse_glossary
+
 
 # =============================================================================
 # MTK 風格顏色定義
@@ -71,7 +84,24 @@ def add_background(slide, prs, color=BG_COLOR):
 # MTK 風格：Content Box（圓角矩形 + 標題 + 內容）
 # =============================================================================
 
-def add_content_box(slide, left, top, width, height, title, content_lines, title_color=ACCENT_BLUE):
+def fit_content_font_size(content_lines, width, height, font_size=10):
+    """
+    計算內容區塊放得下的字體大小（離線估算，不需開 PowerPoint）
+
+    參數：
+    - content_lines: 內容行（list of str），[[術語]] 標記不計入寬度
+    - width, height: 文字框大小（英吋）
+    - font_size: 預設字體大小（搜尋上限）
+    """
+    text = "\n".join(content_lines).replace("[[", "").replace("]]", "")
+    return fit_font_size(
+        text, width * 72, height * 72, font_size,
+        role="body", bold=True, margins=PPTX_TEXTBOX_MARGINS, paragraph_spacing=1
+    )
+
+
+def add_content_box(slide, left, top, width, height, title, content_lines, title_color=ACCENT_BLUE,
+                    autofit=True):
     """
     加入 MTK 風格的內容區塊（圓角矩形）
 
@@ -80,6 +110,7 @@ def add_content_box(slide, left, top, width, height, title, content_lines, title
     - title: 區塊標題
     - content_lines: 內容行（list of str）
     - title_color: 標題顏色
+    - autofit: 內容放不下時自動縮小字體（最小 10pt 本文約束）
     """
     # 圓角矩形背景
     shape = slide.shapes.add_shape(
@@ -98,12 +129,7 @@ def add_content_box(slide, left, top, width, height, title, content_lines, title
     )
     tf = title_box.text_frame
     tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(12)
-    p.font.bold = True
-    p.font.color.rgb = title_color
-    p.font.name = FONT_NAME
+    set_paragraph_text(tf.paragraphs[0], title, text_style("section_title", color=title_color))
 
     # 內容
     content_box = slide.shapes.add_textbox(
@@ -112,17 +138,8 @@ def add_content_box(slide, left, top, width, height, title, content_lines, title
     )
     tf = content_box.text_frame
     tf.word_wrap = True
-    for i, line in enumerate(content_lines):
-        if i == 0:
-            p = tf.paragraphs[0]
-        else:
-            p = tf.add_paragraph()
-        p.text = line
-        p.font.size = Pt(10)
-        p.font.bold = True
-        p.font.color.rgb = DARK_GRAY
-        p.font.name = FONT_NAME
-        p.space_after = Pt(1)
+    font_size = fit_content_font_size(content_lines, width - 0.16, height - 0.32) if autofit else 10
+    set_text_frame_lines(tf, content_lines, text_style("body_bold", size=font_size), space_after=Pt(1))
 
     return shape
 
@@ -142,25 +159,13 @@ def add_main_title(slide, title, subtitle=None):
     title_box = slide.shapes.add_textbox(
         Inches(0.25), Inches(0.1), Inches(10), Inches(0.5)
     )
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(26)
-    p.font.bold = True
-    p.font.color.rgb = DARK_GRAY
-    p.font.name = FONT_NAME
+    set_paragraph_text(title_box.text_frame.paragraphs[0], title, "title")
 
     if subtitle:
         subtitle_box = slide.shapes.add_textbox(
             Inches(0.25), Inches(0.5), Inches(12), Inches(0.3)
         )
-        tf = subtitle_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = subtitle
-        p.font.size = Pt(11)
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(100, 100, 100)
-        p.font.name = FONT_NAME
+        set_paragraph_text(subtitle_box.text_frame.paragraphs[0], subtitle, "subtitle")
 
 
 # =============================================================================
@@ -169,47 +174,28 @@ def add_main_title(slide, title, subtitle=None):
 
 def set_cell_text(cell, text, font_size=10, bold=True, color=DARK_GRAY):
     """設定表格儲存格文字"""
-    cell.text = text
-    for paragraph in cell.text_frame.paragraphs:
-        paragraph.font.size = Pt(font_size)
-        paragraph.font.bold = bold
-        paragraph.font.color.rgb = color
-        paragraph.font.name = FONT_NAME
+    _set_styled_cell_text(cell, text, text_style("table_cell", size=font_size, bold=bold, color=color))
 
 
 def add_table(slide, left, top, width, height, headers, data, header_color=ACCENT_BLUE):
     """
-    加入表格
+    加入表格（整份表格一次建成原生表格，列高依內容量測）
 
     參數：
     - headers: 表頭列表 ['欄1', '欄2', '欄3']
     - data: 資料列表 [['A1', 'A2', 'A3'], ['B1', 'B2', 'B3']]
     - header_color: 表頭背景色
-    """
-    rows = len(data) + 1
-    cols = len(headers)
-
-    table = slide.shapes.add_table(
-        rows, cols,
-        Inches(left), Inches(top), Inches(width), Inches(height)
-    ).table
-
-    # 設定表頭
-    for i, header in enumerate(headers):
-        set_cell_text(table.cell(0, i), header, font_size=10, bold=True, color=WHITE)
-        table.cell(0, i).fill.solid()
-        table.cell(0, i).fill.fore_color.rgb = header_color
 
-    # 設定資料
-    for row_idx, row_data in enumerate(data):
-        for col_idx, cell_text in enumerate(row_data):
-            set_cell_text(table.cell(row_idx + 1, col_idx), cell_text, font_size=9, bold=True)
-            # 交替行背景色
-            if row_idx % 2 == 0:
-                table.cell(row_idx + 1, col_idx).fill.solid()
-                table.cell(row_idx + 1, col_idx).fill.fore_color.rgb = RGBColor(245, 245, 245)
-
-    return table
+    上百列的資料表請改用 scene.paginate_table 分頁（續頁重複表頭）。
+    """
+    style = TableStyle(
+        header=text_style("table_header"), body=text_style("table_cell"),
+        header_fill=header_color, band_fills=(RGBColor(245, 245, 245), WHITE), align="left",
+    )
+    node = fit_table(headers, data, left * 72, top * 72, width * 72, height * 72, style=style)
+    scene = Scene(unit="pt")
+    scene.add(node)
+    return flush_pptx(scene, slide)[0].table
 
 
 # =============================================================================
@@ -223,17 +209,15 @@ def add_title(slide, text, left=0.5, top=0.3, width=12.3, height=0.8):
     )
     tf = txBox.text_frame
     tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(28)
-    p.font.bold = True
-    p.font.name = FONT_NAME
-    p.alignment = PP_ALIGN.LEFT
+    set_paragraph_text(tf.paragraphs[0], text, text_style("title", size=28), PP_ALIGN.LEFT)
     return txBox
 
 
-def add_text_block(slide, text, left, top, width, height, font_size=11):
-    """加入一般文字區塊"""
+def add_text_block(slide, text, left, top, width, height, font_size=11, autofit=True):
+    """加入一般文字區塊（autofit：放不下時自動縮小字體）"""
+    if autofit:
+        font_size = fit_font_size(text, width * 72, height * 72, font_size,
+                                  role="body", margins=PPTX_TEXTBOX_MARGINS)
     txBox = slide.shapes.add_textbox(
         Inches(left), Inches(top), Inches(width), Inches(height)
     )
@@ -241,16 +225,7 @@ def add_text_block(slide, text, left, top, width, height, font_size=11):
     tf.word_wrap = True
     tf.auto_size = None
 
-    lines = text.split('\n')
-    for i, line in enumerate(lines):
-        if i == 0:
-            p = tf.paragraphs[0]
-        else:
-            p = tf.add_paragraph()
-        p.text = line
-        p.font.size = Pt(font_size)
-        p.font.name = FONT_NAME
-        p.alignment = PP_ALIGN.LEFT
+    set_text_frame_lines(tf, text.split('\n'), text_style("body", size=font_size), align=PP_ALIGN.LEFT)
     return txBox
 
 
@@ -262,22 +237,16 @@ def add_bullet_list(slide, items, left, top, width, height, title=None, font_siz
     tf = txBox.text_frame
     tf.word_wrap = True
 
+    item_style = text_style("body", size=font_size)
     if title:
-        p = tf.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(font_size + 2)
-        p.font.bold = True
-        p.font.name = FONT_NAME
+        set_paragraph_text(tf.paragraphs[0], title, text_style("body_bold", size=font_size + 2))
 
     for i, item in enumerate(items):
         if i == 0 and not title:
             p = tf.paragraphs[0]
         else:
             p = tf.add_paragraph()
-        p.text = f"• {item}"
-        p.font.size = Pt(font_size)
-        p.font.name = FONT_NAME
-        p.level = 0
+        set_paragraph_text(p, f"• {item}", item_style)
     return txBox
 
 
@@ -303,13 +272,7 @@ def add_section_header(slide, text, left, top, width, bg_color=(0, 112, 192)):
 
     tf = shape.text_frame
     tf.word_wrap = False
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(12)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 255, 255)
-    p.font.name = FONT_NAME
-    p.alignment = PP_ALIGN.CENTER
+    set_paragraph_text(tf.paragraphs[0], text, text_style("section_title", color=WHITE), PP_ALIGN.CENTER)
     return shape
 
 
@@ -470,6 +433,9 @@ def example_mtk_layout():
 # 術語超連結樣式
 TERM_LINK_COLOR = RGBColor(0, 102, 204)  # 藍色
 
+# [[術語]] 標記
+_TERM_MARKUP = re.compile(r'\[\[(.+?)\]\]')
+
 def add_slide_hyperlink(run, target_slide_index, prs):
     """
     為文字 run 添加投影片內超連結
@@ -514,14 +480,9 @@ def add_term_hyperlink(paragraph, term_text, target_slide_index, prs, font_size=
     Returns:
         run: 添加的 run 物件
     """
-    run = paragraph.add_run()
-    run.text = term_text
-
-    # 設定術語樣式（藍色、底線）
-    run.font.color.rgb = TERM_LINK_COLOR
+    # 術語樣式（藍色、底線）
+    run = add_styled_run(paragraph, term_text, text_style("body", size=font_size, color=TERM_LINK_COLOR))
     run.font.underline = True
-    run.font.size = Pt(font_size)
-    run.font.name = FONT_NAME
 
     # 添加投影片超連結
     add_slide_hyperlink(run, target_slide_index, prs)
@@ -548,10 +509,8 @@ def parse_text_with_terms(text, paragraph, appendix_slide_index, prs, font_size=
         - " 的 " (普通文字)
         - "migration" (藍色底線，可點擊跳到附錄)
     """
-    import re
-
     # 用 [[...]] 分割文字
-    parts = re.split(r'\[\[(.+?)\]\]', text)
+    parts = _TERM_MARKUP.split(text)
 
     for i, part in enumerate(parts):
         if not part:
@@ -559,18 +518,14 @@ def parse_text_with_terms(text, paragraph, appendix_slide_index, prs, font_size=
 
         if i % 2 == 0:
             # 偶數索引：普通文字
-            run = paragraph.add_run()
-            run.text = part
-            run.font.size = Pt(font_size)
-            run.font.name = FONT_NAME
-            run.font.color.rgb = DARK_GRAY
+            add_styled_run(paragraph, part, text_style("body", size=font_size, color=DARK_GRAY))
         else:
             # 奇數索引：術語，加超連結
             add_term_hyperlink(paragraph, part, appendix_slide_index, prs, font_size)
 
 
 def add_content_box_with_terms(slide, left, top, width, height, title, content_lines,
-                                appendix_slide_index, prs, title_color=ACCENT_BLUE):
+                                appendix_slide_index, prs, title_color=ACCENT_BLUE, autofit=True):
     """
     加入 MTK 風格的內容區塊，支援術語超連結
 
@@ -581,6 +536,7 @@ def add_content_box_with_terms(slide, left, top, width, height, title, content_l
     - appendix_slide_index: 附錄投影片索引
     - prs: Presentation 物件
     - title_color: 標題顏色
+    - autofit: 內容放不下時自動縮小字體
     """
     # 圓角矩形背景
     shape = slide.shapes.add_shape(
@@ -599,12 +555,7 @@ def add_content_box_with_terms(slide, left, top, width, height, title, content_l
     )
     tf = title_box.text_frame
     tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(12)
-    p.font.bold = True
-    p.font.color.rgb = title_color
-    p.font.name = FONT_NAME
+    set_paragraph_text(tf.paragraphs[0], title, text_style("section_title", color=title_color))
 
     # 內容（支援術語超連結）
     content_box = slide.shapes.add_textbox(
@@ -613,6 +564,8 @@ def add_content_box_with_terms(slide, left, top, width, height, title, content_l
     )
     tf = content_box.text_frame
     tf.word_wrap = True
+    font_size = fit_content_font_size(content_lines, width - 0.16, height - 0.32) if autofit else 10
+    body_style = text_style("body_bold", size=font_size)
 
     for i, line in enumerate(content_lines):
         if i == 0:
@@ -622,19 +575,33 @@ def add_content_box_with_terms(slide, left, top, width, height, title, content_l
 
         # 檢查是否有術語標記
         if '[[' in line and ']]' in line:
-            parse_text_with_terms(line, p, appendix_slide_index, prs, font_size=10)
+            parse_text_with_terms(line, p, appendix_slide_index, prs, font_size=font_size)
         else:
-            p.text = line
-            p.font.size = Pt(10)
-            p.font.bold = True
-            p.font.color.rgb = DARK_GRAY
-            p.font.name = FONT_NAME
+            set_paragraph_text(p, line, body_style)
 
         p.space_after = Pt(1)
 
     return shape
 
 
+def auto_link_glossary(prs, glossary_path):
+    """
+    依 glossary.md 為整份簡報的術語自動加上超連結（不需 [[術語]] 標記）
+
+    術語頁須已繪製（draw_glossary_page_*）；每個術語連到其卡片所在的投影片。
+    詳見 reference/glossary_links.py。
+
+    Args:
+        prs: Presentation 物件
+        glossary_path: glossary.md 路徑
+
+    Returns:
+        LinkStats: (links, runs, relationships)
+    """
+    terms = [t["term"] for t in parse_glossary(Path(glossary_path).read_text(encoding="utf-8"))]
+    return link_glossary_terms(prs, find_term_slides(prs, terms))
+
+
 # =============================================================================
 # 儲存
 # =============================================================================
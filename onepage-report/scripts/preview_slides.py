@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+preview_slides.py - 無頭投影片預覽（QA 用，不需要 PowerPoint）
+
+用法:
+    # 已產生的 PPTX
+    python preview_slides.py --pptx final.pptx --output ./preview
+
+    # 直接由 layout.json + slide_data.json（不存 PPTX）
+    python preview_slides.py \
+        --layout layout.json \
+        --data slide_data.json \
+        --output ./preview --sheet
+
+每頁輸出 slide_NN.png；--sheet 另外輸出 sheet.png 總覽圖。
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+REFERENCE_DIR = SCRIPT_DIR.parent / "reference"
+sys.path.insert(0, str(REFERENCE_DIR))
+
+from tracing import start_tracing, stop_tracing, add_trace_argument
+from preview import THUMBNAIL_SCALE, contact_sheet, preview_layout, preview_pptx
+from render_from_json import convert_slide_data_to_content_data, load_json
+
+
+def _page_numbers(text: str):
+    """'1,3,5-8' → [1, 3, 5, 6, 7, 8]"""
+    numbers = []
+    for part in text.split(","):
+        part = part.strip()
+        if "-" in part:
+            first, last = part.split("-", 1)
+            numbers.extend(range(int(first), int(last) + 1))
+        elif part:
+            numbers.append(int(part))
+    return numbers
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="投影片預覽 - 以 Pillow 將 PPTX 或 layout.json 畫成 PNG"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--pptx", help="PPTX 檔案路徑")
+    source.add_argument("--layout", help="layout.json 路徑（需搭配 --data）")
+    parser.add_argument("--data", help="slide_data.json 路徑")
+    parser.add_argument("--output", required=True, help="輸出目錄")
+    parser.add_argument("--scale", type=float, default=THUMBNAIL_SCALE,
+                        help=f"每 pt 的像素數（預設 {THUMBNAIL_SCALE}；1.0 = 960x540）")
+    parser.add_argument("--supersample", type=int, default=1, help="反鋸齒倍數（預設 1）")
+    parser.add_argument("--slides", help="只畫指定頁，例如 1,3,5-8")
+    parser.add_argument("--sheet", action="store_true", help="另外輸出 sheet.png 總覽圖")
+    add_trace_argument(parser)
+
+    args = parser.parse_args()
+    if args.layout and not args.data:
+        parser.error("--layout 需要搭配 --data")
+    if args.trace:
+        start_tracing(args.trace, "preview_slides")
+
+    try:
+        options = dict(scale=args.scale, supersample=args.supersample,
+                       slides=_page_numbers(args.slides) if args.slides else None)
+        start = time.perf_counter()
+        if args.pptx:
+            images = preview_pptx(args.pptx, args.output, **options)
+        else:
+            layout = load_json(args.layout)
+            content_data = convert_slide_data_to_content_data(load_json(args.data))
+            images = preview_layout(layout.get("pages", [layout]), content_data, args.output, **options)
+        elapsed = time.perf_counter() - start
+
+        if args.sheet and images:
+            contact_sheet(images).save(Path(args.output) / "sheet.png", "PNG")
+        print(f"[preview_slides] {len(images)} 頁 → {args.output}（{elapsed:.2f}s）")
+    finally:
+        stop_tracing()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+render_daemon.py - 本機渲染服務（常駐 worker，互動預覽與批次工作共用）
+
+用法:
+    # 啟動服務（worker 預先載入渲染模組，啟動完成後才開始接工作）
+    python render_daemon.py serve --workers 2
+    python render_daemon.py serve --listen unix:/tmp/onepage-render.sock --fragment-cache ./.fragment_cache
+
+    # 提交工作並等待結果（參數為 key=value，值可寫 JSON：scale=0.5、slides=[1,2]）
+    python render_daemon.py submit render layout=./output/layout.json data=./output/slide_data.json \\
+        output=./output/final.pptx
+    python render_daemon.py submit preview pptx=./output/final.pptx output_dir=./preview --priority interactive
+    python render_daemon.py submit extract_pdf pdf=report.pdf output_dir=./extracted --priority batch --detach
+
+    # 查詢
+    python render_daemon.py status <job_id>
+    python render_daemon.py metrics
+    python render_daemon.py stop
+
+工作種類與參數見 reference/render_service.py 的 JOB_KINDS（用戶端為 reference/render_client.py）。
+佇列已滿時 submit 結束碼為 75（EX_TEMPFAIL），--retry 會依 Retry-After 退避重試。
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+REFERENCE_DIR = SCRIPT_DIR.parent / "reference"
+sys.path.insert(0, str(REFERENCE_DIR))
+
+from tracing import start_tracing, stop_tracing, add_trace_argument
+from render_client import (DEFAULT_ADDRESS, FAILED, JOB_PATH_PARAMS, PRIORITIES, QUEUED, RUNNING, QueueFull,
+                           ServiceClient, token_path)
+
+EX_TEMPFAIL = 75
+
+
+def _param(text: str):
+    """key=value → (key, value)；value 能解析成 JSON 就用 JSON"""
+    key, sep, value = text.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"參數需為 key=value: {text}")
+    try:
+        return key, json.loads(value)
+    except ValueError:
+        return key, value
+
+
+def _queue_limit(text: str):
+    """interactive=16 → ("interactive", 16)"""
+    name, sep, value = text.partition("=")
+    if not sep or name not in PRIORITIES or not value.isdigit():
+        raise argparse.ArgumentTypeError(f"需為 <{'|'.join(PRIORITIES)}>=<數量>: {text}")
+    return name, int(value)
+
+
+def cmd_serve(args):
+    # 服務端模組（multiprocessing / http.server）只在 serve 時載入，submit 等用戶端指令維持輕量
+    from render_service import RenderService, serve
+
+    service = RenderService(workers=args.workers, queue_limits=dict(args.queue_limit or []),
+                            fragment_cache_dir=args.fragment_cache)
+    if args.trace:
+        start_tracing(args.trace, "render_daemon")
+    start = time.perf_counter()
+    try:
+        service.start()
+        print(f"[render_daemon] {service.workers} 個 worker 已就緒（{time.perf_counter() - start:.2f}s），"
+              f"監聽 {args.listen}（token: {token_path(args.listen)}）", flush=True)
+        serve(service, args.listen, verbose=args.verbose)
+    finally:
+        service.close()
+        stop_tracing()
+    metrics = service.metrics()
+    print(f"[render_daemon] 已停止：完成 {metrics['done']}、失敗 {metrics['failed']}、"
+          f"合併 {metrics['merged']}、拒絕 {metrics['rejected']}")
+
+
+def _print_job(job):
+    print(json.dumps(job, ensure_ascii=False, indent=2))
+    return 1 if job["status"] == FAILED else 0
+
+
+def cmd_submit(args):
+    client = ServiceClient(args.address)
+    params = dict(args.params)
+    while True:
+        try:
+            job = client.submit(args.kind, params, args.priority, wait=None if args.detach else 30)
+            break
+        except QueueFull as e:
+            if not args.retry:
+                print(f"[render_daemon] {e}", file=sys.stderr)
+                return EX_TEMPFAIL
+            time.sleep(e.retry_after)
+        except ValueError as e:
+            print(f"[render_daemon] {e}", file=sys.stderr)
+            return 2
+    while not args.detach and job["status"] in (QUEUED, RUNNING):
+        job = client.job(job["id"], wait=30)
+    return _print_job(job)
+
+
+def cmd_status(args):
+    try:
+        return _print_job(ServiceClient(args.address).job(args.job_id, wait=args.wait))
+    except ValueError as e:
+        print(f"[render_daemon] {e}", file=sys.stderr)
+        return 2
+
+
+def cmd_metrics(args):
+    print(json.dumps(ServiceClient(args.address).metrics(), ensure_ascii=False, indent=2))
+    return 0
+
+
+def cmd_stop(args):
+    ServiceClient(args.address).shutdown()
+    print("[render_daemon] 已要求停止")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="本機渲染服務 - 常駐 worker、優先序佇列、背壓、相同工作合併"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("serve", help="啟動服務")
+    p.add_argument("--listen", default=DEFAULT_ADDRESS, help=f"host:port 或 unix:/path（預設 {DEFAULT_ADDRESS}）")
+    p.add_argument("--workers", type=int, default=1, help="worker 程序數（預設 1）")
+    p.add_argument("--queue-limit", type=_queue_limit, action="append",
+                   help="佇列上限，例如 batch=200（預設見 render_service.DEFAULT_QUEUE_LIMITS）")
+    p.add_argument("--fragment-cache", help="圖表片段快取的磁碟目錄（worker 共用）")
+    p.add_argument("--verbose", action="store_true", help="輸出每個 HTTP 請求")
+    add_trace_argument(p)
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser("submit", help="提交工作")
+    p.add_argument("kind", choices=sorted(JOB_PATH_PARAMS), help="工作種類")
+    p.add_argument("params", nargs="*", type=_param, help="參數 key=value")
+    p.add_argument("--priority", choices=list(PRIORITIES), default="normal", help="優先序（預設 normal）")
+    p.add_argument("--detach", action="store_true", help="不等待，排入佇列後立即回傳工作 id")
+    p.add_argument("--retry", action="store_true", help="佇列已滿時依 Retry-After 重試")
+    p.set_defaults(func=cmd_submit)
+
+    p = sub.add_parser("status", help="查詢工作")
+    p.add_argument("job_id")
+    p.add_argument("--wait", type=float, help="最多等待幾秒")
+    p.set_defaults(func=cmd_status)
+
+    p = sub.add_parser("metrics", help="服務統計")
+    p.set_defaults(func=cmd_metrics)
+
+    p = sub.add_parser("stop", help="停止服務")
+    p.set_defaults(func=cmd_stop)
+
+    for name in ("submit", "status", "metrics", "stop"):
+        sub.choices[name].add_argument("--address", default=DEFAULT_ADDRESS,
+                                       help=f"服務位址（預設 {DEFAULT_ADDRESS}）")
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        cmd_serve(args)
+        return
+    try:
+        sys.exit(args.func(args))
+    except OSError as e:
+        print(f"[render_daemon] 無法連線到服務（{e}），請先執行 render_daemon.py serve", file=sys.stderr)
+        sys.exit(EX_TEMPFAIL)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+render_figures.py - Phase 6 圖表 SVG / PNG 輸出（LAYOUT_ENGINE = svg_png）
+
+用法:
+    python render_figures.py \
+        --data slide_data.json \
+        --layout layout.json \
+        --output ./output
+
+由 slide_data.json 的 figure 元素直接產生 SVG 與透明背景 PNG（<id>.svg / <id>.png），
+不需要 subagent 逐張手寫 SVG。圖表大小取自 layout.json 的方框；未提供 layout
+時使用預設大小。
+
+PNG 依內容雜湊快取（預設 <output>/.figure_cache），重跑時只點陣化有變動的圖表。
+
+多個配色 / 品牌版本（主題檔見 templates/themes/）：
+    python render_figures.py --data slide_data.json --output ./output/figures \
+        --theme templates/themes/dark.json --theme templates/themes/brand-teal.json
+每張圖表的版面只計算一次，各主題輸出到 <output>/<主題名稱>/。
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Tuple
+
+SCRIPT_DIR = Path(__file__).parent
+REFERENCE_DIR = SCRIPT_DIR.parent / "reference"
+sys.path.insert(0, str(REFERENCE_DIR))
+
+from tracing import span, start_tracing, stop_tracing, add_trace_argument
+from figure_export import DEFAULT_SCALE, FigureJob, export_figures
+from scene.themes import load_theme
+from render_from_json import convert_slide_data_to_content_data, load_json
+
+# 沒有 layout.json 時的圖表大小（pt）
+DEFAULT_FIGURE_SIZE = (864.0, 360.0)
+
+
+def figure_sizes(layout: Dict) -> Dict[str, Tuple[float, float]]:
+    """layout.json 中 figure 元素的大小 {id（去掉 fig: 前綴）: (w, h)}"""
+    sizes = {}
+    for page in layout.get("pages", [layout]):
+        for elem in page.get("elements", []):
+            if elem.get("kind") != "figure":
+                continue
+            box = elem.get("box") or elem.get("bounding_box", {})
+            elem_id = elem.get("id", "")
+            clean_id = elem_id[4:] if elem_id.startswith("fig:") else elem_id
+            sizes[clean_id] = (box.get("w", DEFAULT_FIGURE_SIZE[0]), box.get("h", DEFAULT_FIGURE_SIZE[1]))
+    return sizes
+
+
+def _file_name(figure_id: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", figure_id) or "figure"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Phase 6 圖表輸出 - 將 slide_data.json 的圖表轉為 SVG / PNG"
+    )
+    parser.add_argument("--data", required=True, help="slide_data.json 路徑")
+    parser.add_argument("--layout", help="layout.json 路徑（提供圖表大小，可選）")
+    parser.add_argument("--output", required=True, help="輸出目錄")
+    parser.add_argument("--scale", type=float, default=DEFAULT_SCALE,
+                        help=f"每 pt 的像素數（預設 {DEFAULT_SCALE}）")
+    parser.add_argument("--workers", type=int, help="平行程序數（預設 CPU 數，1 = 不平行）")
+    parser.add_argument("--cache-dir", help="PNG 快取目錄（預設 <output>/.figure_cache）")
+    parser.add_argument("--rasterizer", choices=("auto", "pillow", "cairosvg"), default="auto",
+                        help="點陣化方式（auto = 有 cairosvg 就用，否則 Pillow）")
+    parser.add_argument("--theme", action="append", default=[],
+                        help="主題檔（可重複；各主題輸出到 <output>/<主題名稱>/，未指定時為預設配色）")
+    add_trace_argument(parser)
+
+    args = parser.parse_args()
+    try:
+        themes = [load_theme(path) for path in args.theme] or None
+    except (OSError, ValueError) as e:
+        parser.error(f"主題檔錯誤: {e}")
+    if args.trace:
+        start_tracing(args.trace, "render_figures")
+
+    try:
+        with span("load_inputs", cat="io"):
+            content_data = convert_slide_data_to_content_data(load_json(args.data))
+            sizes = figure_sizes(load_json(args.layout)) if args.layout else {}
+
+        jobs = [
+            FigureJob(_file_name(figure_id), dc, *sizes.get(figure_id, DEFAULT_FIGURE_SIZE))
+            for figure_id, dc in content_data["diagrams_content"].items()
+        ]
+        print(f"[render_figures] 圖表: {len(jobs)} 個")
+
+        start = time.perf_counter()
+        results = export_figures(jobs, args.output, scale=args.scale, cache_dir=args.cache_dir,
+                                 workers=args.workers, rasterizer=args.rasterizer, themes=themes)
+        elapsed = time.perf_counter() - start
+
+        for result in results:
+            if result.png is None:
+                print(f"  - {result.name}: 略過（不支援的類型或資料為空）")
+            else:
+                print(f"  - {result.name}: {result.png}{'（快取）' if result.cached else ''}")
+        cached = sum(1 for r in results if r.cached)
+        print(f"[render_figures] 完成 {elapsed:.2f}s（快取命中 {cached}/{len(results)}）")
+    finally:
+        stop_tracing()
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,10 @@ SCRIPT_DIR = Path(__file__).parent
 REFERENCE_DIR = SCRIPT_DIR.parent / "reference"
 sys.path.insert(0, str(REFERENCE_DIR))
 
+from tracing import span, start_tracing, stop_tracing, add_trace_argument
+from profiling import enable_profiling, finish_profiling, add_profile_argument
+from validate_json import validate_document, check_id_consistency
+
 # 延遲載入 pywin32 相關模組
 _renderer_module = None
 _shapes_module = None
@@ -201,14 +205,16 @@ def render(
     renderer_mod, shapes_mod, colors_mod = _load_modules()
     LayoutRenderer = renderer_mod['LayoutRenderer']
 
-    print(f"[render_from_json] 載入 layout: {layout_path}")
-    layout = load_json(layout_path)
+    with span("load_inputs", cat="io"):
+        print(f"[render_from_json] 載入 layout: {layout_path}")
+        layout = load_json(layout_path)
 
-    print(f"[render_from_json] 載入 slide_data: {data_path}")
-    slide_data = load_json(data_path)
+        print(f"[render_from_json] 載入 slide_data: {data_path}")
+        slide_data = load_json(data_path)
 
     # 轉換為 content_data 格式
-    content_data = convert_slide_data_to_content_data(slide_data)
+    with span("content_mapping", cat="convert"):
+        content_data = convert_slide_data_to_content_data(slide_data)
 
     print(f"[render_from_json] 開始渲染...")
     print(f"  - texts: {len(content_data['texts'])} 個")
@@ -217,8 +223,9 @@ def render(
     print(f"  - diagrams: {len(content_data['diagrams_content'])} 個")
 
     # 建立渲染器
-    renderer = LayoutRenderer(visible=True)
-    renderer.create_presentation()
+    with span("create_presentation", cat="render"):
+        renderer = LayoutRenderer(visible=True)
+        renderer.create_presentation()
 
     # 處理多頁（相容單頁和多頁格式）
     if "pages" in layout:
@@ -230,7 +237,8 @@ def render(
     for i, page_data in enumerate(pages):
         page_num = page_data.get("page_number", i + 1)
         print(f"[render_from_json] 渲染第 {page_num} 頁...")
-        renderer.render_from_layout(page_data, content_data)
+        with span("render_page", cat="render", page=page_num):
+            renderer.render_from_layout(page_data, content_data)
 
     # 儲存
     abs_output = os.path.abspath(output_path)
@@ -239,7 +247,8 @@ def render(
 
     # 產生演講稿（如果有指定）
     if script_path:
-        generate_script(slide_data, script_path)
+        with span("generate_script", cat="io"):
+            generate_script(slide_data, script_path)
 
     return abs_output
 
@@ -293,8 +302,21 @@ def generate_script(slide_data: dict, output_path: str):
     print(f"[render_from_json] 演講稿已儲存: {output_path}")
 
 
-def validate_inputs(layout_path: str, data_path: str) -> bool:
-    """驗證輸入檔案"""
+def validate_inputs(layout_path: str, data_path: str, max_errors: Optional[int] = None) -> bool:
+    """
+    驗證輸入檔案（在建立渲染器之前執行，格式錯誤時不浪費渲染成本）
+
+    依 templates/layout-schema.json 與 templates/slide-data-schema.json 檢查結構，
+    每個錯誤附上 JSON 路徑，例如 $.pages[0].elements[3].data.before.steps。
+
+    Args:
+        layout_path: layout.json 路徑
+        data_path: slide_data.json 路徑
+        max_errors: 每個檔案最多回報幾筆錯誤（None = 全部）
+
+    Returns:
+        bool: 是否通過驗證
+    """
     errors = []
 
     if not Path(layout_path).exists():
@@ -309,25 +331,33 @@ def validate_inputs(layout_path: str, data_path: str) -> bool:
         return False
 
     # 驗證 JSON 格式
+    layout = data = None
     try:
         layout = load_json(layout_path)
-        if "elements" not in layout and "pages" not in layout:
-            errors.append("layout.json 缺少 elements 或 pages")
     except json.JSONDecodeError as e:
         errors.append(f"layout.json 格式錯誤: {e}")
 
     try:
         data = load_json(data_path)
-        if "pages" not in data:
-            errors.append("slide_data.json 缺少 pages")
     except json.JSONDecodeError as e:
         errors.append(f"slide_data.json 格式錯誤: {e}")
 
+    # 驗證結構
+    if layout is not None:
+        for path, message in validate_document("layout", layout, max_errors):
+            errors.append(f"layout.json {path}: {message}")
+    if data is not None:
+        for path, message in validate_document("slide_data", data, max_errors):
+            errors.append(f"slide_data.json {path}: {message}")
+
     if errors:
         for err in errors:
             print(f"[錯誤] {err}")
         return False
 
+    for warning in check_id_consistency(layout, data):
+        print(f"[警告] {warning}")
+
     return True
 
 
@@ -355,6 +385,8 @@ def main():
         "--validate-only", action="store_true",
         help="只驗證輸入，不執行渲染"
     )
+    add_trace_argument(parser)
+    add_profile_argument(parser)
 
     args = parser.parse_args()
 
@@ -366,6 +398,12 @@ def main():
         print("[render_from_json] 驗證通過")
         sys.exit(0)
 
+    if args.trace:
+        start_tracing(args.trace, "render_from_json")
+    if args.profile:
+        _load_modules()
+        enable_profiling()
+
     # 執行渲染
     try:
         render(
@@ -379,6 +417,10 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        if args.profile:
+            finish_profiling(args.profile)
+        stop_tracing()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+run_pipeline.py - 以 DAG 執行腳本化的 pipeline 步驟（未變更的步驟自動略過）
+
+用法:
+    python run_pipeline.py --output ./output --material input/deck.pptx --material input/paper.pdf
+    python run_pipeline.py --output ./output --dry-run          # 只列出需要重跑的步驟
+    python run_pipeline.py --output ./output --force render     # 強制重跑（all = 全部）
+    python run_pipeline.py --output ./output --only validate    # 只跑到某個步驟
+
+步驟（依 SKILL.md 的 ./output 結構）:
+    extract:<檔名>  素材抽取（extract_pptx.py / extract_pdf.py）→ phase2/extracted/<檔名>/
+    index           抽取結果的全文索引（search_materials.py 查詢用）→ phase2/index.json
+    yoga            yoga_converter.py：phase5（無則 phase3）one_page.md + diagrams.md
+                    → one_page_yoga.md、content.json
+    layout          MCP yogalayout → layout.json（指定 --mcp-exe 時自動執行，否則為外部步驟）
+    validate        validate_json.py：layout.json + slide_data.json（subagent 產生）
+    render          render_from_json.py → final.pptx（--engine svg_png 時為 render_figures.py → figures/）
+    script          slide_data.json → script.txt
+
+指紋包含輸入內容、參數與腳本版本（scripts/*.py、reference/ 下的渲染模組），
+只改了一個檔案時只有受影響的下游步驟會重跑；互不相依的步驟平行執行。
+狀態與各步驟的 log 在 <output>/.pipeline/。
+"""
+
+import argparse
+import json
+import sys
+import time
+from functools import partial
+from pathlib import Path
+from typing import List
+
+SCRIPT_DIR = Path(__file__).parent
+REFERENCE_DIR = SCRIPT_DIR.parent / "reference"
+sys.path.insert(0, str(REFERENCE_DIR))
+
+from tracing import span, start_tracing, stop_tracing, add_trace_argument
+from pipeline_dag import (ADOPTED, BLOCKED, FAILED, MISSING, RAN, STALE, PipelineExecutor, Step,
+                          format_results)
+
+# 素材副檔名 → 抽取腳本
+EXTRACTORS = {".pptx": "extract_pptx.py", ".pdf": "extract_pdf.py"}
+
+# 各步驟的程式版本（相對於 skill 根目錄）
+RENDER_CODE = {
+    "yoga_pywin32": ["scripts/render_from_json.py", "scripts/validate_json.py", "reference/render_pywin32.py",
+                     "reference/modules_pywin32", "reference/tracing.py", "reference/profiling.py"],
+    "svg_png": ["scripts/render_figures.py", "reference/figure_export.py", "reference/scene", "reference/modules"],
+}
+
+
+def _phase_file(output: Path, name: str) -> Path:
+    """Phase 5 只寫有修改的文件；沒有時沿用 Phase 3 的版本"""
+    revised = output / "phase5" / name
+    return revised if revised.exists() else output / "phase3" / name
+
+
+def _script(name: str) -> List[str]:
+    return [sys.executable, str(SCRIPT_DIR / name)]
+
+
+def _code(*paths: str) -> List[str]:
+    return [str(SCRIPT_DIR.parent / p) for p in paths]
+
+
+def compute_layout(yoga_md: str, output_dir: str, theme: str, mcp_exe: str, mcp_cwd: str):
+    """layout 步驟：呼叫 mcp-yogalayout 並寫出 layout.json"""
+    from modules_pywin32._mcp_client import YogaLayoutClient
+
+    with YogaLayoutClient(exe_path=mcp_exe, cwd=mcp_cwd) as client:
+        layout = client.compute_layout(yoga_md, theme, output_dir, density="compact")
+    Path(output_dir, "layout.json").write_text(json.dumps(layout, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def write_script(data_path: str, script_path: str):
+    """script 步驟：由 slide_data.json 產生演講稿"""
+    from render_from_json import generate_script, load_json
+
+    generate_script(load_json(data_path), script_path)
+
+
+def update_index(targets: List[str], index_path: str):
+    """index 步驟：增量更新素材全文索引（只重新切詞有變更的 text.md）"""
+    from citation_index import CitationIndex
+
+    index = CitationIndex.load(index_path)
+    index.update(targets)
+    index.save(index_path)
+
+
+def build_steps(output: Path, materials: List[str], engine: str, mode: str,
+                mcp_exe: str = None, mcp_cwd: str = None, theme: str = None) -> List[Step]:
+    """
+    依 SKILL.md 的輸出結構建立步驟列表
+
+    Args:
+        output: pipeline 輸出目錄（./output）
+        materials: Phase 2 的素材檔（.pptx / .pdf）
+        engine: LAYOUT_ENGINE（yoga_pywin32 / svg_png）
+        mode: yoga_converter 的 --mode
+        mcp_exe, mcp_cwd: mcp-yogalayout 執行檔與 workspace（未指定時 layout 為外部步驟）
+        theme: mcp-yogalayout 主題路徑
+
+    Returns:
+        list: Step
+    """
+    out = str(output)
+    steps = []
+    targets = []
+    for material in materials:
+        path = Path(material)
+        extractor = EXTRACTORS.get(path.suffix.lower())
+        if extractor is None:
+            raise SystemExit(f"[run_pipeline] 不支援的素材格式: {material}（可用: {', '.join(EXTRACTORS)}）")
+        target = str(output / "phase2" / "extracted" / path.stem)
+        targets.append(target)
+        steps.append(Step(f"extract:{path.stem}", _script(extractor) + [str(path), target],
+                          inputs=[str(path)], outputs=[target], code=_code(f"scripts/{extractor}")))
+    if targets:
+        index_json = str(output / "phase2" / "index.json")
+        steps.append(Step("index", partial(update_index, targets, index_json), inputs=targets,
+                          outputs=[index_json], code=_code("reference/citation_index.py"),
+                          params={"targets": targets}))
+
+    one_page = str(_phase_file(output, "one_page.md"))
+    diagrams = str(_phase_file(output, "diagrams.md"))
+    yoga_md, content_json = f"{out}/one_page_yoga.md", f"{out}/content.json"
+    layout_json, slide_data = f"{out}/layout.json", f"{out}/slide_data.json"
+
+    steps.append(Step("yoga", _script("yoga_converter.py") + [
+        "--one-page", one_page, "--diagrams", diagrams, "--output", yoga_md,
+        "--content-json", content_json, "--mode", mode],
+        inputs=[one_page, diagrams], outputs=[yoga_md, content_json],
+        code=_code("scripts/yoga_converter.py")))
+
+    layout_run = None
+    if mcp_exe:
+        layout_run = partial(compute_layout, str(Path(yoga_md).resolve()), str(output.resolve()),
+                             theme, mcp_exe, mcp_cwd)
+    steps.append(Step("layout", layout_run, inputs=[yoga_md], outputs=[layout_json],
+                      code=_code("reference/modules_pywin32/_mcp_client.py") if mcp_exe else (),
+                      params={"mcp_exe": mcp_exe, "theme": theme, "density": "compact"},
+                      hint="one_page_yoga.md 已變更：請重新呼叫 MCP yogalayout 並覆寫 layout.json"))
+
+    steps.append(Step("validate", _script("validate_json.py") + ["--layout", layout_json, "--data", slide_data],
+                      inputs=[layout_json, slide_data], code=_code("scripts/validate_json.py", "templates")))
+
+    if engine == "svg_png":
+        figures = f"{out}/figures"
+        steps.append(Step("render", _script("render_figures.py") + [
+            "--data", slide_data, "--layout", layout_json, "--output", figures],
+            inputs=[layout_json, slide_data], outputs=[figures], code=_code(*RENDER_CODE[engine]),
+            after=["validate"]))
+    else:
+        steps.append(Step("render", _script("render_from_json.py") + [
+            "--layout", layout_json, "--data", slide_data, "--output", f"{out}/final.pptx"],
+            inputs=[layout_json, slide_data], outputs=[f"{out}/final.pptx"], code=_code(*RENDER_CODE[engine]),
+            after=["validate"]))
+
+    script_txt = f"{out}/script.txt"
+    steps.append(Step("script", partial(write_script, slide_data, script_txt),
+                      inputs=[slide_data], outputs=[script_txt], code=_code("scripts/render_from_json.py"),
+                      params={"data": slide_data, "output": script_txt}, after=["validate"]))
+    return steps
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pipeline DAG 執行器 - 依內容指紋略過未變更的步驟，平行執行獨立步驟"
+    )
+    parser.add_argument("--output", default="./output", help="pipeline 輸出目錄（預設 ./output）")
+    parser.add_argument("--material", action="append", default=[], help="Phase 2 素材（.pptx / .pdf，可重複）")
+    parser.add_argument("--engine", choices=sorted(RENDER_CODE), default="yoga_pywin32",
+                        help="LAYOUT_ENGINE（預設 yoga_pywin32）")
+    parser.add_argument("--mode", choices=("one_page", "multi_page"), default="one_page",
+                        help="yoga_converter 模式（預設 one_page）")
+    parser.add_argument("--mcp-exe", help="mcp-yogalayout 執行檔（未指定時 layout.json 需由 MCP 工具另外寫入）")
+    parser.add_argument("--mcp-cwd", help="mcp-yogalayout workspace 根目錄")
+    parser.add_argument("--theme", default="workspace/themes/default.json", help="mcp-yogalayout 主題路徑")
+    parser.add_argument("--force", action="append", default=[], help="強制重跑的步驟（可重複；all = 全部）")
+    parser.add_argument("--only", action="append", help="只執行這些步驟與其上游（可重複）")
+    parser.add_argument("--dry-run", action="store_true", help="只列出需要重跑的步驟")
+    parser.add_argument("--workers", type=int, help="同時執行的步驟數（預設 CPU 數，1 = 依序）")
+    add_trace_argument(parser)
+
+    args = parser.parse_args()
+    output = Path(args.output)
+    steps = build_steps(output, args.material, args.engine, args.mode, args.mcp_exe, args.mcp_cwd, args.theme)
+    executor = PipelineExecutor(steps, str(output / ".pipeline"), workers=args.workers)
+    unknown = [n for n in (args.only or []) + args.force if n != "all" and n not in executor.steps]
+    if unknown:
+        parser.error(f"未知的步驟: {', '.join(unknown)}（可用: {', '.join(executor.steps)}）")
+
+    if args.dry_run:
+        stale = executor.stale_steps()
+        for name in executor.steps:
+            print(f"  {name:<20} {'需要重跑' if name in stale else '最新'}")
+        return
+
+    if args.trace:
+        start_tracing(args.trace, "run_pipeline")
+    force = executor.steps if "all" in args.force else args.force
+    start = time.perf_counter()
+    try:
+        with span("pipeline", cat="pipeline", steps=len(executor.steps)):
+            results = executor.run(force=force, only=args.only)
+    finally:
+        stop_tracing()
+    elapsed = time.perf_counter() - start
+
+    print(format_results(results))
+    ran = sum(1 for r in results if r.status in (RAN, ADOPTED))
+    skipped = len(results) - ran - sum(1 for r in results if r.status in (FAILED, STALE, MISSING, BLOCKED))
+    print(f"[run_pipeline] 執行 {ran} 個、略過 {skipped} 個步驟（{elapsed:.2f}s）")
+    for r in results:
+        if r.status in (FAILED, STALE, MISSING) and r.message:
+            print(f"[run_pipeline] {r.name}: {r.message}")
+    if any(r.status in (FAILED, STALE, MISSING, BLOCKED) for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
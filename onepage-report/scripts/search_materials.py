@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+search_materials.py - 素材全文索引：建立 / 增量更新、查詢、Citation 定位與宣稱查證
+
+用法:
+    # 建立或更新索引（只重新索引有變更的檔案）
+    python search_materials.py --index ./output/phase2/index.json --add ./output/phase2/extracted --add notes.md
+
+    # 查詢（前 5 筆，附位置與摘錄）
+    python search_materials.py --index ./output/phase2/index.json "SF queue 功耗" -k 5
+
+    # 以原文定位 citation_map.md 的每個 Citation
+    python search_materials.py --index ./output/phase2/index.json --citations ./output/phase2/citation_map.md
+
+    # Phase 4：查證報告中引用 [Cn] 的每一行
+    python search_materials.py --index ./output/phase2/index.json \\
+        --check ./output/phase3/one_page.md --citations ./output/phase2/citation_map.md
+
+輸出位置格式同抽取結果的來源標記（slide=N, shape=K / page=N），純文字素材為「第 a-b 行」。
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+REFERENCE_DIR = SCRIPT_DIR.parent / "reference"
+sys.path.insert(0, str(REFERENCE_DIR))
+
+from tracing import span, start_tracing, stop_tracing, add_trace_argument
+from citation_index import CitationIndex, check_claims, format_location, parse_citation_map, resolve_citation
+
+
+def _hit_dict(hit) -> dict:
+    return {"location": format_location(hit.passage), "score": round(hit.score, 3), "snippet": hit.snippet}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="素材全文索引 - BM25 + CJK bigram，查詢 / Citation 定位 / 宣稱查證"
+    )
+    parser.add_argument("query", nargs="?", help="查詢文字")
+    parser.add_argument("--index", default="./output/phase2/index.json",
+                        help="索引檔（預設 ./output/phase2/index.json）")
+    parser.add_argument("--add", action="append", default=[],
+                        help="要索引的抽取結果目錄或 .md/.txt 素材（可重複；增量更新）")
+    parser.add_argument("-k", type=int, default=5, help="每個查詢回傳的筆數（預設 5）")
+    parser.add_argument("--source", help="只查這個素材（檔名）")
+    parser.add_argument("--citations", help="citation_map.md：定位每個 Citation（搭配 --check 時用來限定素材）")
+    parser.add_argument("--check", help="查證這份報告中引用 [Cn] 的每一行（one_page.md 等）")
+    parser.add_argument("--json", action="store_true", help="以 JSON 輸出")
+    add_trace_argument(parser)
+
+    args = parser.parse_args()
+    if not (args.add or args.query or args.citations or args.check):
+        parser.error("請指定 --add、查詢文字、--citations 或 --check")
+
+    if args.trace:
+        start_tracing(args.trace, "search_materials")
+    try:
+        with span("load_index", cat="index"):
+            index = CitationIndex.load(args.index)
+        if args.add:
+            with span("update_index", cat="index", paths=len(args.add)):
+                try:
+                    stats = index.update(args.add)
+                except ValueError as e:
+                    parser.error(str(e))
+            if stats.added or stats.updated or stats.removed:
+                index.save(args.index)
+            print(f"[search_materials] 新增 {stats.added}、更新 {stats.updated}、移除 {stats.removed}、"
+                  f"未變更 {stats.unchanged} 個檔案；共 {len(index)} 個段落 → {args.index}")
+
+        if len(index) == 0 and (args.query or args.citations or args.check):
+            print(f"[search_materials] 索引是空的，請先以 --add 加入抽取結果: {args.index}", file=sys.stderr)
+            sys.exit(1)
+
+        result = {}
+        if args.query:
+            start = time.perf_counter()
+            with span("search", cat="index"):
+                hits = index.search(args.query, args.k, args.source)
+            elapsed = (time.perf_counter() - start) * 1000
+            result["query"] = [_hit_dict(h) for h in hits]
+            if not args.json:
+                print(f"查詢「{args.query}」：{len(hits)} 筆（{elapsed:.2f} ms）")
+                for hit in hits:
+                    print(f"  {hit.score:6.2f}  {format_location(hit.passage)}")
+                    print(f"          {hit.snippet}")
+
+        citations = parse_citation_map(Path(args.citations).read_text(encoding="utf-8")) if args.citations else None
+        if citations is not None and not args.check:
+            with span("resolve_citations", cat="index", citations=len(citations)):
+                resolved = [(c, resolve_citation(index, c)) for c in citations]
+            result["citations"] = {c.cid: [_hit_dict(h) for h in hits] for c, hits in resolved}
+            if not args.json:
+                for citation, hits in resolved:
+                    found = format_location(hits[0].passage) if hits else "（找不到）"
+                    print(f"  {citation.cid:<5} {citation.location or '-':<16} → {found}")
+
+        unsupported = 0
+        if args.check:
+            markdown = Path(args.check).read_text(encoding="utf-8")
+            with span("check_claims", cat="index"):
+                checks = check_claims(index, markdown, citations, k=min(args.k, 3))
+            unsupported = sum(1 for c in checks if not c.hits or c.missing_numbers)
+            result["check"] = [{"line": c.line, "claim": c.claim, "cids": c.cids,
+                                "hits": [_hit_dict(h) for h in c.hits],
+                                "missing_numbers": c.missing_numbers} for c in checks]
+            if not args.json:
+                for check in checks:
+                    flag = "⚠" if not check.hits or check.missing_numbers else "✓"
+                    print(f"{flag} 第 {check.line} 行 [{', '.join(check.cids)}] {check.claim[:60]}")
+                    if check.hits:
+                        print(f"      → {format_location(check.hits[0].passage)}：{check.hits[0].snippet}")
+                    else:
+                        print("      → 素材中查無相關段落")
+                    if check.missing_numbers:
+                        print(f"      數字未出現在來源段落: {', '.join(check.missing_numbers)}")
+                print(f"[search_materials] {len(checks)} 行引用，{unsupported} 行需要人工確認")
+
+        if args.json:
+            print(json.dumps(result, ensure_ascii=False, indent=2))
+    finally:
+        stop_tracing()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+theme_variants.py - 已渲染的簡報輸出多個配色 / 品牌版本（不重新排版、不重新渲染）
+
+用法:
+    python theme_variants.py ./output/final.pptx \\
+        --theme templates/themes/dark.json --theme templates/themes/brand-teal.json
+    python theme_variants.py ./output/final.pptx --theme dark.json --output-dir ./output/themes
+
+輸出 <output-dir>/<簡報檔名>_<主題名稱>.pptx（預設 output-dir 為簡報所在目錄下的 themes/）。
+主題檔格式見 reference/scene/themes.py 與 templates/themes/。
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+REFERENCE_DIR = SCRIPT_DIR.parent / "reference"
+sys.path.insert(0, str(REFERENCE_DIR))
+
+from tracing import span, start_tracing, stop_tracing, add_trace_argument
+from deck_themes import theme_deck
+from scene.themes import check_contrast, load_theme
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="主題版本輸出 - 只替換已渲染簡報的配色與字體，版面不變"
+    )
+    parser.add_argument("deck", help="以預設配色渲染的 .pptx（final.pptx）")
+    parser.add_argument("--theme", action="append", required=True, help="主題檔（可重複）")
+    parser.add_argument("--output-dir", help="輸出目錄（預設 <簡報目錄>/themes）")
+    add_trace_argument(parser)
+
+    args = parser.parse_args()
+    deck = Path(args.deck)
+    if not deck.exists():
+        parser.error(f"找不到簡報: {deck}")
+    try:
+        themes = [load_theme(path) for path in args.theme]
+    except (OSError, ValueError) as e:
+        parser.error(f"主題檔錯誤: {e}")
+    names = [t.name for t in themes]
+    if len(set(names)) != len(names):
+        parser.error(f"主題名稱重複: {', '.join(names)}")
+    for theme in themes:
+        for problem in check_contrast(theme):
+            print(f"[theme_variants] 警告: {problem}", file=sys.stderr)
+
+    output_dir = Path(args.output_dir) if args.output_dir else deck.parent / "themes"
+    outputs = {str(output_dir / f"{deck.stem}_{theme.name}.pptx"): theme for theme in themes}
+
+    if args.trace:
+        start_tracing(args.trace, "theme_variants")
+    start = time.perf_counter()
+    try:
+        with span("theme_variants", cat="render", themes=len(themes)):
+            results = theme_deck(str(deck), outputs)
+    finally:
+        stop_tracing()
+
+    for result in results:
+        print(f"  - {result.theme}: {result.path}（{result.parts} 個 part 換樣式）")
+    print(f"[theme_variants] {len(results)} 個主題版本，{time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,441 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+validate_json.py - slide_data.json / layout.json 結構驗證
+
+將 templates/ 下的 JSON Schema 預先編譯為巢狀 closure，之後每次驗證只需
+走訪文件一次，逐筆產出 (JSON 路徑, 錯誤訊息)，不必在渲染途中才發現格式錯誤。
+
+支援的關鍵字（templates/*.json 用到的子集）：
+    type, enum, const, required, properties, additionalProperties, items,
+    minItems, maxItems, minimum, maximum, exclusiveMinimum, exclusiveMaximum,
+    minLength, $ref（僅本地 #/...）, allOf, anyOf, oneOf, not, if/then/else
+
+slide_data 的 figure type 除了 schema 列出的內建類型，也接受以 modules.register_drawer
+或 entry point（onepage_report.drawers）登錄的第三方類型。schema 只以內建類型編譯，
+文件用到非內建的類型時才查詢登錄表（並掃描 entry point）。
+
+用法:
+    python validate_json.py --layout layout.json --data slide_data.json
+    python validate_json.py --data slide_data.json --max-errors 20
+"""
+
+import argparse
+import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+SCHEMA_DIR = Path(__file__).parent.parent / "templates"
+REFERENCE_DIR = Path(__file__).parent.parent / "reference"
+sys.path.insert(0, str(REFERENCE_DIR))
+
+SCHEMAS = {
+    "slide_data": "slide-data-schema.json",
+    "layout": "layout-schema.json",
+}
+
+# 只作說明用途、不影響驗證的關鍵字
+_ANNOTATION_KEYS = {
+    "$schema", "$id", "$defs", "definitions", "$comment",
+    "title", "description", "default", "examples",
+}
+
+# (路徑, 訊息)
+ValidationError = Tuple[str, str]
+Validator = Callable[[object, str], Iterator[ValidationError]]
+
+_TYPE_CHECKS = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+_JSON_TYPE_NAMES = {
+    dict: "object", list: "array", str: "string", bool: "boolean",
+    int: "integer", float: "number", type(None): "null",
+}
+
+
+class SchemaError(Exception):
+    """Schema 本身無法編譯"""
+    pass
+
+
+def _type_name(value) -> str:
+    return _JSON_TYPE_NAMES.get(type(value), type(value).__name__)
+
+
+def _is_valid(validator: Validator, value, path: str) -> bool:
+    """只要遇到第一個錯誤就停止（generator 短路）"""
+    return next(validator(value, path), None) is None
+
+
+class _Compiler:
+    """將 schema dict 編譯為 validator closure（$ref 延遲解析並共用）"""
+
+    def __init__(self, root: dict):
+        self.root = root
+        self.refs = {}
+
+    def compile(self, schema) -> Validator:
+        if schema is True or schema == {}:
+            return lambda value, path: iter(())
+        if schema is False:
+            return lambda value, path: iter([(path, "不允許任何值")])
+        if not isinstance(schema, dict):
+            raise SchemaError(f"schema 必須是 object 或 boolean: {schema!r}")
+
+        checks = []
+        for key, arg in schema.items():
+            if key in _ANNOTATION_KEYS:
+                continue
+            if key in ("then", "else"):
+                continue  # 由 if 處理
+            builder = getattr(self, "_kw_" + key.lstrip("$"), None)
+            if builder is None:
+                raise SchemaError(f"不支援的 schema 關鍵字: {key}")
+            checks.append(builder(arg, schema))
+
+        if len(checks) == 1:
+            return checks[0]
+
+        def validate(value, path):
+            for check in checks:
+                yield from check(value, path)
+        return validate
+
+    # --- 參照 ---
+
+    def _kw_ref(self, ref, schema):
+        if not ref.startswith("#/"):
+            raise SchemaError(f"只支援本地 $ref: {ref}")
+        if ref not in self.refs:
+            self.refs[ref] = None  # 佔位，允許遞迴參照
+            target = self.root
+            for part in ref[2:].split("/"):
+                target = target[part]
+            self.refs[ref] = self.compile(target)
+        refs = self.refs
+
+        def validate(value, path):
+            yield from refs[ref](value, path)
+        return validate
+
+    # --- 型別與值 ---
+
+    def _kw_type(self, expected, schema):
+        names = expected if isinstance(expected, list) else [expected]
+        tests = [_TYPE_CHECKS[n] for n in names]
+        label = " / ".join(names)
+
+        def validate(value, path):
+            if not any(test(value) for test in tests):
+                yield path, f"型別應為 {label}，實際為 {_type_name(value)}"
+        return validate
+
+    def _kw_enum(self, options, schema):
+        allowed = list(options)
+
+        def validate(value, path):
+            if value not in allowed:
+                yield path, f"值 {value!r} 不在允許範圍 {allowed}"
+        return validate
+
+    def _kw_const(self, const, schema):
+        def validate(value, path):
+            if value != const:
+                yield path, f"值應為 {const!r}，實際為 {value!r}"
+        return validate
+
+    def _numeric(self, limit, op, text):
+        def validate(value, path):
+            if _TYPE_CHECKS["number"](value) and not op(value, limit):
+                yield path, f"數值 {value} {text} {limit}"
+        return validate
+
+    def _kw_minimum(self, limit, schema):
+        return self._numeric(limit, lambda v, l: v >= l, "應 >=")
+
+    def _kw_maximum(self, limit, schema):
+        return self._numeric(limit, lambda v, l: v <= l, "應 <=")
+
+    def _kw_exclusiveMinimum(self, limit, schema):
+        return self._numeric(limit, lambda v, l: v > l, "應 >")
+
+    def _kw_exclusiveMaximum(self, limit, schema):
+        return self._numeric(limit, lambda v, l: v < l, "應 <")
+
+    def _kw_minLength(self, limit, schema):
+        def validate(value, path):
+            if isinstance(value, str) and len(value) < limit:
+                yield path, f"字串長度至少 {limit}"
+        return validate
+
+    # --- 物件 ---
+
+    def _kw_required(self, keys, schema):
+        def validate(value, path):
+            if isinstance(value, dict):
+                for key in keys:
+                    if key not in value:
+                        yield path, f"缺少必要欄位 '{key}'"
+        return validate
+
+    def _kw_properties(self, props, schema):
+        compiled = [(key, self.compile(sub)) for key, sub in props.items()]
+
+        def validate(value, path):
+            if isinstance(value, dict):
+                for key, sub in compiled:
+                    if key in value:
+                        yield from sub(value[key], f"{path}.{key}")
+        return validate
+
+    def _kw_additionalProperties(self, extra, schema):
+        known = set(schema.get("properties", {}))
+        sub = self.compile(extra)
+
+        def validate(value, path):
+            if isinstance(value, dict):
+                for key, item in value.items():
+                    if key not in known:
+                        if extra is False:
+                            yield path, f"不允許的欄位 '{key}'"
+                        else:
+                            yield from sub(item, f"{path}.{key}")
+        return validate
+
+    # --- 陣列 ---
+
+    def _kw_items(self, items, schema):
+        sub = self.compile(items)
+
+        def validate(value, path):
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    yield from sub(item, f"{path}[{i}]")
+        return validate
+
+    def _kw_minItems(self, limit, schema):
+        def validate(value, path):
+            if isinstance(value, list) and len(value) < limit:
+                yield path, f"陣列至少需要 {limit} 個項目，實際為 {len(value)}"
+        return validate
+
+    def _kw_maxItems(self, limit, schema):
+        def validate(value, path):
+            if isinstance(value, list) and len(value) > limit:
+                yield path, f"陣列最多 {limit} 個項目，實際為 {len(value)}"
+        return validate
+
+    # --- 組合 ---
+
+    def _kw_allOf(self, subs, schema):
+        compiled = [self.compile(sub) for sub in subs]
+
+        def validate(value, path):
+            for sub in compiled:
+                yield from sub(value, path)
+        return validate
+
+    def _kw_anyOf(self, subs, schema):
+        compiled = [self.compile(sub) for sub in subs]
+
+        def validate(value, path):
+            first_errors = None
+            for sub in compiled:
+                errors = list(sub(value, path))
+                if not errors:
+                    return
+                if first_errors is None or len(errors) < len(first_errors):
+                    first_errors = errors
+            # 回報最接近的候選錯誤，較容易定位
+            yield path, "不符合任何一種允許的格式"
+            yield from first_errors
+        return validate
+
+    def _kw_oneOf(self, subs, schema):
+        compiled = [self.compile(sub) for sub in subs]
+
+        def validate(value, path):
+            matches = sum(1 for sub in compiled if _is_valid(sub, value, path))
+            if matches != 1:
+                yield path, f"必須恰好符合一種格式（符合 {matches} 種）"
+        return validate
+
+    def _kw_not(self, sub, schema):
+        compiled = self.compile(sub)
+
+        def validate(value, path):
+            if _is_valid(compiled, value, path):
+                yield path, "不應符合被排除的格式"
+        return validate
+
+    def _kw_if(self, cond, schema):
+        test = self.compile(cond)
+        then = self.compile(schema["then"]) if "then" in schema else None
+        otherwise = self.compile(schema["else"]) if "else" in schema else None
+
+        def validate(value, path):
+            branch = then if _is_valid(test, value, path) else otherwise
+            if branch is not None:
+                yield from branch(value, path)
+        return validate
+
+
+def compile_schema(schema: dict) -> Validator:
+    """
+    編譯 schema
+
+    Args:
+        schema: JSON Schema（dict）
+
+    Returns:
+        validator(value, path) -> Iterator[(JSON 路徑, 錯誤訊息)]
+    """
+    return _Compiler(schema).compile(schema)
+
+
+def registered_figure_types() -> Tuple[str, ...]:
+    """modules.register_drawer / entry point 登錄的第三方圖表類型（不含內建類型）"""
+    from modules import BUILTIN_DRAWERS, drawer_types
+
+    return tuple(name for name in drawer_types() if name not in BUILTIN_DRAWERS)
+
+
+def _load_schema(name: str) -> dict:
+    with open(SCHEMA_DIR / SCHEMAS[name], "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def _builtin_figure_types() -> frozenset:
+    """slide_data schema 列出的內建圖表類型"""
+    return frozenset(_load_schema("slide_data")["$defs"]["figure_type"]["enum"])
+
+
+def _used_figure_types(document) -> set:
+    """文件中 figure 元素用到的類型（結構不符的部分略過，交給 schema 回報）"""
+    used = set()
+    pages = document.get("pages") if isinstance(document, dict) else None
+    for page in pages if isinstance(pages, list) else ():
+        elements = page.get("elements") if isinstance(page, dict) else None
+        for element in elements if isinstance(elements, list) else ():
+            if isinstance(element, dict) and element.get("kind") == "figure" and isinstance(element.get("type"), str):
+                used.add(element["type"])
+    return used
+
+
+@lru_cache(maxsize=None)
+def _compiled(name: str, figure_types: Tuple[str, ...]) -> Validator:
+    schema = _load_schema(name)
+    if figure_types:
+        enum = schema["$defs"]["figure_type"]["enum"]
+        enum.extend(t for t in figure_types if t not in enum)
+    return compile_schema(schema)
+
+
+def get_validator(name: str, document=None) -> Validator:
+    """
+    取得預先編譯的 validator（"slide_data" 或 "layout"）
+
+    slide_data 只以內建 figure type 編譯；document 用到非內建類型時才查詢圖表登錄表，
+    並加上其中已登錄的類型（未登錄的類型照常回報錯誤）。
+
+    Args:
+        name: "slide_data" 或 "layout"
+        document: 要驗證的文件（None 時只接受內建類型）
+    """
+    figure_types = ()
+    if name == "slide_data" and document is not None:
+        unknown = _used_figure_types(document) - _builtin_figure_types()
+        if unknown:
+            figure_types = tuple(sorted(unknown.intersection(registered_figure_types())))
+    return _compiled(name, figure_types)
+
+
+def iter_errors(name: str, document) -> Iterator[ValidationError]:
+    """單次走訪文件，逐筆產出錯誤（呼叫端可隨時停止）"""
+    return get_validator(name, document)(document, "$")
+
+
+def validate_document(name: str, document, max_errors: Optional[int] = None) -> List[ValidationError]:
+    """
+    驗證已載入的文件
+
+    Args:
+        name: "slide_data" 或 "layout"
+        document: JSON 內容
+        max_errors: 最多回報幾筆錯誤（None = 全部，1 = 遇錯即停）
+
+    Returns:
+        list: [(JSON 路徑, 錯誤訊息), ...]
+    """
+    errors = []
+    for error in iter_errors(name, document):
+        errors.append(error)
+        if max_errors is not None and len(errors) >= max_errors:
+            break
+    return errors
+
+
+def check_id_consistency(layout: dict, slide_data: dict) -> List[str]:
+    """
+    交叉檢查 layout 與 slide_data 的元素 ID（警告，不阻擋渲染）
+
+    Returns:
+        list: 警告訊息（layout 有但 slide_data 沒有內容的 ID）
+    """
+    data_ids = {
+        elem.get("id") for page in slide_data.get("pages", [])
+        for elem in page.get("elements", []) if isinstance(elem, dict)
+    }
+    pages = layout.get("pages", [layout])
+    warnings = []
+    for i, page in enumerate(pages):
+        for elem in page.get("elements", []):
+            elem_id = elem.get("id") if isinstance(elem, dict) else None
+            if elem_id and elem_id not in data_ids:
+                warnings.append(f"第 {page.get('page_number', i + 1)} 頁的 '{elem_id}' 在 slide_data 中沒有對應內容")
+    return warnings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="驗證 slide_data.json / layout.json 結構")
+    parser.add_argument("--layout", help="layout.json 路徑")
+    parser.add_argument("--data", help="slide_data.json 路徑")
+    parser.add_argument("--max-errors", type=int, help="每個檔案最多回報幾筆錯誤（預設全部）")
+    args = parser.parse_args()
+
+    if not args.layout and not args.data:
+        parser.error("至少需要 --layout 或 --data")
+
+    failed = False
+    for name, path in (("layout", args.layout), ("slide_data", args.data)):
+        if not path:
+            continue
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                document = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[錯誤] {path}: {e}")
+            failed = True
+            continue
+        errors = validate_document(name, document, args.max_errors)
+        for err_path, message in errors:
+            print(f"[錯誤] {path}: {err_path}: {message}")
+        failed = failed or bool(errors)
+        if not errors:
+            print(f"[validate] {path} 通過")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
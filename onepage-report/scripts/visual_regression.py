@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+visual_regression.py - 版面視覺回歸測試
+
+用法:
+    # 建立 / 更新基準圖
+    python visual_regression.py --baseline ./golden_png --synthetic small,medium \
+        --case ./golden/report_a --case ./golden/deck_b.pptx --update
+
+    # 修改 FLOW_LAYOUT_CONFIG、DIAGRAM_RATIOS 或繪圖函數後比對
+    python visual_regression.py --baseline ./golden_png --synthetic small,medium \
+        --case ./golden/report_a --case ./golden/deck_b.pptx --report ./visual_report
+
+案例來源：
+    --case DIR         目錄內含 layout.json + slide_data.json（以 python-pptx 渲染器重畫）
+    --case FILE.pptx   直接預覽既有的 PPTX
+    --synthetic NAME   bench/gen_synthetic.py 的內建規模（固定種子，內容穩定）
+
+layout.json 是輸入的一部分，DIAGRAM_RATIOS 的變動需先重新產生 layout.json 才會反映。
+比對結果寫到 <report>/index.html（有差異的頁面附目前圖與差異圖）；有差異時結束碼為 1。
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+SCRIPT_DIR = Path(__file__).parent
+REFERENCE_DIR = SCRIPT_DIR.parent / "reference"
+BENCH_DIR = SCRIPT_DIR.parent / "bench"
+sys.path.insert(0, str(REFERENCE_DIR))
+
+from tracing import span, start_tracing, stop_tracing, add_trace_argument
+from preview import preview_layout, preview_pptx
+from render_from_json import convert_slide_data_to_content_data, load_json
+from visual_diff import (DEFAULT_MIN_PIXELS, DEFAULT_THRESHOLD, DEFAULT_TILE, SlideReport,
+                         compare_images, diff_image, write_html_report)
+
+# 回歸比對的預覽倍率（480x270，9pt 字仍會畫出字形）
+DEFAULT_SCALE = 0.5
+
+
+class GoldenCase(NamedTuple):
+    """一組黃金輸入"""
+    name: str
+    pptx: Optional[str] = None
+    layout: Optional[Dict] = None
+    slide_data: Optional[Dict] = None
+
+
+def collect_cases(paths: List[str], presets: List[str]) -> List[GoldenCase]:
+    """由 --case 路徑與 --synthetic 規模組出案例列表"""
+    cases = []
+    for raw in paths:
+        path = Path(raw)
+        if path.suffix.lower() == ".pptx":
+            cases.append(GoldenCase(path.stem, pptx=str(path)))
+        elif (path / "layout.json").exists() and (path / "slide_data.json").exists():
+            cases.append(GoldenCase(path.name, layout=load_json(str(path / "layout.json")),
+                                    slide_data=load_json(str(path / "slide_data.json"))))
+        else:
+            raise SystemExit(f"[visual_regression] 無法辨識的案例（需為 .pptx 或含 layout.json + slide_data.json 的目錄）: {raw}")
+    if presets:
+        sys.path.insert(0, str(BENCH_DIR))
+        from gen_synthetic import PRESETS, generate
+
+        for preset in presets:
+            if preset not in PRESETS:
+                raise SystemExit(f"[visual_regression] 未知的規模: {preset}（可用: {', '.join(sorted(PRESETS))}）")
+            data = generate(**PRESETS[preset])
+            cases.append(GoldenCase(f"synthetic-{preset}", layout=data["layout"], slide_data=data["slide_data"]))
+    return cases
+
+
+def render_case(case: GoldenCase, scale: float) -> List:
+    """將案例畫成預覽圖（依頁序）"""
+    options = dict(scale=scale, supersample=1)
+    if case.pptx:
+        return preview_pptx(case.pptx, **options)
+    content_data = convert_slide_data_to_content_data(case.slide_data)
+    return preview_layout(case.layout.get("pages", [case.layout]), content_data, **options)
+
+
+def check_case(case: GoldenCase, images: List, baseline_dir: Path, report_dir: Path,
+               threshold: float, tile: int, min_pixels: int) -> List[SlideReport]:
+    """逐頁比對基準圖，有差異的頁面寫出目前圖與差異圖"""
+    from PIL import Image
+
+    baseline_case = baseline_dir / case.name
+    out_case = report_dir / case.name
+    reports = []
+    count = max(len(images), len(list(baseline_case.glob("slide_*.png"))))
+    for number in range(1, count + 1):
+        baseline_path = baseline_case / f"slide_{number:02d}.png"
+        current = images[number - 1] if number <= len(images) else None
+        if current is None:
+            reports.append(SlideReport(case.name, number, "removed", baseline=str(baseline_path)))
+            continue
+        current_path = out_case / f"slide_{number:02d}.current.png"
+        if not baseline_path.exists():
+            out_case.mkdir(parents=True, exist_ok=True)
+            current.save(current_path, "PNG")
+            reports.append(SlideReport(case.name, number, "added", 1.0, current=str(current_path)))
+            continue
+
+        with Image.open(baseline_path) as stored:
+            baseline = stored.convert("RGB")
+        result = compare_images(baseline, current, threshold, tile, min_pixels)
+        if not result.changed:
+            reports.append(SlideReport(case.name, number, "same", baseline=str(baseline_path)))
+            continue
+        out_case.mkdir(parents=True, exist_ok=True)
+        diff_path = out_case / f"slide_{number:02d}.diff.png"
+        current.save(current_path, "PNG")
+        diff_image(baseline, current, result).save(diff_path, "PNG")
+        reports.append(SlideReport(case.name, number, "changed", result.score, len(result.regions),
+                                   str(baseline_path), str(current_path), str(diff_path)))
+    return reports
+
+
+def update_baseline(case: GoldenCase, images: List, baseline_dir: Path):
+    """以目前的預覽取代基準圖（先清掉舊的頁面，避免頁數減少時殘留）"""
+    target = baseline_dir / case.name
+    target.mkdir(parents=True, exist_ok=True)
+    for stale in target.glob("slide_*.png"):
+        stale.unlink()
+    for number, image in enumerate(images, 1):
+        image.save(target / f"slide_{number:02d}.png", "PNG")
+
+
+def run_case(case: GoldenCase, baseline_dir: Path, report_dir: Path, scale: float, update: bool,
+             threshold: float, tile: int, min_pixels: int) -> List[SlideReport]:
+    """畫出單一案例並比對（或更新基準圖）；可在子程序執行"""
+    with span("render_case", cat="render", case=case.name):
+        images = render_case(case, scale)
+    if update:
+        update_baseline(case, images, baseline_dir)
+        print(f"  - {case.name}: 基準圖 {len(images)} 頁")
+        return []
+    with span("compare_case", cat="compare", case=case.name):
+        reports = check_case(case, images, baseline_dir, report_dir, threshold, tile, min_pixels)
+    failed = sum(1 for r in reports if r.status != "same")
+    print(f"  - {case.name}: {len(reports)} 頁，{failed} 頁有差異")
+    return reports
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="視覺回歸測試 - 重畫黃金輸入並與基準圖比對"
+    )
+    parser.add_argument("--baseline", required=True, help="基準圖目錄（<baseline>/<案例>/slide_NN.png）")
+    parser.add_argument("--case", action="append", default=[],
+                        help="案例：.pptx 檔，或含 layout.json + slide_data.json 的目錄（可重複）")
+    parser.add_argument("--synthetic", help="合成案例規模（逗號分隔，例如 small,medium）")
+    parser.add_argument("--report", default="./visual_report", help="報告輸出目錄（預設 ./visual_report）")
+    parser.add_argument("--update", action="store_true", help="以目前結果更新基準圖")
+    parser.add_argument("--scale", type=float, default=DEFAULT_SCALE,
+                        help=f"預覽倍率（每 pt 像素數，預設 {DEFAULT_SCALE}）")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"感知差門檻 0~1（預設 {DEFAULT_THRESHOLD}）")
+    parser.add_argument("--tile", type=int, default=DEFAULT_TILE, help=f"分塊大小（像素，預設 {DEFAULT_TILE}）")
+    parser.add_argument("--min-pixels", type=int, default=DEFAULT_MIN_PIXELS,
+                        help=f"方塊內變動像素達此數才標記（預設 {DEFAULT_MIN_PIXELS}）")
+    parser.add_argument("--workers", type=int, help="平行程序數（以案例為單位；預設 CPU 數，1 = 不平行）")
+    add_trace_argument(parser)
+
+    args = parser.parse_args()
+    presets = [p.strip() for p in (args.synthetic or "").split(",") if p.strip()]
+    cases = collect_cases(args.case, presets)
+    if not cases:
+        parser.error("至少需要一個 --case 或 --synthetic")
+    if args.trace:
+        start_tracing(args.trace, "visual_regression")
+
+    worker = partial(run_case, baseline_dir=Path(args.baseline), report_dir=Path(args.report),
+                     scale=args.scale, update=args.update, threshold=args.threshold,
+                     tile=args.tile, min_pixels=args.min_pixels)
+    reports: List[SlideReport] = []
+    start = time.perf_counter()
+    try:
+        if len(cases) > 1 and args.workers != 1:
+            with ProcessPoolExecutor(max_workers=args.workers) as pool:
+                for case_reports in pool.map(worker, cases):
+                    reports.extend(case_reports)
+        else:
+            for case in cases:
+                reports.extend(worker(case))
+    finally:
+        stop_tracing()
+    elapsed = time.perf_counter() - start
+
+    if args.update:
+        print(f"[visual_regression] 已更新基準圖 → {args.baseline}（{elapsed:.2f}s）")
+        return
+    failed = [r for r in reports if r.status != "same"]
+    path = write_html_report(reports, str(Path(args.report) / "index.html"))
+    print(f"[visual_regression] {len(reports)} 頁，{len(failed)} 頁有差異（{elapsed:.2f}s）")
+    print(f"[visual_regression] 報告: {path}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
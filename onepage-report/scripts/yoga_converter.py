@@ -23,10 +23,15 @@ v2.0 改進（真正的 One Page）：
 import re
 import os
 import json
+import sys
 import argparse
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 
+# 加入 reference 目錄到路徑（tracing）
+sys.path.insert(0, str(Path(__file__).parent.parent / "reference"))
+from tracing import span, traced, start_tracing, stop_tracing, add_trace_argument
+
 
 # 圖表類型與適合的 ratio 對應（預設使用緊湊型）
 DIAGRAM_RATIOS = {
@@ -311,6 +316,7 @@ def convert_one_page_to_yoga(one_page_md: str, diagrams: dict, mode: str = "one_
     return '\n'.join(result_lines)
 
 
+@traced("parse_diagram_content", cat="convert")
 def parse_diagram_content(diagram_section: str, diagram_type: str) -> dict:
     """
     解析圖表內容區塊，提取結構化渲染資料
@@ -657,6 +663,7 @@ def _parse_comparison_content(content_block: str) -> dict:
     return result
 
 
+@traced("extract_chart_data", cat="convert")
 def extract_chart_data_from_diagrams(diagrams_md: str) -> dict:
     """
     從 diagrams.md 提取可用於圖表的數據
@@ -686,6 +693,7 @@ def extract_chart_data_from_diagrams(diagrams_md: str) -> dict:
     return chart_data
 
 
+@traced("convert_files", cat="convert")
 def convert_files(
     one_page_path: str,
     diagrams_path: str,
@@ -710,14 +718,17 @@ def convert_files(
     Returns:
         dict: 轉換結果
     """
-    with open(one_page_path, 'r', encoding='utf-8') as f:
-        one_page_md = f.read()
+    with span("read_inputs", cat="io"):
+        with open(one_page_path, 'r', encoding='utf-8') as f:
+            one_page_md = f.read()
 
-    with open(diagrams_path, 'r', encoding='utf-8') as f:
-        diagrams_md = f.read()
+        with open(diagrams_path, 'r', encoding='utf-8') as f:
+            diagrams_md = f.read()
 
-    diagrams_info = parse_diagrams_spec(diagrams_md)
-    yoga_md = convert_one_page_to_yoga(one_page_md, diagrams_info, mode)
+    with span("parse_diagrams_spec", cat="convert"):
+        diagrams_info = parse_diagrams_spec(diagrams_md)
+    with span("convert_one_page_to_yoga", cat="convert", mode=mode):
+        yoga_md = convert_one_page_to_yoga(one_page_md, diagrams_info, mode)
 
     output_dir = Path(output_path).parent
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -817,8 +828,9 @@ def convert_files(
             "mode": mode
         }
 
-        with open(content_output_path, 'w', encoding='utf-8') as f:
-            json.dump(content_data, f, ensure_ascii=False, indent=2)
+        with span("write_content_json", cat="io"):
+            with open(content_output_path, 'w', encoding='utf-8') as f:
+                json.dump(content_data, f, ensure_ascii=False, indent=2)
 
         result["content_json_path"] = content_output_path
 
@@ -859,17 +871,24 @@ def main():
         help='Path to AI pre-processed structured diagrams JSON (optional). '
              'If provided, will use this instead of parsing diagrams.md'
     )
+    add_trace_argument(parser)
 
     args = parser.parse_args()
 
-    result = convert_files(
-        args.one_page,
-        args.diagrams,
-        args.output,
-        args.content_json,
-        args.mode,
-        getattr(args, 'diagrams_structured', None)
-    )
+    if args.trace:
+        start_tracing(args.trace, "yoga_converter")
+
+    try:
+        result = convert_files(
+            args.one_page,
+            args.diagrams,
+            args.output,
+            args.content_json,
+            args.mode,
+            getattr(args, 'diagrams_structured', None)
+        )
+    finally:
+        stop_tracing()
 
     print(f"Converted: {result['yoga_md_path']}")
     print(f"Mode: {result['mode']}")
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""bench/run_bench.py：最近序位法百分位數"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT / "bench"), str(ROOT / "reference")]
+
+from run_bench import _percentile
+
+
+def test_nearest_rank_percentile():
+    samples = list(range(1, 101))
+    assert _percentile(samples, 50) == 50
+    assert _percentile(samples, 99) == 99
+    assert _percentile(samples, 7) == 7
+    assert _percentile(samples, 100) == 100
+    assert _percentile(samples, 0) == 1
+    assert _percentile([1, 2, 3, 4], 50) == 2
+    assert _percentile([5.0], 99) == 5.0
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""圖表資料：數值比類別多時補空類別，python-pptx 與 pywin32 版本都不丟棄多出的數值"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "reference"))
+
+from modules._downsample import downsample_chart
+from modules_pywin32.draw_line_chart_pywin32 import _data_block
+
+SERIES = [{"name": "s", "values": [1, 2, 3, 4]}, {"name": "t", "values": [5]}]
+
+
+def test_com_data_block_pads_categories():
+    assert _data_block(["a", "b"], SERIES) == (
+        (None, "s", "t"), ("a", 1, 5), ("b", 2, None), (None, 3, None), (None, 4, None))
+
+
+def test_native_chart_keeps_values_beyond_categories():
+    pytest.importorskip("pptx")
+    from pptx import Presentation
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.util import Inches
+    from modules._chartxml import NativeChartData
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    chart = slide.shapes.add_chart(XL_CHART_TYPE.LINE, 0, 0, Inches(4), Inches(3),
+                                   NativeChartData(["a", "b"], SERIES)).chart
+    assert list(chart.plots[0].series[0].values) == [1, 2, 3, 4]
+
+
+def test_downsampling_keeps_values_beyond_categories():
+    categories, series = downsample_chart(["a"], [{"name": "s", "values": list(range(1000))}], 100)
+    assert len(categories) == len(series[0]["values"]) <= 200
+    assert series[0]["values"][-1] == 999
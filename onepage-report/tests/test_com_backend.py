@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""scene.com_backend：以假的 COM 物件檢查 run 位置、表格框線與甘特圖；COM 渲染器不載入 python-pptx"""
+
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+REFERENCE = Path(__file__).resolve().parent.parent / "reference"
+sys.path.insert(0, str(REFERENCE))
+
+from scene.com_backend import apply_text_frame, flush_com
+from scene.nodes import Paragraph, Run, Scene, TableCell, TextStyle, para, text_frame
+
+
+class _Any:
+    """接受任意屬性設定與呼叫的 COM 物件替身"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        child = _Any()
+        object.__setattr__(self, name, child)
+        return child
+
+    def __call__(self, *args):
+        self.calls.append(args)
+        return _Any()
+
+
+class _TextRange(_Any):
+    def __init__(self):
+        super().__init__()
+        self.characters = []
+
+    def Characters(self, start, length):
+        self.characters.append((start, length))
+        return _Any()
+
+
+def test_run_offsets_count_utf16_units():
+    style = TextStyle(10, False, (0, 0, 0))
+    frame = text_frame([Paragraph((Run("😀a", style), Run("b", style)), None, None), para("c", style)])
+    tf = _Any()
+    tf.TextRange = _TextRange()
+    apply_text_frame(tf, frame)
+    # 😀 佔 2 個 UTF-16 單位；第二段前有 \r
+    assert tf.TextRange.characters == [(1, 3), (4, 1), (6, 1)]
+
+
+def test_table_border_is_applied():
+    borders = []
+
+    class Cell(_Any):
+        def Borders(self, side):
+            border = SimpleNamespace(ForeColor=SimpleNamespace())
+            borders.append((side, border))
+            return border
+
+    class Table(_Any):
+        def __init__(self):
+            super().__init__()
+            self.cell = Cell()
+
+        def Cell(self, r, c):
+            return self.cell
+
+    table = Table()
+    shape = _Any()
+    shape.Table = table
+    slide = _Any()
+    slide.Shapes = _Any()
+    slide.Shapes.AddTable = lambda *args: shape
+
+    scene = Scene()
+    style = TextStyle(10, False, (0, 0, 0))
+    scene.table(0, 0, 100, 40, [[TableCell(text_frame(para(t, style))) for t in "ab"]], border=(255, 0, 0))
+    flush_com(scene, slide)
+    assert sorted(side for side, _ in borders) == [1, 1, 2, 2, 3, 3, 4, 4]
+    assert all(border.ForeColor.RGB == 0x0000FF and border.Weight == 0.5 for _, border in borders)
+
+
+def test_com_renderer_does_not_load_pptx():
+    code = ("import sys; import render_pywin32; "
+            "assert not {'pptx', 'lxml', 'PIL'} & set(sys.modules), sorted({'pptx', 'lxml', 'PIL'} & set(sys.modules))")
+    subprocess.run([sys.executable, "-c", code], cwd=REFERENCE, check=True, capture_output=True)
+
+
+def _shape_calls(slide):
+    return sum(len(child.calls) for child in vars(slide.Shapes).values() if isinstance(child, _Any))
+
+
+def test_gantt_chart_is_rendered_through_com():
+    import render_pywin32
+
+    renderer = object.__new__(render_pywin32.LayoutRenderer)
+    renderer._slide_size = (render_pywin32.SLIDE_WIDTH_PT, render_pywin32.SLIDE_HEIGHT_PT)
+    continuations = []
+    renderer._add_continuation_slide = lambda title: continuations.append(_Any()) or continuations[-1]
+    renderer._render_placeholder = lambda *args: pytest.fail("甘特圖不應退回佔位框")
+
+    tasks = [{"name": f"任務 {i}", "start": "2025-01-06", "end": "2025-01-19", "group": f"G{i % 4}"}
+             for i in range(120)]
+    slide = _Any()
+    renderer._render_figure(slide, 30, 80, 900, 400, {"id": "fig:plan"},
+                            {"diagrams_content": {"plan": {"type": "gantt_chart", "tasks": tasks}}})
+    assert _shape_calls(slide) > 0 and not continuations
+
+    slide = _Any()
+    renderer._render_figure(slide, 30, 80, 900, 400, {"id": "fig:plan"},
+                            {"diagrams_content": {"plan": {"type": "gantt_chart", "tasks": tasks, "overflow": True}}})
+    assert continuations and all(_shape_calls(s) > 0 for s in [slide] + continuations)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""deck_merge：例外時不留下輸出、投影片大小的容許誤差、app.xml 的頁數與標題，以及 CLI 的錯誤處理"""
+
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pptx")
+from lxml import etree
+from pptx import Presentation
+from pptx.util import Emu
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "reference"))
+
+from deck_merge import DeckMerger, merge_decks
+
+_NS_EP = "http://schemas.openxmlformats.org/officeDocument/2006/extended-properties"
+_NS_VT = "http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes"
+
+
+def _deck(path, titles, width=12192000):
+    prs = Presentation()
+    prs.slide_width, prs.slide_height = Emu(width), Emu(6858000)
+    for title in titles:
+        prs.slides.add_slide(prs.slide_layouts[5]).shapes.title.text = title
+    prs.save(path)
+    return str(path)
+
+
+def test_exception_leaves_no_output(tmp_path):
+    output = tmp_path / "review.pptx"
+    deck = _deck(tmp_path / "a.pptx", ["A"])
+    with pytest.raises(RuntimeError):
+        with DeckMerger(output) as merger:
+            merger.add_deck(deck)
+            raise RuntimeError("中斷")
+    assert list(tmp_path.iterdir()) == [tmp_path / "a.pptx"]
+
+
+def test_slide_size_rounding_is_tolerated(tmp_path):
+    a = _deck(tmp_path / "a.pptx", ["A"], width=12192000)
+    b = _deck(tmp_path / "b.pptx", ["B"], width=12191695)
+    assert merge_decks([a, b], tmp_path / "review.pptx").slides == 2
+
+    c = _deck(tmp_path / "c.pptx", ["C"], width=9144000)
+    with pytest.raises(ValueError):
+        merge_decks([a, c], tmp_path / "mixed.pptx")
+    assert not (tmp_path / "mixed.pptx").exists()
+
+
+def test_app_properties_follow_merged_slides(tmp_path):
+    a = _deck(tmp_path / "a.pptx", ["第一頁", "第二頁"])
+    b = _deck(tmp_path / "b.pptx", ["第三頁"])
+    output = tmp_path / "review.pptx"
+    merge_decks([a, b], output)
+
+    with zipfile.ZipFile(output) as z:
+        app = etree.fromstring(z.read("docProps/app.xml"))
+    assert app.findtext(f"{{{_NS_EP}}}Slides") == "3"
+    pairs = [v[0].text for v in app.find(f"{{{_NS_EP}}}HeadingPairs/{{{_NS_VT}}}vector")]
+    assert pairs == ["Theme", "1", "Slide Titles", "3"]
+    parts = app.find(f"{{{_NS_EP}}}TitlesOfParts/{{{_NS_VT}}}vector")
+    assert parts.get("size") == "4"
+    assert [t.text for t in parts][1:] == ["第一頁", "第二頁", "第三頁"]
+    assert len(Presentation(str(output)).slides) == 3
+
+
+def test_cli_reports_size_mismatch(tmp_path):
+    a = _deck(tmp_path / "a.pptx", ["A"])
+    b = _deck(tmp_path / "b.pptx", ["B"], width=9144000)
+    output = tmp_path / "review.pptx"
+    result = subprocess.run([sys.executable, str(ROOT / "scripts" / "merge_decks.py"), "-o", str(output), a, b],
+                            capture_output=True, text=True, encoding="utf-8")
+    assert result.returncode == 1
+    assert result.stderr.strip().count("\n") == 0
+    assert "投影片大小不一致" in result.stderr
+    assert not output.exists()
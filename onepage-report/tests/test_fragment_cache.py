@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""fragment_cache：磁碟層容量統計（覆寫同一個 key 不重複計算）"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pptx")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "reference"))
+
+from fragment_cache import FragmentCache
+
+
+def test_overwrite_does_not_double_count_disk_bytes(tmp_path):
+    cache = FragmentCache(disk_dir=tmp_path)
+    cache.put("a", b"x" * 100)
+    cache.put("a", b"y" * 40)
+    cache.put("b", b"z" * 10)
+    assert cache.stats()["disk_bytes"] == 50 == sum(p.stat().st_size for p in tmp_path.glob("*.xml"))
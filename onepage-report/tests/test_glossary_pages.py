@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""draw_glossary_pages：預設在本程序依序產生各頁，只有頁數很多或指定 workers 才開 process pool"""
+
+import importlib
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "reference"))
+
+# modules 套件把同名函數 draw_glossary_pages 匯出為屬性，模組本身以 import_module 取得
+glossary = importlib.import_module("modules.draw_glossary_pages")
+
+
+def _terms(count):
+    return [{"term": f"T{i}", "desc": "說明文字 " * (5 + i % 30)} for i in range(count)]
+
+
+def test_default_renders_serially(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("預設不應開 process pool")
+
+    monkeypatch.setattr(glossary, "ProcessPoolExecutor", no_pool)
+    pages = glossary.paginate_glossary(_terms(400))
+    assert 1 < len(pages) < glossary.PARALLEL_MIN_PAGES
+    xmls = glossary.glossary_slide_xmls("附錄", pages)
+    assert len(xmls) == len(pages)
+    assert all(xml.startswith("<") for xml in xmls)
+
+
+def test_large_appendix_uses_pool(monkeypatch):
+    used = []
+
+    class FakePool:
+        def __init__(self, max_workers):
+            used.append(max_workers)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, fn, jobs):
+            return map(fn, jobs)
+
+    monkeypatch.setattr(glossary, "ProcessPoolExecutor", FakePool)
+    monkeypatch.setattr(glossary, "PARALLEL_MIN_PAGES", 2)
+    monkeypatch.setattr(glossary.os, "cpu_count", lambda: 4)
+    pages = glossary.paginate_glossary(_terms(60))
+    glossary.glossary_slide_xmls("附錄", pages)
+    assert used == [min(4, len(pages))]
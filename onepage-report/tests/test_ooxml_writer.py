@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""OoxmlDeckWriter：with 區塊內發生例外時不寫出簡報"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "reference"))
+
+pytest.importorskip("pptx")
+
+from pptx import Presentation
+
+from scene import OoxmlDeckWriter, Scene
+
+
+def test_writes_deck_on_success(tmp_path):
+    output = tmp_path / "deck.pptx"
+    with OoxmlDeckWriter(output) as deck:
+        deck.add_slide(Scene(unit="in"))
+        deck.add_slide(Scene(unit="in"))
+    assert len(Presentation(str(output)).slides) == 2
+    assert list(tmp_path.iterdir()) == [output]
+
+
+def test_exception_discards_output(tmp_path):
+    output = tmp_path / "deck.pptx"
+    output.write_bytes(b"previous")
+    with pytest.raises(RuntimeError):
+        with OoxmlDeckWriter(output) as deck:
+            deck.add_slide(Scene(unit="in"))
+            raise RuntimeError("渲染失敗")
+    assert output.read_bytes() == b"previous"
+    assert list(tmp_path.iterdir()) == [output]
+
+
+def test_presentation_part_has_one_slide_list(tmp_path):
+    import zipfile
+
+    output = tmp_path / "deck.pptx"
+    with OoxmlDeckWriter(output) as deck:
+        deck.add_slide(Scene(unit="in"))
+    xml = zipfile.ZipFile(output).read("ppt/presentation.xml").decode("utf-8")
+    assert xml.count("<p:sldIdLst") == 1
+    assert xml.count("<p:sldId ") == 1
+    assert 'type="screen4x3"' not in xml
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""pipeline_dag：多個步驟同時完成時，狀態檔寫入不能互相干擾"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "reference"))
+
+from pipeline_dag import RAN, PipelineExecutor, Step
+
+
+def test_concurrent_completion_saves_state(tmp_path):
+    steps = [Step(f"s{i}", lambda: None, params={"i": i}) for i in range(200)]
+    for _ in range(3):
+        results = PipelineExecutor(steps, str(tmp_path / "state"), root=str(tmp_path), workers=16).run(
+            force=[step.name for step in steps])
+        failed = [r for r in results if r.status != RAN]
+        assert not failed, failed[:3]
+
+    state = json.loads((tmp_path / "state" / "state.json").read_text(encoding="utf-8"))
+    assert len(state["steps"]) == 200
+    assert not (tmp_path / "state" / "state.tmp").exists()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""scene.pptx_import：原生圖表轉回 Scene 時沿用標題、文字與數列的顏色"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pptx")
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "reference"))
+
+from modules._colors import COLOR_TEXT
+from modules.draw_bar_chart import draw_bar_chart
+from modules.draw_line_chart import draw_line_chart
+from modules.draw_pie_chart import draw_pie_chart
+from scene.pptx_import import slide_to_scene
+
+RED, GREEN = (200, 30, 30), (20, 160, 60)
+
+
+def _slide():
+    prs = Presentation()
+    return prs.slides.add_slide(prs.slide_layouts[6])
+
+
+def _texts(scene):
+    return {run.text: run.style for node in scene if getattr(node, "text", None)
+            for p in node.text.paragraphs for run in p.runs}
+
+
+def test_line_chart_keeps_title_and_series_colors():
+    slide = _slide()
+    draw_line_chart(slide, 0, 0, 6, 3, "延遲趨勢", ["W1", "W2", "W3"],
+                    [{"name": "延遲", "values": [80, 65, 45], "color": RGBColor(*RED)},
+                     {"name": "吞吐", "values": [20, 30, 50], "color": RGBColor(*GREEN)}])
+    scene = slide_to_scene(slide)
+    title = _texts(scene)["延遲趨勢"]
+    assert (title.size, title.bold, title.color) == (12, True, tuple(COLOR_TEXT))
+    assert _texts(scene)["W1"].color == (51, 51, 51)
+    assert [node.line for node in scene if node.kind == "path"] == [RED, GREEN]
+
+
+def test_bar_and_pie_keep_fills():
+    slide = _slide()
+    draw_bar_chart(slide, 0, 0, 6, 3, "數量", ["A", "B"], [{"name": "s", "values": [1, 2], "color": RGBColor(*RED)}])
+    assert {node.fill for node in slide_to_scene(slide) if node.kind == "shape" and node.geom == "RECTANGLE"
+            and node.fill not in (None, (255, 255, 255))} == {RED}
+
+    slide = _slide()
+    draw_pie_chart(slide, 0, 0, 6, 3, "占比", [{"name": "A", "value": 60, "color": RGBColor(*GREEN)},
+                                              {"name": "B", "value": 40}])
+    fills = [node.fill for node in slide_to_scene(slide) if node.kind == "path" and node.closed]
+    assert fills[0] == GREEN and fills[1] != GREEN
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""profiling：第一個參數是 Presentation 的繪圖函數以整份簡報計數"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "reference"))
+
+pytest.importorskip("pptx")
+
+from pptx import Presentation
+
+from profiling import disable_profiling, enable_profiling
+
+
+def test_presentation_drawer_counts_added_slides():
+    prs = Presentation()
+    prs.slides.add_slide(prs.slide_layouts[6])
+    terms = [{"term": f"T{i}", "desc": "說明文字 " * (5 + i % 30)} for i in range(60)]
+    profiler = enable_profiling(track_memory=False)
+    try:
+        from modules import draw_glossary_pages
+        slides = draw_glossary_pages(prs, "附錄", terms)
+    finally:
+        disable_profiling()
+
+    calls = [c for c in profiler.calls if c["drawer"] == "draw_glossary_pages"]
+    assert len(calls) == 1
+    assert len(slides) > 1
+    assert calls[0]["slide"] == f"2-{len(slides) + 1}"
+    assert calls[0]["shapes"] == sum(len(s.shapes) for s in slides)
+    assert calls[0]["text_runs"] > 0
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""render_service：只接受帶 token、非瀏覽器、JSON 的請求"""
+
+import http.client
+import json
+import socket
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "reference"))
+
+from render_client import TOKEN_HEADER, ServiceClient, read_token, token_path
+from render_service import RenderService, make_server
+
+if not hasattr(socket, "AF_UNIX"):
+    pytest.skip("需要 Unix socket", allow_module_level=True)
+
+
+class _Connection(http.client.HTTPConnection):
+    def __init__(self, path):
+        super().__init__("localhost", timeout=10)
+        self._path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self._path)
+
+
+@pytest.fixture
+def server(tmp_path):
+    address = f"unix:{tmp_path / 'render.sock'}"
+    server = make_server(RenderService(workers=1), address)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, address
+    server.shutdown()
+    server.server_close()
+
+
+def _post(address, path, payload, headers):
+    conn = _Connection(address[len("unix:"):])
+    try:
+        conn.request("POST", path, json.dumps(payload).encode("utf-8"), headers)
+        response = conn.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        conn.close()
+
+
+def _job(output):
+    return {"kind": "render", "params": {"layout": "l.json", "data": "d.json", "output": str(output)}}
+
+
+def test_token_file_is_private(server):
+    _, address = server
+    path = Path(token_path(address))
+    assert path.stat().st_mode & 0o077 == 0
+    assert read_token(address) == server[0].token
+
+
+def test_rejects_missing_token(server, tmp_path):
+    _, address = server
+    status, _ = _post(address, "/jobs", _job(tmp_path / "out.pptx"), {"Content-Type": "application/json"})
+    assert status == 403
+
+
+def test_rejects_browser_origin(server, tmp_path):
+    srv, address = server
+    status, _ = _post(address, "/shutdown", {}, {"Content-Type": "application/json", TOKEN_HEADER: srv.token,
+                                                 "Origin": "http://evil.example"})
+    assert status == 403
+
+
+def test_rejects_non_json_content_type(server, tmp_path):
+    srv, address = server
+    status, _ = _post(address, "/jobs", _job(tmp_path / "out.pptx"),
+                      {"Content-Type": "text/plain", TOKEN_HEADER: srv.token})
+    assert status == 415
+
+
+def test_client_uses_token_file(server):
+    _, address = server
+    assert "queued" in ServiceClient(address).metrics()
+    with pytest.raises(ValueError):
+        ServiceClient(address).submit("no_such_kind", {})
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""auto-fit：放不下的文字確實縮小；pywin32 路徑載入 _textfit 不執行 modules 套件"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REFERENCE = Path(__file__).resolve().parent.parent / "reference"
+sys.path.insert(0, str(REFERENCE))
+
+
+def test_pywin32_shapes_do_not_import_modules_package():
+    code = ("import sys; import modules_pywin32._shapes_pywin32; "
+            "assert 'modules' not in sys.modules and 'pptx' not in sys.modules, "
+            "sorted(m for m in sys.modules if m.split('.')[0] in ('modules', 'pptx'))")
+    subprocess.run([sys.executable, "-c", code], cwd=REFERENCE, check=True)
+
+
+def test_content_box_default_shrinks_long_content():
+    pytest.importorskip("pptx")
+    from pptx import Presentation
+    from modules import add_content_box
+    from modules._textfit import overflow_min_size
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    add_content_box(slide, 0, 0, 3, 1.5, "短", ["短內容"])
+    add_content_box(slide, 3, 0, 3, 1.5, "長", ["很長的說明文字，需要折成好幾行才放得下" * 3] * 3)
+    short_size, long_size = [shape.text_frame.paragraphs[0].runs[0].font.size.pt
+                             for shape in list(slide.shapes)[1::2]]
+    assert short_size == 9
+    assert long_size < short_size
+    assert long_size >= overflow_min_size("body", 9)
+
+
+@pytest.mark.parametrize("start", [8, 10, 11, 14])
+def test_long_text_shrinks_below_start(start):
+    from modules._textfit import fit_font_size, min_font_size, overflow_min_size
+
+    long_text = "很長的說明文字需要折成好幾行才放得下。" * 8
+    size = fit_font_size(long_text, 200, 60, start, role="body")
+    assert overflow_min_size("body", start) <= size < min(start, min_font_size("body"))
+    assert fit_font_size("短", 200, 60, start, role="body") == start
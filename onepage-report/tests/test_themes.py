@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""scene.themes：內附主題的文字對比，以及填色與文字分開換色"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "reference"))
+
+from scene.themes import check_contrast, load_theme, style_map, theme_slide_xml
+
+THEME_FILES = sorted((ROOT / "templates" / "themes").glob("*.json"))
+
+
+@pytest.mark.parametrize("path", THEME_FILES, ids=lambda p: p.stem)
+def test_shipped_theme_contrast(path):
+    assert check_contrast(load_theme(path)) == []
+
+
+def test_white_fill_and_white_text_are_themed_separately():
+    dark = load_theme(ROOT / "templates" / "themes" / "dark.json")
+    xml = ('<p:sp><p:spPr><a:solidFill><a:srgbClr val="FFFFFF"/></a:solidFill></p:spPr>'
+           '<a:r><a:rPr lang="zh-TW" sz="900"><a:solidFill><a:srgbClr val="FFFFFF"/></a:solidFill></a:rPr>'
+           '<a:t>標題</a:t></a:r>'
+           '<a:r><a:rPr lang="zh-TW"><a:solidFill><a:srgbClr val="333333"/></a:solidFill></a:rPr>'
+           '<a:t>內文</a:t></a:r><a:endParaRPr lang="zh-TW"/></p:sp>')
+    themed = theme_slide_xml(xml, dark)
+    assert themed.count('<a:srgbClr val="252526"/>') == 1       # 卡片底色換暗
+    assert themed.count('<a:srgbClr val="FFFFFF"/>') == 1       # 色塊上的白字維持白色
+    assert themed.count('<a:srgbClr val="EEEEEE"/>') == 1       # 內文換亮
+
+
+def test_chart_default_text_is_themed():
+    pytest.importorskip("pptx")
+    from pptx.enum.chart import XL_CHART_TYPE
+    from modules._chartxml import NativeChartData
+
+    xml = NativeChartData(["a", "b"], [{"name": "s", "values": [1, 2]}]).xml_bytes(XL_CHART_TYPE.LINE).decode()
+    themed = theme_slide_xml(xml, load_theme(ROOT / "templates" / "themes" / "dark.json"))
+    assert '<a:defRPr sz="1800"><a:solidFill><a:srgbClr val="EEEEEE"/>' in themed
+
+
+def test_text_colors_only_change_text():
+    mapping = style_map(load_theme({"name": "t", "colors": {"white": "#101010"},
+                                    "text_colors": {"white": "#FFFFFF"}}))
+    assert mapping.colors == {(255, 255, 255): (16, 16, 16)}
+    assert mapping.text_colors == {}
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""validate_json：內建圖表類型不查詢登錄表，第三方類型依登錄表接受"""
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "reference"))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import validate_json
+from modules import register_drawer, unregister_drawer
+
+
+def _document(figure_type):
+    return {"metadata": {"title": "t"},
+            "pages": [{"page": 1, "elements": [{"id": "f1", "kind": "figure", "type": figure_type, "data": {}}]}]}
+
+
+def test_builtin_types_skip_the_registry(monkeypatch):
+    def fail():
+        raise AssertionError("內建類型不應查詢登錄表")
+
+    monkeypatch.setattr(validate_json, "registered_figure_types", fail)
+    example = json.loads((ROOT / "templates" / "slide-data-example.json").read_text(encoding="utf-8"))
+    assert validate_json.validate_document("slide_data", example) == []
+
+
+def test_registered_types_are_accepted():
+    assert validate_json.validate_document("slide_data", _document("radar_chart"))
+    register_drawer("radar_chart", "my_charts.radar:draw_radar")
+    try:
+        assert validate_json.validate_document("slide_data", _document("radar_chart")) == []
+        assert validate_json.validate_document("slide_data", _document("funnel"))
+    finally:
+        unregister_drawer("radar_chart")